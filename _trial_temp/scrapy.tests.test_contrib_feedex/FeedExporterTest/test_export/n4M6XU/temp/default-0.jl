@@ -0,0 +1,3 @@
+{"name": "a"}
+{"name": "b"}
+{"name": "c"}
@@ -0,0 +1,3641 @@
+{"name": "00000"}
+{"name": "00001"}
+{"name": "00002"}
+{"name": "00003"}
+{"name": "00004"}
+{"name": "00005"}
+{"name": "00006"}
+{"name": "00007"}
+{"name": "00008"}
+{"name": "00009"}
+{"name": "00010"}
+{"name": "00011"}
+{"name": "00012"}
+{"name": "00013"}
+{"name": "00014"}
+{"name": "00015"}
+{"name": "00016"}
+{"name": "00017"}
+{"name": "00018"}
+{"name": "00019"}
+{"name": "00020"}
+{"name": "00021"}
+{"name": "00022"}
+{"name": "00023"}
+{"name": "00024"}
+{"name": "00025"}
+{"name": "00026"}
+{"name": "00027"}
+{"name": "00028"}
+{"name": "00029"}
+{"name": "00030"}
+{"name": "00031"}
+{"name": "00032"}
+{"name": "00033"}
+{"name": "00034"}
+{"name": "00035"}
+{"name": "00036"}
+{"name": "00037"}
+{"name": "00038"}
+{"name": "00039"}
+{"name": "00040"}
+{"name": "00041"}
+{"name": "00042"}
+{"name": "00043"}
+{"name": "00044"}
+{"name": "00045"}
+{"name": "00046"}
+{"name": "00047"}
+{"name": "00048"}
+{"name": "00049"}
+{"name": "00050"}
+{"name": "00051"}
+{"name": "00052"}
+{"name": "00053"}
+{"name": "00054"}
+{"name": "00055"}
+{"name": "00056"}
+{"name": "00057"}
+{"name": "00058"}
+{"name": "00059"}
+{"name": "00060"}
+{"name": "00061"}
+{"name": "00062"}
+{"name": "00063"}
+{"name": "00064"}
+{"name": "00065"}
+{"name": "00066"}
+{"name": "00067"}
+{"name": "00068"}
+{"name": "00069"}
+{"name": "00070"}
+{"name": "00071"}
+{"name": "00072"}
+{"name": "00073"}
+{"name": "00074"}
+{"name": "00075"}
+{"name": "00076"}
+{"name": "00077"}
+{"name": "00078"}
+{"name": "00079"}
+{"name": "00080"}
+{"name": "00081"}
+{"name": "00082"}
+{"name": "00083"}
+{"name": "00084"}
+{"name": "00085"}
+{"name": "00086"}
+{"name": "00087"}
+{"name": "00088"}
+{"name": "00089"}
+{"name": "00090"}
+{"name": "00091"}
+{"name": "00092"}
+{"name": "00093"}
+{"name": "00094"}
+{"name": "00095"}
+{"name": "00096"}
+{"name": "00097"}
+{"name": "00098"}
+{"name": "00099"}
+{"name": "00100"}
+{"name": "00101"}
+{"name": "00102"}
+{"name": "00103"}
+{"name": "00104"}
+{"name": "00105"}
+{"name": "00106"}
+{"name": "00107"}
+{"name": "00108"}
+{"name": "00109"}
+{"name": "00110"}
+{"name": "00111"}
+{"name": "00112"}
+{"name": "00113"}
+{"name": "00114"}
+{"name": "00115"}
+{"name": "00116"}
+{"name": "00117"}
+{"name": "00118"}
+{"name": "00119"}
+{"name": "00120"}
+{"name": "00121"}
+{"name": "00122"}
+{"name": "00123"}
+{"name": "00124"}
+{"name": "00125"}
+{"name": "00126"}
+{"name": "00127"}
+{"name": "00128"}
+{"name": "00129"}
+{"name": "00130"}
+{"name": "00131"}
+{"name": "00132"}
+{"name": "00133"}
+{"name": "00134"}
+{"name": "00135"}
+{"name": "00136"}
+{"name": "00137"}
+{"name": "00138"}
+{"name": "00139"}
+{"name": "00140"}
+{"name": "00141"}
+{"name": "00142"}
+{"name": "00143"}
+{"name": "00144"}
+{"name": "00145"}
+{"name": "00146"}
+{"name": "00147"}
+{"name": "00148"}
+{"name": "00149"}
+{"name": "00150"}
+{"name": "00151"}
+{"name": "00152"}
+{"name": "00153"}
+{"name": "00154"}
+{"name": "00155"}
+{"name": "00156"}
+{"name": "00157"}
+{"name": "00158"}
+{"name": "00159"}
+{"name": "00160"}
+{"name": "00161"}
+{"name": "00162"}
+{"name": "00163"}
+{"name": "00164"}
+{"name": "00165"}
+{"name": "00166"}
+{"name": "00167"}
+{"name": "00168"}
+{"name": "00169"}
+{"name": "00170"}
+{"name": "00171"}
+{"name": "00172"}
+{"name": "00173"}
+{"name": "00174"}
+{"name": "00175"}
+{"name": "00176"}
+{"name": "00177"}
+{"name": "00178"}
+{"name": "00179"}
+{"name": "00180"}
+{"name": "00181"}
+{"name": "00182"}
+{"name": "00183"}
+{"name": "00184"}
+{"name": "00185"}
+{"name": "00186"}
+{"name": "00187"}
+{"name": "00188"}
+{"name": "00189"}
+{"name": "00190"}
+{"name": "00191"}
+{"name": "00192"}
+{"name": "00193"}
+{"name": "00194"}
+{"name": "00195"}
+{"name": "00196"}
+{"name": "00197"}
+{"name": "00198"}
+{"name": "00199"}
+{"name": "00200"}
+{"name": "00201"}
+{"name": "00202"}
+{"name": "00203"}
+{"name": "00204"}
+{"name": "00205"}
+{"name": "00206"}
+{"name": "00207"}
+{"name": "00208"}
+{"name": "00209"}
+{"name": "00210"}
+{"name": "00211"}
+{"name": "00212"}
+{"name": "00213"}
+{"name": "00214"}
+{"name": "00215"}
+{"name": "00216"}
+{"name": "00217"}
+{"name": "00218"}
+{"name": "00219"}
+{"name": "00220"}
+{"name": "00221"}
+{"name": "00222"}
+{"name": "00223"}
+{"name": "00224"}
+{"name": "00225"}
+{"name": "00226"}
+{"name": "00227"}
+{"name": "00228"}
+{"name": "00229"}
+{"name": "00230"}
+{"name": "00231"}
+{"name": "00232"}
+{"name": "00233"}
+{"name": "00234"}
+{"name": "00235"}
+{"name": "00236"}
+{"name": "00237"}
+{"name": "00238"}
+{"name": "00239"}
+{"name": "00240"}
+{"name": "00241"}
+{"name": "00242"}
+{"name": "00243"}
+{"name": "00244"}
+{"name": "00245"}
+{"name": "00246"}
+{"name": "00247"}
+{"name": "00248"}
+{"name": "00249"}
+{"name": "00250"}
+{"name": "00251"}
+{"name": "00252"}
+{"name": "00253"}
+{"name": "00254"}
+{"name": "00255"}
+{"name": "00256"}
+{"name": "00257"}
+{"name": "00258"}
+{"name": "00259"}
+{"name": "00260"}
+{"name": "00261"}
+{"name": "00262"}
+{"name": "00263"}
+{"name": "00264"}
+{"name": "00265"}
+{"name": "00266"}
+{"name": "00267"}
+{"name": "00268"}
+{"name": "00269"}
+{"name": "00270"}
+{"name": "00271"}
+{"name": "00272"}
+{"name": "00273"}
+{"name": "00274"}
+{"name": "00275"}
+{"name": "00276"}
+{"name": "00277"}
+{"name": "00278"}
+{"name": "00279"}
+{"name": "00280"}
+{"name": "00281"}
+{"name": "00282"}
+{"name": "00283"}
+{"name": "00284"}
+{"name": "00285"}
+{"name": "00286"}
+{"name": "00287"}
+{"name": "00288"}
+{"name": "00289"}
+{"name": "00290"}
+{"name": "00291"}
+{"name": "00292"}
+{"name": "00293"}
+{"name": "00294"}
+{"name": "00295"}
+{"name": "00296"}
+{"name": "00297"}
+{"name": "00298"}
+{"name": "00299"}
+{"name": "00300"}
+{"name": "00301"}
+{"name": "00302"}
+{"name": "00303"}
+{"name": "00304"}
+{"name": "00305"}
+{"name": "00306"}
+{"name": "00307"}
+{"name": "00308"}
+{"name": "00309"}
+{"name": "00310"}
+{"name": "00311"}
+{"name": "00312"}
+{"name": "00313"}
+{"name": "00314"}
+{"name": "00315"}
+{"name": "00316"}
+{"name": "00317"}
+{"name": "00318"}
+{"name": "00319"}
+{"name": "00320"}
+{"name": "00321"}
+{"name": "00322"}
+{"name": "00323"}
+{"name": "00324"}
+{"name": "00325"}
+{"name": "00326"}
+{"name": "00327"}
+{"name": "00328"}
+{"name": "00329"}
+{"name": "00330"}
+{"name": "00331"}
+{"name": "00332"}
+{"name": "00333"}
+{"name": "00334"}
+{"name": "00335"}
+{"name": "00336"}
+{"name": "00337"}
+{"name": "00338"}
+{"name": "00339"}
+{"name": "00340"}
+{"name": "00341"}
+{"name": "00342"}
+{"name": "00343"}
+{"name": "00344"}
+{"name": "00345"}
+{"name": "00346"}
+{"name": "00347"}
+{"name": "00348"}
+{"name": "00349"}
+{"name": "00350"}
+{"name": "00351"}
+{"name": "00352"}
+{"name": "00353"}
+{"name": "00354"}
+{"name": "00355"}
+{"name": "00356"}
+{"name": "00357"}
+{"name": "00358"}
+{"name": "00359"}
+{"name": "00360"}
+{"name": "00361"}
+{"name": "00362"}
+{"name": "00363"}
+{"name": "00364"}
+{"name": "00365"}
+{"name": "00366"}
+{"name": "00367"}
+{"name": "00368"}
+{"name": "00369"}
+{"name": "00370"}
+{"name": "00371"}
+{"name": "00372"}
+{"name": "00373"}
+{"name": "00374"}
+{"name": "00375"}
+{"name": "00376"}
+{"name": "00377"}
+{"name": "00378"}
+{"name": "00379"}
+{"name": "00380"}
+{"name": "00381"}
+{"name": "00382"}
+{"name": "00383"}
+{"name": "00384"}
+{"name": "00385"}
+{"name": "00386"}
+{"name": "00387"}
+{"name": "00388"}
+{"name": "00389"}
+{"name": "00390"}
+{"name": "00391"}
+{"name": "00392"}
+{"name": "00393"}
+{"name": "00394"}
+{"name": "00395"}
+{"name": "00396"}
+{"name": "00397"}
+{"name": "00398"}
+{"name": "00399"}
+{"name": "00400"}
+{"name": "00401"}
+{"name": "00402"}
+{"name": "00403"}
+{"name": "00404"}
+{"name": "00405"}
+{"name": "00406"}
+{"name": "00407"}
+{"name": "00408"}
+{"name": "00409"}
+{"name": "00410"}
+{"name": "00411"}
+{"name": "00412"}
+{"name": "00413"}
+{"name": "00414"}
+{"name": "00415"}
+{"name": "00416"}
+{"name": "00417"}
+{"name": "00418"}
+{"name": "00419"}
+{"name": "00420"}
+{"name": "00421"}
+{"name": "00422"}
+{"name": "00423"}
+{"name": "00424"}
+{"name": "00425"}
+{"name": "00426"}
+{"name": "00427"}
+{"name": "00428"}
+{"name": "00429"}
+{"name": "00430"}
+{"name": "00431"}
+{"name": "00432"}
+{"name": "00433"}
+{"name": "00434"}
+{"name": "00435"}
+{"name": "00436"}
+{"name": "00437"}
+{"name": "00438"}
+{"name": "00439"}
+{"name": "00440"}
+{"name": "00441"}
+{"name": "00442"}
+{"name": "00443"}
+{"name": "00444"}
+{"name": "00445"}
+{"name": "00446"}
+{"name": "00447"}
+{"name": "00448"}
+{"name": "00449"}
+{"name": "00450"}
+{"name": "00451"}
+{"name": "00452"}
+{"name": "00453"}
+{"name": "00454"}
+{"name": "00455"}
+{"name": "00456"}
+{"name": "00457"}
+{"name": "00458"}
+{"name": "00459"}
+{"name": "00460"}
+{"name": "00461"}
+{"name": "00462"}
+{"name": "00463"}
+{"name": "00464"}
+{"name": "00465"}
+{"name": "00466"}
+{"name": "00467"}
+{"name": "00468"}
+{"name": "00469"}
+{"name": "00470"}
+{"name": "00471"}
+{"name": "00472"}
+{"name": "00473"}
+{"name": "00474"}
+{"name": "00475"}
+{"name": "00476"}
+{"name": "00477"}
+{"name": "00478"}
+{"name": "00479"}
+{"name": "00480"}
+{"name": "00481"}
+{"name": "00482"}
+{"name": "00483"}
+{"name": "00484"}
+{"name": "00485"}
+{"name": "00486"}
+{"name": "00487"}
+{"name": "00488"}
+{"name": "00489"}
+{"name": "00490"}
+{"name": "00491"}
+{"name": "00492"}
+{"name": "00493"}
+{"name": "00494"}
+{"name": "00495"}
+{"name": "00496"}
+{"name": "00497"}
+{"name": "00498"}
+{"name": "00499"}
+{"name": "00500"}
+{"name": "00501"}
+{"name": "00502"}
+{"name": "00503"}
+{"name": "00504"}
+{"name": "00505"}
+{"name": "00506"}
+{"name": "00507"}
+{"name": "00508"}
+{"name": "00509"}
+{"name": "00510"}
+{"name": "00511"}
+{"name": "00512"}
+{"name": "00513"}
+{"name": "00514"}
+{"name": "00515"}
+{"name": "00516"}
+{"name": "00517"}
+{"name": "00518"}
+{"name": "00519"}
+{"name": "00520"}
+{"name": "00521"}
+{"name": "00522"}
+{"name": "00523"}
+{"name": "00524"}
+{"name": "00525"}
+{"name": "00526"}
+{"name": "00527"}
+{"name": "00528"}
+{"name": "00529"}
+{"name": "00530"}
+{"name": "00531"}
+{"name": "00532"}
+{"name": "00533"}
+{"name": "00534"}
+{"name": "00535"}
+{"name": "00536"}
+{"name": "00537"}
+{"name": "00538"}
+{"name": "00539"}
+{"name": "00540"}
+{"name": "00541"}
+{"name": "00542"}
+{"name": "00543"}
+{"name": "00544"}
+{"name": "00545"}
+{"name": "00546"}
+{"name": "00547"}
+{"name": "00548"}
+{"name": "00549"}
+{"name": "00550"}
+{"name": "00551"}
+{"name": "00552"}
+{"name": "00553"}
+{"name": "00554"}
+{"name": "00555"}
+{"name": "00556"}
+{"name": "00557"}
+{"name": "00558"}
+{"name": "00559"}
+{"name": "00560"}
+{"name": "00561"}
+{"name": "00562"}
+{"name": "00563"}
+{"name": "00564"}
+{"name": "00565"}
+{"name": "00566"}
+{"name": "00567"}
+{"name": "00568"}
+{"name": "00569"}
+{"name": "00570"}
+{"name": "00571"}
+{"name": "00572"}
+{"name": "00573"}
+{"name": "00574"}
+{"name": "00575"}
+{"name": "00576"}
+{"name": "00577"}
+{"name": "00578"}
+{"name": "00579"}
+{"name": "00580"}
+{"name": "00581"}
+{"name": "00582"}
+{"name": "00583"}
+{"name": "00584"}
+{"name": "00585"}
+{"name": "00586"}
+{"name": "00587"}
+{"name": "00588"}
+{"name": "00589"}
+{"name": "00590"}
+{"name": "00591"}
+{"name": "00592"}
+{"name": "00593"}
+{"name": "00594"}
+{"name": "00595"}
+{"name": "00596"}
+{"name": "00597"}
+{"name": "00598"}
+{"name": "00599"}
+{"name": "00600"}
+{"name": "00601"}
+{"name": "00602"}
+{"name": "00603"}
+{"name": "00604"}
+{"name": "00605"}
+{"name": "00606"}
+{"name": "00607"}
+{"name": "00608"}
+{"name": "00609"}
+{"name": "00610"}
+{"name": "00611"}
+{"name": "00612"}
+{"name": "00613"}
+{"name": "00614"}
+{"name": "00615"}
+{"name": "00616"}
+{"name": "00617"}
+{"name": "00618"}
+{"name": "00619"}
+{"name": "00620"}
+{"name": "00621"}
+{"name": "00622"}
+{"name": "00623"}
+{"name": "00624"}
+{"name": "00625"}
+{"name": "00626"}
+{"name": "00627"}
+{"name": "00628"}
+{"name": "00629"}
+{"name": "00630"}
+{"name": "00631"}
+{"name": "00632"}
+{"name": "00633"}
+{"name": "00634"}
+{"name": "00635"}
+{"name": "00636"}
+{"name": "00637"}
+{"name": "00638"}
+{"name": "00639"}
+{"name": "00640"}
+{"name": "00641"}
+{"name": "00642"}
+{"name": "00643"}
+{"name": "00644"}
+{"name": "00645"}
+{"name": "00646"}
+{"name": "00647"}
+{"name": "00648"}
+{"name": "00649"}
+{"name": "00650"}
+{"name": "00651"}
+{"name": "00652"}
+{"name": "00653"}
+{"name": "00654"}
+{"name": "00655"}
+{"name": "00656"}
+{"name": "00657"}
+{"name": "00658"}
+{"name": "00659"}
+{"name": "00660"}
+{"name": "00661"}
+{"name": "00662"}
+{"name": "00663"}
+{"name": "00664"}
+{"name": "00665"}
+{"name": "00666"}
+{"name": "00667"}
+{"name": "00668"}
+{"name": "00669"}
+{"name": "00670"}
+{"name": "00671"}
+{"name": "00672"}
+{"name": "00673"}
+{"name": "00674"}
+{"name": "00675"}
+{"name": "00676"}
+{"name": "00677"}
+{"name": "00678"}
+{"name": "00679"}
+{"name": "00680"}
+{"name": "00681"}
+{"name": "00682"}
+{"name": "00683"}
+{"name": "00684"}
+{"name": "00685"}
+{"name": "00686"}
+{"name": "00687"}
+{"name": "00688"}
+{"name": "00689"}
+{"name": "00690"}
+{"name": "00691"}
+{"name": "00692"}
+{"name": "00693"}
+{"name": "00694"}
+{"name": "00695"}
+{"name": "00696"}
+{"name": "00697"}
+{"name": "00698"}
+{"name": "00699"}
+{"name": "00700"}
+{"name": "00701"}
+{"name": "00702"}
+{"name": "00703"}
+{"name": "00704"}
+{"name": "00705"}
+{"name": "00706"}
+{"name": "00707"}
+{"name": "00708"}
+{"name": "00709"}
+{"name": "00710"}
+{"name": "00711"}
+{"name": "00712"}
+{"name": "00713"}
+{"name": "00714"}
+{"name": "00715"}
+{"name": "00716"}
+{"name": "00717"}
+{"name": "00718"}
+{"name": "00719"}
+{"name": "00720"}
+{"name": "00721"}
+{"name": "00722"}
+{"name": "00723"}
+{"name": "00724"}
+{"name": "00725"}
+{"name": "00726"}
+{"name": "00727"}
+{"name": "00728"}
+{"name": "00729"}
+{"name": "00730"}
+{"name": "00731"}
+{"name": "00732"}
+{"name": "00733"}
+{"name": "00734"}
+{"name": "00735"}
+{"name": "00736"}
+{"name": "00737"}
+{"name": "00738"}
+{"name": "00739"}
+{"name": "00740"}
+{"name": "00741"}
+{"name": "00742"}
+{"name": "00743"}
+{"name": "00744"}
+{"name": "00745"}
+{"name": "00746"}
+{"name": "00747"}
+{"name": "00748"}
+{"name": "00749"}
+{"name": "00750"}
+{"name": "00751"}
+{"name": "00752"}
+{"name": "00753"}
+{"name": "00754"}
+{"name": "00755"}
+{"name": "00756"}
+{"name": "00757"}
+{"name": "00758"}
+{"name": "00759"}
+{"name": "00760"}
+{"name": "00761"}
+{"name": "00762"}
+{"name": "00763"}
+{"name": "00764"}
+{"name": "00765"}
+{"name": "00766"}
+{"name": "00767"}
+{"name": "00768"}
+{"name": "00769"}
+{"name": "00770"}
+{"name": "00771"}
+{"name": "00772"}
+{"name": "00773"}
+{"name": "00774"}
+{"name": "00775"}
+{"name": "00776"}
+{"name": "00777"}
+{"name": "00778"}
+{"name": "00779"}
+{"name": "00780"}
+{"name": "00781"}
+{"name": "00782"}
+{"name": "00783"}
+{"name": "00784"}
+{"name": "00785"}
+{"name": "00786"}
+{"name": "00787"}
+{"name": "00788"}
+{"name": "00789"}
+{"name": "00790"}
+{"name": "00791"}
+{"name": "00792"}
+{"name": "00793"}
+{"name": "00794"}
+{"name": "00795"}
+{"name": "00796"}
+{"name": "00797"}
+{"name": "00798"}
+{"name": "00799"}
+{"name": "00800"}
+{"name": "00801"}
+{"name": "00802"}
+{"name": "00803"}
+{"name": "00804"}
+{"name": "00805"}
+{"name": "00806"}
+{"name": "00807"}
+{"name": "00808"}
+{"name": "00809"}
+{"name": "00810"}
+{"name": "00811"}
+{"name": "00812"}
+{"name": "00813"}
+{"name": "00814"}
+{"name": "00815"}
+{"name": "00816"}
+{"name": "00817"}
+{"name": "00818"}
+{"name": "00819"}
+{"name": "00820"}
+{"name": "00821"}
+{"name": "00822"}
+{"name": "00823"}
+{"name": "00824"}
+{"name": "00825"}
+{"name": "00826"}
+{"name": "00827"}
+{"name": "00828"}
+{"name": "00829"}
+{"name": "00830"}
+{"name": "00831"}
+{"name": "00832"}
+{"name": "00833"}
+{"name": "00834"}
+{"name": "00835"}
+{"name": "00836"}
+{"name": "00837"}
+{"name": "00838"}
+{"name": "00839"}
+{"name": "00840"}
+{"name": "00841"}
+{"name": "00842"}
+{"name": "00843"}
+{"name": "00844"}
+{"name": "00845"}
+{"name": "00846"}
+{"name": "00847"}
+{"name": "00848"}
+{"name": "00849"}
+{"name": "00850"}
+{"name": "00851"}
+{"name": "00852"}
+{"name": "00853"}
+{"name": "00854"}
+{"name": "00855"}
+{"name": "00856"}
+{"name": "00857"}
+{"name": "00858"}
+{"name": "00859"}
+{"name": "00860"}
+{"name": "00861"}
+{"name": "00862"}
+{"name": "00863"}
+{"name": "00864"}
+{"name": "00865"}
+{"name": "00866"}
+{"name": "00867"}
+{"name": "00868"}
+{"name": "00869"}
+{"name": "00870"}
+{"name": "00871"}
+{"name": "00872"}
+{"name": "00873"}
+{"name": "00874"}
+{"name": "00875"}
+{"name": "00876"}
+{"name": "00877"}
+{"name": "00878"}
+{"name": "00879"}
+{"name": "00880"}
+{"name": "00881"}
+{"name": "00882"}
+{"name": "00883"}
+{"name": "00884"}
+{"name": "00885"}
+{"name": "00886"}
+{"name": "00887"}
+{"name": "00888"}
+{"name": "00889"}
+{"name": "00890"}
+{"name": "00891"}
+{"name": "00892"}
+{"name": "00893"}
+{"name": "00894"}
+{"name": "00895"}
+{"name": "00896"}
+{"name": "00897"}
+{"name": "00898"}
+{"name": "00899"}
+{"name": "00900"}
+{"name": "00901"}
+{"name": "00902"}
+{"name": "00903"}
+{"name": "00904"}
+{"name": "00905"}
+{"name": "00906"}
+{"name": "00907"}
+{"name": "00908"}
+{"name": "00909"}
+{"name": "00910"}
+{"name": "00911"}
+{"name": "00912"}
+{"name": "00913"}
+{"name": "00914"}
+{"name": "00915"}
+{"name": "00916"}
+{"name": "00917"}
+{"name": "00918"}
+{"name": "00919"}
+{"name": "00920"}
+{"name": "00921"}
+{"name": "00922"}
+{"name": "00923"}
+{"name": "00924"}
+{"name": "00925"}
+{"name": "00926"}
+{"name": "00927"}
+{"name": "00928"}
+{"name": "00929"}
+{"name": "00930"}
+{"name": "00931"}
+{"name": "00932"}
+{"name": "00933"}
+{"name": "00934"}
+{"name": "00935"}
+{"name": "00936"}
+{"name": "00937"}
+{"name": "00938"}
+{"name": "00939"}
+{"name": "00940"}
+{"name": "00941"}
+{"name": "00942"}
+{"name": "00943"}
+{"name": "00944"}
+{"name": "00945"}
+{"name": "00946"}
+{"name": "00947"}
+{"name": "00948"}
+{"name": "00949"}
+{"name": "00950"}
+{"name": "00951"}
+{"name": "00952"}
+{"name": "00953"}
+{"name": "00954"}
+{"name": "00955"}
+{"name": "00956"}
+{"name": "00957"}
+{"name": "00958"}
+{"name": "00959"}
+{"name": "00960"}
+{"name": "00961"}
+{"name": "00962"}
+{"name": "00963"}
+{"name": "00964"}
+{"name": "00965"}
+{"name": "00966"}
+{"name": "00967"}
+{"name": "00968"}
+{"name": "00969"}
+{"name": "00970"}
+{"name": "00971"}
+{"name": "00972"}
+{"name": "00973"}
+{"name": "00974"}
+{"name": "00975"}
+{"name": "00976"}
+{"name": "00977"}
+{"name": "00978"}
+{"name": "00979"}
+{"name": "00980"}
+{"name": "00981"}
+{"name": "00982"}
+{"name": "00983"}
+{"name": "00984"}
+{"name": "00985"}
+{"name": "00986"}
+{"name": "00987"}
+{"name": "00988"}
+{"name": "00989"}
+{"name": "00990"}
+{"name": "00991"}
+{"name": "00992"}
+{"name": "00993"}
+{"name": "00994"}
+{"name": "00995"}
+{"name": "00996"}
+{"name": "00997"}
+{"name": "00998"}
+{"name": "00999"}
+{"name": "01000"}
+{"name": "01001"}
+{"name": "01002"}
+{"name": "01003"}
+{"name": "01004"}
+{"name": "01005"}
+{"name": "01006"}
+{"name": "01007"}
+{"name": "01008"}
+{"name": "01009"}
+{"name": "01010"}
+{"name": "01011"}
+{"name": "01012"}
+{"name": "01013"}
+{"name": "01014"}
+{"name": "01015"}
+{"name": "01016"}
+{"name": "01017"}
+{"name": "01018"}
+{"name": "01019"}
+{"name": "01020"}
+{"name": "01021"}
+{"name": "01022"}
+{"name": "01023"}
+{"name": "01024"}
+{"name": "01025"}
+{"name": "01026"}
+{"name": "01027"}
+{"name": "01028"}
+{"name": "01029"}
+{"name": "01030"}
+{"name": "01031"}
+{"name": "01032"}
+{"name": "01033"}
+{"name": "01034"}
+{"name": "01035"}
+{"name": "01036"}
+{"name": "01037"}
+{"name": "01038"}
+{"name": "01039"}
+{"name": "01040"}
+{"name": "01041"}
+{"name": "01042"}
+{"name": "01043"}
+{"name": "01044"}
+{"name": "01045"}
+{"name": "01046"}
+{"name": "01047"}
+{"name": "01048"}
+{"name": "01049"}
+{"name": "01050"}
+{"name": "01051"}
+{"name": "01052"}
+{"name": "01053"}
+{"name": "01054"}
+{"name": "01055"}
+{"name": "01056"}
+{"name": "01057"}
+{"name": "01058"}
+{"name": "01059"}
+{"name": "01060"}
+{"name": "01061"}
+{"name": "01062"}
+{"name": "01063"}
+{"name": "01064"}
+{"name": "01065"}
+{"name": "01066"}
+{"name": "01067"}
+{"name": "01068"}
+{"name": "01069"}
+{"name": "01070"}
+{"name": "01071"}
+{"name": "01072"}
+{"name": "01073"}
+{"name": "01074"}
+{"name": "01075"}
+{"name": "01076"}
+{"name": "01077"}
+{"name": "01078"}
+{"name": "01079"}
+{"name": "01080"}
+{"name": "01081"}
+{"name": "01082"}
+{"name": "01083"}
+{"name": "01084"}
+{"name": "01085"}
+{"name": "01086"}
+{"name": "01087"}
+{"name": "01088"}
+{"name": "01089"}
+{"name": "01090"}
+{"name": "01091"}
+{"name": "01092"}
+{"name": "01093"}
+{"name": "01094"}
+{"name": "01095"}
+{"name": "01096"}
+{"name": "01097"}
+{"name": "01098"}
+{"name": "01099"}
+{"name": "01100"}
+{"name": "01101"}
+{"name": "01102"}
+{"name": "01103"}
+{"name": "01104"}
+{"name": "01105"}
+{"name": "01106"}
+{"name": "01107"}
+{"name": "01108"}
+{"name": "01109"}
+{"name": "01110"}
+{"name": "01111"}
+{"name": "01112"}
+{"name": "01113"}
+{"name": "01114"}
+{"name": "01115"}
+{"name": "01116"}
+{"name": "01117"}
+{"name": "01118"}
+{"name": "01119"}
+{"name": "01120"}
+{"name": "01121"}
+{"name": "01122"}
+{"name": "01123"}
+{"name": "01124"}
+{"name": "01125"}
+{"name": "01126"}
+{"name": "01127"}
+{"name": "01128"}
+{"name": "01129"}
+{"name": "01130"}
+{"name": "01131"}
+{"name": "01132"}
+{"name": "01133"}
+{"name": "01134"}
+{"name": "01135"}
+{"name": "01136"}
+{"name": "01137"}
+{"name": "01138"}
+{"name": "01139"}
+{"name": "01140"}
+{"name": "01141"}
+{"name": "01142"}
+{"name": "01143"}
+{"name": "01144"}
+{"name": "01145"}
+{"name": "01146"}
+{"name": "01147"}
+{"name": "01148"}
+{"name": "01149"}
+{"name": "01150"}
+{"name": "01151"}
+{"name": "01152"}
+{"name": "01153"}
+{"name": "01154"}
+{"name": "01155"}
+{"name": "01156"}
+{"name": "01157"}
+{"name": "01158"}
+{"name": "01159"}
+{"name": "01160"}
+{"name": "01161"}
+{"name": "01162"}
+{"name": "01163"}
+{"name": "01164"}
+{"name": "01165"}
+{"name": "01166"}
+{"name": "01167"}
+{"name": "01168"}
+{"name": "01169"}
+{"name": "01170"}
+{"name": "01171"}
+{"name": "01172"}
+{"name": "01173"}
+{"name": "01174"}
+{"name": "01175"}
+{"name": "01176"}
+{"name": "01177"}
+{"name": "01178"}
+{"name": "01179"}
+{"name": "01180"}
+{"name": "01181"}
+{"name": "01182"}
+{"name": "01183"}
+{"name": "01184"}
+{"name": "01185"}
+{"name": "01186"}
+{"name": "01187"}
+{"name": "01188"}
+{"name": "01189"}
+{"name": "01190"}
+{"name": "01191"}
+{"name": "01192"}
+{"name": "01193"}
+{"name": "01194"}
+{"name": "01195"}
+{"name": "01196"}
+{"name": "01197"}
+{"name": "01198"}
+{"name": "01199"}
+{"name": "01200"}
+{"name": "01201"}
+{"name": "01202"}
+{"name": "01203"}
+{"name": "01204"}
+{"name": "01205"}
+{"name": "01206"}
+{"name": "01207"}
+{"name": "01208"}
+{"name": "01209"}
+{"name": "01210"}
+{"name": "01211"}
+{"name": "01212"}
+{"name": "01213"}
+{"name": "01214"}
+{"name": "01215"}
+{"name": "01216"}
+{"name": "01217"}
+{"name": "01218"}
+{"name": "01219"}
+{"name": "01220"}
+{"name": "01221"}
+{"name": "01222"}
+{"name": "01223"}
+{"name": "01224"}
+{"name": "01225"}
+{"name": "01226"}
+{"name": "01227"}
+{"name": "01228"}
+{"name": "01229"}
+{"name": "01230"}
+{"name": "01231"}
+{"name": "01232"}
+{"name": "01233"}
+{"name": "01234"}
+{"name": "01235"}
+{"name": "01236"}
+{"name": "01237"}
+{"name": "01238"}
+{"name": "01239"}
+{"name": "01240"}
+{"name": "01241"}
+{"name": "01242"}
+{"name": "01243"}
+{"name": "01244"}
+{"name": "01245"}
+{"name": "01246"}
+{"name": "01247"}
+{"name": "01248"}
+{"name": "01249"}
+{"name": "01250"}
+{"name": "01251"}
+{"name": "01252"}
+{"name": "01253"}
+{"name": "01254"}
+{"name": "01255"}
+{"name": "01256"}
+{"name": "01257"}
+{"name": "01258"}
+{"name": "01259"}
+{"name": "01260"}
+{"name": "01261"}
+{"name": "01262"}
+{"name": "01263"}
+{"name": "01264"}
+{"name": "01265"}
+{"name": "01266"}
+{"name": "01267"}
+{"name": "01268"}
+{"name": "01269"}
+{"name": "01270"}
+{"name": "01271"}
+{"name": "01272"}
+{"name": "01273"}
+{"name": "01274"}
+{"name": "01275"}
+{"name": "01276"}
+{"name": "01277"}
+{"name": "01278"}
+{"name": "01279"}
+{"name": "01280"}
+{"name": "01281"}
+{"name": "01282"}
+{"name": "01283"}
+{"name": "01284"}
+{"name": "01285"}
+{"name": "01286"}
+{"name": "01287"}
+{"name": "01288"}
+{"name": "01289"}
+{"name": "01290"}
+{"name": "01291"}
+{"name": "01292"}
+{"name": "01293"}
+{"name": "01294"}
+{"name": "01295"}
+{"name": "01296"}
+{"name": "01297"}
+{"name": "01298"}
+{"name": "01299"}
+{"name": "01300"}
+{"name": "01301"}
+{"name": "01302"}
+{"name": "01303"}
+{"name": "01304"}
+{"name": "01305"}
+{"name": "01306"}
+{"name": "01307"}
+{"name": "01308"}
+{"name": "01309"}
+{"name": "01310"}
+{"name": "01311"}
+{"name": "01312"}
+{"name": "01313"}
+{"name": "01314"}
+{"name": "01315"}
+{"name": "01316"}
+{"name": "01317"}
+{"name": "01318"}
+{"name": "01319"}
+{"name": "01320"}
+{"name": "01321"}
+{"name": "01322"}
+{"name": "01323"}
+{"name": "01324"}
+{"name": "01325"}
+{"name": "01326"}
+{"name": "01327"}
+{"name": "01328"}
+{"name": "01329"}
+{"name": "01330"}
+{"name": "01331"}
+{"name": "01332"}
+{"name": "01333"}
+{"name": "01334"}
+{"name": "01335"}
+{"name": "01336"}
+{"name": "01337"}
+{"name": "01338"}
+{"name": "01339"}
+{"name": "01340"}
+{"name": "01341"}
+{"name": "01342"}
+{"name": "01343"}
+{"name": "01344"}
+{"name": "01345"}
+{"name": "01346"}
+{"name": "01347"}
+{"name": "01348"}
+{"name": "01349"}
+{"name": "01350"}
+{"name": "01351"}
+{"name": "01352"}
+{"name": "01353"}
+{"name": "01354"}
+{"name": "01355"}
+{"name": "01356"}
+{"name": "01357"}
+{"name": "01358"}
+{"name": "01359"}
+{"name": "01360"}
+{"name": "01361"}
+{"name": "01362"}
+{"name": "01363"}
+{"name": "01364"}
+{"name": "01365"}
+{"name": "01366"}
+{"name": "01367"}
+{"name": "01368"}
+{"name": "01369"}
+{"name": "01370"}
+{"name": "01371"}
+{"name": "01372"}
+{"name": "01373"}
+{"name": "01374"}
+{"name": "01375"}
+{"name": "01376"}
+{"name": "01377"}
+{"name": "01378"}
+{"name": "01379"}
+{"name": "01380"}
+{"name": "01381"}
+{"name": "01382"}
+{"name": "01383"}
+{"name": "01384"}
+{"name": "01385"}
+{"name": "01386"}
+{"name": "01387"}
+{"name": "01388"}
+{"name": "01389"}
+{"name": "01390"}
+{"name": "01391"}
+{"name": "01392"}
+{"name": "01393"}
+{"name": "01394"}
+{"name": "01395"}
+{"name": "01396"}
+{"name": "01397"}
+{"name": "01398"}
+{"name": "01399"}
+{"name": "01400"}
+{"name": "01401"}
+{"name": "01402"}
+{"name": "01403"}
+{"name": "01404"}
+{"name": "01405"}
+{"name": "01406"}
+{"name": "01407"}
+{"name": "01408"}
+{"name": "01409"}
+{"name": "01410"}
+{"name": "01411"}
+{"name": "01412"}
+{"name": "01413"}
+{"name": "01414"}
+{"name": "01415"}
+{"name": "01416"}
+{"name": "01417"}
+{"name": "01418"}
+{"name": "01419"}
+{"name": "01420"}
+{"name": "01421"}
+{"name": "01422"}
+{"name": "01423"}
+{"name": "01424"}
+{"name": "01425"}
+{"name": "01426"}
+{"name": "01427"}
+{"name": "01428"}
+{"name": "01429"}
+{"name": "01430"}
+{"name": "01431"}
+{"name": "01432"}
+{"name": "01433"}
+{"name": "01434"}
+{"name": "01435"}
+{"name": "01436"}
+{"name": "01437"}
+{"name": "01438"}
+{"name": "01439"}
+{"name": "01440"}
+{"name": "01441"}
+{"name": "01442"}
+{"name": "01443"}
+{"name": "01444"}
+{"name": "01445"}
+{"name": "01446"}
+{"name": "01447"}
+{"name": "01448"}
+{"name": "01449"}
+{"name": "01450"}
+{"name": "01451"}
+{"name": "01452"}
+{"name": "01453"}
+{"name": "01454"}
+{"name": "01455"}
+{"name": "01456"}
+{"name": "01457"}
+{"name": "01458"}
+{"name": "01459"}
+{"name": "01460"}
+{"name": "01461"}
+{"name": "01462"}
+{"name": "01463"}
+{"name": "01464"}
+{"name": "01465"}
+{"name": "01466"}
+{"name": "01467"}
+{"name": "01468"}
+{"name": "01469"}
+{"name": "01470"}
+{"name": "01471"}
+{"name": "01472"}
+{"name": "01473"}
+{"name": "01474"}
+{"name": "01475"}
+{"name": "01476"}
+{"name": "01477"}
+{"name": "01478"}
+{"name": "01479"}
+{"name": "01480"}
+{"name": "01481"}
+{"name": "01482"}
+{"name": "01483"}
+{"name": "01484"}
+{"name": "01485"}
+{"name": "01486"}
+{"name": "01487"}
+{"name": "01488"}
+{"name": "01489"}
+{"name": "01490"}
+{"name": "01491"}
+{"name": "01492"}
+{"name": "01493"}
+{"name": "01494"}
+{"name": "01495"}
+{"name": "01496"}
+{"name": "01497"}
+{"name": "01498"}
+{"name": "01499"}
+{"name": "01500"}
+{"name": "01501"}
+{"name": "01502"}
+{"name": "01503"}
+{"name": "01504"}
+{"name": "01505"}
+{"name": "01506"}
+{"name": "01507"}
+{"name": "01508"}
+{"name": "01509"}
+{"name": "01510"}
+{"name": "01511"}
+{"name": "01512"}
+{"name": "01513"}
+{"name": "01514"}
+{"name": "01515"}
+{"name": "01516"}
+{"name": "01517"}
+{"name": "01518"}
+{"name": "01519"}
+{"name": "01520"}
+{"name": "01521"}
+{"name": "01522"}
+{"name": "01523"}
+{"name": "01524"}
+{"name": "01525"}
+{"name": "01526"}
+{"name": "01527"}
+{"name": "01528"}
+{"name": "01529"}
+{"name": "01530"}
+{"name": "01531"}
+{"name": "01532"}
+{"name": "01533"}
+{"name": "01534"}
+{"name": "01535"}
+{"name": "01536"}
+{"name": "01537"}
+{"name": "01538"}
+{"name": "01539"}
+{"name": "01540"}
+{"name": "01541"}
+{"name": "01542"}
+{"name": "01543"}
+{"name": "01544"}
+{"name": "01545"}
+{"name": "01546"}
+{"name": "01547"}
+{"name": "01548"}
+{"name": "01549"}
+{"name": "01550"}
+{"name": "01551"}
+{"name": "01552"}
+{"name": "01553"}
+{"name": "01554"}
+{"name": "01555"}
+{"name": "01556"}
+{"name": "01557"}
+{"name": "01558"}
+{"name": "01559"}
+{"name": "01560"}
+{"name": "01561"}
+{"name": "01562"}
+{"name": "01563"}
+{"name": "01564"}
+{"name": "01565"}
+{"name": "01566"}
+{"name": "01567"}
+{"name": "01568"}
+{"name": "01569"}
+{"name": "01570"}
+{"name": "01571"}
+{"name": "01572"}
+{"name": "01573"}
+{"name": "01574"}
+{"name": "01575"}
+{"name": "01576"}
+{"name": "01577"}
+{"name": "01578"}
+{"name": "01579"}
+{"name": "01580"}
+{"name": "01581"}
+{"name": "01582"}
+{"name": "01583"}
+{"name": "01584"}
+{"name": "01585"}
+{"name": "01586"}
+{"name": "01587"}
+{"name": "01588"}
+{"name": "01589"}
+{"name": "01590"}
+{"name": "01591"}
+{"name": "01592"}
+{"name": "01593"}
+{"name": "01594"}
+{"name": "01595"}
+{"name": "01596"}
+{"name": "01597"}
+{"name": "01598"}
+{"name": "01599"}
+{"name": "01600"}
+{"name": "01601"}
+{"name": "01602"}
+{"name": "01603"}
+{"name": "01604"}
+{"name": "01605"}
+{"name": "01606"}
+{"name": "01607"}
+{"name": "01608"}
+{"name": "01609"}
+{"name": "01610"}
+{"name": "01611"}
+{"name": "01612"}
+{"name": "01613"}
+{"name": "01614"}
+{"name": "01615"}
+{"name": "01616"}
+{"name": "01617"}
+{"name": "01618"}
+{"name": "01619"}
+{"name": "01620"}
+{"name": "01621"}
+{"name": "01622"}
+{"name": "01623"}
+{"name": "01624"}
+{"name": "01625"}
+{"name": "01626"}
+{"name": "01627"}
+{"name": "01628"}
+{"name": "01629"}
+{"name": "01630"}
+{"name": "01631"}
+{"name": "01632"}
+{"name": "01633"}
+{"name": "01634"}
+{"name": "01635"}
+{"name": "01636"}
+{"name": "01637"}
+{"name": "01638"}
+{"name": "01639"}
+{"name": "01640"}
+{"name": "01641"}
+{"name": "01642"}
+{"name": "01643"}
+{"name": "01644"}
+{"name": "01645"}
+{"name": "01646"}
+{"name": "01647"}
+{"name": "01648"}
+{"name": "01649"}
+{"name": "01650"}
+{"name": "01651"}
+{"name": "01652"}
+{"name": "01653"}
+{"name": "01654"}
+{"name": "01655"}
+{"name": "01656"}
+{"name": "01657"}
+{"name": "01658"}
+{"name": "01659"}
+{"name": "01660"}
+{"name": "01661"}
+{"name": "01662"}
+{"name": "01663"}
+{"name": "01664"}
+{"name": "01665"}
+{"name": "01666"}
+{"name": "01667"}
+{"name": "01668"}
+{"name": "01669"}
+{"name": "01670"}
+{"name": "01671"}
+{"name": "01672"}
+{"name": "01673"}
+{"name": "01674"}
+{"name": "01675"}
+{"name": "01676"}
+{"name": "01677"}
+{"name": "01678"}
+{"name": "01679"}
+{"name": "01680"}
+{"name": "01681"}
+{"name": "01682"}
+{"name": "01683"}
+{"name": "01684"}
+{"name": "01685"}
+{"name": "01686"}
+{"name": "01687"}
+{"name": "01688"}
+{"name": "01689"}
+{"name": "01690"}
+{"name": "01691"}
+{"name": "01692"}
+{"name": "01693"}
+{"name": "01694"}
+{"name": "01695"}
+{"name": "01696"}
+{"name": "01697"}
+{"name": "01698"}
+{"name": "01699"}
+{"name": "01700"}
+{"name": "01701"}
+{"name": "01702"}
+{"name": "01703"}
+{"name": "01704"}
+{"name": "01705"}
+{"name": "01706"}
+{"name": "01707"}
+{"name": "01708"}
+{"name": "01709"}
+{"name": "01710"}
+{"name": "01711"}
+{"name": "01712"}
+{"name": "01713"}
+{"name": "01714"}
+{"name": "01715"}
+{"name": "01716"}
+{"name": "01717"}
+{"name": "01718"}
+{"name": "01719"}
+{"name": "01720"}
+{"name": "01721"}
+{"name": "01722"}
+{"name": "01723"}
+{"name": "01724"}
+{"name": "01725"}
+{"name": "01726"}
+{"name": "01727"}
+{"name": "01728"}
+{"name": "01729"}
+{"name": "01730"}
+{"name": "01731"}
+{"name": "01732"}
+{"name": "01733"}
+{"name": "01734"}
+{"name": "01735"}
+{"name": "01736"}
+{"name": "01737"}
+{"name": "01738"}
+{"name": "01739"}
+{"name": "01740"}
+{"name": "01741"}
+{"name": "01742"}
+{"name": "01743"}
+{"name": "01744"}
+{"name": "01745"}
+{"name": "01746"}
+{"name": "01747"}
+{"name": "01748"}
+{"name": "01749"}
+{"name": "01750"}
+{"name": "01751"}
+{"name": "01752"}
+{"name": "01753"}
+{"name": "01754"}
+{"name": "01755"}
+{"name": "01756"}
+{"name": "01757"}
+{"name": "01758"}
+{"name": "01759"}
+{"name": "01760"}
+{"name": "01761"}
+{"name": "01762"}
+{"name": "01763"}
+{"name": "01764"}
+{"name": "01765"}
+{"name": "01766"}
+{"name": "01767"}
+{"name": "01768"}
+{"name": "01769"}
+{"name": "01770"}
+{"name": "01771"}
+{"name": "01772"}
+{"name": "01773"}
+{"name": "01774"}
+{"name": "01775"}
+{"name": "01776"}
+{"name": "01777"}
+{"name": "01778"}
+{"name": "01779"}
+{"name": "01780"}
+{"name": "01781"}
+{"name": "01782"}
+{"name": "01783"}
+{"name": "01784"}
+{"name": "01785"}
+{"name": "01786"}
+{"name": "01787"}
+{"name": "01788"}
+{"name": "01789"}
+{"name": "01790"}
+{"name": "01791"}
+{"name": "01792"}
+{"name": "01793"}
+{"name": "01794"}
+{"name": "01795"}
+{"name": "01796"}
+{"name": "01797"}
+{"name": "01798"}
+{"name": "01799"}
+{"name": "01800"}
+{"name": "01801"}
+{"name": "01802"}
+{"name": "01803"}
+{"name": "01804"}
+{"name": "01805"}
+{"name": "01806"}
+{"name": "01807"}
+{"name": "01808"}
+{"name": "01809"}
+{"name": "01810"}
+{"name": "01811"}
+{"name": "01812"}
+{"name": "01813"}
+{"name": "01814"}
+{"name": "01815"}
+{"name": "01816"}
+{"name": "01817"}
+{"name": "01818"}
+{"name": "01819"}
+{"name": "01820"}
+{"name": "01821"}
+{"name": "01822"}
+{"name": "01823"}
+{"name": "01824"}
+{"name": "01825"}
+{"name": "01826"}
+{"name": "01827"}
+{"name": "01828"}
+{"name": "01829"}
+{"name": "01830"}
+{"name": "01831"}
+{"name": "01832"}
+{"name": "01833"}
+{"name": "01834"}
+{"name": "01835"}
+{"name": "01836"}
+{"name": "01837"}
+{"name": "01838"}
+{"name": "01839"}
+{"name": "01840"}
+{"name": "01841"}
+{"name": "01842"}
+{"name": "01843"}
+{"name": "01844"}
+{"name": "01845"}
+{"name": "01846"}
+{"name": "01847"}
+{"name": "01848"}
+{"name": "01849"}
+{"name": "01850"}
+{"name": "01851"}
+{"name": "01852"}
+{"name": "01853"}
+{"name": "01854"}
+{"name": "01855"}
+{"name": "01856"}
+{"name": "01857"}
+{"name": "01858"}
+{"name": "01859"}
+{"name": "01860"}
+{"name": "01861"}
+{"name": "01862"}
+{"name": "01863"}
+{"name": "01864"}
+{"name": "01865"}
+{"name": "01866"}
+{"name": "01867"}
+{"name": "01868"}
+{"name": "01869"}
+{"name": "01870"}
+{"name": "01871"}
+{"name": "01872"}
+{"name": "01873"}
+{"name": "01874"}
+{"name": "01875"}
+{"name": "01876"}
+{"name": "01877"}
+{"name": "01878"}
+{"name": "01879"}
+{"name": "01880"}
+{"name": "01881"}
+{"name": "01882"}
+{"name": "01883"}
+{"name": "01884"}
+{"name": "01885"}
+{"name": "01886"}
+{"name": "01887"}
+{"name": "01888"}
+{"name": "01889"}
+{"name": "01890"}
+{"name": "01891"}
+{"name": "01892"}
+{"name": "01893"}
+{"name": "01894"}
+{"name": "01895"}
+{"name": "01896"}
+{"name": "01897"}
+{"name": "01898"}
+{"name": "01899"}
+{"name": "01900"}
+{"name": "01901"}
+{"name": "01902"}
+{"name": "01903"}
+{"name": "01904"}
+{"name": "01905"}
+{"name": "01906"}
+{"name": "01907"}
+{"name": "01908"}
+{"name": "01909"}
+{"name": "01910"}
+{"name": "01911"}
+{"name": "01912"}
+{"name": "01913"}
+{"name": "01914"}
+{"name": "01915"}
+{"name": "01916"}
+{"name": "01917"}
+{"name": "01918"}
+{"name": "01919"}
+{"name": "01920"}
+{"name": "01921"}
+{"name": "01922"}
+{"name": "01923"}
+{"name": "01924"}
+{"name": "01925"}
+{"name": "01926"}
+{"name": "01927"}
+{"name": "01928"}
+{"name": "01929"}
+{"name": "01930"}
+{"name": "01931"}
+{"name": "01932"}
+{"name": "01933"}
+{"name": "01934"}
+{"name": "01935"}
+{"name": "01936"}
+{"name": "01937"}
+{"name": "01938"}
+{"name": "01939"}
+{"name": "01940"}
+{"name": "01941"}
+{"name": "01942"}
+{"name": "01943"}
+{"name": "01944"}
+{"name": "01945"}
+{"name": "01946"}
+{"name": "01947"}
+{"name": "01948"}
+{"name": "01949"}
+{"name": "01950"}
+{"name": "01951"}
+{"name": "01952"}
+{"name": "01953"}
+{"name": "01954"}
+{"name": "01955"}
+{"name": "01956"}
+{"name": "01957"}
+{"name": "01958"}
+{"name": "01959"}
+{"name": "01960"}
+{"name": "01961"}
+{"name": "01962"}
+{"name": "01963"}
+{"name": "01964"}
+{"name": "01965"}
+{"name": "01966"}
+{"name": "01967"}
+{"name": "01968"}
+{"name": "01969"}
+{"name": "01970"}
+{"name": "01971"}
+{"name": "01972"}
+{"name": "01973"}
+{"name": "01974"}
+{"name": "01975"}
+{"name": "01976"}
+{"name": "01977"}
+{"name": "01978"}
+{"name": "01979"}
+{"name": "01980"}
+{"name": "01981"}
+{"name": "01982"}
+{"name": "01983"}
+{"name": "01984"}
+{"name": "01985"}
+{"name": "01986"}
+{"name": "01987"}
+{"name": "01988"}
+{"name": "01989"}
+{"name": "01990"}
+{"name": "01991"}
+{"name": "01992"}
+{"name": "01993"}
+{"name": "01994"}
+{"name": "01995"}
+{"name": "01996"}
+{"name": "01997"}
+{"name": "01998"}
+{"name": "01999"}
+{"name": "02000"}
+{"name": "02001"}
+{"name": "02002"}
+{"name": "02003"}
+{"name": "02004"}
+{"name": "02005"}
+{"name": "02006"}
+{"name": "02007"}
+{"name": "02008"}
+{"name": "02009"}
+{"name": "02010"}
+{"name": "02011"}
+{"name": "02012"}
+{"name": "02013"}
+{"name": "02014"}
+{"name": "02015"}
+{"name": "02016"}
+{"name": "02017"}
+{"name": "02018"}
+{"name": "02019"}
+{"name": "02020"}
+{"name": "02021"}
+{"name": "02022"}
+{"name": "02023"}
+{"name": "02024"}
+{"name": "02025"}
+{"name": "02026"}
+{"name": "02027"}
+{"name": "02028"}
+{"name": "02029"}
+{"name": "02030"}
+{"name": "02031"}
+{"name": "02032"}
+{"name": "02033"}
+{"name": "02034"}
+{"name": "02035"}
+{"name": "02036"}
+{"name": "02037"}
+{"name": "02038"}
+{"name": "02039"}
+{"name": "02040"}
+{"name": "02041"}
+{"name": "02042"}
+{"name": "02043"}
+{"name": "02044"}
+{"name": "02045"}
+{"name": "02046"}
+{"name": "02047"}
+{"name": "02048"}
+{"name": "02049"}
+{"name": "02050"}
+{"name": "02051"}
+{"name": "02052"}
+{"name": "02053"}
+{"name": "02054"}
+{"name": "02055"}
+{"name": "02056"}
+{"name": "02057"}
+{"name": "02058"}
+{"name": "02059"}
+{"name": "02060"}
+{"name": "02061"}
+{"name": "02062"}
+{"name": "02063"}
+{"name": "02064"}
+{"name": "02065"}
+{"name": "02066"}
+{"name": "02067"}
+{"name": "02068"}
+{"name": "02069"}
+{"name": "02070"}
+{"name": "02071"}
+{"name": "02072"}
+{"name": "02073"}
+{"name": "02074"}
+{"name": "02075"}
+{"name": "02076"}
+{"name": "02077"}
+{"name": "02078"}
+{"name": "02079"}
+{"name": "02080"}
+{"name": "02081"}
+{"name": "02082"}
+{"name": "02083"}
+{"name": "02084"}
+{"name": "02085"}
+{"name": "02086"}
+{"name": "02087"}
+{"name": "02088"}
+{"name": "02089"}
+{"name": "02090"}
+{"name": "02091"}
+{"name": "02092"}
+{"name": "02093"}
+{"name": "02094"}
+{"name": "02095"}
+{"name": "02096"}
+{"name": "02097"}
+{"name": "02098"}
+{"name": "02099"}
+{"name": "02100"}
+{"name": "02101"}
+{"name": "02102"}
+{"name": "02103"}
+{"name": "02104"}
+{"name": "02105"}
+{"name": "02106"}
+{"name": "02107"}
+{"name": "02108"}
+{"name": "02109"}
+{"name": "02110"}
+{"name": "02111"}
+{"name": "02112"}
+{"name": "02113"}
+{"name": "02114"}
+{"name": "02115"}
+{"name": "02116"}
+{"name": "02117"}
+{"name": "02118"}
+{"name": "02119"}
+{"name": "02120"}
+{"name": "02121"}
+{"name": "02122"}
+{"name": "02123"}
+{"name": "02124"}
+{"name": "02125"}
+{"name": "02126"}
+{"name": "02127"}
+{"name": "02128"}
+{"name": "02129"}
+{"name": "02130"}
+{"name": "02131"}
+{"name": "02132"}
+{"name": "02133"}
+{"name": "02134"}
+{"name": "02135"}
+{"name": "02136"}
+{"name": "02137"}
+{"name": "02138"}
+{"name": "02139"}
+{"name": "02140"}
+{"name": "02141"}
+{"name": "02142"}
+{"name": "02143"}
+{"name": "02144"}
+{"name": "02145"}
+{"name": "02146"}
+{"name": "02147"}
+{"name": "02148"}
+{"name": "02149"}
+{"name": "02150"}
+{"name": "02151"}
+{"name": "02152"}
+{"name": "02153"}
+{"name": "02154"}
+{"name": "02155"}
+{"name": "02156"}
+{"name": "02157"}
+{"name": "02158"}
+{"name": "02159"}
+{"name": "02160"}
+{"name": "02161"}
+{"name": "02162"}
+{"name": "02163"}
+{"name": "02164"}
+{"name": "02165"}
+{"name": "02166"}
+{"name": "02167"}
+{"name": "02168"}
+{"name": "02169"}
+{"name": "02170"}
+{"name": "02171"}
+{"name": "02172"}
+{"name": "02173"}
+{"name": "02174"}
+{"name": "02175"}
+{"name": "02176"}
+{"name": "02177"}
+{"name": "02178"}
+{"name": "02179"}
+{"name": "02180"}
+{"name": "02181"}
+{"name": "02182"}
+{"name": "02183"}
+{"name": "02184"}
+{"name": "02185"}
+{"name": "02186"}
+{"name": "02187"}
+{"name": "02188"}
+{"name": "02189"}
+{"name": "02190"}
+{"name": "02191"}
+{"name": "02192"}
+{"name": "02193"}
+{"name": "02194"}
+{"name": "02195"}
+{"name": "02196"}
+{"name": "02197"}
+{"name": "02198"}
+{"name": "02199"}
+{"name": "02200"}
+{"name": "02201"}
+{"name": "02202"}
+{"name": "02203"}
+{"name": "02204"}
+{"name": "02205"}
+{"name": "02206"}
+{"name": "02207"}
+{"name": "02208"}
+{"name": "02209"}
+{"name": "02210"}
+{"name": "02211"}
+{"name": "02212"}
+{"name": "02213"}
+{"name": "02214"}
+{"name": "02215"}
+{"name": "02216"}
+{"name": "02217"}
+{"name": "02218"}
+{"name": "02219"}
+{"name": "02220"}
+{"name": "02221"}
+{"name": "02222"}
+{"name": "02223"}
+{"name": "02224"}
+{"name": "02225"}
+{"name": "02226"}
+{"name": "02227"}
+{"name": "02228"}
+{"name": "02229"}
+{"name": "02230"}
+{"name": "02231"}
+{"name": "02232"}
+{"name": "02233"}
+{"name": "02234"}
+{"name": "02235"}
+{"name": "02236"}
+{"name": "02237"}
+{"name": "02238"}
+{"name": "02239"}
+{"name": "02240"}
+{"name": "02241"}
+{"name": "02242"}
+{"name": "02243"}
+{"name": "02244"}
+{"name": "02245"}
+{"name": "02246"}
+{"name": "02247"}
+{"name": "02248"}
+{"name": "02249"}
+{"name": "02250"}
+{"name": "02251"}
+{"name": "02252"}
+{"name": "02253"}
+{"name": "02254"}
+{"name": "02255"}
+{"name": "02256"}
+{"name": "02257"}
+{"name": "02258"}
+{"name": "02259"}
+{"name": "02260"}
+{"name": "02261"}
+{"name": "02262"}
+{"name": "02263"}
+{"name": "02264"}
+{"name": "02265"}
+{"name": "02266"}
+{"name": "02267"}
+{"name": "02268"}
+{"name": "02269"}
+{"name": "02270"}
+{"name": "02271"}
+{"name": "02272"}
+{"name": "02273"}
+{"name": "02274"}
+{"name": "02275"}
+{"name": "02276"}
+{"name": "02277"}
+{"name": "02278"}
+{"name": "02279"}
+{"name": "02280"}
+{"name": "02281"}
+{"name": "02282"}
+{"name": "02283"}
+{"name": "02284"}
+{"name": "02285"}
+{"name": "02286"}
+{"name": "02287"}
+{"name": "02288"}
+{"name": "02289"}
+{"name": "02290"}
+{"name": "02291"}
+{"name": "02292"}
+{"name": "02293"}
+{"name": "02294"}
+{"name": "02295"}
+{"name": "02296"}
+{"name": "02297"}
+{"name": "02298"}
+{"name": "02299"}
+{"name": "02300"}
+{"name": "02301"}
+{"name": "02302"}
+{"name": "02303"}
+{"name": "02304"}
+{"name": "02305"}
+{"name": "02306"}
+{"name": "02307"}
+{"name": "02308"}
+{"name": "02309"}
+{"name": "02310"}
+{"name": "02311"}
+{"name": "02312"}
+{"name": "02313"}
+{"name": "02314"}
+{"name": "02315"}
+{"name": "02316"}
+{"name": "02317"}
+{"name": "02318"}
+{"name": "02319"}
+{"name": "02320"}
+{"name": "02321"}
+{"name": "02322"}
+{"name": "02323"}
+{"name": "02324"}
+{"name": "02325"}
+{"name": "02326"}
+{"name": "02327"}
+{"name": "02328"}
+{"name": "02329"}
+{"name": "02330"}
+{"name": "02331"}
+{"name": "02332"}
+{"name": "02333"}
+{"name": "02334"}
+{"name": "02335"}
+{"name": "02336"}
+{"name": "02337"}
+{"name": "02338"}
+{"name": "02339"}
+{"name": "02340"}
+{"name": "02341"}
+{"name": "02342"}
+{"name": "02343"}
+{"name": "02344"}
+{"name": "02345"}
+{"name": "02346"}
+{"name": "02347"}
+{"name": "02348"}
+{"name": "02349"}
+{"name": "02350"}
+{"name": "02351"}
+{"name": "02352"}
+{"name": "02353"}
+{"name": "02354"}
+{"name": "02355"}
+{"name": "02356"}
+{"name": "02357"}
+{"name": "02358"}
+{"name": "02359"}
+{"name": "02360"}
+{"name": "02361"}
+{"name": "02362"}
+{"name": "02363"}
+{"name": "02364"}
+{"name": "02365"}
+{"name": "02366"}
+{"name": "02367"}
+{"name": "02368"}
+{"name": "02369"}
+{"name": "02370"}
+{"name": "02371"}
+{"name": "02372"}
+{"name": "02373"}
+{"name": "02374"}
+{"name": "02375"}
+{"name": "02376"}
+{"name": "02377"}
+{"name": "02378"}
+{"name": "02379"}
+{"name": "02380"}
+{"name": "02381"}
+{"name": "02382"}
+{"name": "02383"}
+{"name": "02384"}
+{"name": "02385"}
+{"name": "02386"}
+{"name": "02387"}
+{"name": "02388"}
+{"name": "02389"}
+{"name": "02390"}
+{"name": "02391"}
+{"name": "02392"}
+{"name": "02393"}
+{"name": "02394"}
+{"name": "02395"}
+{"name": "02396"}
+{"name": "02397"}
+{"name": "02398"}
+{"name": "02399"}
+{"name": "02400"}
+{"name": "02401"}
+{"name": "02402"}
+{"name": "02403"}
+{"name": "02404"}
+{"name": "02405"}
+{"name": "02406"}
+{"name": "02407"}
+{"name": "02408"}
+{"name": "02409"}
+{"name": "02410"}
+{"name": "02411"}
+{"name": "02412"}
+{"name": "02413"}
+{"name": "02414"}
+{"name": "02415"}
+{"name": "02416"}
+{"name": "02417"}
+{"name": "02418"}
+{"name": "02419"}
+{"name": "02420"}
+{"name": "02421"}
+{"name": "02422"}
+{"name": "02423"}
+{"name": "02424"}
+{"name": "02425"}
+{"name": "02426"}
+{"name": "02427"}
+{"name": "02428"}
+{"name": "02429"}
+{"name": "02430"}
+{"name": "02431"}
+{"name": "02432"}
+{"name": "02433"}
+{"name": "02434"}
+{"name": "02435"}
+{"name": "02436"}
+{"name": "02437"}
+{"name": "02438"}
+{"name": "02439"}
+{"name": "02440"}
+{"name": "02441"}
+{"name": "02442"}
+{"name": "02443"}
+{"name": "02444"}
+{"name": "02445"}
+{"name": "02446"}
+{"name": "02447"}
+{"name": "02448"}
+{"name": "02449"}
+{"name": "02450"}
+{"name": "02451"}
+{"name": "02452"}
+{"name": "02453"}
+{"name": "02454"}
+{"name": "02455"}
+{"name": "02456"}
+{"name": "02457"}
+{"name": "02458"}
+{"name": "02459"}
+{"name": "02460"}
+{"name": "02461"}
+{"name": "02462"}
+{"name": "02463"}
+{"name": "02464"}
+{"name": "02465"}
+{"name": "02466"}
+{"name": "02467"}
+{"name": "02468"}
+{"name": "02469"}
+{"name": "02470"}
+{"name": "02471"}
+{"name": "02472"}
+{"name": "02473"}
+{"name": "02474"}
+{"name": "02475"}
+{"name": "02476"}
+{"name": "02477"}
+{"name": "02478"}
+{"name": "02479"}
+{"name": "02480"}
+{"name": "02481"}
+{"name": "02482"}
+{"name": "02483"}
+{"name": "02484"}
+{"name": "02485"}
+{"name": "02486"}
+{"name": "02487"}
+{"name": "02488"}
+{"name": "02489"}
+{"name": "02490"}
+{"name": "02491"}
+{"name": "02492"}
+{"name": "02493"}
+{"name": "02494"}
+{"name": "02495"}
+{"name": "02496"}
+{"name": "02497"}
+{"name": "02498"}
+{"name": "02499"}
+{"name": "02500"}
+{"name": "02501"}
+{"name": "02502"}
+{"name": "02503"}
+{"name": "02504"}
+{"name": "02505"}
+{"name": "02506"}
+{"name": "02507"}
+{"name": "02508"}
+{"name": "02509"}
+{"name": "02510"}
+{"name": "02511"}
+{"name": "02512"}
+{"name": "02513"}
+{"name": "02514"}
+{"name": "02515"}
+{"name": "02516"}
+{"name": "02517"}
+{"name": "02518"}
+{"name": "02519"}
+{"name": "02520"}
+{"name": "02521"}
+{"name": "02522"}
+{"name": "02523"}
+{"name": "02524"}
+{"name": "02525"}
+{"name": "02526"}
+{"name": "02527"}
+{"name": "02528"}
+{"name": "02529"}
+{"name": "02530"}
+{"name": "02531"}
+{"name": "02532"}
+{"name": "02533"}
+{"name": "02534"}
+{"name": "02535"}
+{"name": "02536"}
+{"name": "02537"}
+{"name": "02538"}
+{"name": "02539"}
+{"name": "02540"}
+{"name": "02541"}
+{"name": "02542"}
+{"name": "02543"}
+{"name": "02544"}
+{"name": "02545"}
+{"name": "02546"}
+{"name": "02547"}
+{"name": "02548"}
+{"name": "02549"}
+{"name": "02550"}
+{"name": "02551"}
+{"name": "02552"}
+{"name": "02553"}
+{"name": "02554"}
+{"name": "02555"}
+{"name": "02556"}
+{"name": "02557"}
+{"name": "02558"}
+{"name": "02559"}
+{"name": "02560"}
+{"name": "02561"}
+{"name": "02562"}
+{"name": "02563"}
+{"name": "02564"}
+{"name": "02565"}
+{"name": "02566"}
+{"name": "02567"}
+{"name": "02568"}
+{"name": "02569"}
+{"name": "02570"}
+{"name": "02571"}
+{"name": "02572"}
+{"name": "02573"}
+{"name": "02574"}
+{"name": "02575"}
+{"name": "02576"}
+{"name": "02577"}
+{"name": "02578"}
+{"name": "02579"}
+{"name": "02580"}
+{"name": "02581"}
+{"name": "02582"}
+{"name": "02583"}
+{"name": "02584"}
+{"name": "02585"}
+{"name": "02586"}
+{"name": "02587"}
+{"name": "02588"}
+{"name": "02589"}
+{"name": "02590"}
+{"name": "02591"}
+{"name": "02592"}
+{"name": "02593"}
+{"name": "02594"}
+{"name": "02595"}
+{"name": "02596"}
+{"name": "02597"}
+{"name": "02598"}
+{"name": "02599"}
+{"name": "02600"}
+{"name": "02601"}
+{"name": "02602"}
+{"name": "02603"}
+{"name": "02604"}
+{"name": "02605"}
+{"name": "02606"}
+{"name": "02607"}
+{"name": "02608"}
+{"name": "02609"}
+{"name": "02610"}
+{"name": "02611"}
+{"name": "02612"}
+{"name": "02613"}
+{"name": "02614"}
+{"name": "02615"}
+{"name": "02616"}
+{"name": "02617"}
+{"name": "02618"}
+{"name": "02619"}
+{"name": "02620"}
+{"name": "02621"}
+{"name": "02622"}
+{"name": "02623"}
+{"name": "02624"}
+{"name": "02625"}
+{"name": "02626"}
+{"name": "02627"}
+{"name": "02628"}
+{"name": "02629"}
+{"name": "02630"}
+{"name": "02631"}
+{"name": "02632"}
+{"name": "02633"}
+{"name": "02634"}
+{"name": "02635"}
+{"name": "02636"}
+{"name": "02637"}
+{"name": "02638"}
+{"name": "02639"}
+{"name": "02640"}
+{"name": "02641"}
+{"name": "02642"}
+{"name": "02643"}
+{"name": "02644"}
+{"name": "02645"}
+{"name": "02646"}
+{"name": "02647"}
+{"name": "02648"}
+{"name": "02649"}
+{"name": "02650"}
+{"name": "02651"}
+{"name": "02652"}
+{"name": "02653"}
+{"name": "02654"}
+{"name": "02655"}
+{"name": "02656"}
+{"name": "02657"}
+{"name": "02658"}
+{"name": "02659"}
+{"name": "02660"}
+{"name": "02661"}
+{"name": "02662"}
+{"name": "02663"}
+{"name": "02664"}
+{"name": "02665"}
+{"name": "02666"}
+{"name": "02667"}
+{"name": "02668"}
+{"name": "02669"}
+{"name": "02670"}
+{"name": "02671"}
+{"name": "02672"}
+{"name": "02673"}
+{"name": "02674"}
+{"name": "02675"}
+{"name": "02676"}
+{"name": "02677"}
+{"name": "02678"}
+{"name": "02679"}
+{"name": "02680"}
+{"name": "02681"}
+{"name": "02682"}
+{"name": "02683"}
+{"name": "02684"}
+{"name": "02685"}
+{"name": "02686"}
+{"name": "02687"}
+{"name": "02688"}
+{"name": "02689"}
+{"name": "02690"}
+{"name": "02691"}
+{"name": "02692"}
+{"name": "02693"}
+{"name": "02694"}
+{"name": "02695"}
+{"name": "02696"}
+{"name": "02697"}
+{"name": "02698"}
+{"name": "02699"}
+{"name": "02700"}
+{"name": "02701"}
+{"name": "02702"}
+{"name": "02703"}
+{"name": "02704"}
+{"name": "02705"}
+{"name": "02706"}
+{"name": "02707"}
+{"name": "02708"}
+{"name": "02709"}
+{"name": "02710"}
+{"name": "02711"}
+{"name": "02712"}
+{"name": "02713"}
+{"name": "02714"}
+{"name": "02715"}
+{"name": "02716"}
+{"name": "02717"}
+{"name": "02718"}
+{"name": "02719"}
+{"name": "02720"}
+{"name": "02721"}
+{"name": "02722"}
+{"name": "02723"}
+{"name": "02724"}
+{"name": "02725"}
+{"name": "02726"}
+{"name": "02727"}
+{"name": "02728"}
+{"name": "02729"}
+{"name": "02730"}
+{"name": "02731"}
+{"name": "02732"}
+{"name": "02733"}
+{"name": "02734"}
+{"name": "02735"}
+{"name": "02736"}
+{"name": "02737"}
+{"name": "02738"}
+{"name": "02739"}
+{"name": "02740"}
+{"name": "02741"}
+{"name": "02742"}
+{"name": "02743"}
+{"name": "02744"}
+{"name": "02745"}
+{"name": "02746"}
+{"name": "02747"}
+{"name": "02748"}
+{"name": "02749"}
+{"name": "02750"}
+{"name": "02751"}
+{"name": "02752"}
+{"name": "02753"}
+{"name": "02754"}
+{"name": "02755"}
+{"name": "02756"}
+{"name": "02757"}
+{"name": "02758"}
+{"name": "02759"}
+{"name": "02760"}
+{"name": "02761"}
+{"name": "02762"}
+{"name": "02763"}
+{"name": "02764"}
+{"name": "02765"}
+{"name": "02766"}
+{"name": "02767"}
+{"name": "02768"}
+{"name": "02769"}
+{"name": "02770"}
+{"name": "02771"}
+{"name": "02772"}
+{"name": "02773"}
+{"name": "02774"}
+{"name": "02775"}
+{"name": "02776"}
+{"name": "02777"}
+{"name": "02778"}
+{"name": "02779"}
+{"name": "02780"}
+{"name": "02781"}
+{"name": "02782"}
+{"name": "02783"}
+{"name": "02784"}
+{"name": "02785"}
+{"name": "02786"}
+{"name": "02787"}
+{"name": "02788"}
+{"name": "02789"}
+{"name": "02790"}
+{"name": "02791"}
+{"name": "02792"}
+{"name": "02793"}
+{"name": "02794"}
+{"name": "02795"}
+{"name": "02796"}
+{"name": "02797"}
+{"name": "02798"}
+{"name": "02799"}
+{"name": "02800"}
+{"name": "02801"}
+{"name": "02802"}
+{"name": "02803"}
+{"name": "02804"}
+{"name": "02805"}
+{"name": "02806"}
+{"name": "02807"}
+{"name": "02808"}
+{"name": "02809"}
+{"name": "02810"}
+{"name": "02811"}
+{"name": "02812"}
+{"name": "02813"}
+{"name": "02814"}
+{"name": "02815"}
+{"name": "02816"}
+{"name": "02817"}
+{"name": "02818"}
+{"name": "02819"}
+{"name": "02820"}
+{"name": "02821"}
+{"name": "02822"}
+{"name": "02823"}
+{"name": "02824"}
+{"name": "02825"}
+{"name": "02826"}
+{"name": "02827"}
+{"name": "02828"}
+{"name": "02829"}
+{"name": "02830"}
+{"name": "02831"}
+{"name": "02832"}
+{"name": "02833"}
+{"name": "02834"}
+{"name": "02835"}
+{"name": "02836"}
+{"name": "02837"}
+{"name": "02838"}
+{"name": "02839"}
+{"name": "02840"}
+{"name": "02841"}
+{"name": "02842"}
+{"name": "02843"}
+{"name": "02844"}
+{"name": "02845"}
+{"name": "02846"}
+{"name": "02847"}
+{"name": "02848"}
+{"name": "02849"}
+{"name": "02850"}
+{"name": "02851"}
+{"name": "02852"}
+{"name": "02853"}
+{"name": "02854"}
+{"name": "02855"}
+{"name": "02856"}
+{"name": "02857"}
+{"name": "02858"}
+{"name": "02859"}
+{"name": "02860"}
+{"name": "02861"}
+{"name": "02862"}
+{"name": "02863"}
+{"name": "02864"}
+{"name": "02865"}
+{"name": "02866"}
+{"name": "02867"}
+{"name": "02868"}
+{"name": "02869"}
+{"name": "02870"}
+{"name": "02871"}
+{"name": "02872"}
+{"name": "02873"}
+{"name": "02874"}
+{"name": "02875"}
+{"name": "02876"}
+{"name": "02877"}
+{"name": "02878"}
+{"name": "02879"}
+{"name": "02880"}
+{"name": "02881"}
+{"name": "02882"}
+{"name": "02883"}
+{"name": "02884"}
+{"name": "02885"}
+{"name": "02886"}
+{"name": "02887"}
+{"name": "02888"}
+{"name": "02889"}
+{"name": "02890"}
+{"name": "02891"}
+{"name": "02892"}
+{"name": "02893"}
+{"name": "02894"}
+{"name": "02895"}
+{"name": "02896"}
+{"name": "02897"}
+{"name": "02898"}
+{"name": "02899"}
+{"name": "02900"}
+{"name": "02901"}
+{"name": "02902"}
+{"name": "02903"}
+{"name": "02904"}
+{"name": "02905"}
+{"name": "02906"}
+{"name": "02907"}
+{"name": "02908"}
+{"name": "02909"}
+{"name": "02910"}
+{"name": "02911"}
+{"name": "02912"}
+{"name": "02913"}
+{"name": "02914"}
+{"name": "02915"}
+{"name": "02916"}
+{"name": "02917"}
+{"name": "02918"}
+{"name": "02919"}
+{"name": "02920"}
+{"name": "02921"}
+{"name": "02922"}
+{"name": "02923"}
+{"name": "02924"}
+{"name": "02925"}
+{"name": "02926"}
+{"name": "02927"}
+{"name": "02928"}
+{"name": "02929"}
+{"name": "02930"}
+{"name": "02931"}
+{"name": "02932"}
+{"name": "02933"}
+{"name": "02934"}
+{"name": "02935"}
+{"name": "02936"}
+{"name": "02937"}
+{"name": "02938"}
+{"name": "02939"}
+{"name": "02940"}
+{"name": "02941"}
+{"name": "02942"}
+{"name": "02943"}
+{"name": "02944"}
+{"name": "02945"}
+{"name": "02946"}
+{"name": "02947"}
+{"name": "02948"}
+{"name": "02949"}
+{"name": "02950"}
+{"name": "02951"}
+{"name": "02952"}
+{"name": "02953"}
+{"name": "02954"}
+{"name": "02955"}
+{"name": "02956"}
+{"name": "02957"}
+{"name": "02958"}
+{"name": "02959"}
+{"name": "02960"}
+{"name": "02961"}
+{"name": "02962"}
+{"name": "02963"}
+{"name": "02964"}
+{"name": "02965"}
+{"name": "02966"}
+{"name": "02967"}
+{"name": "02968"}
+{"name": "02969"}
+{"name": "02970"}
+{"name": "02971"}
+{"name": "02972"}
+{"name": "02973"}
+{"name": "02974"}
+{"name": "02975"}
+{"name": "02976"}
+{"name": "02977"}
+{"name": "02978"}
+{"name": "02979"}
+{"name": "02980"}
+{"name": "02981"}
+{"name": "02982"}
+{"name": "02983"}
+{"name": "02984"}
+{"name": "02985"}
+{"name": "02986"}
+{"name": "02987"}
+{"name": "02988"}
+{"name": "02989"}
+{"name": "02990"}
+{"name": "02991"}
+{"name": "02992"}
+{"name": "02993"}
+{"name": "02994"}
+{"name": "02995"}
+{"name": "02996"}
+{"name": "02997"}
+{"name": "02998"}
+{"name": "02999"}
+{"name": "03000"}
+{"name": "03001"}
+{"name": "03002"}
+{"name": "03003"}
+{"name": "03004"}
+{"name": "03005"}
+{"name": "03006"}
+{"name": "03007"}
+{"name": "03008"}
+{"name": "03009"}
+{"name": "03010"}
+{"name": "03011"}
+{"name": "03012"}
+{"name": "03013"}
+{"name": "03014"}
+{"name": "03015"}
+{"name": "03016"}
+{"name": "03017"}
+{"name": "03018"}
+{"name": "03019"}
+{"name": "03020"}
+{"name": "03021"}
+{"name": "03022"}
+{"name": "03023"}
+{"name": "03024"}
+{"name": "03025"}
+{"name": "03026"}
+{"name": "03027"}
+{"name": "03028"}
+{"name": "03029"}
+{"name": "03030"}
+{"name": "03031"}
+{"name": "03032"}
+{"name": "03033"}
+{"name": "03034"}
+{"name": "03035"}
+{"name": "03036"}
+{"name": "03037"}
+{"name": "03038"}
+{"name": "03039"}
+{"name": "03040"}
+{"name": "03041"}
+{"name": "03042"}
+{"name": "03043"}
+{"name": "03044"}
+{"name": "03045"}
+{"name": "03046"}
+{"name": "03047"}
+{"name": "03048"}
+{"name": "03049"}
+{"name": "03050"}
+{"name": "03051"}
+{"name": "03052"}
+{"name": "03053"}
+{"name": "03054"}
+{"name": "03055"}
+{"name": "03056"}
+{"name": "03057"}
+{"name": "03058"}
+{"name": "03059"}
+{"name": "03060"}
+{"name": "03061"}
+{"name": "03062"}
+{"name": "03063"}
+{"name": "03064"}
+{"name": "03065"}
+{"name": "03066"}
+{"name": "03067"}
+{"name": "03068"}
+{"name": "03069"}
+{"name": "03070"}
+{"name": "03071"}
+{"name": "03072"}
+{"name": "03073"}
+{"name": "03074"}
+{"name": "03075"}
+{"name": "03076"}
+{"name": "03077"}
+{"name": "03078"}
+{"name": "03079"}
+{"name": "03080"}
+{"name": "03081"}
+{"name": "03082"}
+{"name": "03083"}
+{"name": "03084"}
+{"name": "03085"}
+{"name": "03086"}
+{"name": "03087"}
+{"name": "03088"}
+{"name": "03089"}
+{"name": "03090"}
+{"name": "03091"}
+{"name": "03092"}
+{"name": "03093"}
+{"name": "03094"}
+{"name": "03095"}
+{"name": "03096"}
+{"name": "03097"}
+{"name": "03098"}
+{"name": "03099"}
+{"name": "03100"}
+{"name": "03101"}
+{"name": "03102"}
+{"name": "03103"}
+{"name": "03104"}
+{"name": "03105"}
+{"name": "03106"}
+{"name": "03107"}
+{"name": "03108"}
+{"name": "03109"}
+{"name": "03110"}
+{"name": "03111"}
+{"name": "03112"}
+{"name": "03113"}
+{"name": "03114"}
+{"name": "03115"}
+{"name": "03116"}
+{"name": "03117"}
+{"name": "03118"}
+{"name": "03119"}
+{"name": "03120"}
+{"name": "03121"}
+{"name": "03122"}
+{"name": "03123"}
+{"name": "03124"}
+{"name": "03125"}
+{"name": "03126"}
+{"name": "03127"}
+{"name": "03128"}
+{"name": "03129"}
+{"name": "03130"}
+{"name": "03131"}
+{"name": "03132"}
+{"name": "03133"}
+{"name": "03134"}
+{"name": "03135"}
+{"name": "03136"}
+{"name": "03137"}
+{"name": "03138"}
+{"name": "03139"}
+{"name": "03140"}
+{"name": "03141"}
+{"name": "03142"}
+{"name": "03143"}
+{"name": "03144"}
+{"name": "03145"}
+{"name": "03146"}
+{"name": "03147"}
+{"name": "03148"}
+{"name": "03149"}
+{"name": "03150"}
+{"name": "03151"}
+{"name": "03152"}
+{"name": "03153"}
+{"name": "03154"}
+{"name": "03155"}
+{"name": "03156"}
+{"name": "03157"}
+{"name": "03158"}
+{"name": "03159"}
+{"name": "03160"}
+{"name": "03161"}
+{"name": "03162"}
+{"name": "03163"}
+{"name": "03164"}
+{"name": "03165"}
+{"name": "03166"}
+{"name": "03167"}
+{"name": "03168"}
+{"name": "03169"}
+{"name": "03170"}
+{"name": "03171"}
+{"name": "03172"}
+{"name": "03173"}
+{"name": "03174"}
+{"name": "03175"}
+{"name": "03176"}
+{"name": "03177"}
+{"name": "03178"}
+{"name": "03179"}
+{"name": "03180"}
+{"name": "03181"}
+{"name": "03182"}
+{"name": "03183"}
+{"name": "03184"}
+{"name": "03185"}
+{"name": "03186"}
+{"name": "03187"}
+{"name": "03188"}
+{"name": "03189"}
+{"name": "03190"}
+{"name": "03191"}
+{"name": "03192"}
+{"name": "03193"}
+{"name": "03194"}
+{"name": "03195"}
+{"name": "03196"}
+{"name": "03197"}
+{"name": "03198"}
+{"name": "03199"}
+{"name": "03200"}
+{"name": "03201"}
+{"name": "03202"}
+{"name": "03203"}
+{"name": "03204"}
+{"name": "03205"}
+{"name": "03206"}
+{"name": "03207"}
+{"name": "03208"}
+{"name": "03209"}
+{"name": "03210"}
+{"name": "03211"}
+{"name": "03212"}
+{"name": "03213"}
+{"name": "03214"}
+{"name": "03215"}
+{"name": "03216"}
+{"name": "03217"}
+{"name": "03218"}
+{"name": "03219"}
+{"name": "03220"}
+{"name": "03221"}
+{"name": "03222"}
+{"name": "03223"}
+{"name": "03224"}
+{"name": "03225"}
+{"name": "03226"}
+{"name": "03227"}
+{"name": "03228"}
+{"name": "03229"}
+{"name": "03230"}
+{"name": "03231"}
+{"name": "03232"}
+{"name": "03233"}
+{"name": "03234"}
+{"name": "03235"}
+{"name": "03236"}
+{"name": "03237"}
+{"name": "03238"}
+{"name": "03239"}
+{"name": "03240"}
+{"name": "03241"}
+{"name": "03242"}
+{"name": "03243"}
+{"name": "03244"}
+{"name": "03245"}
+{"name": "03246"}
+{"name": "03247"}
+{"name": "03248"}
+{"name": "03249"}
+{"name": "03250"}
+{"name": "03251"}
+{"name": "03252"}
+{"name": "03253"}
+{"name": "03254"}
+{"name": "03255"}
+{"name": "03256"}
+{"name": "03257"}
+{"name": "03258"}
+{"name": "03259"}
+{"name": "03260"}
+{"name": "03261"}
+{"name": "03262"}
+{"name": "03263"}
+{"name": "03264"}
+{"name": "03265"}
+{"name": "03266"}
+{"name": "03267"}
+{"name": "03268"}
+{"name": "03269"}
+{"name": "03270"}
+{"name": "03271"}
+{"name": "03272"}
+{"name": "03273"}
+{"name": "03274"}
+{"name": "03275"}
+{"name": "03276"}
+{"name": "03277"}
+{"name": "03278"}
+{"name": "03279"}
+{"name": "03280"}
+{"name": "03281"}
+{"name": "03282"}
+{"name": "03283"}
+{"name": "03284"}
+{"name": "03285"}
+{"name": "03286"}
+{"name": "03287"}
+{"name": "03288"}
+{"name": "03289"}
+{"name": "03290"}
+{"name": "03291"}
+{"name": "03292"}
+{"name": "03293"}
+{"name": "03294"}
+{"name": "03295"}
+{"name": "03296"}
+{"name": "03297"}
+{"name": "03298"}
+{"name": "03299"}
+{"name": "03300"}
+{"name": "03301"}
+{"name": "03302"}
+{"name": "03303"}
+{"name": "03304"}
+{"name": "03305"}
+{"name": "03306"}
+{"name": "03307"}
+{"name": "03308"}
+{"name": "03309"}
+{"name": "03310"}
+{"name": "03311"}
+{"name": "03312"}
+{"name": "03313"}
+{"name": "03314"}
+{"name": "03315"}
+{"name": "03316"}
+{"name": "03317"}
+{"name": "03318"}
+{"name": "03319"}
+{"name": "03320"}
+{"name": "03321"}
+{"name": "03322"}
+{"name": "03323"}
+{"name": "03324"}
+{"name": "03325"}
+{"name": "03326"}
+{"name": "03327"}
+{"name": "03328"}
+{"name": "03329"}
+{"name": "03330"}
+{"name": "03331"}
+{"name": "03332"}
+{"name": "03333"}
+{"name": "03334"}
+{"name": "03335"}
+{"name": "03336"}
+{"name": "03337"}
+{"name": "03338"}
+{"name": "03339"}
+{"name": "03340"}
+{"name": "03341"}
+{"name": "03342"}
+{"name": "03343"}
+{"name": "03344"}
+{"name": "03345"}
+{"name": "03346"}
+{"name": "03347"}
+{"name": "03348"}
+{"name": "03349"}
+{"name": "03350"}
+{"name": "03351"}
+{"name": "03352"}
+{"name": "03353"}
+{"name": "03354"}
+{"name": "03355"}
+{"name": "03356"}
+{"name": "03357"}
+{"name": "03358"}
+{"name": "03359"}
+{"name": "03360"}
+{"name": "03361"}
+{"name": "03362"}
+{"name": "03363"}
+{"name": "03364"}
+{"name": "03365"}
+{"name": "03366"}
+{"name": "03367"}
+{"name": "03368"}
+{"name": "03369"}
+{"name": "03370"}
+{"name": "03371"}
+{"name": "03372"}
+{"name": "03373"}
+{"name": "03374"}
+{"name": "03375"}
+{"name": "03376"}
+{"name": "03377"}
+{"name": "03378"}
+{"name": "03379"}
+{"name": "03380"}
+{"name": "03381"}
+{"name": "03382"}
+{"name": "03383"}
+{"name": "03384"}
+{"name": "03385"}
+{"name": "03386"}
+{"name": "03387"}
+{"name": "03388"}
+{"name": "03389"}
+{"name": "03390"}
+{"name": "03391"}
+{"name": "03392"}
+{"name": "03393"}
+{"name": "03394"}
+{"name": "03395"}
+{"name": "03396"}
+{"name": "03397"}
+{"name": "03398"}
+{"name": "03399"}
+{"name": "03400"}
+{"name": "03401"}
+{"name": "03402"}
+{"name": "03403"}
+{"name": "03404"}
+{"name": "03405"}
+{"name": "03406"}
+{"name": "03407"}
+{"name": "03408"}
+{"name": "03409"}
+{"name": "03410"}
+{"name": "03411"}
+{"name": "03412"}
+{"name": "03413"}
+{"name": "03414"}
+{"name": "03415"}
+{"name": "03416"}
+{"name": "03417"}
+{"name": "03418"}
+{"name": "03419"}
+{"name": "03420"}
+{"name": "03421"}
+{"name": "03422"}
+{"name": "03423"}
+{"name": "03424"}
+{"name": "03425"}
+{"name": "03426"}
+{"name": "03427"}
+{"name": "03428"}
+{"name": "03429"}
+{"name": "03430"}
+{"name": "03431"}
+{"name": "03432"}
+{"name": "03433"}
+{"name": "03434"}
+{"name": "03435"}
+{"name": "03436"}
+{"name": "03437"}
+{"name": "03438"}
+{"name": "03439"}
+{"name": "03440"}
+{"name": "03441"}
+{"name": "03442"}
+{"name": "03443"}
+{"name": "03444"}
+{"name": "03445"}
+{"name": "03446"}
+{"name": "03447"}
+{"name": "03448"}
+{"name": "03449"}
+{"name": "03450"}
+{"name": "03451"}
+{"name": "03452"}
+{"name": "03453"}
+{"name": "03454"}
+{"name": "03455"}
+{"name": "03456"}
+{"name": "03457"}
+{"name": "03458"}
+{"name": "03459"}
+{"name": "03460"}
+{"name": "03461"}
+{"name": "03462"}
+{"name": "03463"}
+{"name": "03464"}
+{"name": "03465"}
+{"name": "03466"}
+{"name": "03467"}
+{"name": "03468"}
+{"name": "03469"}
+{"name": "03470"}
+{"name": "03471"}
+{"name": "03472"}
+{"name": "03473"}
+{"name": "03474"}
+{"name": "03475"}
+{"name": "03476"}
+{"name": "03477"}
+{"name": "03478"}
+{"name": "03479"}
+{"name": "03480"}
+{"name": "03481"}
+{"name": "03482"}
+{"name": "03483"}
+{"name": "03484"}
+{"name": "03485"}
+{"name": "03486"}
+{"name": "03487"}
+{"name": "03488"}
+{"name": "03489"}
+{"name": "03490"}
+{"name": "03491"}
+{"name": "03492"}
+{"name": "03493"}
+{"name": "03494"}
+{"name": "03495"}
+{"name": "03496"}
+{"name": "03497"}
+{"name": "03498"}
+{"name": "03499"}
+{"name": "03500"}
+{"name": "03501"}
+{"name": "03502"}
+{"name": "03503"}
+{"name": "03504"}
+{"name": "03505"}
+{"name": "03506"}
+{"name": "03507"}
+{"name": "03508"}
+{"name": "03509"}
+{"name": "03510"}
+{"name": "03511"}
+{"name": "03512"}
+{"name": "03513"}
+{"name": "03514"}
+{"name": "03515"}
+{"name": "03516"}
+{"name": "03517"}
+{"name": "03518"}
+{"name": "03519"}
+{"name": "03520"}
+{"name": "03521"}
+{"name": "03522"}
+{"name": "03523"}
+{"name": "03524"}
+{"name": "03525"}
+{"name": "03526"}
+{"name": "03527"}
+{"name": "03528"}
+{"name": "03529"}
+{"name": "03530"}
+{"name": "03531"}
+{"name": "03532"}
+{"name": "03533"}
+{"name": "03534"}
+{"name": "03535"}
+{"name": "03536"}
+{"name": "03537"}
+{"name": "03538"}
+{"name": "03539"}
+{"name": "03540"}
+{"name": "03541"}
+{"name": "03542"}
+{"name": "03543"}
+{"name": "03544"}
+{"name": "03545"}
+{"name": "03546"}
+{"name": "03547"}
+{"name": "03548"}
+{"name": "03549"}
+{"name": "03550"}
+{"name": "03551"}
+{"name": "03552"}
+{"name": "03553"}
+{"name": "03554"}
+{"name": "03555"}
+{"name": "03556"}
+{"name": "03557"}
+{"name": "03558"}
+{"name": "03559"}
+{"name": "03560"}
+{"name": "03561"}
+{"name": "03562"}
+{"name": "03563"}
+{"name": "03564"}
+{"name": "03565"}
+{"name": "03566"}
+{"name": "03567"}
+{"name": "03568"}
+{"name": "03569"}
+{"name": "03570"}
+{"name": "03571"}
+{"name": "03572"}
+{"name": "03573"}
+{"name": "03574"}
+{"name": "03575"}
+{"name": "03576"}
+{"name": "03577"}
+{"name": "03578"}
+{"name": "03579"}
+{"name": "03580"}
+{"name": "03581"}
+{"name": "03582"}
+{"name": "03583"}
+{"name": "03584"}
+{"name": "03585"}
+{"name": "03586"}
+{"name": "03587"}
+{"name": "03588"}
+{"name": "03589"}
+{"name": "03590"}
+{"name": "03591"}
+{"name": "03592"}
+{"name": "03593"}
+{"name": "03594"}
+{"name": "03595"}
+{"name": "03596"}
+{"name": "03597"}
+{"name": "03598"}
+{"name": "03599"}
+{"name": "03600"}
+{"name": "03601"}
+{"name": "03602"}
+{"name": "03603"}
+{"name": "03604"}
+{"name": "03605"}
+{"name": "03606"}
+{"name": "03607"}
+{"name": "03608"}
+{"name": "03609"}
+{"name": "03610"}
+{"name": "03611"}
+{"name": "03612"}
+{"name": "03613"}
+{"name": "03614"}
+{"name": "03615"}
+{"name": "03616"}
+{"name": "03617"}
+{"name": "03618"}
+{"name": "03619"}
+{"name": "03620"}
+{"name": "03621"}
+{"name": "03622"}
+{"name": "03623"}
+{"name": "03624"}
+{"name": "03625"}
+{"name": "03626"}
+{"name": "03627"}
+{"name": "03628"}
+{"name": "03629"}
+{"name": "03630"}
+{"name": "03631"}
+{"name": "03632"}
+{"name": "03633"}
+{"name": "03634"}
+{"name": "03635"}
+{"name": "03636"}
+{"name": "03637"}
+{"name": "03638"}
+{"name": "03639"}
+{"name": "03640"}
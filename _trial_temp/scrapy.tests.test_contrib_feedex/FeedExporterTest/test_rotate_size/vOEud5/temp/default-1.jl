@@ -0,0 +1,3641 @@
+{"name": "03641"}
+{"name": "03642"}
+{"name": "03643"}
+{"name": "03644"}
+{"name": "03645"}
+{"name": "03646"}
+{"name": "03647"}
+{"name": "03648"}
+{"name": "03649"}
+{"name": "03650"}
+{"name": "03651"}
+{"name": "03652"}
+{"name": "03653"}
+{"name": "03654"}
+{"name": "03655"}
+{"name": "03656"}
+{"name": "03657"}
+{"name": "03658"}
+{"name": "03659"}
+{"name": "03660"}
+{"name": "03661"}
+{"name": "03662"}
+{"name": "03663"}
+{"name": "03664"}
+{"name": "03665"}
+{"name": "03666"}
+{"name": "03667"}
+{"name": "03668"}
+{"name": "03669"}
+{"name": "03670"}
+{"name": "03671"}
+{"name": "03672"}
+{"name": "03673"}
+{"name": "03674"}
+{"name": "03675"}
+{"name": "03676"}
+{"name": "03677"}
+{"name": "03678"}
+{"name": "03679"}
+{"name": "03680"}
+{"name": "03681"}
+{"name": "03682"}
+{"name": "03683"}
+{"name": "03684"}
+{"name": "03685"}
+{"name": "03686"}
+{"name": "03687"}
+{"name": "03688"}
+{"name": "03689"}
+{"name": "03690"}
+{"name": "03691"}
+{"name": "03692"}
+{"name": "03693"}
+{"name": "03694"}
+{"name": "03695"}
+{"name": "03696"}
+{"name": "03697"}
+{"name": "03698"}
+{"name": "03699"}
+{"name": "03700"}
+{"name": "03701"}
+{"name": "03702"}
+{"name": "03703"}
+{"name": "03704"}
+{"name": "03705"}
+{"name": "03706"}
+{"name": "03707"}
+{"name": "03708"}
+{"name": "03709"}
+{"name": "03710"}
+{"name": "03711"}
+{"name": "03712"}
+{"name": "03713"}
+{"name": "03714"}
+{"name": "03715"}
+{"name": "03716"}
+{"name": "03717"}
+{"name": "03718"}
+{"name": "03719"}
+{"name": "03720"}
+{"name": "03721"}
+{"name": "03722"}
+{"name": "03723"}
+{"name": "03724"}
+{"name": "03725"}
+{"name": "03726"}
+{"name": "03727"}
+{"name": "03728"}
+{"name": "03729"}
+{"name": "03730"}
+{"name": "03731"}
+{"name": "03732"}
+{"name": "03733"}
+{"name": "03734"}
+{"name": "03735"}
+{"name": "03736"}
+{"name": "03737"}
+{"name": "03738"}
+{"name": "03739"}
+{"name": "03740"}
+{"name": "03741"}
+{"name": "03742"}
+{"name": "03743"}
+{"name": "03744"}
+{"name": "03745"}
+{"name": "03746"}
+{"name": "03747"}
+{"name": "03748"}
+{"name": "03749"}
+{"name": "03750"}
+{"name": "03751"}
+{"name": "03752"}
+{"name": "03753"}
+{"name": "03754"}
+{"name": "03755"}
+{"name": "03756"}
+{"name": "03757"}
+{"name": "03758"}
+{"name": "03759"}
+{"name": "03760"}
+{"name": "03761"}
+{"name": "03762"}
+{"name": "03763"}
+{"name": "03764"}
+{"name": "03765"}
+{"name": "03766"}
+{"name": "03767"}
+{"name": "03768"}
+{"name": "03769"}
+{"name": "03770"}
+{"name": "03771"}
+{"name": "03772"}
+{"name": "03773"}
+{"name": "03774"}
+{"name": "03775"}
+{"name": "03776"}
+{"name": "03777"}
+{"name": "03778"}
+{"name": "03779"}
+{"name": "03780"}
+{"name": "03781"}
+{"name": "03782"}
+{"name": "03783"}
+{"name": "03784"}
+{"name": "03785"}
+{"name": "03786"}
+{"name": "03787"}
+{"name": "03788"}
+{"name": "03789"}
+{"name": "03790"}
+{"name": "03791"}
+{"name": "03792"}
+{"name": "03793"}
+{"name": "03794"}
+{"name": "03795"}
+{"name": "03796"}
+{"name": "03797"}
+{"name": "03798"}
+{"name": "03799"}
+{"name": "03800"}
+{"name": "03801"}
+{"name": "03802"}
+{"name": "03803"}
+{"name": "03804"}
+{"name": "03805"}
+{"name": "03806"}
+{"name": "03807"}
+{"name": "03808"}
+{"name": "03809"}
+{"name": "03810"}
+{"name": "03811"}
+{"name": "03812"}
+{"name": "03813"}
+{"name": "03814"}
+{"name": "03815"}
+{"name": "03816"}
+{"name": "03817"}
+{"name": "03818"}
+{"name": "03819"}
+{"name": "03820"}
+{"name": "03821"}
+{"name": "03822"}
+{"name": "03823"}
+{"name": "03824"}
+{"name": "03825"}
+{"name": "03826"}
+{"name": "03827"}
+{"name": "03828"}
+{"name": "03829"}
+{"name": "03830"}
+{"name": "03831"}
+{"name": "03832"}
+{"name": "03833"}
+{"name": "03834"}
+{"name": "03835"}
+{"name": "03836"}
+{"name": "03837"}
+{"name": "03838"}
+{"name": "03839"}
+{"name": "03840"}
+{"name": "03841"}
+{"name": "03842"}
+{"name": "03843"}
+{"name": "03844"}
+{"name": "03845"}
+{"name": "03846"}
+{"name": "03847"}
+{"name": "03848"}
+{"name": "03849"}
+{"name": "03850"}
+{"name": "03851"}
+{"name": "03852"}
+{"name": "03853"}
+{"name": "03854"}
+{"name": "03855"}
+{"name": "03856"}
+{"name": "03857"}
+{"name": "03858"}
+{"name": "03859"}
+{"name": "03860"}
+{"name": "03861"}
+{"name": "03862"}
+{"name": "03863"}
+{"name": "03864"}
+{"name": "03865"}
+{"name": "03866"}
+{"name": "03867"}
+{"name": "03868"}
+{"name": "03869"}
+{"name": "03870"}
+{"name": "03871"}
+{"name": "03872"}
+{"name": "03873"}
+{"name": "03874"}
+{"name": "03875"}
+{"name": "03876"}
+{"name": "03877"}
+{"name": "03878"}
+{"name": "03879"}
+{"name": "03880"}
+{"name": "03881"}
+{"name": "03882"}
+{"name": "03883"}
+{"name": "03884"}
+{"name": "03885"}
+{"name": "03886"}
+{"name": "03887"}
+{"name": "03888"}
+{"name": "03889"}
+{"name": "03890"}
+{"name": "03891"}
+{"name": "03892"}
+{"name": "03893"}
+{"name": "03894"}
+{"name": "03895"}
+{"name": "03896"}
+{"name": "03897"}
+{"name": "03898"}
+{"name": "03899"}
+{"name": "03900"}
+{"name": "03901"}
+{"name": "03902"}
+{"name": "03903"}
+{"name": "03904"}
+{"name": "03905"}
+{"name": "03906"}
+{"name": "03907"}
+{"name": "03908"}
+{"name": "03909"}
+{"name": "03910"}
+{"name": "03911"}
+{"name": "03912"}
+{"name": "03913"}
+{"name": "03914"}
+{"name": "03915"}
+{"name": "03916"}
+{"name": "03917"}
+{"name": "03918"}
+{"name": "03919"}
+{"name": "03920"}
+{"name": "03921"}
+{"name": "03922"}
+{"name": "03923"}
+{"name": "03924"}
+{"name": "03925"}
+{"name": "03926"}
+{"name": "03927"}
+{"name": "03928"}
+{"name": "03929"}
+{"name": "03930"}
+{"name": "03931"}
+{"name": "03932"}
+{"name": "03933"}
+{"name": "03934"}
+{"name": "03935"}
+{"name": "03936"}
+{"name": "03937"}
+{"name": "03938"}
+{"name": "03939"}
+{"name": "03940"}
+{"name": "03941"}
+{"name": "03942"}
+{"name": "03943"}
+{"name": "03944"}
+{"name": "03945"}
+{"name": "03946"}
+{"name": "03947"}
+{"name": "03948"}
+{"name": "03949"}
+{"name": "03950"}
+{"name": "03951"}
+{"name": "03952"}
+{"name": "03953"}
+{"name": "03954"}
+{"name": "03955"}
+{"name": "03956"}
+{"name": "03957"}
+{"name": "03958"}
+{"name": "03959"}
+{"name": "03960"}
+{"name": "03961"}
+{"name": "03962"}
+{"name": "03963"}
+{"name": "03964"}
+{"name": "03965"}
+{"name": "03966"}
+{"name": "03967"}
+{"name": "03968"}
+{"name": "03969"}
+{"name": "03970"}
+{"name": "03971"}
+{"name": "03972"}
+{"name": "03973"}
+{"name": "03974"}
+{"name": "03975"}
+{"name": "03976"}
+{"name": "03977"}
+{"name": "03978"}
+{"name": "03979"}
+{"name": "03980"}
+{"name": "03981"}
+{"name": "03982"}
+{"name": "03983"}
+{"name": "03984"}
+{"name": "03985"}
+{"name": "03986"}
+{"name": "03987"}
+{"name": "03988"}
+{"name": "03989"}
+{"name": "03990"}
+{"name": "03991"}
+{"name": "03992"}
+{"name": "03993"}
+{"name": "03994"}
+{"name": "03995"}
+{"name": "03996"}
+{"name": "03997"}
+{"name": "03998"}
+{"name": "03999"}
+{"name": "04000"}
+{"name": "04001"}
+{"name": "04002"}
+{"name": "04003"}
+{"name": "04004"}
+{"name": "04005"}
+{"name": "04006"}
+{"name": "04007"}
+{"name": "04008"}
+{"name": "04009"}
+{"name": "04010"}
+{"name": "04011"}
+{"name": "04012"}
+{"name": "04013"}
+{"name": "04014"}
+{"name": "04015"}
+{"name": "04016"}
+{"name": "04017"}
+{"name": "04018"}
+{"name": "04019"}
+{"name": "04020"}
+{"name": "04021"}
+{"name": "04022"}
+{"name": "04023"}
+{"name": "04024"}
+{"name": "04025"}
+{"name": "04026"}
+{"name": "04027"}
+{"name": "04028"}
+{"name": "04029"}
+{"name": "04030"}
+{"name": "04031"}
+{"name": "04032"}
+{"name": "04033"}
+{"name": "04034"}
+{"name": "04035"}
+{"name": "04036"}
+{"name": "04037"}
+{"name": "04038"}
+{"name": "04039"}
+{"name": "04040"}
+{"name": "04041"}
+{"name": "04042"}
+{"name": "04043"}
+{"name": "04044"}
+{"name": "04045"}
+{"name": "04046"}
+{"name": "04047"}
+{"name": "04048"}
+{"name": "04049"}
+{"name": "04050"}
+{"name": "04051"}
+{"name": "04052"}
+{"name": "04053"}
+{"name": "04054"}
+{"name": "04055"}
+{"name": "04056"}
+{"name": "04057"}
+{"name": "04058"}
+{"name": "04059"}
+{"name": "04060"}
+{"name": "04061"}
+{"name": "04062"}
+{"name": "04063"}
+{"name": "04064"}
+{"name": "04065"}
+{"name": "04066"}
+{"name": "04067"}
+{"name": "04068"}
+{"name": "04069"}
+{"name": "04070"}
+{"name": "04071"}
+{"name": "04072"}
+{"name": "04073"}
+{"name": "04074"}
+{"name": "04075"}
+{"name": "04076"}
+{"name": "04077"}
+{"name": "04078"}
+{"name": "04079"}
+{"name": "04080"}
+{"name": "04081"}
+{"name": "04082"}
+{"name": "04083"}
+{"name": "04084"}
+{"name": "04085"}
+{"name": "04086"}
+{"name": "04087"}
+{"name": "04088"}
+{"name": "04089"}
+{"name": "04090"}
+{"name": "04091"}
+{"name": "04092"}
+{"name": "04093"}
+{"name": "04094"}
+{"name": "04095"}
+{"name": "04096"}
+{"name": "04097"}
+{"name": "04098"}
+{"name": "04099"}
+{"name": "04100"}
+{"name": "04101"}
+{"name": "04102"}
+{"name": "04103"}
+{"name": "04104"}
+{"name": "04105"}
+{"name": "04106"}
+{"name": "04107"}
+{"name": "04108"}
+{"name": "04109"}
+{"name": "04110"}
+{"name": "04111"}
+{"name": "04112"}
+{"name": "04113"}
+{"name": "04114"}
+{"name": "04115"}
+{"name": "04116"}
+{"name": "04117"}
+{"name": "04118"}
+{"name": "04119"}
+{"name": "04120"}
+{"name": "04121"}
+{"name": "04122"}
+{"name": "04123"}
+{"name": "04124"}
+{"name": "04125"}
+{"name": "04126"}
+{"name": "04127"}
+{"name": "04128"}
+{"name": "04129"}
+{"name": "04130"}
+{"name": "04131"}
+{"name": "04132"}
+{"name": "04133"}
+{"name": "04134"}
+{"name": "04135"}
+{"name": "04136"}
+{"name": "04137"}
+{"name": "04138"}
+{"name": "04139"}
+{"name": "04140"}
+{"name": "04141"}
+{"name": "04142"}
+{"name": "04143"}
+{"name": "04144"}
+{"name": "04145"}
+{"name": "04146"}
+{"name": "04147"}
+{"name": "04148"}
+{"name": "04149"}
+{"name": "04150"}
+{"name": "04151"}
+{"name": "04152"}
+{"name": "04153"}
+{"name": "04154"}
+{"name": "04155"}
+{"name": "04156"}
+{"name": "04157"}
+{"name": "04158"}
+{"name": "04159"}
+{"name": "04160"}
+{"name": "04161"}
+{"name": "04162"}
+{"name": "04163"}
+{"name": "04164"}
+{"name": "04165"}
+{"name": "04166"}
+{"name": "04167"}
+{"name": "04168"}
+{"name": "04169"}
+{"name": "04170"}
+{"name": "04171"}
+{"name": "04172"}
+{"name": "04173"}
+{"name": "04174"}
+{"name": "04175"}
+{"name": "04176"}
+{"name": "04177"}
+{"name": "04178"}
+{"name": "04179"}
+{"name": "04180"}
+{"name": "04181"}
+{"name": "04182"}
+{"name": "04183"}
+{"name": "04184"}
+{"name": "04185"}
+{"name": "04186"}
+{"name": "04187"}
+{"name": "04188"}
+{"name": "04189"}
+{"name": "04190"}
+{"name": "04191"}
+{"name": "04192"}
+{"name": "04193"}
+{"name": "04194"}
+{"name": "04195"}
+{"name": "04196"}
+{"name": "04197"}
+{"name": "04198"}
+{"name": "04199"}
+{"name": "04200"}
+{"name": "04201"}
+{"name": "04202"}
+{"name": "04203"}
+{"name": "04204"}
+{"name": "04205"}
+{"name": "04206"}
+{"name": "04207"}
+{"name": "04208"}
+{"name": "04209"}
+{"name": "04210"}
+{"name": "04211"}
+{"name": "04212"}
+{"name": "04213"}
+{"name": "04214"}
+{"name": "04215"}
+{"name": "04216"}
+{"name": "04217"}
+{"name": "04218"}
+{"name": "04219"}
+{"name": "04220"}
+{"name": "04221"}
+{"name": "04222"}
+{"name": "04223"}
+{"name": "04224"}
+{"name": "04225"}
+{"name": "04226"}
+{"name": "04227"}
+{"name": "04228"}
+{"name": "04229"}
+{"name": "04230"}
+{"name": "04231"}
+{"name": "04232"}
+{"name": "04233"}
+{"name": "04234"}
+{"name": "04235"}
+{"name": "04236"}
+{"name": "04237"}
+{"name": "04238"}
+{"name": "04239"}
+{"name": "04240"}
+{"name": "04241"}
+{"name": "04242"}
+{"name": "04243"}
+{"name": "04244"}
+{"name": "04245"}
+{"name": "04246"}
+{"name": "04247"}
+{"name": "04248"}
+{"name": "04249"}
+{"name": "04250"}
+{"name": "04251"}
+{"name": "04252"}
+{"name": "04253"}
+{"name": "04254"}
+{"name": "04255"}
+{"name": "04256"}
+{"name": "04257"}
+{"name": "04258"}
+{"name": "04259"}
+{"name": "04260"}
+{"name": "04261"}
+{"name": "04262"}
+{"name": "04263"}
+{"name": "04264"}
+{"name": "04265"}
+{"name": "04266"}
+{"name": "04267"}
+{"name": "04268"}
+{"name": "04269"}
+{"name": "04270"}
+{"name": "04271"}
+{"name": "04272"}
+{"name": "04273"}
+{"name": "04274"}
+{"name": "04275"}
+{"name": "04276"}
+{"name": "04277"}
+{"name": "04278"}
+{"name": "04279"}
+{"name": "04280"}
+{"name": "04281"}
+{"name": "04282"}
+{"name": "04283"}
+{"name": "04284"}
+{"name": "04285"}
+{"name": "04286"}
+{"name": "04287"}
+{"name": "04288"}
+{"name": "04289"}
+{"name": "04290"}
+{"name": "04291"}
+{"name": "04292"}
+{"name": "04293"}
+{"name": "04294"}
+{"name": "04295"}
+{"name": "04296"}
+{"name": "04297"}
+{"name": "04298"}
+{"name": "04299"}
+{"name": "04300"}
+{"name": "04301"}
+{"name": "04302"}
+{"name": "04303"}
+{"name": "04304"}
+{"name": "04305"}
+{"name": "04306"}
+{"name": "04307"}
+{"name": "04308"}
+{"name": "04309"}
+{"name": "04310"}
+{"name": "04311"}
+{"name": "04312"}
+{"name": "04313"}
+{"name": "04314"}
+{"name": "04315"}
+{"name": "04316"}
+{"name": "04317"}
+{"name": "04318"}
+{"name": "04319"}
+{"name": "04320"}
+{"name": "04321"}
+{"name": "04322"}
+{"name": "04323"}
+{"name": "04324"}
+{"name": "04325"}
+{"name": "04326"}
+{"name": "04327"}
+{"name": "04328"}
+{"name": "04329"}
+{"name": "04330"}
+{"name": "04331"}
+{"name": "04332"}
+{"name": "04333"}
+{"name": "04334"}
+{"name": "04335"}
+{"name": "04336"}
+{"name": "04337"}
+{"name": "04338"}
+{"name": "04339"}
+{"name": "04340"}
+{"name": "04341"}
+{"name": "04342"}
+{"name": "04343"}
+{"name": "04344"}
+{"name": "04345"}
+{"name": "04346"}
+{"name": "04347"}
+{"name": "04348"}
+{"name": "04349"}
+{"name": "04350"}
+{"name": "04351"}
+{"name": "04352"}
+{"name": "04353"}
+{"name": "04354"}
+{"name": "04355"}
+{"name": "04356"}
+{"name": "04357"}
+{"name": "04358"}
+{"name": "04359"}
+{"name": "04360"}
+{"name": "04361"}
+{"name": "04362"}
+{"name": "04363"}
+{"name": "04364"}
+{"name": "04365"}
+{"name": "04366"}
+{"name": "04367"}
+{"name": "04368"}
+{"name": "04369"}
+{"name": "04370"}
+{"name": "04371"}
+{"name": "04372"}
+{"name": "04373"}
+{"name": "04374"}
+{"name": "04375"}
+{"name": "04376"}
+{"name": "04377"}
+{"name": "04378"}
+{"name": "04379"}
+{"name": "04380"}
+{"name": "04381"}
+{"name": "04382"}
+{"name": "04383"}
+{"name": "04384"}
+{"name": "04385"}
+{"name": "04386"}
+{"name": "04387"}
+{"name": "04388"}
+{"name": "04389"}
+{"name": "04390"}
+{"name": "04391"}
+{"name": "04392"}
+{"name": "04393"}
+{"name": "04394"}
+{"name": "04395"}
+{"name": "04396"}
+{"name": "04397"}
+{"name": "04398"}
+{"name": "04399"}
+{"name": "04400"}
+{"name": "04401"}
+{"name": "04402"}
+{"name": "04403"}
+{"name": "04404"}
+{"name": "04405"}
+{"name": "04406"}
+{"name": "04407"}
+{"name": "04408"}
+{"name": "04409"}
+{"name": "04410"}
+{"name": "04411"}
+{"name": "04412"}
+{"name": "04413"}
+{"name": "04414"}
+{"name": "04415"}
+{"name": "04416"}
+{"name": "04417"}
+{"name": "04418"}
+{"name": "04419"}
+{"name": "04420"}
+{"name": "04421"}
+{"name": "04422"}
+{"name": "04423"}
+{"name": "04424"}
+{"name": "04425"}
+{"name": "04426"}
+{"name": "04427"}
+{"name": "04428"}
+{"name": "04429"}
+{"name": "04430"}
+{"name": "04431"}
+{"name": "04432"}
+{"name": "04433"}
+{"name": "04434"}
+{"name": "04435"}
+{"name": "04436"}
+{"name": "04437"}
+{"name": "04438"}
+{"name": "04439"}
+{"name": "04440"}
+{"name": "04441"}
+{"name": "04442"}
+{"name": "04443"}
+{"name": "04444"}
+{"name": "04445"}
+{"name": "04446"}
+{"name": "04447"}
+{"name": "04448"}
+{"name": "04449"}
+{"name": "04450"}
+{"name": "04451"}
+{"name": "04452"}
+{"name": "04453"}
+{"name": "04454"}
+{"name": "04455"}
+{"name": "04456"}
+{"name": "04457"}
+{"name": "04458"}
+{"name": "04459"}
+{"name": "04460"}
+{"name": "04461"}
+{"name": "04462"}
+{"name": "04463"}
+{"name": "04464"}
+{"name": "04465"}
+{"name": "04466"}
+{"name": "04467"}
+{"name": "04468"}
+{"name": "04469"}
+{"name": "04470"}
+{"name": "04471"}
+{"name": "04472"}
+{"name": "04473"}
+{"name": "04474"}
+{"name": "04475"}
+{"name": "04476"}
+{"name": "04477"}
+{"name": "04478"}
+{"name": "04479"}
+{"name": "04480"}
+{"name": "04481"}
+{"name": "04482"}
+{"name": "04483"}
+{"name": "04484"}
+{"name": "04485"}
+{"name": "04486"}
+{"name": "04487"}
+{"name": "04488"}
+{"name": "04489"}
+{"name": "04490"}
+{"name": "04491"}
+{"name": "04492"}
+{"name": "04493"}
+{"name": "04494"}
+{"name": "04495"}
+{"name": "04496"}
+{"name": "04497"}
+{"name": "04498"}
+{"name": "04499"}
+{"name": "04500"}
+{"name": "04501"}
+{"name": "04502"}
+{"name": "04503"}
+{"name": "04504"}
+{"name": "04505"}
+{"name": "04506"}
+{"name": "04507"}
+{"name": "04508"}
+{"name": "04509"}
+{"name": "04510"}
+{"name": "04511"}
+{"name": "04512"}
+{"name": "04513"}
+{"name": "04514"}
+{"name": "04515"}
+{"name": "04516"}
+{"name": "04517"}
+{"name": "04518"}
+{"name": "04519"}
+{"name": "04520"}
+{"name": "04521"}
+{"name": "04522"}
+{"name": "04523"}
+{"name": "04524"}
+{"name": "04525"}
+{"name": "04526"}
+{"name": "04527"}
+{"name": "04528"}
+{"name": "04529"}
+{"name": "04530"}
+{"name": "04531"}
+{"name": "04532"}
+{"name": "04533"}
+{"name": "04534"}
+{"name": "04535"}
+{"name": "04536"}
+{"name": "04537"}
+{"name": "04538"}
+{"name": "04539"}
+{"name": "04540"}
+{"name": "04541"}
+{"name": "04542"}
+{"name": "04543"}
+{"name": "04544"}
+{"name": "04545"}
+{"name": "04546"}
+{"name": "04547"}
+{"name": "04548"}
+{"name": "04549"}
+{"name": "04550"}
+{"name": "04551"}
+{"name": "04552"}
+{"name": "04553"}
+{"name": "04554"}
+{"name": "04555"}
+{"name": "04556"}
+{"name": "04557"}
+{"name": "04558"}
+{"name": "04559"}
+{"name": "04560"}
+{"name": "04561"}
+{"name": "04562"}
+{"name": "04563"}
+{"name": "04564"}
+{"name": "04565"}
+{"name": "04566"}
+{"name": "04567"}
+{"name": "04568"}
+{"name": "04569"}
+{"name": "04570"}
+{"name": "04571"}
+{"name": "04572"}
+{"name": "04573"}
+{"name": "04574"}
+{"name": "04575"}
+{"name": "04576"}
+{"name": "04577"}
+{"name": "04578"}
+{"name": "04579"}
+{"name": "04580"}
+{"name": "04581"}
+{"name": "04582"}
+{"name": "04583"}
+{"name": "04584"}
+{"name": "04585"}
+{"name": "04586"}
+{"name": "04587"}
+{"name": "04588"}
+{"name": "04589"}
+{"name": "04590"}
+{"name": "04591"}
+{"name": "04592"}
+{"name": "04593"}
+{"name": "04594"}
+{"name": "04595"}
+{"name": "04596"}
+{"name": "04597"}
+{"name": "04598"}
+{"name": "04599"}
+{"name": "04600"}
+{"name": "04601"}
+{"name": "04602"}
+{"name": "04603"}
+{"name": "04604"}
+{"name": "04605"}
+{"name": "04606"}
+{"name": "04607"}
+{"name": "04608"}
+{"name": "04609"}
+{"name": "04610"}
+{"name": "04611"}
+{"name": "04612"}
+{"name": "04613"}
+{"name": "04614"}
+{"name": "04615"}
+{"name": "04616"}
+{"name": "04617"}
+{"name": "04618"}
+{"name": "04619"}
+{"name": "04620"}
+{"name": "04621"}
+{"name": "04622"}
+{"name": "04623"}
+{"name": "04624"}
+{"name": "04625"}
+{"name": "04626"}
+{"name": "04627"}
+{"name": "04628"}
+{"name": "04629"}
+{"name": "04630"}
+{"name": "04631"}
+{"name": "04632"}
+{"name": "04633"}
+{"name": "04634"}
+{"name": "04635"}
+{"name": "04636"}
+{"name": "04637"}
+{"name": "04638"}
+{"name": "04639"}
+{"name": "04640"}
+{"name": "04641"}
+{"name": "04642"}
+{"name": "04643"}
+{"name": "04644"}
+{"name": "04645"}
+{"name": "04646"}
+{"name": "04647"}
+{"name": "04648"}
+{"name": "04649"}
+{"name": "04650"}
+{"name": "04651"}
+{"name": "04652"}
+{"name": "04653"}
+{"name": "04654"}
+{"name": "04655"}
+{"name": "04656"}
+{"name": "04657"}
+{"name": "04658"}
+{"name": "04659"}
+{"name": "04660"}
+{"name": "04661"}
+{"name": "04662"}
+{"name": "04663"}
+{"name": "04664"}
+{"name": "04665"}
+{"name": "04666"}
+{"name": "04667"}
+{"name": "04668"}
+{"name": "04669"}
+{"name": "04670"}
+{"name": "04671"}
+{"name": "04672"}
+{"name": "04673"}
+{"name": "04674"}
+{"name": "04675"}
+{"name": "04676"}
+{"name": "04677"}
+{"name": "04678"}
+{"name": "04679"}
+{"name": "04680"}
+{"name": "04681"}
+{"name": "04682"}
+{"name": "04683"}
+{"name": "04684"}
+{"name": "04685"}
+{"name": "04686"}
+{"name": "04687"}
+{"name": "04688"}
+{"name": "04689"}
+{"name": "04690"}
+{"name": "04691"}
+{"name": "04692"}
+{"name": "04693"}
+{"name": "04694"}
+{"name": "04695"}
+{"name": "04696"}
+{"name": "04697"}
+{"name": "04698"}
+{"name": "04699"}
+{"name": "04700"}
+{"name": "04701"}
+{"name": "04702"}
+{"name": "04703"}
+{"name": "04704"}
+{"name": "04705"}
+{"name": "04706"}
+{"name": "04707"}
+{"name": "04708"}
+{"name": "04709"}
+{"name": "04710"}
+{"name": "04711"}
+{"name": "04712"}
+{"name": "04713"}
+{"name": "04714"}
+{"name": "04715"}
+{"name": "04716"}
+{"name": "04717"}
+{"name": "04718"}
+{"name": "04719"}
+{"name": "04720"}
+{"name": "04721"}
+{"name": "04722"}
+{"name": "04723"}
+{"name": "04724"}
+{"name": "04725"}
+{"name": "04726"}
+{"name": "04727"}
+{"name": "04728"}
+{"name": "04729"}
+{"name": "04730"}
+{"name": "04731"}
+{"name": "04732"}
+{"name": "04733"}
+{"name": "04734"}
+{"name": "04735"}
+{"name": "04736"}
+{"name": "04737"}
+{"name": "04738"}
+{"name": "04739"}
+{"name": "04740"}
+{"name": "04741"}
+{"name": "04742"}
+{"name": "04743"}
+{"name": "04744"}
+{"name": "04745"}
+{"name": "04746"}
+{"name": "04747"}
+{"name": "04748"}
+{"name": "04749"}
+{"name": "04750"}
+{"name": "04751"}
+{"name": "04752"}
+{"name": "04753"}
+{"name": "04754"}
+{"name": "04755"}
+{"name": "04756"}
+{"name": "04757"}
+{"name": "04758"}
+{"name": "04759"}
+{"name": "04760"}
+{"name": "04761"}
+{"name": "04762"}
+{"name": "04763"}
+{"name": "04764"}
+{"name": "04765"}
+{"name": "04766"}
+{"name": "04767"}
+{"name": "04768"}
+{"name": "04769"}
+{"name": "04770"}
+{"name": "04771"}
+{"name": "04772"}
+{"name": "04773"}
+{"name": "04774"}
+{"name": "04775"}
+{"name": "04776"}
+{"name": "04777"}
+{"name": "04778"}
+{"name": "04779"}
+{"name": "04780"}
+{"name": "04781"}
+{"name": "04782"}
+{"name": "04783"}
+{"name": "04784"}
+{"name": "04785"}
+{"name": "04786"}
+{"name": "04787"}
+{"name": "04788"}
+{"name": "04789"}
+{"name": "04790"}
+{"name": "04791"}
+{"name": "04792"}
+{"name": "04793"}
+{"name": "04794"}
+{"name": "04795"}
+{"name": "04796"}
+{"name": "04797"}
+{"name": "04798"}
+{"name": "04799"}
+{"name": "04800"}
+{"name": "04801"}
+{"name": "04802"}
+{"name": "04803"}
+{"name": "04804"}
+{"name": "04805"}
+{"name": "04806"}
+{"name": "04807"}
+{"name": "04808"}
+{"name": "04809"}
+{"name": "04810"}
+{"name": "04811"}
+{"name": "04812"}
+{"name": "04813"}
+{"name": "04814"}
+{"name": "04815"}
+{"name": "04816"}
+{"name": "04817"}
+{"name": "04818"}
+{"name": "04819"}
+{"name": "04820"}
+{"name": "04821"}
+{"name": "04822"}
+{"name": "04823"}
+{"name": "04824"}
+{"name": "04825"}
+{"name": "04826"}
+{"name": "04827"}
+{"name": "04828"}
+{"name": "04829"}
+{"name": "04830"}
+{"name": "04831"}
+{"name": "04832"}
+{"name": "04833"}
+{"name": "04834"}
+{"name": "04835"}
+{"name": "04836"}
+{"name": "04837"}
+{"name": "04838"}
+{"name": "04839"}
+{"name": "04840"}
+{"name": "04841"}
+{"name": "04842"}
+{"name": "04843"}
+{"name": "04844"}
+{"name": "04845"}
+{"name": "04846"}
+{"name": "04847"}
+{"name": "04848"}
+{"name": "04849"}
+{"name": "04850"}
+{"name": "04851"}
+{"name": "04852"}
+{"name": "04853"}
+{"name": "04854"}
+{"name": "04855"}
+{"name": "04856"}
+{"name": "04857"}
+{"name": "04858"}
+{"name": "04859"}
+{"name": "04860"}
+{"name": "04861"}
+{"name": "04862"}
+{"name": "04863"}
+{"name": "04864"}
+{"name": "04865"}
+{"name": "04866"}
+{"name": "04867"}
+{"name": "04868"}
+{"name": "04869"}
+{"name": "04870"}
+{"name": "04871"}
+{"name": "04872"}
+{"name": "04873"}
+{"name": "04874"}
+{"name": "04875"}
+{"name": "04876"}
+{"name": "04877"}
+{"name": "04878"}
+{"name": "04879"}
+{"name": "04880"}
+{"name": "04881"}
+{"name": "04882"}
+{"name": "04883"}
+{"name": "04884"}
+{"name": "04885"}
+{"name": "04886"}
+{"name": "04887"}
+{"name": "04888"}
+{"name": "04889"}
+{"name": "04890"}
+{"name": "04891"}
+{"name": "04892"}
+{"name": "04893"}
+{"name": "04894"}
+{"name": "04895"}
+{"name": "04896"}
+{"name": "04897"}
+{"name": "04898"}
+{"name": "04899"}
+{"name": "04900"}
+{"name": "04901"}
+{"name": "04902"}
+{"name": "04903"}
+{"name": "04904"}
+{"name": "04905"}
+{"name": "04906"}
+{"name": "04907"}
+{"name": "04908"}
+{"name": "04909"}
+{"name": "04910"}
+{"name": "04911"}
+{"name": "04912"}
+{"name": "04913"}
+{"name": "04914"}
+{"name": "04915"}
+{"name": "04916"}
+{"name": "04917"}
+{"name": "04918"}
+{"name": "04919"}
+{"name": "04920"}
+{"name": "04921"}
+{"name": "04922"}
+{"name": "04923"}
+{"name": "04924"}
+{"name": "04925"}
+{"name": "04926"}
+{"name": "04927"}
+{"name": "04928"}
+{"name": "04929"}
+{"name": "04930"}
+{"name": "04931"}
+{"name": "04932"}
+{"name": "04933"}
+{"name": "04934"}
+{"name": "04935"}
+{"name": "04936"}
+{"name": "04937"}
+{"name": "04938"}
+{"name": "04939"}
+{"name": "04940"}
+{"name": "04941"}
+{"name": "04942"}
+{"name": "04943"}
+{"name": "04944"}
+{"name": "04945"}
+{"name": "04946"}
+{"name": "04947"}
+{"name": "04948"}
+{"name": "04949"}
+{"name": "04950"}
+{"name": "04951"}
+{"name": "04952"}
+{"name": "04953"}
+{"name": "04954"}
+{"name": "04955"}
+{"name": "04956"}
+{"name": "04957"}
+{"name": "04958"}
+{"name": "04959"}
+{"name": "04960"}
+{"name": "04961"}
+{"name": "04962"}
+{"name": "04963"}
+{"name": "04964"}
+{"name": "04965"}
+{"name": "04966"}
+{"name": "04967"}
+{"name": "04968"}
+{"name": "04969"}
+{"name": "04970"}
+{"name": "04971"}
+{"name": "04972"}
+{"name": "04973"}
+{"name": "04974"}
+{"name": "04975"}
+{"name": "04976"}
+{"name": "04977"}
+{"name": "04978"}
+{"name": "04979"}
+{"name": "04980"}
+{"name": "04981"}
+{"name": "04982"}
+{"name": "04983"}
+{"name": "04984"}
+{"name": "04985"}
+{"name": "04986"}
+{"name": "04987"}
+{"name": "04988"}
+{"name": "04989"}
+{"name": "04990"}
+{"name": "04991"}
+{"name": "04992"}
+{"name": "04993"}
+{"name": "04994"}
+{"name": "04995"}
+{"name": "04996"}
+{"name": "04997"}
+{"name": "04998"}
+{"name": "04999"}
+{"name": "05000"}
+{"name": "05001"}
+{"name": "05002"}
+{"name": "05003"}
+{"name": "05004"}
+{"name": "05005"}
+{"name": "05006"}
+{"name": "05007"}
+{"name": "05008"}
+{"name": "05009"}
+{"name": "05010"}
+{"name": "05011"}
+{"name": "05012"}
+{"name": "05013"}
+{"name": "05014"}
+{"name": "05015"}
+{"name": "05016"}
+{"name": "05017"}
+{"name": "05018"}
+{"name": "05019"}
+{"name": "05020"}
+{"name": "05021"}
+{"name": "05022"}
+{"name": "05023"}
+{"name": "05024"}
+{"name": "05025"}
+{"name": "05026"}
+{"name": "05027"}
+{"name": "05028"}
+{"name": "05029"}
+{"name": "05030"}
+{"name": "05031"}
+{"name": "05032"}
+{"name": "05033"}
+{"name": "05034"}
+{"name": "05035"}
+{"name": "05036"}
+{"name": "05037"}
+{"name": "05038"}
+{"name": "05039"}
+{"name": "05040"}
+{"name": "05041"}
+{"name": "05042"}
+{"name": "05043"}
+{"name": "05044"}
+{"name": "05045"}
+{"name": "05046"}
+{"name": "05047"}
+{"name": "05048"}
+{"name": "05049"}
+{"name": "05050"}
+{"name": "05051"}
+{"name": "05052"}
+{"name": "05053"}
+{"name": "05054"}
+{"name": "05055"}
+{"name": "05056"}
+{"name": "05057"}
+{"name": "05058"}
+{"name": "05059"}
+{"name": "05060"}
+{"name": "05061"}
+{"name": "05062"}
+{"name": "05063"}
+{"name": "05064"}
+{"name": "05065"}
+{"name": "05066"}
+{"name": "05067"}
+{"name": "05068"}
+{"name": "05069"}
+{"name": "05070"}
+{"name": "05071"}
+{"name": "05072"}
+{"name": "05073"}
+{"name": "05074"}
+{"name": "05075"}
+{"name": "05076"}
+{"name": "05077"}
+{"name": "05078"}
+{"name": "05079"}
+{"name": "05080"}
+{"name": "05081"}
+{"name": "05082"}
+{"name": "05083"}
+{"name": "05084"}
+{"name": "05085"}
+{"name": "05086"}
+{"name": "05087"}
+{"name": "05088"}
+{"name": "05089"}
+{"name": "05090"}
+{"name": "05091"}
+{"name": "05092"}
+{"name": "05093"}
+{"name": "05094"}
+{"name": "05095"}
+{"name": "05096"}
+{"name": "05097"}
+{"name": "05098"}
+{"name": "05099"}
+{"name": "05100"}
+{"name": "05101"}
+{"name": "05102"}
+{"name": "05103"}
+{"name": "05104"}
+{"name": "05105"}
+{"name": "05106"}
+{"name": "05107"}
+{"name": "05108"}
+{"name": "05109"}
+{"name": "05110"}
+{"name": "05111"}
+{"name": "05112"}
+{"name": "05113"}
+{"name": "05114"}
+{"name": "05115"}
+{"name": "05116"}
+{"name": "05117"}
+{"name": "05118"}
+{"name": "05119"}
+{"name": "05120"}
+{"name": "05121"}
+{"name": "05122"}
+{"name": "05123"}
+{"name": "05124"}
+{"name": "05125"}
+{"name": "05126"}
+{"name": "05127"}
+{"name": "05128"}
+{"name": "05129"}
+{"name": "05130"}
+{"name": "05131"}
+{"name": "05132"}
+{"name": "05133"}
+{"name": "05134"}
+{"name": "05135"}
+{"name": "05136"}
+{"name": "05137"}
+{"name": "05138"}
+{"name": "05139"}
+{"name": "05140"}
+{"name": "05141"}
+{"name": "05142"}
+{"name": "05143"}
+{"name": "05144"}
+{"name": "05145"}
+{"name": "05146"}
+{"name": "05147"}
+{"name": "05148"}
+{"name": "05149"}
+{"name": "05150"}
+{"name": "05151"}
+{"name": "05152"}
+{"name": "05153"}
+{"name": "05154"}
+{"name": "05155"}
+{"name": "05156"}
+{"name": "05157"}
+{"name": "05158"}
+{"name": "05159"}
+{"name": "05160"}
+{"name": "05161"}
+{"name": "05162"}
+{"name": "05163"}
+{"name": "05164"}
+{"name": "05165"}
+{"name": "05166"}
+{"name": "05167"}
+{"name": "05168"}
+{"name": "05169"}
+{"name": "05170"}
+{"name": "05171"}
+{"name": "05172"}
+{"name": "05173"}
+{"name": "05174"}
+{"name": "05175"}
+{"name": "05176"}
+{"name": "05177"}
+{"name": "05178"}
+{"name": "05179"}
+{"name": "05180"}
+{"name": "05181"}
+{"name": "05182"}
+{"name": "05183"}
+{"name": "05184"}
+{"name": "05185"}
+{"name": "05186"}
+{"name": "05187"}
+{"name": "05188"}
+{"name": "05189"}
+{"name": "05190"}
+{"name": "05191"}
+{"name": "05192"}
+{"name": "05193"}
+{"name": "05194"}
+{"name": "05195"}
+{"name": "05196"}
+{"name": "05197"}
+{"name": "05198"}
+{"name": "05199"}
+{"name": "05200"}
+{"name": "05201"}
+{"name": "05202"}
+{"name": "05203"}
+{"name": "05204"}
+{"name": "05205"}
+{"name": "05206"}
+{"name": "05207"}
+{"name": "05208"}
+{"name": "05209"}
+{"name": "05210"}
+{"name": "05211"}
+{"name": "05212"}
+{"name": "05213"}
+{"name": "05214"}
+{"name": "05215"}
+{"name": "05216"}
+{"name": "05217"}
+{"name": "05218"}
+{"name": "05219"}
+{"name": "05220"}
+{"name": "05221"}
+{"name": "05222"}
+{"name": "05223"}
+{"name": "05224"}
+{"name": "05225"}
+{"name": "05226"}
+{"name": "05227"}
+{"name": "05228"}
+{"name": "05229"}
+{"name": "05230"}
+{"name": "05231"}
+{"name": "05232"}
+{"name": "05233"}
+{"name": "05234"}
+{"name": "05235"}
+{"name": "05236"}
+{"name": "05237"}
+{"name": "05238"}
+{"name": "05239"}
+{"name": "05240"}
+{"name": "05241"}
+{"name": "05242"}
+{"name": "05243"}
+{"name": "05244"}
+{"name": "05245"}
+{"name": "05246"}
+{"name": "05247"}
+{"name": "05248"}
+{"name": "05249"}
+{"name": "05250"}
+{"name": "05251"}
+{"name": "05252"}
+{"name": "05253"}
+{"name": "05254"}
+{"name": "05255"}
+{"name": "05256"}
+{"name": "05257"}
+{"name": "05258"}
+{"name": "05259"}
+{"name": "05260"}
+{"name": "05261"}
+{"name": "05262"}
+{"name": "05263"}
+{"name": "05264"}
+{"name": "05265"}
+{"name": "05266"}
+{"name": "05267"}
+{"name": "05268"}
+{"name": "05269"}
+{"name": "05270"}
+{"name": "05271"}
+{"name": "05272"}
+{"name": "05273"}
+{"name": "05274"}
+{"name": "05275"}
+{"name": "05276"}
+{"name": "05277"}
+{"name": "05278"}
+{"name": "05279"}
+{"name": "05280"}
+{"name": "05281"}
+{"name": "05282"}
+{"name": "05283"}
+{"name": "05284"}
+{"name": "05285"}
+{"name": "05286"}
+{"name": "05287"}
+{"name": "05288"}
+{"name": "05289"}
+{"name": "05290"}
+{"name": "05291"}
+{"name": "05292"}
+{"name": "05293"}
+{"name": "05294"}
+{"name": "05295"}
+{"name": "05296"}
+{"name": "05297"}
+{"name": "05298"}
+{"name": "05299"}
+{"name": "05300"}
+{"name": "05301"}
+{"name": "05302"}
+{"name": "05303"}
+{"name": "05304"}
+{"name": "05305"}
+{"name": "05306"}
+{"name": "05307"}
+{"name": "05308"}
+{"name": "05309"}
+{"name": "05310"}
+{"name": "05311"}
+{"name": "05312"}
+{"name": "05313"}
+{"name": "05314"}
+{"name": "05315"}
+{"name": "05316"}
+{"name": "05317"}
+{"name": "05318"}
+{"name": "05319"}
+{"name": "05320"}
+{"name": "05321"}
+{"name": "05322"}
+{"name": "05323"}
+{"name": "05324"}
+{"name": "05325"}
+{"name": "05326"}
+{"name": "05327"}
+{"name": "05328"}
+{"name": "05329"}
+{"name": "05330"}
+{"name": "05331"}
+{"name": "05332"}
+{"name": "05333"}
+{"name": "05334"}
+{"name": "05335"}
+{"name": "05336"}
+{"name": "05337"}
+{"name": "05338"}
+{"name": "05339"}
+{"name": "05340"}
+{"name": "05341"}
+{"name": "05342"}
+{"name": "05343"}
+{"name": "05344"}
+{"name": "05345"}
+{"name": "05346"}
+{"name": "05347"}
+{"name": "05348"}
+{"name": "05349"}
+{"name": "05350"}
+{"name": "05351"}
+{"name": "05352"}
+{"name": "05353"}
+{"name": "05354"}
+{"name": "05355"}
+{"name": "05356"}
+{"name": "05357"}
+{"name": "05358"}
+{"name": "05359"}
+{"name": "05360"}
+{"name": "05361"}
+{"name": "05362"}
+{"name": "05363"}
+{"name": "05364"}
+{"name": "05365"}
+{"name": "05366"}
+{"name": "05367"}
+{"name": "05368"}
+{"name": "05369"}
+{"name": "05370"}
+{"name": "05371"}
+{"name": "05372"}
+{"name": "05373"}
+{"name": "05374"}
+{"name": "05375"}
+{"name": "05376"}
+{"name": "05377"}
+{"name": "05378"}
+{"name": "05379"}
+{"name": "05380"}
+{"name": "05381"}
+{"name": "05382"}
+{"name": "05383"}
+{"name": "05384"}
+{"name": "05385"}
+{"name": "05386"}
+{"name": "05387"}
+{"name": "05388"}
+{"name": "05389"}
+{"name": "05390"}
+{"name": "05391"}
+{"name": "05392"}
+{"name": "05393"}
+{"name": "05394"}
+{"name": "05395"}
+{"name": "05396"}
+{"name": "05397"}
+{"name": "05398"}
+{"name": "05399"}
+{"name": "05400"}
+{"name": "05401"}
+{"name": "05402"}
+{"name": "05403"}
+{"name": "05404"}
+{"name": "05405"}
+{"name": "05406"}
+{"name": "05407"}
+{"name": "05408"}
+{"name": "05409"}
+{"name": "05410"}
+{"name": "05411"}
+{"name": "05412"}
+{"name": "05413"}
+{"name": "05414"}
+{"name": "05415"}
+{"name": "05416"}
+{"name": "05417"}
+{"name": "05418"}
+{"name": "05419"}
+{"name": "05420"}
+{"name": "05421"}
+{"name": "05422"}
+{"name": "05423"}
+{"name": "05424"}
+{"name": "05425"}
+{"name": "05426"}
+{"name": "05427"}
+{"name": "05428"}
+{"name": "05429"}
+{"name": "05430"}
+{"name": "05431"}
+{"name": "05432"}
+{"name": "05433"}
+{"name": "05434"}
+{"name": "05435"}
+{"name": "05436"}
+{"name": "05437"}
+{"name": "05438"}
+{"name": "05439"}
+{"name": "05440"}
+{"name": "05441"}
+{"name": "05442"}
+{"name": "05443"}
+{"name": "05444"}
+{"name": "05445"}
+{"name": "05446"}
+{"name": "05447"}
+{"name": "05448"}
+{"name": "05449"}
+{"name": "05450"}
+{"name": "05451"}
+{"name": "05452"}
+{"name": "05453"}
+{"name": "05454"}
+{"name": "05455"}
+{"name": "05456"}
+{"name": "05457"}
+{"name": "05458"}
+{"name": "05459"}
+{"name": "05460"}
+{"name": "05461"}
+{"name": "05462"}
+{"name": "05463"}
+{"name": "05464"}
+{"name": "05465"}
+{"name": "05466"}
+{"name": "05467"}
+{"name": "05468"}
+{"name": "05469"}
+{"name": "05470"}
+{"name": "05471"}
+{"name": "05472"}
+{"name": "05473"}
+{"name": "05474"}
+{"name": "05475"}
+{"name": "05476"}
+{"name": "05477"}
+{"name": "05478"}
+{"name": "05479"}
+{"name": "05480"}
+{"name": "05481"}
+{"name": "05482"}
+{"name": "05483"}
+{"name": "05484"}
+{"name": "05485"}
+{"name": "05486"}
+{"name": "05487"}
+{"name": "05488"}
+{"name": "05489"}
+{"name": "05490"}
+{"name": "05491"}
+{"name": "05492"}
+{"name": "05493"}
+{"name": "05494"}
+{"name": "05495"}
+{"name": "05496"}
+{"name": "05497"}
+{"name": "05498"}
+{"name": "05499"}
+{"name": "05500"}
+{"name": "05501"}
+{"name": "05502"}
+{"name": "05503"}
+{"name": "05504"}
+{"name": "05505"}
+{"name": "05506"}
+{"name": "05507"}
+{"name": "05508"}
+{"name": "05509"}
+{"name": "05510"}
+{"name": "05511"}
+{"name": "05512"}
+{"name": "05513"}
+{"name": "05514"}
+{"name": "05515"}
+{"name": "05516"}
+{"name": "05517"}
+{"name": "05518"}
+{"name": "05519"}
+{"name": "05520"}
+{"name": "05521"}
+{"name": "05522"}
+{"name": "05523"}
+{"name": "05524"}
+{"name": "05525"}
+{"name": "05526"}
+{"name": "05527"}
+{"name": "05528"}
+{"name": "05529"}
+{"name": "05530"}
+{"name": "05531"}
+{"name": "05532"}
+{"name": "05533"}
+{"name": "05534"}
+{"name": "05535"}
+{"name": "05536"}
+{"name": "05537"}
+{"name": "05538"}
+{"name": "05539"}
+{"name": "05540"}
+{"name": "05541"}
+{"name": "05542"}
+{"name": "05543"}
+{"name": "05544"}
+{"name": "05545"}
+{"name": "05546"}
+{"name": "05547"}
+{"name": "05548"}
+{"name": "05549"}
+{"name": "05550"}
+{"name": "05551"}
+{"name": "05552"}
+{"name": "05553"}
+{"name": "05554"}
+{"name": "05555"}
+{"name": "05556"}
+{"name": "05557"}
+{"name": "05558"}
+{"name": "05559"}
+{"name": "05560"}
+{"name": "05561"}
+{"name": "05562"}
+{"name": "05563"}
+{"name": "05564"}
+{"name": "05565"}
+{"name": "05566"}
+{"name": "05567"}
+{"name": "05568"}
+{"name": "05569"}
+{"name": "05570"}
+{"name": "05571"}
+{"name": "05572"}
+{"name": "05573"}
+{"name": "05574"}
+{"name": "05575"}
+{"name": "05576"}
+{"name": "05577"}
+{"name": "05578"}
+{"name": "05579"}
+{"name": "05580"}
+{"name": "05581"}
+{"name": "05582"}
+{"name": "05583"}
+{"name": "05584"}
+{"name": "05585"}
+{"name": "05586"}
+{"name": "05587"}
+{"name": "05588"}
+{"name": "05589"}
+{"name": "05590"}
+{"name": "05591"}
+{"name": "05592"}
+{"name": "05593"}
+{"name": "05594"}
+{"name": "05595"}
+{"name": "05596"}
+{"name": "05597"}
+{"name": "05598"}
+{"name": "05599"}
+{"name": "05600"}
+{"name": "05601"}
+{"name": "05602"}
+{"name": "05603"}
+{"name": "05604"}
+{"name": "05605"}
+{"name": "05606"}
+{"name": "05607"}
+{"name": "05608"}
+{"name": "05609"}
+{"name": "05610"}
+{"name": "05611"}
+{"name": "05612"}
+{"name": "05613"}
+{"name": "05614"}
+{"name": "05615"}
+{"name": "05616"}
+{"name": "05617"}
+{"name": "05618"}
+{"name": "05619"}
+{"name": "05620"}
+{"name": "05621"}
+{"name": "05622"}
+{"name": "05623"}
+{"name": "05624"}
+{"name": "05625"}
+{"name": "05626"}
+{"name": "05627"}
+{"name": "05628"}
+{"name": "05629"}
+{"name": "05630"}
+{"name": "05631"}
+{"name": "05632"}
+{"name": "05633"}
+{"name": "05634"}
+{"name": "05635"}
+{"name": "05636"}
+{"name": "05637"}
+{"name": "05638"}
+{"name": "05639"}
+{"name": "05640"}
+{"name": "05641"}
+{"name": "05642"}
+{"name": "05643"}
+{"name": "05644"}
+{"name": "05645"}
+{"name": "05646"}
+{"name": "05647"}
+{"name": "05648"}
+{"name": "05649"}
+{"name": "05650"}
+{"name": "05651"}
+{"name": "05652"}
+{"name": "05653"}
+{"name": "05654"}
+{"name": "05655"}
+{"name": "05656"}
+{"name": "05657"}
+{"name": "05658"}
+{"name": "05659"}
+{"name": "05660"}
+{"name": "05661"}
+{"name": "05662"}
+{"name": "05663"}
+{"name": "05664"}
+{"name": "05665"}
+{"name": "05666"}
+{"name": "05667"}
+{"name": "05668"}
+{"name": "05669"}
+{"name": "05670"}
+{"name": "05671"}
+{"name": "05672"}
+{"name": "05673"}
+{"name": "05674"}
+{"name": "05675"}
+{"name": "05676"}
+{"name": "05677"}
+{"name": "05678"}
+{"name": "05679"}
+{"name": "05680"}
+{"name": "05681"}
+{"name": "05682"}
+{"name": "05683"}
+{"name": "05684"}
+{"name": "05685"}
+{"name": "05686"}
+{"name": "05687"}
+{"name": "05688"}
+{"name": "05689"}
+{"name": "05690"}
+{"name": "05691"}
+{"name": "05692"}
+{"name": "05693"}
+{"name": "05694"}
+{"name": "05695"}
+{"name": "05696"}
+{"name": "05697"}
+{"name": "05698"}
+{"name": "05699"}
+{"name": "05700"}
+{"name": "05701"}
+{"name": "05702"}
+{"name": "05703"}
+{"name": "05704"}
+{"name": "05705"}
+{"name": "05706"}
+{"name": "05707"}
+{"name": "05708"}
+{"name": "05709"}
+{"name": "05710"}
+{"name": "05711"}
+{"name": "05712"}
+{"name": "05713"}
+{"name": "05714"}
+{"name": "05715"}
+{"name": "05716"}
+{"name": "05717"}
+{"name": "05718"}
+{"name": "05719"}
+{"name": "05720"}
+{"name": "05721"}
+{"name": "05722"}
+{"name": "05723"}
+{"name": "05724"}
+{"name": "05725"}
+{"name": "05726"}
+{"name": "05727"}
+{"name": "05728"}
+{"name": "05729"}
+{"name": "05730"}
+{"name": "05731"}
+{"name": "05732"}
+{"name": "05733"}
+{"name": "05734"}
+{"name": "05735"}
+{"name": "05736"}
+{"name": "05737"}
+{"name": "05738"}
+{"name": "05739"}
+{"name": "05740"}
+{"name": "05741"}
+{"name": "05742"}
+{"name": "05743"}
+{"name": "05744"}
+{"name": "05745"}
+{"name": "05746"}
+{"name": "05747"}
+{"name": "05748"}
+{"name": "05749"}
+{"name": "05750"}
+{"name": "05751"}
+{"name": "05752"}
+{"name": "05753"}
+{"name": "05754"}
+{"name": "05755"}
+{"name": "05756"}
+{"name": "05757"}
+{"name": "05758"}
+{"name": "05759"}
+{"name": "05760"}
+{"name": "05761"}
+{"name": "05762"}
+{"name": "05763"}
+{"name": "05764"}
+{"name": "05765"}
+{"name": "05766"}
+{"name": "05767"}
+{"name": "05768"}
+{"name": "05769"}
+{"name": "05770"}
+{"name": "05771"}
+{"name": "05772"}
+{"name": "05773"}
+{"name": "05774"}
+{"name": "05775"}
+{"name": "05776"}
+{"name": "05777"}
+{"name": "05778"}
+{"name": "05779"}
+{"name": "05780"}
+{"name": "05781"}
+{"name": "05782"}
+{"name": "05783"}
+{"name": "05784"}
+{"name": "05785"}
+{"name": "05786"}
+{"name": "05787"}
+{"name": "05788"}
+{"name": "05789"}
+{"name": "05790"}
+{"name": "05791"}
+{"name": "05792"}
+{"name": "05793"}
+{"name": "05794"}
+{"name": "05795"}
+{"name": "05796"}
+{"name": "05797"}
+{"name": "05798"}
+{"name": "05799"}
+{"name": "05800"}
+{"name": "05801"}
+{"name": "05802"}
+{"name": "05803"}
+{"name": "05804"}
+{"name": "05805"}
+{"name": "05806"}
+{"name": "05807"}
+{"name": "05808"}
+{"name": "05809"}
+{"name": "05810"}
+{"name": "05811"}
+{"name": "05812"}
+{"name": "05813"}
+{"name": "05814"}
+{"name": "05815"}
+{"name": "05816"}
+{"name": "05817"}
+{"name": "05818"}
+{"name": "05819"}
+{"name": "05820"}
+{"name": "05821"}
+{"name": "05822"}
+{"name": "05823"}
+{"name": "05824"}
+{"name": "05825"}
+{"name": "05826"}
+{"name": "05827"}
+{"name": "05828"}
+{"name": "05829"}
+{"name": "05830"}
+{"name": "05831"}
+{"name": "05832"}
+{"name": "05833"}
+{"name": "05834"}
+{"name": "05835"}
+{"name": "05836"}
+{"name": "05837"}
+{"name": "05838"}
+{"name": "05839"}
+{"name": "05840"}
+{"name": "05841"}
+{"name": "05842"}
+{"name": "05843"}
+{"name": "05844"}
+{"name": "05845"}
+{"name": "05846"}
+{"name": "05847"}
+{"name": "05848"}
+{"name": "05849"}
+{"name": "05850"}
+{"name": "05851"}
+{"name": "05852"}
+{"name": "05853"}
+{"name": "05854"}
+{"name": "05855"}
+{"name": "05856"}
+{"name": "05857"}
+{"name": "05858"}
+{"name": "05859"}
+{"name": "05860"}
+{"name": "05861"}
+{"name": "05862"}
+{"name": "05863"}
+{"name": "05864"}
+{"name": "05865"}
+{"name": "05866"}
+{"name": "05867"}
+{"name": "05868"}
+{"name": "05869"}
+{"name": "05870"}
+{"name": "05871"}
+{"name": "05872"}
+{"name": "05873"}
+{"name": "05874"}
+{"name": "05875"}
+{"name": "05876"}
+{"name": "05877"}
+{"name": "05878"}
+{"name": "05879"}
+{"name": "05880"}
+{"name": "05881"}
+{"name": "05882"}
+{"name": "05883"}
+{"name": "05884"}
+{"name": "05885"}
+{"name": "05886"}
+{"name": "05887"}
+{"name": "05888"}
+{"name": "05889"}
+{"name": "05890"}
+{"name": "05891"}
+{"name": "05892"}
+{"name": "05893"}
+{"name": "05894"}
+{"name": "05895"}
+{"name": "05896"}
+{"name": "05897"}
+{"name": "05898"}
+{"name": "05899"}
+{"name": "05900"}
+{"name": "05901"}
+{"name": "05902"}
+{"name": "05903"}
+{"name": "05904"}
+{"name": "05905"}
+{"name": "05906"}
+{"name": "05907"}
+{"name": "05908"}
+{"name": "05909"}
+{"name": "05910"}
+{"name": "05911"}
+{"name": "05912"}
+{"name": "05913"}
+{"name": "05914"}
+{"name": "05915"}
+{"name": "05916"}
+{"name": "05917"}
+{"name": "05918"}
+{"name": "05919"}
+{"name": "05920"}
+{"name": "05921"}
+{"name": "05922"}
+{"name": "05923"}
+{"name": "05924"}
+{"name": "05925"}
+{"name": "05926"}
+{"name": "05927"}
+{"name": "05928"}
+{"name": "05929"}
+{"name": "05930"}
+{"name": "05931"}
+{"name": "05932"}
+{"name": "05933"}
+{"name": "05934"}
+{"name": "05935"}
+{"name": "05936"}
+{"name": "05937"}
+{"name": "05938"}
+{"name": "05939"}
+{"name": "05940"}
+{"name": "05941"}
+{"name": "05942"}
+{"name": "05943"}
+{"name": "05944"}
+{"name": "05945"}
+{"name": "05946"}
+{"name": "05947"}
+{"name": "05948"}
+{"name": "05949"}
+{"name": "05950"}
+{"name": "05951"}
+{"name": "05952"}
+{"name": "05953"}
+{"name": "05954"}
+{"name": "05955"}
+{"name": "05956"}
+{"name": "05957"}
+{"name": "05958"}
+{"name": "05959"}
+{"name": "05960"}
+{"name": "05961"}
+{"name": "05962"}
+{"name": "05963"}
+{"name": "05964"}
+{"name": "05965"}
+{"name": "05966"}
+{"name": "05967"}
+{"name": "05968"}
+{"name": "05969"}
+{"name": "05970"}
+{"name": "05971"}
+{"name": "05972"}
+{"name": "05973"}
+{"name": "05974"}
+{"name": "05975"}
+{"name": "05976"}
+{"name": "05977"}
+{"name": "05978"}
+{"name": "05979"}
+{"name": "05980"}
+{"name": "05981"}
+{"name": "05982"}
+{"name": "05983"}
+{"name": "05984"}
+{"name": "05985"}
+{"name": "05986"}
+{"name": "05987"}
+{"name": "05988"}
+{"name": "05989"}
+{"name": "05990"}
+{"name": "05991"}
+{"name": "05992"}
+{"name": "05993"}
+{"name": "05994"}
+{"name": "05995"}
+{"name": "05996"}
+{"name": "05997"}
+{"name": "05998"}
+{"name": "05999"}
+{"name": "06000"}
+{"name": "06001"}
+{"name": "06002"}
+{"name": "06003"}
+{"name": "06004"}
+{"name": "06005"}
+{"name": "06006"}
+{"name": "06007"}
+{"name": "06008"}
+{"name": "06009"}
+{"name": "06010"}
+{"name": "06011"}
+{"name": "06012"}
+{"name": "06013"}
+{"name": "06014"}
+{"name": "06015"}
+{"name": "06016"}
+{"name": "06017"}
+{"name": "06018"}
+{"name": "06019"}
+{"name": "06020"}
+{"name": "06021"}
+{"name": "06022"}
+{"name": "06023"}
+{"name": "06024"}
+{"name": "06025"}
+{"name": "06026"}
+{"name": "06027"}
+{"name": "06028"}
+{"name": "06029"}
+{"name": "06030"}
+{"name": "06031"}
+{"name": "06032"}
+{"name": "06033"}
+{"name": "06034"}
+{"name": "06035"}
+{"name": "06036"}
+{"name": "06037"}
+{"name": "06038"}
+{"name": "06039"}
+{"name": "06040"}
+{"name": "06041"}
+{"name": "06042"}
+{"name": "06043"}
+{"name": "06044"}
+{"name": "06045"}
+{"name": "06046"}
+{"name": "06047"}
+{"name": "06048"}
+{"name": "06049"}
+{"name": "06050"}
+{"name": "06051"}
+{"name": "06052"}
+{"name": "06053"}
+{"name": "06054"}
+{"name": "06055"}
+{"name": "06056"}
+{"name": "06057"}
+{"name": "06058"}
+{"name": "06059"}
+{"name": "06060"}
+{"name": "06061"}
+{"name": "06062"}
+{"name": "06063"}
+{"name": "06064"}
+{"name": "06065"}
+{"name": "06066"}
+{"name": "06067"}
+{"name": "06068"}
+{"name": "06069"}
+{"name": "06070"}
+{"name": "06071"}
+{"name": "06072"}
+{"name": "06073"}
+{"name": "06074"}
+{"name": "06075"}
+{"name": "06076"}
+{"name": "06077"}
+{"name": "06078"}
+{"name": "06079"}
+{"name": "06080"}
+{"name": "06081"}
+{"name": "06082"}
+{"name": "06083"}
+{"name": "06084"}
+{"name": "06085"}
+{"name": "06086"}
+{"name": "06087"}
+{"name": "06088"}
+{"name": "06089"}
+{"name": "06090"}
+{"name": "06091"}
+{"name": "06092"}
+{"name": "06093"}
+{"name": "06094"}
+{"name": "06095"}
+{"name": "06096"}
+{"name": "06097"}
+{"name": "06098"}
+{"name": "06099"}
+{"name": "06100"}
+{"name": "06101"}
+{"name": "06102"}
+{"name": "06103"}
+{"name": "06104"}
+{"name": "06105"}
+{"name": "06106"}
+{"name": "06107"}
+{"name": "06108"}
+{"name": "06109"}
+{"name": "06110"}
+{"name": "06111"}
+{"name": "06112"}
+{"name": "06113"}
+{"name": "06114"}
+{"name": "06115"}
+{"name": "06116"}
+{"name": "06117"}
+{"name": "06118"}
+{"name": "06119"}
+{"name": "06120"}
+{"name": "06121"}
+{"name": "06122"}
+{"name": "06123"}
+{"name": "06124"}
+{"name": "06125"}
+{"name": "06126"}
+{"name": "06127"}
+{"name": "06128"}
+{"name": "06129"}
+{"name": "06130"}
+{"name": "06131"}
+{"name": "06132"}
+{"name": "06133"}
+{"name": "06134"}
+{"name": "06135"}
+{"name": "06136"}
+{"name": "06137"}
+{"name": "06138"}
+{"name": "06139"}
+{"name": "06140"}
+{"name": "06141"}
+{"name": "06142"}
+{"name": "06143"}
+{"name": "06144"}
+{"name": "06145"}
+{"name": "06146"}
+{"name": "06147"}
+{"name": "06148"}
+{"name": "06149"}
+{"name": "06150"}
+{"name": "06151"}
+{"name": "06152"}
+{"name": "06153"}
+{"name": "06154"}
+{"name": "06155"}
+{"name": "06156"}
+{"name": "06157"}
+{"name": "06158"}
+{"name": "06159"}
+{"name": "06160"}
+{"name": "06161"}
+{"name": "06162"}
+{"name": "06163"}
+{"name": "06164"}
+{"name": "06165"}
+{"name": "06166"}
+{"name": "06167"}
+{"name": "06168"}
+{"name": "06169"}
+{"name": "06170"}
+{"name": "06171"}
+{"name": "06172"}
+{"name": "06173"}
+{"name": "06174"}
+{"name": "06175"}
+{"name": "06176"}
+{"name": "06177"}
+{"name": "06178"}
+{"name": "06179"}
+{"name": "06180"}
+{"name": "06181"}
+{"name": "06182"}
+{"name": "06183"}
+{"name": "06184"}
+{"name": "06185"}
+{"name": "06186"}
+{"name": "06187"}
+{"name": "06188"}
+{"name": "06189"}
+{"name": "06190"}
+{"name": "06191"}
+{"name": "06192"}
+{"name": "06193"}
+{"name": "06194"}
+{"name": "06195"}
+{"name": "06196"}
+{"name": "06197"}
+{"name": "06198"}
+{"name": "06199"}
+{"name": "06200"}
+{"name": "06201"}
+{"name": "06202"}
+{"name": "06203"}
+{"name": "06204"}
+{"name": "06205"}
+{"name": "06206"}
+{"name": "06207"}
+{"name": "06208"}
+{"name": "06209"}
+{"name": "06210"}
+{"name": "06211"}
+{"name": "06212"}
+{"name": "06213"}
+{"name": "06214"}
+{"name": "06215"}
+{"name": "06216"}
+{"name": "06217"}
+{"name": "06218"}
+{"name": "06219"}
+{"name": "06220"}
+{"name": "06221"}
+{"name": "06222"}
+{"name": "06223"}
+{"name": "06224"}
+{"name": "06225"}
+{"name": "06226"}
+{"name": "06227"}
+{"name": "06228"}
+{"name": "06229"}
+{"name": "06230"}
+{"name": "06231"}
+{"name": "06232"}
+{"name": "06233"}
+{"name": "06234"}
+{"name": "06235"}
+{"name": "06236"}
+{"name": "06237"}
+{"name": "06238"}
+{"name": "06239"}
+{"name": "06240"}
+{"name": "06241"}
+{"name": "06242"}
+{"name": "06243"}
+{"name": "06244"}
+{"name": "06245"}
+{"name": "06246"}
+{"name": "06247"}
+{"name": "06248"}
+{"name": "06249"}
+{"name": "06250"}
+{"name": "06251"}
+{"name": "06252"}
+{"name": "06253"}
+{"name": "06254"}
+{"name": "06255"}
+{"name": "06256"}
+{"name": "06257"}
+{"name": "06258"}
+{"name": "06259"}
+{"name": "06260"}
+{"name": "06261"}
+{"name": "06262"}
+{"name": "06263"}
+{"name": "06264"}
+{"name": "06265"}
+{"name": "06266"}
+{"name": "06267"}
+{"name": "06268"}
+{"name": "06269"}
+{"name": "06270"}
+{"name": "06271"}
+{"name": "06272"}
+{"name": "06273"}
+{"name": "06274"}
+{"name": "06275"}
+{"name": "06276"}
+{"name": "06277"}
+{"name": "06278"}
+{"name": "06279"}
+{"name": "06280"}
+{"name": "06281"}
+{"name": "06282"}
+{"name": "06283"}
+{"name": "06284"}
+{"name": "06285"}
+{"name": "06286"}
+{"name": "06287"}
+{"name": "06288"}
+{"name": "06289"}
+{"name": "06290"}
+{"name": "06291"}
+{"name": "06292"}
+{"name": "06293"}
+{"name": "06294"}
+{"name": "06295"}
+{"name": "06296"}
+{"name": "06297"}
+{"name": "06298"}
+{"name": "06299"}
+{"name": "06300"}
+{"name": "06301"}
+{"name": "06302"}
+{"name": "06303"}
+{"name": "06304"}
+{"name": "06305"}
+{"name": "06306"}
+{"name": "06307"}
+{"name": "06308"}
+{"name": "06309"}
+{"name": "06310"}
+{"name": "06311"}
+{"name": "06312"}
+{"name": "06313"}
+{"name": "06314"}
+{"name": "06315"}
+{"name": "06316"}
+{"name": "06317"}
+{"name": "06318"}
+{"name": "06319"}
+{"name": "06320"}
+{"name": "06321"}
+{"name": "06322"}
+{"name": "06323"}
+{"name": "06324"}
+{"name": "06325"}
+{"name": "06326"}
+{"name": "06327"}
+{"name": "06328"}
+{"name": "06329"}
+{"name": "06330"}
+{"name": "06331"}
+{"name": "06332"}
+{"name": "06333"}
+{"name": "06334"}
+{"name": "06335"}
+{"name": "06336"}
+{"name": "06337"}
+{"name": "06338"}
+{"name": "06339"}
+{"name": "06340"}
+{"name": "06341"}
+{"name": "06342"}
+{"name": "06343"}
+{"name": "06344"}
+{"name": "06345"}
+{"name": "06346"}
+{"name": "06347"}
+{"name": "06348"}
+{"name": "06349"}
+{"name": "06350"}
+{"name": "06351"}
+{"name": "06352"}
+{"name": "06353"}
+{"name": "06354"}
+{"name": "06355"}
+{"name": "06356"}
+{"name": "06357"}
+{"name": "06358"}
+{"name": "06359"}
+{"name": "06360"}
+{"name": "06361"}
+{"name": "06362"}
+{"name": "06363"}
+{"name": "06364"}
+{"name": "06365"}
+{"name": "06366"}
+{"name": "06367"}
+{"name": "06368"}
+{"name": "06369"}
+{"name": "06370"}
+{"name": "06371"}
+{"name": "06372"}
+{"name": "06373"}
+{"name": "06374"}
+{"name": "06375"}
+{"name": "06376"}
+{"name": "06377"}
+{"name": "06378"}
+{"name": "06379"}
+{"name": "06380"}
+{"name": "06381"}
+{"name": "06382"}
+{"name": "06383"}
+{"name": "06384"}
+{"name": "06385"}
+{"name": "06386"}
+{"name": "06387"}
+{"name": "06388"}
+{"name": "06389"}
+{"name": "06390"}
+{"name": "06391"}
+{"name": "06392"}
+{"name": "06393"}
+{"name": "06394"}
+{"name": "06395"}
+{"name": "06396"}
+{"name": "06397"}
+{"name": "06398"}
+{"name": "06399"}
+{"name": "06400"}
+{"name": "06401"}
+{"name": "06402"}
+{"name": "06403"}
+{"name": "06404"}
+{"name": "06405"}
+{"name": "06406"}
+{"name": "06407"}
+{"name": "06408"}
+{"name": "06409"}
+{"name": "06410"}
+{"name": "06411"}
+{"name": "06412"}
+{"name": "06413"}
+{"name": "06414"}
+{"name": "06415"}
+{"name": "06416"}
+{"name": "06417"}
+{"name": "06418"}
+{"name": "06419"}
+{"name": "06420"}
+{"name": "06421"}
+{"name": "06422"}
+{"name": "06423"}
+{"name": "06424"}
+{"name": "06425"}
+{"name": "06426"}
+{"name": "06427"}
+{"name": "06428"}
+{"name": "06429"}
+{"name": "06430"}
+{"name": "06431"}
+{"name": "06432"}
+{"name": "06433"}
+{"name": "06434"}
+{"name": "06435"}
+{"name": "06436"}
+{"name": "06437"}
+{"name": "06438"}
+{"name": "06439"}
+{"name": "06440"}
+{"name": "06441"}
+{"name": "06442"}
+{"name": "06443"}
+{"name": "06444"}
+{"name": "06445"}
+{"name": "06446"}
+{"name": "06447"}
+{"name": "06448"}
+{"name": "06449"}
+{"name": "06450"}
+{"name": "06451"}
+{"name": "06452"}
+{"name": "06453"}
+{"name": "06454"}
+{"name": "06455"}
+{"name": "06456"}
+{"name": "06457"}
+{"name": "06458"}
+{"name": "06459"}
+{"name": "06460"}
+{"name": "06461"}
+{"name": "06462"}
+{"name": "06463"}
+{"name": "06464"}
+{"name": "06465"}
+{"name": "06466"}
+{"name": "06467"}
+{"name": "06468"}
+{"name": "06469"}
+{"name": "06470"}
+{"name": "06471"}
+{"name": "06472"}
+{"name": "06473"}
+{"name": "06474"}
+{"name": "06475"}
+{"name": "06476"}
+{"name": "06477"}
+{"name": "06478"}
+{"name": "06479"}
+{"name": "06480"}
+{"name": "06481"}
+{"name": "06482"}
+{"name": "06483"}
+{"name": "06484"}
+{"name": "06485"}
+{"name": "06486"}
+{"name": "06487"}
+{"name": "06488"}
+{"name": "06489"}
+{"name": "06490"}
+{"name": "06491"}
+{"name": "06492"}
+{"name": "06493"}
+{"name": "06494"}
+{"name": "06495"}
+{"name": "06496"}
+{"name": "06497"}
+{"name": "06498"}
+{"name": "06499"}
+{"name": "06500"}
+{"name": "06501"}
+{"name": "06502"}
+{"name": "06503"}
+{"name": "06504"}
+{"name": "06505"}
+{"name": "06506"}
+{"name": "06507"}
+{"name": "06508"}
+{"name": "06509"}
+{"name": "06510"}
+{"name": "06511"}
+{"name": "06512"}
+{"name": "06513"}
+{"name": "06514"}
+{"name": "06515"}
+{"name": "06516"}
+{"name": "06517"}
+{"name": "06518"}
+{"name": "06519"}
+{"name": "06520"}
+{"name": "06521"}
+{"name": "06522"}
+{"name": "06523"}
+{"name": "06524"}
+{"name": "06525"}
+{"name": "06526"}
+{"name": "06527"}
+{"name": "06528"}
+{"name": "06529"}
+{"name": "06530"}
+{"name": "06531"}
+{"name": "06532"}
+{"name": "06533"}
+{"name": "06534"}
+{"name": "06535"}
+{"name": "06536"}
+{"name": "06537"}
+{"name": "06538"}
+{"name": "06539"}
+{"name": "06540"}
+{"name": "06541"}
+{"name": "06542"}
+{"name": "06543"}
+{"name": "06544"}
+{"name": "06545"}
+{"name": "06546"}
+{"name": "06547"}
+{"name": "06548"}
+{"name": "06549"}
+{"name": "06550"}
+{"name": "06551"}
+{"name": "06552"}
+{"name": "06553"}
+{"name": "06554"}
+{"name": "06555"}
+{"name": "06556"}
+{"name": "06557"}
+{"name": "06558"}
+{"name": "06559"}
+{"name": "06560"}
+{"name": "06561"}
+{"name": "06562"}
+{"name": "06563"}
+{"name": "06564"}
+{"name": "06565"}
+{"name": "06566"}
+{"name": "06567"}
+{"name": "06568"}
+{"name": "06569"}
+{"name": "06570"}
+{"name": "06571"}
+{"name": "06572"}
+{"name": "06573"}
+{"name": "06574"}
+{"name": "06575"}
+{"name": "06576"}
+{"name": "06577"}
+{"name": "06578"}
+{"name": "06579"}
+{"name": "06580"}
+{"name": "06581"}
+{"name": "06582"}
+{"name": "06583"}
+{"name": "06584"}
+{"name": "06585"}
+{"name": "06586"}
+{"name": "06587"}
+{"name": "06588"}
+{"name": "06589"}
+{"name": "06590"}
+{"name": "06591"}
+{"name": "06592"}
+{"name": "06593"}
+{"name": "06594"}
+{"name": "06595"}
+{"name": "06596"}
+{"name": "06597"}
+{"name": "06598"}
+{"name": "06599"}
+{"name": "06600"}
+{"name": "06601"}
+{"name": "06602"}
+{"name": "06603"}
+{"name": "06604"}
+{"name": "06605"}
+{"name": "06606"}
+{"name": "06607"}
+{"name": "06608"}
+{"name": "06609"}
+{"name": "06610"}
+{"name": "06611"}
+{"name": "06612"}
+{"name": "06613"}
+{"name": "06614"}
+{"name": "06615"}
+{"name": "06616"}
+{"name": "06617"}
+{"name": "06618"}
+{"name": "06619"}
+{"name": "06620"}
+{"name": "06621"}
+{"name": "06622"}
+{"name": "06623"}
+{"name": "06624"}
+{"name": "06625"}
+{"name": "06626"}
+{"name": "06627"}
+{"name": "06628"}
+{"name": "06629"}
+{"name": "06630"}
+{"name": "06631"}
+{"name": "06632"}
+{"name": "06633"}
+{"name": "06634"}
+{"name": "06635"}
+{"name": "06636"}
+{"name": "06637"}
+{"name": "06638"}
+{"name": "06639"}
+{"name": "06640"}
+{"name": "06641"}
+{"name": "06642"}
+{"name": "06643"}
+{"name": "06644"}
+{"name": "06645"}
+{"name": "06646"}
+{"name": "06647"}
+{"name": "06648"}
+{"name": "06649"}
+{"name": "06650"}
+{"name": "06651"}
+{"name": "06652"}
+{"name": "06653"}
+{"name": "06654"}
+{"name": "06655"}
+{"name": "06656"}
+{"name": "06657"}
+{"name": "06658"}
+{"name": "06659"}
+{"name": "06660"}
+{"name": "06661"}
+{"name": "06662"}
+{"name": "06663"}
+{"name": "06664"}
+{"name": "06665"}
+{"name": "06666"}
+{"name": "06667"}
+{"name": "06668"}
+{"name": "06669"}
+{"name": "06670"}
+{"name": "06671"}
+{"name": "06672"}
+{"name": "06673"}
+{"name": "06674"}
+{"name": "06675"}
+{"name": "06676"}
+{"name": "06677"}
+{"name": "06678"}
+{"name": "06679"}
+{"name": "06680"}
+{"name": "06681"}
+{"name": "06682"}
+{"name": "06683"}
+{"name": "06684"}
+{"name": "06685"}
+{"name": "06686"}
+{"name": "06687"}
+{"name": "06688"}
+{"name": "06689"}
+{"name": "06690"}
+{"name": "06691"}
+{"name": "06692"}
+{"name": "06693"}
+{"name": "06694"}
+{"name": "06695"}
+{"name": "06696"}
+{"name": "06697"}
+{"name": "06698"}
+{"name": "06699"}
+{"name": "06700"}
+{"name": "06701"}
+{"name": "06702"}
+{"name": "06703"}
+{"name": "06704"}
+{"name": "06705"}
+{"name": "06706"}
+{"name": "06707"}
+{"name": "06708"}
+{"name": "06709"}
+{"name": "06710"}
+{"name": "06711"}
+{"name": "06712"}
+{"name": "06713"}
+{"name": "06714"}
+{"name": "06715"}
+{"name": "06716"}
+{"name": "06717"}
+{"name": "06718"}
+{"name": "06719"}
+{"name": "06720"}
+{"name": "06721"}
+{"name": "06722"}
+{"name": "06723"}
+{"name": "06724"}
+{"name": "06725"}
+{"name": "06726"}
+{"name": "06727"}
+{"name": "06728"}
+{"name": "06729"}
+{"name": "06730"}
+{"name": "06731"}
+{"name": "06732"}
+{"name": "06733"}
+{"name": "06734"}
+{"name": "06735"}
+{"name": "06736"}
+{"name": "06737"}
+{"name": "06738"}
+{"name": "06739"}
+{"name": "06740"}
+{"name": "06741"}
+{"name": "06742"}
+{"name": "06743"}
+{"name": "06744"}
+{"name": "06745"}
+{"name": "06746"}
+{"name": "06747"}
+{"name": "06748"}
+{"name": "06749"}
+{"name": "06750"}
+{"name": "06751"}
+{"name": "06752"}
+{"name": "06753"}
+{"name": "06754"}
+{"name": "06755"}
+{"name": "06756"}
+{"name": "06757"}
+{"name": "06758"}
+{"name": "06759"}
+{"name": "06760"}
+{"name": "06761"}
+{"name": "06762"}
+{"name": "06763"}
+{"name": "06764"}
+{"name": "06765"}
+{"name": "06766"}
+{"name": "06767"}
+{"name": "06768"}
+{"name": "06769"}
+{"name": "06770"}
+{"name": "06771"}
+{"name": "06772"}
+{"name": "06773"}
+{"name": "06774"}
+{"name": "06775"}
+{"name": "06776"}
+{"name": "06777"}
+{"name": "06778"}
+{"name": "06779"}
+{"name": "06780"}
+{"name": "06781"}
+{"name": "06782"}
+{"name": "06783"}
+{"name": "06784"}
+{"name": "06785"}
+{"name": "06786"}
+{"name": "06787"}
+{"name": "06788"}
+{"name": "06789"}
+{"name": "06790"}
+{"name": "06791"}
+{"name": "06792"}
+{"name": "06793"}
+{"name": "06794"}
+{"name": "06795"}
+{"name": "06796"}
+{"name": "06797"}
+{"name": "06798"}
+{"name": "06799"}
+{"name": "06800"}
+{"name": "06801"}
+{"name": "06802"}
+{"name": "06803"}
+{"name": "06804"}
+{"name": "06805"}
+{"name": "06806"}
+{"name": "06807"}
+{"name": "06808"}
+{"name": "06809"}
+{"name": "06810"}
+{"name": "06811"}
+{"name": "06812"}
+{"name": "06813"}
+{"name": "06814"}
+{"name": "06815"}
+{"name": "06816"}
+{"name": "06817"}
+{"name": "06818"}
+{"name": "06819"}
+{"name": "06820"}
+{"name": "06821"}
+{"name": "06822"}
+{"name": "06823"}
+{"name": "06824"}
+{"name": "06825"}
+{"name": "06826"}
+{"name": "06827"}
+{"name": "06828"}
+{"name": "06829"}
+{"name": "06830"}
+{"name": "06831"}
+{"name": "06832"}
+{"name": "06833"}
+{"name": "06834"}
+{"name": "06835"}
+{"name": "06836"}
+{"name": "06837"}
+{"name": "06838"}
+{"name": "06839"}
+{"name": "06840"}
+{"name": "06841"}
+{"name": "06842"}
+{"name": "06843"}
+{"name": "06844"}
+{"name": "06845"}
+{"name": "06846"}
+{"name": "06847"}
+{"name": "06848"}
+{"name": "06849"}
+{"name": "06850"}
+{"name": "06851"}
+{"name": "06852"}
+{"name": "06853"}
+{"name": "06854"}
+{"name": "06855"}
+{"name": "06856"}
+{"name": "06857"}
+{"name": "06858"}
+{"name": "06859"}
+{"name": "06860"}
+{"name": "06861"}
+{"name": "06862"}
+{"name": "06863"}
+{"name": "06864"}
+{"name": "06865"}
+{"name": "06866"}
+{"name": "06867"}
+{"name": "06868"}
+{"name": "06869"}
+{"name": "06870"}
+{"name": "06871"}
+{"name": "06872"}
+{"name": "06873"}
+{"name": "06874"}
+{"name": "06875"}
+{"name": "06876"}
+{"name": "06877"}
+{"name": "06878"}
+{"name": "06879"}
+{"name": "06880"}
+{"name": "06881"}
+{"name": "06882"}
+{"name": "06883"}
+{"name": "06884"}
+{"name": "06885"}
+{"name": "06886"}
+{"name": "06887"}
+{"name": "06888"}
+{"name": "06889"}
+{"name": "06890"}
+{"name": "06891"}
+{"name": "06892"}
+{"name": "06893"}
+{"name": "06894"}
+{"name": "06895"}
+{"name": "06896"}
+{"name": "06897"}
+{"name": "06898"}
+{"name": "06899"}
+{"name": "06900"}
+{"name": "06901"}
+{"name": "06902"}
+{"name": "06903"}
+{"name": "06904"}
+{"name": "06905"}
+{"name": "06906"}
+{"name": "06907"}
+{"name": "06908"}
+{"name": "06909"}
+{"name": "06910"}
+{"name": "06911"}
+{"name": "06912"}
+{"name": "06913"}
+{"name": "06914"}
+{"name": "06915"}
+{"name": "06916"}
+{"name": "06917"}
+{"name": "06918"}
+{"name": "06919"}
+{"name": "06920"}
+{"name": "06921"}
+{"name": "06922"}
+{"name": "06923"}
+{"name": "06924"}
+{"name": "06925"}
+{"name": "06926"}
+{"name": "06927"}
+{"name": "06928"}
+{"name": "06929"}
+{"name": "06930"}
+{"name": "06931"}
+{"name": "06932"}
+{"name": "06933"}
+{"name": "06934"}
+{"name": "06935"}
+{"name": "06936"}
+{"name": "06937"}
+{"name": "06938"}
+{"name": "06939"}
+{"name": "06940"}
+{"name": "06941"}
+{"name": "06942"}
+{"name": "06943"}
+{"name": "06944"}
+{"name": "06945"}
+{"name": "06946"}
+{"name": "06947"}
+{"name": "06948"}
+{"name": "06949"}
+{"name": "06950"}
+{"name": "06951"}
+{"name": "06952"}
+{"name": "06953"}
+{"name": "06954"}
+{"name": "06955"}
+{"name": "06956"}
+{"name": "06957"}
+{"name": "06958"}
+{"name": "06959"}
+{"name": "06960"}
+{"name": "06961"}
+{"name": "06962"}
+{"name": "06963"}
+{"name": "06964"}
+{"name": "06965"}
+{"name": "06966"}
+{"name": "06967"}
+{"name": "06968"}
+{"name": "06969"}
+{"name": "06970"}
+{"name": "06971"}
+{"name": "06972"}
+{"name": "06973"}
+{"name": "06974"}
+{"name": "06975"}
+{"name": "06976"}
+{"name": "06977"}
+{"name": "06978"}
+{"name": "06979"}
+{"name": "06980"}
+{"name": "06981"}
+{"name": "06982"}
+{"name": "06983"}
+{"name": "06984"}
+{"name": "06985"}
+{"name": "06986"}
+{"name": "06987"}
+{"name": "06988"}
+{"name": "06989"}
+{"name": "06990"}
+{"name": "06991"}
+{"name": "06992"}
+{"name": "06993"}
+{"name": "06994"}
+{"name": "06995"}
+{"name": "06996"}
+{"name": "06997"}
+{"name": "06998"}
+{"name": "06999"}
+{"name": "07000"}
+{"name": "07001"}
+{"name": "07002"}
+{"name": "07003"}
+{"name": "07004"}
+{"name": "07005"}
+{"name": "07006"}
+{"name": "07007"}
+{"name": "07008"}
+{"name": "07009"}
+{"name": "07010"}
+{"name": "07011"}
+{"name": "07012"}
+{"name": "07013"}
+{"name": "07014"}
+{"name": "07015"}
+{"name": "07016"}
+{"name": "07017"}
+{"name": "07018"}
+{"name": "07019"}
+{"name": "07020"}
+{"name": "07021"}
+{"name": "07022"}
+{"name": "07023"}
+{"name": "07024"}
+{"name": "07025"}
+{"name": "07026"}
+{"name": "07027"}
+{"name": "07028"}
+{"name": "07029"}
+{"name": "07030"}
+{"name": "07031"}
+{"name": "07032"}
+{"name": "07033"}
+{"name": "07034"}
+{"name": "07035"}
+{"name": "07036"}
+{"name": "07037"}
+{"name": "07038"}
+{"name": "07039"}
+{"name": "07040"}
+{"name": "07041"}
+{"name": "07042"}
+{"name": "07043"}
+{"name": "07044"}
+{"name": "07045"}
+{"name": "07046"}
+{"name": "07047"}
+{"name": "07048"}
+{"name": "07049"}
+{"name": "07050"}
+{"name": "07051"}
+{"name": "07052"}
+{"name": "07053"}
+{"name": "07054"}
+{"name": "07055"}
+{"name": "07056"}
+{"name": "07057"}
+{"name": "07058"}
+{"name": "07059"}
+{"name": "07060"}
+{"name": "07061"}
+{"name": "07062"}
+{"name": "07063"}
+{"name": "07064"}
+{"name": "07065"}
+{"name": "07066"}
+{"name": "07067"}
+{"name": "07068"}
+{"name": "07069"}
+{"name": "07070"}
+{"name": "07071"}
+{"name": "07072"}
+{"name": "07073"}
+{"name": "07074"}
+{"name": "07075"}
+{"name": "07076"}
+{"name": "07077"}
+{"name": "07078"}
+{"name": "07079"}
+{"name": "07080"}
+{"name": "07081"}
+{"name": "07082"}
+{"name": "07083"}
+{"name": "07084"}
+{"name": "07085"}
+{"name": "07086"}
+{"name": "07087"}
+{"name": "07088"}
+{"name": "07089"}
+{"name": "07090"}
+{"name": "07091"}
+{"name": "07092"}
+{"name": "07093"}
+{"name": "07094"}
+{"name": "07095"}
+{"name": "07096"}
+{"name": "07097"}
+{"name": "07098"}
+{"name": "07099"}
+{"name": "07100"}
+{"name": "07101"}
+{"name": "07102"}
+{"name": "07103"}
+{"name": "07104"}
+{"name": "07105"}
+{"name": "07106"}
+{"name": "07107"}
+{"name": "07108"}
+{"name": "07109"}
+{"name": "07110"}
+{"name": "07111"}
+{"name": "07112"}
+{"name": "07113"}
+{"name": "07114"}
+{"name": "07115"}
+{"name": "07116"}
+{"name": "07117"}
+{"name": "07118"}
+{"name": "07119"}
+{"name": "07120"}
+{"name": "07121"}
+{"name": "07122"}
+{"name": "07123"}
+{"name": "07124"}
+{"name": "07125"}
+{"name": "07126"}
+{"name": "07127"}
+{"name": "07128"}
+{"name": "07129"}
+{"name": "07130"}
+{"name": "07131"}
+{"name": "07132"}
+{"name": "07133"}
+{"name": "07134"}
+{"name": "07135"}
+{"name": "07136"}
+{"name": "07137"}
+{"name": "07138"}
+{"name": "07139"}
+{"name": "07140"}
+{"name": "07141"}
+{"name": "07142"}
+{"name": "07143"}
+{"name": "07144"}
+{"name": "07145"}
+{"name": "07146"}
+{"name": "07147"}
+{"name": "07148"}
+{"name": "07149"}
+{"name": "07150"}
+{"name": "07151"}
+{"name": "07152"}
+{"name": "07153"}
+{"name": "07154"}
+{"name": "07155"}
+{"name": "07156"}
+{"name": "07157"}
+{"name": "07158"}
+{"name": "07159"}
+{"name": "07160"}
+{"name": "07161"}
+{"name": "07162"}
+{"name": "07163"}
+{"name": "07164"}
+{"name": "07165"}
+{"name": "07166"}
+{"name": "07167"}
+{"name": "07168"}
+{"name": "07169"}
+{"name": "07170"}
+{"name": "07171"}
+{"name": "07172"}
+{"name": "07173"}
+{"name": "07174"}
+{"name": "07175"}
+{"name": "07176"}
+{"name": "07177"}
+{"name": "07178"}
+{"name": "07179"}
+{"name": "07180"}
+{"name": "07181"}
+{"name": "07182"}
+{"name": "07183"}
+{"name": "07184"}
+{"name": "07185"}
+{"name": "07186"}
+{"name": "07187"}
+{"name": "07188"}
+{"name": "07189"}
+{"name": "07190"}
+{"name": "07191"}
+{"name": "07192"}
+{"name": "07193"}
+{"name": "07194"}
+{"name": "07195"}
+{"name": "07196"}
+{"name": "07197"}
+{"name": "07198"}
+{"name": "07199"}
+{"name": "07200"}
+{"name": "07201"}
+{"name": "07202"}
+{"name": "07203"}
+{"name": "07204"}
+{"name": "07205"}
+{"name": "07206"}
+{"name": "07207"}
+{"name": "07208"}
+{"name": "07209"}
+{"name": "07210"}
+{"name": "07211"}
+{"name": "07212"}
+{"name": "07213"}
+{"name": "07214"}
+{"name": "07215"}
+{"name": "07216"}
+{"name": "07217"}
+{"name": "07218"}
+{"name": "07219"}
+{"name": "07220"}
+{"name": "07221"}
+{"name": "07222"}
+{"name": "07223"}
+{"name": "07224"}
+{"name": "07225"}
+{"name": "07226"}
+{"name": "07227"}
+{"name": "07228"}
+{"name": "07229"}
+{"name": "07230"}
+{"name": "07231"}
+{"name": "07232"}
+{"name": "07233"}
+{"name": "07234"}
+{"name": "07235"}
+{"name": "07236"}
+{"name": "07237"}
+{"name": "07238"}
+{"name": "07239"}
+{"name": "07240"}
+{"name": "07241"}
+{"name": "07242"}
+{"name": "07243"}
+{"name": "07244"}
+{"name": "07245"}
+{"name": "07246"}
+{"name": "07247"}
+{"name": "07248"}
+{"name": "07249"}
+{"name": "07250"}
+{"name": "07251"}
+{"name": "07252"}
+{"name": "07253"}
+{"name": "07254"}
+{"name": "07255"}
+{"name": "07256"}
+{"name": "07257"}
+{"name": "07258"}
+{"name": "07259"}
+{"name": "07260"}
+{"name": "07261"}
+{"name": "07262"}
+{"name": "07263"}
+{"name": "07264"}
+{"name": "07265"}
+{"name": "07266"}
+{"name": "07267"}
+{"name": "07268"}
+{"name": "07269"}
+{"name": "07270"}
+{"name": "07271"}
+{"name": "07272"}
+{"name": "07273"}
+{"name": "07274"}
+{"name": "07275"}
+{"name": "07276"}
+{"name": "07277"}
+{"name": "07278"}
+{"name": "07279"}
+{"name": "07280"}
+{"name": "07281"}
@@ -0,0 +1,2718 @@
+{"name": "07282"}
+{"name": "07283"}
+{"name": "07284"}
+{"name": "07285"}
+{"name": "07286"}
+{"name": "07287"}
+{"name": "07288"}
+{"name": "07289"}
+{"name": "07290"}
+{"name": "07291"}
+{"name": "07292"}
+{"name": "07293"}
+{"name": "07294"}
+{"name": "07295"}
+{"name": "07296"}
+{"name": "07297"}
+{"name": "07298"}
+{"name": "07299"}
+{"name": "07300"}
+{"name": "07301"}
+{"name": "07302"}
+{"name": "07303"}
+{"name": "07304"}
+{"name": "07305"}
+{"name": "07306"}
+{"name": "07307"}
+{"name": "07308"}
+{"name": "07309"}
+{"name": "07310"}
+{"name": "07311"}
+{"name": "07312"}
+{"name": "07313"}
+{"name": "07314"}
+{"name": "07315"}
+{"name": "07316"}
+{"name": "07317"}
+{"name": "07318"}
+{"name": "07319"}
+{"name": "07320"}
+{"name": "07321"}
+{"name": "07322"}
+{"name": "07323"}
+{"name": "07324"}
+{"name": "07325"}
+{"name": "07326"}
+{"name": "07327"}
+{"name": "07328"}
+{"name": "07329"}
+{"name": "07330"}
+{"name": "07331"}
+{"name": "07332"}
+{"name": "07333"}
+{"name": "07334"}
+{"name": "07335"}
+{"name": "07336"}
+{"name": "07337"}
+{"name": "07338"}
+{"name": "07339"}
+{"name": "07340"}
+{"name": "07341"}
+{"name": "07342"}
+{"name": "07343"}
+{"name": "07344"}
+{"name": "07345"}
+{"name": "07346"}
+{"name": "07347"}
+{"name": "07348"}
+{"name": "07349"}
+{"name": "07350"}
+{"name": "07351"}
+{"name": "07352"}
+{"name": "07353"}
+{"name": "07354"}
+{"name": "07355"}
+{"name": "07356"}
+{"name": "07357"}
+{"name": "07358"}
+{"name": "07359"}
+{"name": "07360"}
+{"name": "07361"}
+{"name": "07362"}
+{"name": "07363"}
+{"name": "07364"}
+{"name": "07365"}
+{"name": "07366"}
+{"name": "07367"}
+{"name": "07368"}
+{"name": "07369"}
+{"name": "07370"}
+{"name": "07371"}
+{"name": "07372"}
+{"name": "07373"}
+{"name": "07374"}
+{"name": "07375"}
+{"name": "07376"}
+{"name": "07377"}
+{"name": "07378"}
+{"name": "07379"}
+{"name": "07380"}
+{"name": "07381"}
+{"name": "07382"}
+{"name": "07383"}
+{"name": "07384"}
+{"name": "07385"}
+{"name": "07386"}
+{"name": "07387"}
+{"name": "07388"}
+{"name": "07389"}
+{"name": "07390"}
+{"name": "07391"}
+{"name": "07392"}
+{"name": "07393"}
+{"name": "07394"}
+{"name": "07395"}
+{"name": "07396"}
+{"name": "07397"}
+{"name": "07398"}
+{"name": "07399"}
+{"name": "07400"}
+{"name": "07401"}
+{"name": "07402"}
+{"name": "07403"}
+{"name": "07404"}
+{"name": "07405"}
+{"name": "07406"}
+{"name": "07407"}
+{"name": "07408"}
+{"name": "07409"}
+{"name": "07410"}
+{"name": "07411"}
+{"name": "07412"}
+{"name": "07413"}
+{"name": "07414"}
+{"name": "07415"}
+{"name": "07416"}
+{"name": "07417"}
+{"name": "07418"}
+{"name": "07419"}
+{"name": "07420"}
+{"name": "07421"}
+{"name": "07422"}
+{"name": "07423"}
+{"name": "07424"}
+{"name": "07425"}
+{"name": "07426"}
+{"name": "07427"}
+{"name": "07428"}
+{"name": "07429"}
+{"name": "07430"}
+{"name": "07431"}
+{"name": "07432"}
+{"name": "07433"}
+{"name": "07434"}
+{"name": "07435"}
+{"name": "07436"}
+{"name": "07437"}
+{"name": "07438"}
+{"name": "07439"}
+{"name": "07440"}
+{"name": "07441"}
+{"name": "07442"}
+{"name": "07443"}
+{"name": "07444"}
+{"name": "07445"}
+{"name": "07446"}
+{"name": "07447"}
+{"name": "07448"}
+{"name": "07449"}
+{"name": "07450"}
+{"name": "07451"}
+{"name": "07452"}
+{"name": "07453"}
+{"name": "07454"}
+{"name": "07455"}
+{"name": "07456"}
+{"name": "07457"}
+{"name": "07458"}
+{"name": "07459"}
+{"name": "07460"}
+{"name": "07461"}
+{"name": "07462"}
+{"name": "07463"}
+{"name": "07464"}
+{"name": "07465"}
+{"name": "07466"}
+{"name": "07467"}
+{"name": "07468"}
+{"name": "07469"}
+{"name": "07470"}
+{"name": "07471"}
+{"name": "07472"}
+{"name": "07473"}
+{"name": "07474"}
+{"name": "07475"}
+{"name": "07476"}
+{"name": "07477"}
+{"name": "07478"}
+{"name": "07479"}
+{"name": "07480"}
+{"name": "07481"}
+{"name": "07482"}
+{"name": "07483"}
+{"name": "07484"}
+{"name": "07485"}
+{"name": "07486"}
+{"name": "07487"}
+{"name": "07488"}
+{"name": "07489"}
+{"name": "07490"}
+{"name": "07491"}
+{"name": "07492"}
+{"name": "07493"}
+{"name": "07494"}
+{"name": "07495"}
+{"name": "07496"}
+{"name": "07497"}
+{"name": "07498"}
+{"name": "07499"}
+{"name": "07500"}
+{"name": "07501"}
+{"name": "07502"}
+{"name": "07503"}
+{"name": "07504"}
+{"name": "07505"}
+{"name": "07506"}
+{"name": "07507"}
+{"name": "07508"}
+{"name": "07509"}
+{"name": "07510"}
+{"name": "07511"}
+{"name": "07512"}
+{"name": "07513"}
+{"name": "07514"}
+{"name": "07515"}
+{"name": "07516"}
+{"name": "07517"}
+{"name": "07518"}
+{"name": "07519"}
+{"name": "07520"}
+{"name": "07521"}
+{"name": "07522"}
+{"name": "07523"}
+{"name": "07524"}
+{"name": "07525"}
+{"name": "07526"}
+{"name": "07527"}
+{"name": "07528"}
+{"name": "07529"}
+{"name": "07530"}
+{"name": "07531"}
+{"name": "07532"}
+{"name": "07533"}
+{"name": "07534"}
+{"name": "07535"}
+{"name": "07536"}
+{"name": "07537"}
+{"name": "07538"}
+{"name": "07539"}
+{"name": "07540"}
+{"name": "07541"}
+{"name": "07542"}
+{"name": "07543"}
+{"name": "07544"}
+{"name": "07545"}
+{"name": "07546"}
+{"name": "07547"}
+{"name": "07548"}
+{"name": "07549"}
+{"name": "07550"}
+{"name": "07551"}
+{"name": "07552"}
+{"name": "07553"}
+{"name": "07554"}
+{"name": "07555"}
+{"name": "07556"}
+{"name": "07557"}
+{"name": "07558"}
+{"name": "07559"}
+{"name": "07560"}
+{"name": "07561"}
+{"name": "07562"}
+{"name": "07563"}
+{"name": "07564"}
+{"name": "07565"}
+{"name": "07566"}
+{"name": "07567"}
+{"name": "07568"}
+{"name": "07569"}
+{"name": "07570"}
+{"name": "07571"}
+{"name": "07572"}
+{"name": "07573"}
+{"name": "07574"}
+{"name": "07575"}
+{"name": "07576"}
+{"name": "07577"}
+{"name": "07578"}
+{"name": "07579"}
+{"name": "07580"}
+{"name": "07581"}
+{"name": "07582"}
+{"name": "07583"}
+{"name": "07584"}
+{"name": "07585"}
+{"name": "07586"}
+{"name": "07587"}
+{"name": "07588"}
+{"name": "07589"}
+{"name": "07590"}
+{"name": "07591"}
+{"name": "07592"}
+{"name": "07593"}
+{"name": "07594"}
+{"name": "07595"}
+{"name": "07596"}
+{"name": "07597"}
+{"name": "07598"}
+{"name": "07599"}
+{"name": "07600"}
+{"name": "07601"}
+{"name": "07602"}
+{"name": "07603"}
+{"name": "07604"}
+{"name": "07605"}
+{"name": "07606"}
+{"name": "07607"}
+{"name": "07608"}
+{"name": "07609"}
+{"name": "07610"}
+{"name": "07611"}
+{"name": "07612"}
+{"name": "07613"}
+{"name": "07614"}
+{"name": "07615"}
+{"name": "07616"}
+{"name": "07617"}
+{"name": "07618"}
+{"name": "07619"}
+{"name": "07620"}
+{"name": "07621"}
+{"name": "07622"}
+{"name": "07623"}
+{"name": "07624"}
+{"name": "07625"}
+{"name": "07626"}
+{"name": "07627"}
+{"name": "07628"}
+{"name": "07629"}
+{"name": "07630"}
+{"name": "07631"}
+{"name": "07632"}
+{"name": "07633"}
+{"name": "07634"}
+{"name": "07635"}
+{"name": "07636"}
+{"name": "07637"}
+{"name": "07638"}
+{"name": "07639"}
+{"name": "07640"}
+{"name": "07641"}
+{"name": "07642"}
+{"name": "07643"}
+{"name": "07644"}
+{"name": "07645"}
+{"name": "07646"}
+{"name": "07647"}
+{"name": "07648"}
+{"name": "07649"}
+{"name": "07650"}
+{"name": "07651"}
+{"name": "07652"}
+{"name": "07653"}
+{"name": "07654"}
+{"name": "07655"}
+{"name": "07656"}
+{"name": "07657"}
+{"name": "07658"}
+{"name": "07659"}
+{"name": "07660"}
+{"name": "07661"}
+{"name": "07662"}
+{"name": "07663"}
+{"name": "07664"}
+{"name": "07665"}
+{"name": "07666"}
+{"name": "07667"}
+{"name": "07668"}
+{"name": "07669"}
+{"name": "07670"}
+{"name": "07671"}
+{"name": "07672"}
+{"name": "07673"}
+{"name": "07674"}
+{"name": "07675"}
+{"name": "07676"}
+{"name": "07677"}
+{"name": "07678"}
+{"name": "07679"}
+{"name": "07680"}
+{"name": "07681"}
+{"name": "07682"}
+{"name": "07683"}
+{"name": "07684"}
+{"name": "07685"}
+{"name": "07686"}
+{"name": "07687"}
+{"name": "07688"}
+{"name": "07689"}
+{"name": "07690"}
+{"name": "07691"}
+{"name": "07692"}
+{"name": "07693"}
+{"name": "07694"}
+{"name": "07695"}
+{"name": "07696"}
+{"name": "07697"}
+{"name": "07698"}
+{"name": "07699"}
+{"name": "07700"}
+{"name": "07701"}
+{"name": "07702"}
+{"name": "07703"}
+{"name": "07704"}
+{"name": "07705"}
+{"name": "07706"}
+{"name": "07707"}
+{"name": "07708"}
+{"name": "07709"}
+{"name": "07710"}
+{"name": "07711"}
+{"name": "07712"}
+{"name": "07713"}
+{"name": "07714"}
+{"name": "07715"}
+{"name": "07716"}
+{"name": "07717"}
+{"name": "07718"}
+{"name": "07719"}
+{"name": "07720"}
+{"name": "07721"}
+{"name": "07722"}
+{"name": "07723"}
+{"name": "07724"}
+{"name": "07725"}
+{"name": "07726"}
+{"name": "07727"}
+{"name": "07728"}
+{"name": "07729"}
+{"name": "07730"}
+{"name": "07731"}
+{"name": "07732"}
+{"name": "07733"}
+{"name": "07734"}
+{"name": "07735"}
+{"name": "07736"}
+{"name": "07737"}
+{"name": "07738"}
+{"name": "07739"}
+{"name": "07740"}
+{"name": "07741"}
+{"name": "07742"}
+{"name": "07743"}
+{"name": "07744"}
+{"name": "07745"}
+{"name": "07746"}
+{"name": "07747"}
+{"name": "07748"}
+{"name": "07749"}
+{"name": "07750"}
+{"name": "07751"}
+{"name": "07752"}
+{"name": "07753"}
+{"name": "07754"}
+{"name": "07755"}
+{"name": "07756"}
+{"name": "07757"}
+{"name": "07758"}
+{"name": "07759"}
+{"name": "07760"}
+{"name": "07761"}
+{"name": "07762"}
+{"name": "07763"}
+{"name": "07764"}
+{"name": "07765"}
+{"name": "07766"}
+{"name": "07767"}
+{"name": "07768"}
+{"name": "07769"}
+{"name": "07770"}
+{"name": "07771"}
+{"name": "07772"}
+{"name": "07773"}
+{"name": "07774"}
+{"name": "07775"}
+{"name": "07776"}
+{"name": "07777"}
+{"name": "07778"}
+{"name": "07779"}
+{"name": "07780"}
+{"name": "07781"}
+{"name": "07782"}
+{"name": "07783"}
+{"name": "07784"}
+{"name": "07785"}
+{"name": "07786"}
+{"name": "07787"}
+{"name": "07788"}
+{"name": "07789"}
+{"name": "07790"}
+{"name": "07791"}
+{"name": "07792"}
+{"name": "07793"}
+{"name": "07794"}
+{"name": "07795"}
+{"name": "07796"}
+{"name": "07797"}
+{"name": "07798"}
+{"name": "07799"}
+{"name": "07800"}
+{"name": "07801"}
+{"name": "07802"}
+{"name": "07803"}
+{"name": "07804"}
+{"name": "07805"}
+{"name": "07806"}
+{"name": "07807"}
+{"name": "07808"}
+{"name": "07809"}
+{"name": "07810"}
+{"name": "07811"}
+{"name": "07812"}
+{"name": "07813"}
+{"name": "07814"}
+{"name": "07815"}
+{"name": "07816"}
+{"name": "07817"}
+{"name": "07818"}
+{"name": "07819"}
+{"name": "07820"}
+{"name": "07821"}
+{"name": "07822"}
+{"name": "07823"}
+{"name": "07824"}
+{"name": "07825"}
+{"name": "07826"}
+{"name": "07827"}
+{"name": "07828"}
+{"name": "07829"}
+{"name": "07830"}
+{"name": "07831"}
+{"name": "07832"}
+{"name": "07833"}
+{"name": "07834"}
+{"name": "07835"}
+{"name": "07836"}
+{"name": "07837"}
+{"name": "07838"}
+{"name": "07839"}
+{"name": "07840"}
+{"name": "07841"}
+{"name": "07842"}
+{"name": "07843"}
+{"name": "07844"}
+{"name": "07845"}
+{"name": "07846"}
+{"name": "07847"}
+{"name": "07848"}
+{"name": "07849"}
+{"name": "07850"}
+{"name": "07851"}
+{"name": "07852"}
+{"name": "07853"}
+{"name": "07854"}
+{"name": "07855"}
+{"name": "07856"}
+{"name": "07857"}
+{"name": "07858"}
+{"name": "07859"}
+{"name": "07860"}
+{"name": "07861"}
+{"name": "07862"}
+{"name": "07863"}
+{"name": "07864"}
+{"name": "07865"}
+{"name": "07866"}
+{"name": "07867"}
+{"name": "07868"}
+{"name": "07869"}
+{"name": "07870"}
+{"name": "07871"}
+{"name": "07872"}
+{"name": "07873"}
+{"name": "07874"}
+{"name": "07875"}
+{"name": "07876"}
+{"name": "07877"}
+{"name": "07878"}
+{"name": "07879"}
+{"name": "07880"}
+{"name": "07881"}
+{"name": "07882"}
+{"name": "07883"}
+{"name": "07884"}
+{"name": "07885"}
+{"name": "07886"}
+{"name": "07887"}
+{"name": "07888"}
+{"name": "07889"}
+{"name": "07890"}
+{"name": "07891"}
+{"name": "07892"}
+{"name": "07893"}
+{"name": "07894"}
+{"name": "07895"}
+{"name": "07896"}
+{"name": "07897"}
+{"name": "07898"}
+{"name": "07899"}
+{"name": "07900"}
+{"name": "07901"}
+{"name": "07902"}
+{"name": "07903"}
+{"name": "07904"}
+{"name": "07905"}
+{"name": "07906"}
+{"name": "07907"}
+{"name": "07908"}
+{"name": "07909"}
+{"name": "07910"}
+{"name": "07911"}
+{"name": "07912"}
+{"name": "07913"}
+{"name": "07914"}
+{"name": "07915"}
+{"name": "07916"}
+{"name": "07917"}
+{"name": "07918"}
+{"name": "07919"}
+{"name": "07920"}
+{"name": "07921"}
+{"name": "07922"}
+{"name": "07923"}
+{"name": "07924"}
+{"name": "07925"}
+{"name": "07926"}
+{"name": "07927"}
+{"name": "07928"}
+{"name": "07929"}
+{"name": "07930"}
+{"name": "07931"}
+{"name": "07932"}
+{"name": "07933"}
+{"name": "07934"}
+{"name": "07935"}
+{"name": "07936"}
+{"name": "07937"}
+{"name": "07938"}
+{"name": "07939"}
+{"name": "07940"}
+{"name": "07941"}
+{"name": "07942"}
+{"name": "07943"}
+{"name": "07944"}
+{"name": "07945"}
+{"name": "07946"}
+{"name": "07947"}
+{"name": "07948"}
+{"name": "07949"}
+{"name": "07950"}
+{"name": "07951"}
+{"name": "07952"}
+{"name": "07953"}
+{"name": "07954"}
+{"name": "07955"}
+{"name": "07956"}
+{"name": "07957"}
+{"name": "07958"}
+{"name": "07959"}
+{"name": "07960"}
+{"name": "07961"}
+{"name": "07962"}
+{"name": "07963"}
+{"name": "07964"}
+{"name": "07965"}
+{"name": "07966"}
+{"name": "07967"}
+{"name": "07968"}
+{"name": "07969"}
+{"name": "07970"}
+{"name": "07971"}
+{"name": "07972"}
+{"name": "07973"}
+{"name": "07974"}
+{"name": "07975"}
+{"name": "07976"}
+{"name": "07977"}
+{"name": "07978"}
+{"name": "07979"}
+{"name": "07980"}
+{"name": "07981"}
+{"name": "07982"}
+{"name": "07983"}
+{"name": "07984"}
+{"name": "07985"}
+{"name": "07986"}
+{"name": "07987"}
+{"name": "07988"}
+{"name": "07989"}
+{"name": "07990"}
+{"name": "07991"}
+{"name": "07992"}
+{"name": "07993"}
+{"name": "07994"}
+{"name": "07995"}
+{"name": "07996"}
+{"name": "07997"}
+{"name": "07998"}
+{"name": "07999"}
+{"name": "08000"}
+{"name": "08001"}
+{"name": "08002"}
+{"name": "08003"}
+{"name": "08004"}
+{"name": "08005"}
+{"name": "08006"}
+{"name": "08007"}
+{"name": "08008"}
+{"name": "08009"}
+{"name": "08010"}
+{"name": "08011"}
+{"name": "08012"}
+{"name": "08013"}
+{"name": "08014"}
+{"name": "08015"}
+{"name": "08016"}
+{"name": "08017"}
+{"name": "08018"}
+{"name": "08019"}
+{"name": "08020"}
+{"name": "08021"}
+{"name": "08022"}
+{"name": "08023"}
+{"name": "08024"}
+{"name": "08025"}
+{"name": "08026"}
+{"name": "08027"}
+{"name": "08028"}
+{"name": "08029"}
+{"name": "08030"}
+{"name": "08031"}
+{"name": "08032"}
+{"name": "08033"}
+{"name": "08034"}
+{"name": "08035"}
+{"name": "08036"}
+{"name": "08037"}
+{"name": "08038"}
+{"name": "08039"}
+{"name": "08040"}
+{"name": "08041"}
+{"name": "08042"}
+{"name": "08043"}
+{"name": "08044"}
+{"name": "08045"}
+{"name": "08046"}
+{"name": "08047"}
+{"name": "08048"}
+{"name": "08049"}
+{"name": "08050"}
+{"name": "08051"}
+{"name": "08052"}
+{"name": "08053"}
+{"name": "08054"}
+{"name": "08055"}
+{"name": "08056"}
+{"name": "08057"}
+{"name": "08058"}
+{"name": "08059"}
+{"name": "08060"}
+{"name": "08061"}
+{"name": "08062"}
+{"name": "08063"}
+{"name": "08064"}
+{"name": "08065"}
+{"name": "08066"}
+{"name": "08067"}
+{"name": "08068"}
+{"name": "08069"}
+{"name": "08070"}
+{"name": "08071"}
+{"name": "08072"}
+{"name": "08073"}
+{"name": "08074"}
+{"name": "08075"}
+{"name": "08076"}
+{"name": "08077"}
+{"name": "08078"}
+{"name": "08079"}
+{"name": "08080"}
+{"name": "08081"}
+{"name": "08082"}
+{"name": "08083"}
+{"name": "08084"}
+{"name": "08085"}
+{"name": "08086"}
+{"name": "08087"}
+{"name": "08088"}
+{"name": "08089"}
+{"name": "08090"}
+{"name": "08091"}
+{"name": "08092"}
+{"name": "08093"}
+{"name": "08094"}
+{"name": "08095"}
+{"name": "08096"}
+{"name": "08097"}
+{"name": "08098"}
+{"name": "08099"}
+{"name": "08100"}
+{"name": "08101"}
+{"name": "08102"}
+{"name": "08103"}
+{"name": "08104"}
+{"name": "08105"}
+{"name": "08106"}
+{"name": "08107"}
+{"name": "08108"}
+{"name": "08109"}
+{"name": "08110"}
+{"name": "08111"}
+{"name": "08112"}
+{"name": "08113"}
+{"name": "08114"}
+{"name": "08115"}
+{"name": "08116"}
+{"name": "08117"}
+{"name": "08118"}
+{"name": "08119"}
+{"name": "08120"}
+{"name": "08121"}
+{"name": "08122"}
+{"name": "08123"}
+{"name": "08124"}
+{"name": "08125"}
+{"name": "08126"}
+{"name": "08127"}
+{"name": "08128"}
+{"name": "08129"}
+{"name": "08130"}
+{"name": "08131"}
+{"name": "08132"}
+{"name": "08133"}
+{"name": "08134"}
+{"name": "08135"}
+{"name": "08136"}
+{"name": "08137"}
+{"name": "08138"}
+{"name": "08139"}
+{"name": "08140"}
+{"name": "08141"}
+{"name": "08142"}
+{"name": "08143"}
+{"name": "08144"}
+{"name": "08145"}
+{"name": "08146"}
+{"name": "08147"}
+{"name": "08148"}
+{"name": "08149"}
+{"name": "08150"}
+{"name": "08151"}
+{"name": "08152"}
+{"name": "08153"}
+{"name": "08154"}
+{"name": "08155"}
+{"name": "08156"}
+{"name": "08157"}
+{"name": "08158"}
+{"name": "08159"}
+{"name": "08160"}
+{"name": "08161"}
+{"name": "08162"}
+{"name": "08163"}
+{"name": "08164"}
+{"name": "08165"}
+{"name": "08166"}
+{"name": "08167"}
+{"name": "08168"}
+{"name": "08169"}
+{"name": "08170"}
+{"name": "08171"}
+{"name": "08172"}
+{"name": "08173"}
+{"name": "08174"}
+{"name": "08175"}
+{"name": "08176"}
+{"name": "08177"}
+{"name": "08178"}
+{"name": "08179"}
+{"name": "08180"}
+{"name": "08181"}
+{"name": "08182"}
+{"name": "08183"}
+{"name": "08184"}
+{"name": "08185"}
+{"name": "08186"}
+{"name": "08187"}
+{"name": "08188"}
+{"name": "08189"}
+{"name": "08190"}
+{"name": "08191"}
+{"name": "08192"}
+{"name": "08193"}
+{"name": "08194"}
+{"name": "08195"}
+{"name": "08196"}
+{"name": "08197"}
+{"name": "08198"}
+{"name": "08199"}
+{"name": "08200"}
+{"name": "08201"}
+{"name": "08202"}
+{"name": "08203"}
+{"name": "08204"}
+{"name": "08205"}
+{"name": "08206"}
+{"name": "08207"}
+{"name": "08208"}
+{"name": "08209"}
+{"name": "08210"}
+{"name": "08211"}
+{"name": "08212"}
+{"name": "08213"}
+{"name": "08214"}
+{"name": "08215"}
+{"name": "08216"}
+{"name": "08217"}
+{"name": "08218"}
+{"name": "08219"}
+{"name": "08220"}
+{"name": "08221"}
+{"name": "08222"}
+{"name": "08223"}
+{"name": "08224"}
+{"name": "08225"}
+{"name": "08226"}
+{"name": "08227"}
+{"name": "08228"}
+{"name": "08229"}
+{"name": "08230"}
+{"name": "08231"}
+{"name": "08232"}
+{"name": "08233"}
+{"name": "08234"}
+{"name": "08235"}
+{"name": "08236"}
+{"name": "08237"}
+{"name": "08238"}
+{"name": "08239"}
+{"name": "08240"}
+{"name": "08241"}
+{"name": "08242"}
+{"name": "08243"}
+{"name": "08244"}
+{"name": "08245"}
+{"name": "08246"}
+{"name": "08247"}
+{"name": "08248"}
+{"name": "08249"}
+{"name": "08250"}
+{"name": "08251"}
+{"name": "08252"}
+{"name": "08253"}
+{"name": "08254"}
+{"name": "08255"}
+{"name": "08256"}
+{"name": "08257"}
+{"name": "08258"}
+{"name": "08259"}
+{"name": "08260"}
+{"name": "08261"}
+{"name": "08262"}
+{"name": "08263"}
+{"name": "08264"}
+{"name": "08265"}
+{"name": "08266"}
+{"name": "08267"}
+{"name": "08268"}
+{"name": "08269"}
+{"name": "08270"}
+{"name": "08271"}
+{"name": "08272"}
+{"name": "08273"}
+{"name": "08274"}
+{"name": "08275"}
+{"name": "08276"}
+{"name": "08277"}
+{"name": "08278"}
+{"name": "08279"}
+{"name": "08280"}
+{"name": "08281"}
+{"name": "08282"}
+{"name": "08283"}
+{"name": "08284"}
+{"name": "08285"}
+{"name": "08286"}
+{"name": "08287"}
+{"name": "08288"}
+{"name": "08289"}
+{"name": "08290"}
+{"name": "08291"}
+{"name": "08292"}
+{"name": "08293"}
+{"name": "08294"}
+{"name": "08295"}
+{"name": "08296"}
+{"name": "08297"}
+{"name": "08298"}
+{"name": "08299"}
+{"name": "08300"}
+{"name": "08301"}
+{"name": "08302"}
+{"name": "08303"}
+{"name": "08304"}
+{"name": "08305"}
+{"name": "08306"}
+{"name": "08307"}
+{"name": "08308"}
+{"name": "08309"}
+{"name": "08310"}
+{"name": "08311"}
+{"name": "08312"}
+{"name": "08313"}
+{"name": "08314"}
+{"name": "08315"}
+{"name": "08316"}
+{"name": "08317"}
+{"name": "08318"}
+{"name": "08319"}
+{"name": "08320"}
+{"name": "08321"}
+{"name": "08322"}
+{"name": "08323"}
+{"name": "08324"}
+{"name": "08325"}
+{"name": "08326"}
+{"name": "08327"}
+{"name": "08328"}
+{"name": "08329"}
+{"name": "08330"}
+{"name": "08331"}
+{"name": "08332"}
+{"name": "08333"}
+{"name": "08334"}
+{"name": "08335"}
+{"name": "08336"}
+{"name": "08337"}
+{"name": "08338"}
+{"name": "08339"}
+{"name": "08340"}
+{"name": "08341"}
+{"name": "08342"}
+{"name": "08343"}
+{"name": "08344"}
+{"name": "08345"}
+{"name": "08346"}
+{"name": "08347"}
+{"name": "08348"}
+{"name": "08349"}
+{"name": "08350"}
+{"name": "08351"}
+{"name": "08352"}
+{"name": "08353"}
+{"name": "08354"}
+{"name": "08355"}
+{"name": "08356"}
+{"name": "08357"}
+{"name": "08358"}
+{"name": "08359"}
+{"name": "08360"}
+{"name": "08361"}
+{"name": "08362"}
+{"name": "08363"}
+{"name": "08364"}
+{"name": "08365"}
+{"name": "08366"}
+{"name": "08367"}
+{"name": "08368"}
+{"name": "08369"}
+{"name": "08370"}
+{"name": "08371"}
+{"name": "08372"}
+{"name": "08373"}
+{"name": "08374"}
+{"name": "08375"}
+{"name": "08376"}
+{"name": "08377"}
+{"name": "08378"}
+{"name": "08379"}
+{"name": "08380"}
+{"name": "08381"}
+{"name": "08382"}
+{"name": "08383"}
+{"name": "08384"}
+{"name": "08385"}
+{"name": "08386"}
+{"name": "08387"}
+{"name": "08388"}
+{"name": "08389"}
+{"name": "08390"}
+{"name": "08391"}
+{"name": "08392"}
+{"name": "08393"}
+{"name": "08394"}
+{"name": "08395"}
+{"name": "08396"}
+{"name": "08397"}
+{"name": "08398"}
+{"name": "08399"}
+{"name": "08400"}
+{"name": "08401"}
+{"name": "08402"}
+{"name": "08403"}
+{"name": "08404"}
+{"name": "08405"}
+{"name": "08406"}
+{"name": "08407"}
+{"name": "08408"}
+{"name": "08409"}
+{"name": "08410"}
+{"name": "08411"}
+{"name": "08412"}
+{"name": "08413"}
+{"name": "08414"}
+{"name": "08415"}
+{"name": "08416"}
+{"name": "08417"}
+{"name": "08418"}
+{"name": "08419"}
+{"name": "08420"}
+{"name": "08421"}
+{"name": "08422"}
+{"name": "08423"}
+{"name": "08424"}
+{"name": "08425"}
+{"name": "08426"}
+{"name": "08427"}
+{"name": "08428"}
+{"name": "08429"}
+{"name": "08430"}
+{"name": "08431"}
+{"name": "08432"}
+{"name": "08433"}
+{"name": "08434"}
+{"name": "08435"}
+{"name": "08436"}
+{"name": "08437"}
+{"name": "08438"}
+{"name": "08439"}
+{"name": "08440"}
+{"name": "08441"}
+{"name": "08442"}
+{"name": "08443"}
+{"name": "08444"}
+{"name": "08445"}
+{"name": "08446"}
+{"name": "08447"}
+{"name": "08448"}
+{"name": "08449"}
+{"name": "08450"}
+{"name": "08451"}
+{"name": "08452"}
+{"name": "08453"}
+{"name": "08454"}
+{"name": "08455"}
+{"name": "08456"}
+{"name": "08457"}
+{"name": "08458"}
+{"name": "08459"}
+{"name": "08460"}
+{"name": "08461"}
+{"name": "08462"}
+{"name": "08463"}
+{"name": "08464"}
+{"name": "08465"}
+{"name": "08466"}
+{"name": "08467"}
+{"name": "08468"}
+{"name": "08469"}
+{"name": "08470"}
+{"name": "08471"}
+{"name": "08472"}
+{"name": "08473"}
+{"name": "08474"}
+{"name": "08475"}
+{"name": "08476"}
+{"name": "08477"}
+{"name": "08478"}
+{"name": "08479"}
+{"name": "08480"}
+{"name": "08481"}
+{"name": "08482"}
+{"name": "08483"}
+{"name": "08484"}
+{"name": "08485"}
+{"name": "08486"}
+{"name": "08487"}
+{"name": "08488"}
+{"name": "08489"}
+{"name": "08490"}
+{"name": "08491"}
+{"name": "08492"}
+{"name": "08493"}
+{"name": "08494"}
+{"name": "08495"}
+{"name": "08496"}
+{"name": "08497"}
+{"name": "08498"}
+{"name": "08499"}
+{"name": "08500"}
+{"name": "08501"}
+{"name": "08502"}
+{"name": "08503"}
+{"name": "08504"}
+{"name": "08505"}
+{"name": "08506"}
+{"name": "08507"}
+{"name": "08508"}
+{"name": "08509"}
+{"name": "08510"}
+{"name": "08511"}
+{"name": "08512"}
+{"name": "08513"}
+{"name": "08514"}
+{"name": "08515"}
+{"name": "08516"}
+{"name": "08517"}
+{"name": "08518"}
+{"name": "08519"}
+{"name": "08520"}
+{"name": "08521"}
+{"name": "08522"}
+{"name": "08523"}
+{"name": "08524"}
+{"name": "08525"}
+{"name": "08526"}
+{"name": "08527"}
+{"name": "08528"}
+{"name": "08529"}
+{"name": "08530"}
+{"name": "08531"}
+{"name": "08532"}
+{"name": "08533"}
+{"name": "08534"}
+{"name": "08535"}
+{"name": "08536"}
+{"name": "08537"}
+{"name": "08538"}
+{"name": "08539"}
+{"name": "08540"}
+{"name": "08541"}
+{"name": "08542"}
+{"name": "08543"}
+{"name": "08544"}
+{"name": "08545"}
+{"name": "08546"}
+{"name": "08547"}
+{"name": "08548"}
+{"name": "08549"}
+{"name": "08550"}
+{"name": "08551"}
+{"name": "08552"}
+{"name": "08553"}
+{"name": "08554"}
+{"name": "08555"}
+{"name": "08556"}
+{"name": "08557"}
+{"name": "08558"}
+{"name": "08559"}
+{"name": "08560"}
+{"name": "08561"}
+{"name": "08562"}
+{"name": "08563"}
+{"name": "08564"}
+{"name": "08565"}
+{"name": "08566"}
+{"name": "08567"}
+{"name": "08568"}
+{"name": "08569"}
+{"name": "08570"}
+{"name": "08571"}
+{"name": "08572"}
+{"name": "08573"}
+{"name": "08574"}
+{"name": "08575"}
+{"name": "08576"}
+{"name": "08577"}
+{"name": "08578"}
+{"name": "08579"}
+{"name": "08580"}
+{"name": "08581"}
+{"name": "08582"}
+{"name": "08583"}
+{"name": "08584"}
+{"name": "08585"}
+{"name": "08586"}
+{"name": "08587"}
+{"name": "08588"}
+{"name": "08589"}
+{"name": "08590"}
+{"name": "08591"}
+{"name": "08592"}
+{"name": "08593"}
+{"name": "08594"}
+{"name": "08595"}
+{"name": "08596"}
+{"name": "08597"}
+{"name": "08598"}
+{"name": "08599"}
+{"name": "08600"}
+{"name": "08601"}
+{"name": "08602"}
+{"name": "08603"}
+{"name": "08604"}
+{"name": "08605"}
+{"name": "08606"}
+{"name": "08607"}
+{"name": "08608"}
+{"name": "08609"}
+{"name": "08610"}
+{"name": "08611"}
+{"name": "08612"}
+{"name": "08613"}
+{"name": "08614"}
+{"name": "08615"}
+{"name": "08616"}
+{"name": "08617"}
+{"name": "08618"}
+{"name": "08619"}
+{"name": "08620"}
+{"name": "08621"}
+{"name": "08622"}
+{"name": "08623"}
+{"name": "08624"}
+{"name": "08625"}
+{"name": "08626"}
+{"name": "08627"}
+{"name": "08628"}
+{"name": "08629"}
+{"name": "08630"}
+{"name": "08631"}
+{"name": "08632"}
+{"name": "08633"}
+{"name": "08634"}
+{"name": "08635"}
+{"name": "08636"}
+{"name": "08637"}
+{"name": "08638"}
+{"name": "08639"}
+{"name": "08640"}
+{"name": "08641"}
+{"name": "08642"}
+{"name": "08643"}
+{"name": "08644"}
+{"name": "08645"}
+{"name": "08646"}
+{"name": "08647"}
+{"name": "08648"}
+{"name": "08649"}
+{"name": "08650"}
+{"name": "08651"}
+{"name": "08652"}
+{"name": "08653"}
+{"name": "08654"}
+{"name": "08655"}
+{"name": "08656"}
+{"name": "08657"}
+{"name": "08658"}
+{"name": "08659"}
+{"name": "08660"}
+{"name": "08661"}
+{"name": "08662"}
+{"name": "08663"}
+{"name": "08664"}
+{"name": "08665"}
+{"name": "08666"}
+{"name": "08667"}
+{"name": "08668"}
+{"name": "08669"}
+{"name": "08670"}
+{"name": "08671"}
+{"name": "08672"}
+{"name": "08673"}
+{"name": "08674"}
+{"name": "08675"}
+{"name": "08676"}
+{"name": "08677"}
+{"name": "08678"}
+{"name": "08679"}
+{"name": "08680"}
+{"name": "08681"}
+{"name": "08682"}
+{"name": "08683"}
+{"name": "08684"}
+{"name": "08685"}
+{"name": "08686"}
+{"name": "08687"}
+{"name": "08688"}
+{"name": "08689"}
+{"name": "08690"}
+{"name": "08691"}
+{"name": "08692"}
+{"name": "08693"}
+{"name": "08694"}
+{"name": "08695"}
+{"name": "08696"}
+{"name": "08697"}
+{"name": "08698"}
+{"name": "08699"}
+{"name": "08700"}
+{"name": "08701"}
+{"name": "08702"}
+{"name": "08703"}
+{"name": "08704"}
+{"name": "08705"}
+{"name": "08706"}
+{"name": "08707"}
+{"name": "08708"}
+{"name": "08709"}
+{"name": "08710"}
+{"name": "08711"}
+{"name": "08712"}
+{"name": "08713"}
+{"name": "08714"}
+{"name": "08715"}
+{"name": "08716"}
+{"name": "08717"}
+{"name": "08718"}
+{"name": "08719"}
+{"name": "08720"}
+{"name": "08721"}
+{"name": "08722"}
+{"name": "08723"}
+{"name": "08724"}
+{"name": "08725"}
+{"name": "08726"}
+{"name": "08727"}
+{"name": "08728"}
+{"name": "08729"}
+{"name": "08730"}
+{"name": "08731"}
+{"name": "08732"}
+{"name": "08733"}
+{"name": "08734"}
+{"name": "08735"}
+{"name": "08736"}
+{"name": "08737"}
+{"name": "08738"}
+{"name": "08739"}
+{"name": "08740"}
+{"name": "08741"}
+{"name": "08742"}
+{"name": "08743"}
+{"name": "08744"}
+{"name": "08745"}
+{"name": "08746"}
+{"name": "08747"}
+{"name": "08748"}
+{"name": "08749"}
+{"name": "08750"}
+{"name": "08751"}
+{"name": "08752"}
+{"name": "08753"}
+{"name": "08754"}
+{"name": "08755"}
+{"name": "08756"}
+{"name": "08757"}
+{"name": "08758"}
+{"name": "08759"}
+{"name": "08760"}
+{"name": "08761"}
+{"name": "08762"}
+{"name": "08763"}
+{"name": "08764"}
+{"name": "08765"}
+{"name": "08766"}
+{"name": "08767"}
+{"name": "08768"}
+{"name": "08769"}
+{"name": "08770"}
+{"name": "08771"}
+{"name": "08772"}
+{"name": "08773"}
+{"name": "08774"}
+{"name": "08775"}
+{"name": "08776"}
+{"name": "08777"}
+{"name": "08778"}
+{"name": "08779"}
+{"name": "08780"}
+{"name": "08781"}
+{"name": "08782"}
+{"name": "08783"}
+{"name": "08784"}
+{"name": "08785"}
+{"name": "08786"}
+{"name": "08787"}
+{"name": "08788"}
+{"name": "08789"}
+{"name": "08790"}
+{"name": "08791"}
+{"name": "08792"}
+{"name": "08793"}
+{"name": "08794"}
+{"name": "08795"}
+{"name": "08796"}
+{"name": "08797"}
+{"name": "08798"}
+{"name": "08799"}
+{"name": "08800"}
+{"name": "08801"}
+{"name": "08802"}
+{"name": "08803"}
+{"name": "08804"}
+{"name": "08805"}
+{"name": "08806"}
+{"name": "08807"}
+{"name": "08808"}
+{"name": "08809"}
+{"name": "08810"}
+{"name": "08811"}
+{"name": "08812"}
+{"name": "08813"}
+{"name": "08814"}
+{"name": "08815"}
+{"name": "08816"}
+{"name": "08817"}
+{"name": "08818"}
+{"name": "08819"}
+{"name": "08820"}
+{"name": "08821"}
+{"name": "08822"}
+{"name": "08823"}
+{"name": "08824"}
+{"name": "08825"}
+{"name": "08826"}
+{"name": "08827"}
+{"name": "08828"}
+{"name": "08829"}
+{"name": "08830"}
+{"name": "08831"}
+{"name": "08832"}
+{"name": "08833"}
+{"name": "08834"}
+{"name": "08835"}
+{"name": "08836"}
+{"name": "08837"}
+{"name": "08838"}
+{"name": "08839"}
+{"name": "08840"}
+{"name": "08841"}
+{"name": "08842"}
+{"name": "08843"}
+{"name": "08844"}
+{"name": "08845"}
+{"name": "08846"}
+{"name": "08847"}
+{"name": "08848"}
+{"name": "08849"}
+{"name": "08850"}
+{"name": "08851"}
+{"name": "08852"}
+{"name": "08853"}
+{"name": "08854"}
+{"name": "08855"}
+{"name": "08856"}
+{"name": "08857"}
+{"name": "08858"}
+{"name": "08859"}
+{"name": "08860"}
+{"name": "08861"}
+{"name": "08862"}
+{"name": "08863"}
+{"name": "08864"}
+{"name": "08865"}
+{"name": "08866"}
+{"name": "08867"}
+{"name": "08868"}
+{"name": "08869"}
+{"name": "08870"}
+{"name": "08871"}
+{"name": "08872"}
+{"name": "08873"}
+{"name": "08874"}
+{"name": "08875"}
+{"name": "08876"}
+{"name": "08877"}
+{"name": "08878"}
+{"name": "08879"}
+{"name": "08880"}
+{"name": "08881"}
+{"name": "08882"}
+{"name": "08883"}
+{"name": "08884"}
+{"name": "08885"}
+{"name": "08886"}
+{"name": "08887"}
+{"name": "08888"}
+{"name": "08889"}
+{"name": "08890"}
+{"name": "08891"}
+{"name": "08892"}
+{"name": "08893"}
+{"name": "08894"}
+{"name": "08895"}
+{"name": "08896"}
+{"name": "08897"}
+{"name": "08898"}
+{"name": "08899"}
+{"name": "08900"}
+{"name": "08901"}
+{"name": "08902"}
+{"name": "08903"}
+{"name": "08904"}
+{"name": "08905"}
+{"name": "08906"}
+{"name": "08907"}
+{"name": "08908"}
+{"name": "08909"}
+{"name": "08910"}
+{"name": "08911"}
+{"name": "08912"}
+{"name": "08913"}
+{"name": "08914"}
+{"name": "08915"}
+{"name": "08916"}
+{"name": "08917"}
+{"name": "08918"}
+{"name": "08919"}
+{"name": "08920"}
+{"name": "08921"}
+{"name": "08922"}
+{"name": "08923"}
+{"name": "08924"}
+{"name": "08925"}
+{"name": "08926"}
+{"name": "08927"}
+{"name": "08928"}
+{"name": "08929"}
+{"name": "08930"}
+{"name": "08931"}
+{"name": "08932"}
+{"name": "08933"}
+{"name": "08934"}
+{"name": "08935"}
+{"name": "08936"}
+{"name": "08937"}
+{"name": "08938"}
+{"name": "08939"}
+{"name": "08940"}
+{"name": "08941"}
+{"name": "08942"}
+{"name": "08943"}
+{"name": "08944"}
+{"name": "08945"}
+{"name": "08946"}
+{"name": "08947"}
+{"name": "08948"}
+{"name": "08949"}
+{"name": "08950"}
+{"name": "08951"}
+{"name": "08952"}
+{"name": "08953"}
+{"name": "08954"}
+{"name": "08955"}
+{"name": "08956"}
+{"name": "08957"}
+{"name": "08958"}
+{"name": "08959"}
+{"name": "08960"}
+{"name": "08961"}
+{"name": "08962"}
+{"name": "08963"}
+{"name": "08964"}
+{"name": "08965"}
+{"name": "08966"}
+{"name": "08967"}
+{"name": "08968"}
+{"name": "08969"}
+{"name": "08970"}
+{"name": "08971"}
+{"name": "08972"}
+{"name": "08973"}
+{"name": "08974"}
+{"name": "08975"}
+{"name": "08976"}
+{"name": "08977"}
+{"name": "08978"}
+{"name": "08979"}
+{"name": "08980"}
+{"name": "08981"}
+{"name": "08982"}
+{"name": "08983"}
+{"name": "08984"}
+{"name": "08985"}
+{"name": "08986"}
+{"name": "08987"}
+{"name": "08988"}
+{"name": "08989"}
+{"name": "08990"}
+{"name": "08991"}
+{"name": "08992"}
+{"name": "08993"}
+{"name": "08994"}
+{"name": "08995"}
+{"name": "08996"}
+{"name": "08997"}
+{"name": "08998"}
+{"name": "08999"}
+{"name": "09000"}
+{"name": "09001"}
+{"name": "09002"}
+{"name": "09003"}
+{"name": "09004"}
+{"name": "09005"}
+{"name": "09006"}
+{"name": "09007"}
+{"name": "09008"}
+{"name": "09009"}
+{"name": "09010"}
+{"name": "09011"}
+{"name": "09012"}
+{"name": "09013"}
+{"name": "09014"}
+{"name": "09015"}
+{"name": "09016"}
+{"name": "09017"}
+{"name": "09018"}
+{"name": "09019"}
+{"name": "09020"}
+{"name": "09021"}
+{"name": "09022"}
+{"name": "09023"}
+{"name": "09024"}
+{"name": "09025"}
+{"name": "09026"}
+{"name": "09027"}
+{"name": "09028"}
+{"name": "09029"}
+{"name": "09030"}
+{"name": "09031"}
+{"name": "09032"}
+{"name": "09033"}
+{"name": "09034"}
+{"name": "09035"}
+{"name": "09036"}
+{"name": "09037"}
+{"name": "09038"}
+{"name": "09039"}
+{"name": "09040"}
+{"name": "09041"}
+{"name": "09042"}
+{"name": "09043"}
+{"name": "09044"}
+{"name": "09045"}
+{"name": "09046"}
+{"name": "09047"}
+{"name": "09048"}
+{"name": "09049"}
+{"name": "09050"}
+{"name": "09051"}
+{"name": "09052"}
+{"name": "09053"}
+{"name": "09054"}
+{"name": "09055"}
+{"name": "09056"}
+{"name": "09057"}
+{"name": "09058"}
+{"name": "09059"}
+{"name": "09060"}
+{"name": "09061"}
+{"name": "09062"}
+{"name": "09063"}
+{"name": "09064"}
+{"name": "09065"}
+{"name": "09066"}
+{"name": "09067"}
+{"name": "09068"}
+{"name": "09069"}
+{"name": "09070"}
+{"name": "09071"}
+{"name": "09072"}
+{"name": "09073"}
+{"name": "09074"}
+{"name": "09075"}
+{"name": "09076"}
+{"name": "09077"}
+{"name": "09078"}
+{"name": "09079"}
+{"name": "09080"}
+{"name": "09081"}
+{"name": "09082"}
+{"name": "09083"}
+{"name": "09084"}
+{"name": "09085"}
+{"name": "09086"}
+{"name": "09087"}
+{"name": "09088"}
+{"name": "09089"}
+{"name": "09090"}
+{"name": "09091"}
+{"name": "09092"}
+{"name": "09093"}
+{"name": "09094"}
+{"name": "09095"}
+{"name": "09096"}
+{"name": "09097"}
+{"name": "09098"}
+{"name": "09099"}
+{"name": "09100"}
+{"name": "09101"}
+{"name": "09102"}
+{"name": "09103"}
+{"name": "09104"}
+{"name": "09105"}
+{"name": "09106"}
+{"name": "09107"}
+{"name": "09108"}
+{"name": "09109"}
+{"name": "09110"}
+{"name": "09111"}
+{"name": "09112"}
+{"name": "09113"}
+{"name": "09114"}
+{"name": "09115"}
+{"name": "09116"}
+{"name": "09117"}
+{"name": "09118"}
+{"name": "09119"}
+{"name": "09120"}
+{"name": "09121"}
+{"name": "09122"}
+{"name": "09123"}
+{"name": "09124"}
+{"name": "09125"}
+{"name": "09126"}
+{"name": "09127"}
+{"name": "09128"}
+{"name": "09129"}
+{"name": "09130"}
+{"name": "09131"}
+{"name": "09132"}
+{"name": "09133"}
+{"name": "09134"}
+{"name": "09135"}
+{"name": "09136"}
+{"name": "09137"}
+{"name": "09138"}
+{"name": "09139"}
+{"name": "09140"}
+{"name": "09141"}
+{"name": "09142"}
+{"name": "09143"}
+{"name": "09144"}
+{"name": "09145"}
+{"name": "09146"}
+{"name": "09147"}
+{"name": "09148"}
+{"name": "09149"}
+{"name": "09150"}
+{"name": "09151"}
+{"name": "09152"}
+{"name": "09153"}
+{"name": "09154"}
+{"name": "09155"}
+{"name": "09156"}
+{"name": "09157"}
+{"name": "09158"}
+{"name": "09159"}
+{"name": "09160"}
+{"name": "09161"}
+{"name": "09162"}
+{"name": "09163"}
+{"name": "09164"}
+{"name": "09165"}
+{"name": "09166"}
+{"name": "09167"}
+{"name": "09168"}
+{"name": "09169"}
+{"name": "09170"}
+{"name": "09171"}
+{"name": "09172"}
+{"name": "09173"}
+{"name": "09174"}
+{"name": "09175"}
+{"name": "09176"}
+{"name": "09177"}
+{"name": "09178"}
+{"name": "09179"}
+{"name": "09180"}
+{"name": "09181"}
+{"name": "09182"}
+{"name": "09183"}
+{"name": "09184"}
+{"name": "09185"}
+{"name": "09186"}
+{"name": "09187"}
+{"name": "09188"}
+{"name": "09189"}
+{"name": "09190"}
+{"name": "09191"}
+{"name": "09192"}
+{"name": "09193"}
+{"name": "09194"}
+{"name": "09195"}
+{"name": "09196"}
+{"name": "09197"}
+{"name": "09198"}
+{"name": "09199"}
+{"name": "09200"}
+{"name": "09201"}
+{"name": "09202"}
+{"name": "09203"}
+{"name": "09204"}
+{"name": "09205"}
+{"name": "09206"}
+{"name": "09207"}
+{"name": "09208"}
+{"name": "09209"}
+{"name": "09210"}
+{"name": "09211"}
+{"name": "09212"}
+{"name": "09213"}
+{"name": "09214"}
+{"name": "09215"}
+{"name": "09216"}
+{"name": "09217"}
+{"name": "09218"}
+{"name": "09219"}
+{"name": "09220"}
+{"name": "09221"}
+{"name": "09222"}
+{"name": "09223"}
+{"name": "09224"}
+{"name": "09225"}
+{"name": "09226"}
+{"name": "09227"}
+{"name": "09228"}
+{"name": "09229"}
+{"name": "09230"}
+{"name": "09231"}
+{"name": "09232"}
+{"name": "09233"}
+{"name": "09234"}
+{"name": "09235"}
+{"name": "09236"}
+{"name": "09237"}
+{"name": "09238"}
+{"name": "09239"}
+{"name": "09240"}
+{"name": "09241"}
+{"name": "09242"}
+{"name": "09243"}
+{"name": "09244"}
+{"name": "09245"}
+{"name": "09246"}
+{"name": "09247"}
+{"name": "09248"}
+{"name": "09249"}
+{"name": "09250"}
+{"name": "09251"}
+{"name": "09252"}
+{"name": "09253"}
+{"name": "09254"}
+{"name": "09255"}
+{"name": "09256"}
+{"name": "09257"}
+{"name": "09258"}
+{"name": "09259"}
+{"name": "09260"}
+{"name": "09261"}
+{"name": "09262"}
+{"name": "09263"}
+{"name": "09264"}
+{"name": "09265"}
+{"name": "09266"}
+{"name": "09267"}
+{"name": "09268"}
+{"name": "09269"}
+{"name": "09270"}
+{"name": "09271"}
+{"name": "09272"}
+{"name": "09273"}
+{"name": "09274"}
+{"name": "09275"}
+{"name": "09276"}
+{"name": "09277"}
+{"name": "09278"}
+{"name": "09279"}
+{"name": "09280"}
+{"name": "09281"}
+{"name": "09282"}
+{"name": "09283"}
+{"name": "09284"}
+{"name": "09285"}
+{"name": "09286"}
+{"name": "09287"}
+{"name": "09288"}
+{"name": "09289"}
+{"name": "09290"}
+{"name": "09291"}
+{"name": "09292"}
+{"name": "09293"}
+{"name": "09294"}
+{"name": "09295"}
+{"name": "09296"}
+{"name": "09297"}
+{"name": "09298"}
+{"name": "09299"}
+{"name": "09300"}
+{"name": "09301"}
+{"name": "09302"}
+{"name": "09303"}
+{"name": "09304"}
+{"name": "09305"}
+{"name": "09306"}
+{"name": "09307"}
+{"name": "09308"}
+{"name": "09309"}
+{"name": "09310"}
+{"name": "09311"}
+{"name": "09312"}
+{"name": "09313"}
+{"name": "09314"}
+{"name": "09315"}
+{"name": "09316"}
+{"name": "09317"}
+{"name": "09318"}
+{"name": "09319"}
+{"name": "09320"}
+{"name": "09321"}
+{"name": "09322"}
+{"name": "09323"}
+{"name": "09324"}
+{"name": "09325"}
+{"name": "09326"}
+{"name": "09327"}
+{"name": "09328"}
+{"name": "09329"}
+{"name": "09330"}
+{"name": "09331"}
+{"name": "09332"}
+{"name": "09333"}
+{"name": "09334"}
+{"name": "09335"}
+{"name": "09336"}
+{"name": "09337"}
+{"name": "09338"}
+{"name": "09339"}
+{"name": "09340"}
+{"name": "09341"}
+{"name": "09342"}
+{"name": "09343"}
+{"name": "09344"}
+{"name": "09345"}
+{"name": "09346"}
+{"name": "09347"}
+{"name": "09348"}
+{"name": "09349"}
+{"name": "09350"}
+{"name": "09351"}
+{"name": "09352"}
+{"name": "09353"}
+{"name": "09354"}
+{"name": "09355"}
+{"name": "09356"}
+{"name": "09357"}
+{"name": "09358"}
+{"name": "09359"}
+{"name": "09360"}
+{"name": "09361"}
+{"name": "09362"}
+{"name": "09363"}
+{"name": "09364"}
+{"name": "09365"}
+{"name": "09366"}
+{"name": "09367"}
+{"name": "09368"}
+{"name": "09369"}
+{"name": "09370"}
+{"name": "09371"}
+{"name": "09372"}
+{"name": "09373"}
+{"name": "09374"}
+{"name": "09375"}
+{"name": "09376"}
+{"name": "09377"}
+{"name": "09378"}
+{"name": "09379"}
+{"name": "09380"}
+{"name": "09381"}
+{"name": "09382"}
+{"name": "09383"}
+{"name": "09384"}
+{"name": "09385"}
+{"name": "09386"}
+{"name": "09387"}
+{"name": "09388"}
+{"name": "09389"}
+{"name": "09390"}
+{"name": "09391"}
+{"name": "09392"}
+{"name": "09393"}
+{"name": "09394"}
+{"name": "09395"}
+{"name": "09396"}
+{"name": "09397"}
+{"name": "09398"}
+{"name": "09399"}
+{"name": "09400"}
+{"name": "09401"}
+{"name": "09402"}
+{"name": "09403"}
+{"name": "09404"}
+{"name": "09405"}
+{"name": "09406"}
+{"name": "09407"}
+{"name": "09408"}
+{"name": "09409"}
+{"name": "09410"}
+{"name": "09411"}
+{"name": "09412"}
+{"name": "09413"}
+{"name": "09414"}
+{"name": "09415"}
+{"name": "09416"}
+{"name": "09417"}
+{"name": "09418"}
+{"name": "09419"}
+{"name": "09420"}
+{"name": "09421"}
+{"name": "09422"}
+{"name": "09423"}
+{"name": "09424"}
+{"name": "09425"}
+{"name": "09426"}
+{"name": "09427"}
+{"name": "09428"}
+{"name": "09429"}
+{"name": "09430"}
+{"name": "09431"}
+{"name": "09432"}
+{"name": "09433"}
+{"name": "09434"}
+{"name": "09435"}
+{"name": "09436"}
+{"name": "09437"}
+{"name": "09438"}
+{"name": "09439"}
+{"name": "09440"}
+{"name": "09441"}
+{"name": "09442"}
+{"name": "09443"}
+{"name": "09444"}
+{"name": "09445"}
+{"name": "09446"}
+{"name": "09447"}
+{"name": "09448"}
+{"name": "09449"}
+{"name": "09450"}
+{"name": "09451"}
+{"name": "09452"}
+{"name": "09453"}
+{"name": "09454"}
+{"name": "09455"}
+{"name": "09456"}
+{"name": "09457"}
+{"name": "09458"}
+{"name": "09459"}
+{"name": "09460"}
+{"name": "09461"}
+{"name": "09462"}
+{"name": "09463"}
+{"name": "09464"}
+{"name": "09465"}
+{"name": "09466"}
+{"name": "09467"}
+{"name": "09468"}
+{"name": "09469"}
+{"name": "09470"}
+{"name": "09471"}
+{"name": "09472"}
+{"name": "09473"}
+{"name": "09474"}
+{"name": "09475"}
+{"name": "09476"}
+{"name": "09477"}
+{"name": "09478"}
+{"name": "09479"}
+{"name": "09480"}
+{"name": "09481"}
+{"name": "09482"}
+{"name": "09483"}
+{"name": "09484"}
+{"name": "09485"}
+{"name": "09486"}
+{"name": "09487"}
+{"name": "09488"}
+{"name": "09489"}
+{"name": "09490"}
+{"name": "09491"}
+{"name": "09492"}
+{"name": "09493"}
+{"name": "09494"}
+{"name": "09495"}
+{"name": "09496"}
+{"name": "09497"}
+{"name": "09498"}
+{"name": "09499"}
+{"name": "09500"}
+{"name": "09501"}
+{"name": "09502"}
+{"name": "09503"}
+{"name": "09504"}
+{"name": "09505"}
+{"name": "09506"}
+{"name": "09507"}
+{"name": "09508"}
+{"name": "09509"}
+{"name": "09510"}
+{"name": "09511"}
+{"name": "09512"}
+{"name": "09513"}
+{"name": "09514"}
+{"name": "09515"}
+{"name": "09516"}
+{"name": "09517"}
+{"name": "09518"}
+{"name": "09519"}
+{"name": "09520"}
+{"name": "09521"}
+{"name": "09522"}
+{"name": "09523"}
+{"name": "09524"}
+{"name": "09525"}
+{"name": "09526"}
+{"name": "09527"}
+{"name": "09528"}
+{"name": "09529"}
+{"name": "09530"}
+{"name": "09531"}
+{"name": "09532"}
+{"name": "09533"}
+{"name": "09534"}
+{"name": "09535"}
+{"name": "09536"}
+{"name": "09537"}
+{"name": "09538"}
+{"name": "09539"}
+{"name": "09540"}
+{"name": "09541"}
+{"name": "09542"}
+{"name": "09543"}
+{"name": "09544"}
+{"name": "09545"}
+{"name": "09546"}
+{"name": "09547"}
+{"name": "09548"}
+{"name": "09549"}
+{"name": "09550"}
+{"name": "09551"}
+{"name": "09552"}
+{"name": "09553"}
+{"name": "09554"}
+{"name": "09555"}
+{"name": "09556"}
+{"name": "09557"}
+{"name": "09558"}
+{"name": "09559"}
+{"name": "09560"}
+{"name": "09561"}
+{"name": "09562"}
+{"name": "09563"}
+{"name": "09564"}
+{"name": "09565"}
+{"name": "09566"}
+{"name": "09567"}
+{"name": "09568"}
+{"name": "09569"}
+{"name": "09570"}
+{"name": "09571"}
+{"name": "09572"}
+{"name": "09573"}
+{"name": "09574"}
+{"name": "09575"}
+{"name": "09576"}
+{"name": "09577"}
+{"name": "09578"}
+{"name": "09579"}
+{"name": "09580"}
+{"name": "09581"}
+{"name": "09582"}
+{"name": "09583"}
+{"name": "09584"}
+{"name": "09585"}
+{"name": "09586"}
+{"name": "09587"}
+{"name": "09588"}
+{"name": "09589"}
+{"name": "09590"}
+{"name": "09591"}
+{"name": "09592"}
+{"name": "09593"}
+{"name": "09594"}
+{"name": "09595"}
+{"name": "09596"}
+{"name": "09597"}
+{"name": "09598"}
+{"name": "09599"}
+{"name": "09600"}
+{"name": "09601"}
+{"name": "09602"}
+{"name": "09603"}
+{"name": "09604"}
+{"name": "09605"}
+{"name": "09606"}
+{"name": "09607"}
+{"name": "09608"}
+{"name": "09609"}
+{"name": "09610"}
+{"name": "09611"}
+{"name": "09612"}
+{"name": "09613"}
+{"name": "09614"}
+{"name": "09615"}
+{"name": "09616"}
+{"name": "09617"}
+{"name": "09618"}
+{"name": "09619"}
+{"name": "09620"}
+{"name": "09621"}
+{"name": "09622"}
+{"name": "09623"}
+{"name": "09624"}
+{"name": "09625"}
+{"name": "09626"}
+{"name": "09627"}
+{"name": "09628"}
+{"name": "09629"}
+{"name": "09630"}
+{"name": "09631"}
+{"name": "09632"}
+{"name": "09633"}
+{"name": "09634"}
+{"name": "09635"}
+{"name": "09636"}
+{"name": "09637"}
+{"name": "09638"}
+{"name": "09639"}
+{"name": "09640"}
+{"name": "09641"}
+{"name": "09642"}
+{"name": "09643"}
+{"name": "09644"}
+{"name": "09645"}
+{"name": "09646"}
+{"name": "09647"}
+{"name": "09648"}
+{"name": "09649"}
+{"name": "09650"}
+{"name": "09651"}
+{"name": "09652"}
+{"name": "09653"}
+{"name": "09654"}
+{"name": "09655"}
+{"name": "09656"}
+{"name": "09657"}
+{"name": "09658"}
+{"name": "09659"}
+{"name": "09660"}
+{"name": "09661"}
+{"name": "09662"}
+{"name": "09663"}
+{"name": "09664"}
+{"name": "09665"}
+{"name": "09666"}
+{"name": "09667"}
+{"name": "09668"}
+{"name": "09669"}
+{"name": "09670"}
+{"name": "09671"}
+{"name": "09672"}
+{"name": "09673"}
+{"name": "09674"}
+{"name": "09675"}
+{"name": "09676"}
+{"name": "09677"}
+{"name": "09678"}
+{"name": "09679"}
+{"name": "09680"}
+{"name": "09681"}
+{"name": "09682"}
+{"name": "09683"}
+{"name": "09684"}
+{"name": "09685"}
+{"name": "09686"}
+{"name": "09687"}
+{"name": "09688"}
+{"name": "09689"}
+{"name": "09690"}
+{"name": "09691"}
+{"name": "09692"}
+{"name": "09693"}
+{"name": "09694"}
+{"name": "09695"}
+{"name": "09696"}
+{"name": "09697"}
+{"name": "09698"}
+{"name": "09699"}
+{"name": "09700"}
+{"name": "09701"}
+{"name": "09702"}
+{"name": "09703"}
+{"name": "09704"}
+{"name": "09705"}
+{"name": "09706"}
+{"name": "09707"}
+{"name": "09708"}
+{"name": "09709"}
+{"name": "09710"}
+{"name": "09711"}
+{"name": "09712"}
+{"name": "09713"}
+{"name": "09714"}
+{"name": "09715"}
+{"name": "09716"}
+{"name": "09717"}
+{"name": "09718"}
+{"name": "09719"}
+{"name": "09720"}
+{"name": "09721"}
+{"name": "09722"}
+{"name": "09723"}
+{"name": "09724"}
+{"name": "09725"}
+{"name": "09726"}
+{"name": "09727"}
+{"name": "09728"}
+{"name": "09729"}
+{"name": "09730"}
+{"name": "09731"}
+{"name": "09732"}
+{"name": "09733"}
+{"name": "09734"}
+{"name": "09735"}
+{"name": "09736"}
+{"name": "09737"}
+{"name": "09738"}
+{"name": "09739"}
+{"name": "09740"}
+{"name": "09741"}
+{"name": "09742"}
+{"name": "09743"}
+{"name": "09744"}
+{"name": "09745"}
+{"name": "09746"}
+{"name": "09747"}
+{"name": "09748"}
+{"name": "09749"}
+{"name": "09750"}
+{"name": "09751"}
+{"name": "09752"}
+{"name": "09753"}
+{"name": "09754"}
+{"name": "09755"}
+{"name": "09756"}
+{"name": "09757"}
+{"name": "09758"}
+{"name": "09759"}
+{"name": "09760"}
+{"name": "09761"}
+{"name": "09762"}
+{"name": "09763"}
+{"name": "09764"}
+{"name": "09765"}
+{"name": "09766"}
+{"name": "09767"}
+{"name": "09768"}
+{"name": "09769"}
+{"name": "09770"}
+{"name": "09771"}
+{"name": "09772"}
+{"name": "09773"}
+{"name": "09774"}
+{"name": "09775"}
+{"name": "09776"}
+{"name": "09777"}
+{"name": "09778"}
+{"name": "09779"}
+{"name": "09780"}
+{"name": "09781"}
+{"name": "09782"}
+{"name": "09783"}
+{"name": "09784"}
+{"name": "09785"}
+{"name": "09786"}
+{"name": "09787"}
+{"name": "09788"}
+{"name": "09789"}
+{"name": "09790"}
+{"name": "09791"}
+{"name": "09792"}
+{"name": "09793"}
+{"name": "09794"}
+{"name": "09795"}
+{"name": "09796"}
+{"name": "09797"}
+{"name": "09798"}
+{"name": "09799"}
+{"name": "09800"}
+{"name": "09801"}
+{"name": "09802"}
+{"name": "09803"}
+{"name": "09804"}
+{"name": "09805"}
+{"name": "09806"}
+{"name": "09807"}
+{"name": "09808"}
+{"name": "09809"}
+{"name": "09810"}
+{"name": "09811"}
+{"name": "09812"}
+{"name": "09813"}
+{"name": "09814"}
+{"name": "09815"}
+{"name": "09816"}
+{"name": "09817"}
+{"name": "09818"}
+{"name": "09819"}
+{"name": "09820"}
+{"name": "09821"}
+{"name": "09822"}
+{"name": "09823"}
+{"name": "09824"}
+{"name": "09825"}
+{"name": "09826"}
+{"name": "09827"}
+{"name": "09828"}
+{"name": "09829"}
+{"name": "09830"}
+{"name": "09831"}
+{"name": "09832"}
+{"name": "09833"}
+{"name": "09834"}
+{"name": "09835"}
+{"name": "09836"}
+{"name": "09837"}
+{"name": "09838"}
+{"name": "09839"}
+{"name": "09840"}
+{"name": "09841"}
+{"name": "09842"}
+{"name": "09843"}
+{"name": "09844"}
+{"name": "09845"}
+{"name": "09846"}
+{"name": "09847"}
+{"name": "09848"}
+{"name": "09849"}
+{"name": "09850"}
+{"name": "09851"}
+{"name": "09852"}
+{"name": "09853"}
+{"name": "09854"}
+{"name": "09855"}
+{"name": "09856"}
+{"name": "09857"}
+{"name": "09858"}
+{"name": "09859"}
+{"name": "09860"}
+{"name": "09861"}
+{"name": "09862"}
+{"name": "09863"}
+{"name": "09864"}
+{"name": "09865"}
+{"name": "09866"}
+{"name": "09867"}
+{"name": "09868"}
+{"name": "09869"}
+{"name": "09870"}
+{"name": "09871"}
+{"name": "09872"}
+{"name": "09873"}
+{"name": "09874"}
+{"name": "09875"}
+{"name": "09876"}
+{"name": "09877"}
+{"name": "09878"}
+{"name": "09879"}
+{"name": "09880"}
+{"name": "09881"}
+{"name": "09882"}
+{"name": "09883"}
+{"name": "09884"}
+{"name": "09885"}
+{"name": "09886"}
+{"name": "09887"}
+{"name": "09888"}
+{"name": "09889"}
+{"name": "09890"}
+{"name": "09891"}
+{"name": "09892"}
+{"name": "09893"}
+{"name": "09894"}
+{"name": "09895"}
+{"name": "09896"}
+{"name": "09897"}
+{"name": "09898"}
+{"name": "09899"}
+{"name": "09900"}
+{"name": "09901"}
+{"name": "09902"}
+{"name": "09903"}
+{"name": "09904"}
+{"name": "09905"}
+{"name": "09906"}
+{"name": "09907"}
+{"name": "09908"}
+{"name": "09909"}
+{"name": "09910"}
+{"name": "09911"}
+{"name": "09912"}
+{"name": "09913"}
+{"name": "09914"}
+{"name": "09915"}
+{"name": "09916"}
+{"name": "09917"}
+{"name": "09918"}
+{"name": "09919"}
+{"name": "09920"}
+{"name": "09921"}
+{"name": "09922"}
+{"name": "09923"}
+{"name": "09924"}
+{"name": "09925"}
+{"name": "09926"}
+{"name": "09927"}
+{"name": "09928"}
+{"name": "09929"}
+{"name": "09930"}
+{"name": "09931"}
+{"name": "09932"}
+{"name": "09933"}
+{"name": "09934"}
+{"name": "09935"}
+{"name": "09936"}
+{"name": "09937"}
+{"name": "09938"}
+{"name": "09939"}
+{"name": "09940"}
+{"name": "09941"}
+{"name": "09942"}
+{"name": "09943"}
+{"name": "09944"}
+{"name": "09945"}
+{"name": "09946"}
+{"name": "09947"}
+{"name": "09948"}
+{"name": "09949"}
+{"name": "09950"}
+{"name": "09951"}
+{"name": "09952"}
+{"name": "09953"}
+{"name": "09954"}
+{"name": "09955"}
+{"name": "09956"}
+{"name": "09957"}
+{"name": "09958"}
+{"name": "09959"}
+{"name": "09960"}
+{"name": "09961"}
+{"name": "09962"}
+{"name": "09963"}
+{"name": "09964"}
+{"name": "09965"}
+{"name": "09966"}
+{"name": "09967"}
+{"name": "09968"}
+{"name": "09969"}
+{"name": "09970"}
+{"name": "09971"}
+{"name": "09972"}
+{"name": "09973"}
+{"name": "09974"}
+{"name": "09975"}
+{"name": "09976"}
+{"name": "09977"}
+{"name": "09978"}
+{"name": "09979"}
+{"name": "09980"}
+{"name": "09981"}
+{"name": "09982"}
+{"name": "09983"}
+{"name": "09984"}
+{"name": "09985"}
+{"name": "09986"}
+{"name": "09987"}
+{"name": "09988"}
+{"name": "09989"}
+{"name": "09990"}
+{"name": "09991"}
+{"name": "09992"}
+{"name": "09993"}
+{"name": "09994"}
+{"name": "09995"}
+{"name": "09996"}
+{"name": "09997"}
+{"name": "09998"}
+{"name": "09999"}
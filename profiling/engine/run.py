@@ -0,0 +1,113 @@
+"""
+Benchmark of the per-request overhead of the engine (scheduler, downloader
+and scraper), without any network access.
+
+It crawls a fake site, served by an in-memory download handler, where each
+page links to the next ones, and reports the pages crawled per second and
+the reactor calls (reactor.callLater) scheduled per page.
+
+Usage::
+
+    python run.py [-n PAGES] [-l LINKS] [-s NAME=VALUE ...]
+"""
+
+import re
+from time import time
+from optparse import OptionParser
+
+from twisted.internet import reactor, defer
+
+from scrapy.conf import settings
+from scrapy.crawler import CrawlerProcess
+from scrapy.spider import BaseSpider
+from scrapy.http import Request, HtmlResponse
+
+PAGES = 10000
+LINKS = 10
+
+
+class BenchDownloadHandler(object):
+    """Serve pages linking to the following LINKS pages, up to PAGES"""
+
+    def download_request(self, request, spider):
+        n = int(request.url.rsplit('/', 1)[1])
+        links = ''.join('<a href="/%d">page %d</a>\n' % (i, i) for i in \
+            xrange(n * LINKS + 1, min(n * LINKS + LINKS, PAGES - 1) + 1))
+        body = '<html><body>\n%s</body></html>' % links
+        return defer.succeed(HtmlResponse(request.url, body=body))
+
+
+class BenchSpider(BaseSpider):
+    name = 'bench'
+    start_urls = ['http://localhost/0']
+    link_re = re.compile(r'href="(.*?)"')
+
+    def parse(self, response):
+        for url in self.link_re.findall(response.body):
+            yield Request('http://localhost' + url)
+
+
+class CallCounter(object):
+    """Count the calls scheduled with reactor.callLater"""
+
+    def __init__(self):
+        self.calls = 0
+        self._callLater = reactor.callLater
+        reactor.callLater = self.callLater
+
+    def callLater(self, *a, **kw):
+        self.calls += 1
+        return self._callLater(*a, **kw)
+
+
+def run(pages, links):
+    global PAGES, LINKS
+    PAGES, LINKS = pages, links
+    settings.overrides['LOG_ENABLED'] = False
+    settings.overrides['DOWNLOAD_HANDLERS'] = {
+        'http': '__main__.BenchDownloadHandler',
+    }
+
+    crawler = CrawlerProcess(settings)
+    crawler.install()
+    crawler.configure()
+    crawler.queue.append_spider(BenchSpider())
+    counter = CallCounter()
+    start = time()
+    crawler.start() # blocking call
+    elapsed = time() - start
+    crawler.uninstall()
+
+    print "pages = %s, links per page = %s" % (pages, links)
+    print "time: %.2f seconds (%.0f pages/second)" % (elapsed, pages / elapsed)
+    print "reactor calls: %d (%.2f per page)" % (counter.calls, \
+        float(counter.calls) / pages)
+
+
+if __name__ == '__main__':
+    o = OptionParser()
+    o.add_option('-n', '--pages', type='int', default=PAGES, metavar='NUMBER',
+        help='the number of pages to crawl')
+    o.add_option('-l', '--links', type='int', default=LINKS, metavar='NUMBER',
+        help='the number of links in each page')
+    o.add_option('-s', '--set', action='append', default=[], metavar='NAME=VALUE',
+        help='set/override setting (may be repeated)')
+    opt, args = o.parse_args()
+    for name_value in opt.set:
+        name, value = name_value.split('=', 1)
+        settings.overrides[name] = value
+    run(opt.pages, opt.links)
+
+# Results (in seconds, on an Intel Xeon, single core):
+
+# pages = 10000, links per page = 10
+
+# one reactor call per scheduled request and scraped response, and one
+# cooperative task per CONCURRENT_ITEMS for each response:
+# time: 80.25 seconds (125 pages/second)
+# reactor calls: 30034 (3.00 per page)
+
+# engine ticks, scheduling and spider callbacks without reactor calls, and
+# cooperative tasks started on demand:
+# time: 9.39 seconds (1065 pages/second)
+# reactor calls: 10122 (1.01 per page)
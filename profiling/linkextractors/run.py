@@ -0,0 +1,102 @@
+"""
+Benchmark of the SgmlLinkExtractor against the LxmlHtmlLinkExtractor.
+
+It extracts the links of a corpus of saved pages with both extractors (each
+page is a new response, like in a crawl) and reports the pages processed per
+second, and the pages where both extractors didn't extract the same links.
+
+The corpus is made of the files (or the files in the directories) passed as
+arguments, or of generated pages if none are given.
+
+Usage::
+
+    python run.py [-r TIMES] [-x XPATH ...] [FILE_OR_DIR ...]
+"""
+
+import os
+from time import time
+from optparse import OptionParser
+
+from scrapy.http import HtmlResponse
+from scrapy.contrib.linkextractors.sgml import SgmlLinkExtractor
+from scrapy.contrib.linkextractors.lxmlhtml import LxmlHtmlLinkExtractor
+
+TIMES = 3
+
+
+def generated_corpus(pages=200, links=100):
+    corpus = []
+    for n in xrange(pages):
+        items = ''.join('<li><a href="/page/%d/%d?x=1" class="l">Item <b>%d</b>' \
+            '</a> <img src="/i/%d.png"> some text</li>\n' % (n, i, i, i) \
+            for i in xrange(links))
+        body = '<html><head><title>Page %d</title></head><body>\n' \
+            '<div id="nav"><a href="/">Home</a> <a href="/about">About</a></div>' \
+            '<ul id="items">\n%s</ul><p>Footer &copy; <a href="/c">c</a></p>' \
+            '</body></html>' % (n, items)
+        corpus.append(('http://www.example.com/page/%d' % n, body))
+    return corpus
+
+
+def files_corpus(paths):
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for dirpath, _, filenames in os.walk(path):
+                files.extend(os.path.join(dirpath, x) for x in sorted(filenames))
+        else:
+            files.append(path)
+    return [('http://www.example.com/%s' % os.path.basename(x), \
+        open(x, 'rb').read()) for x in files]
+
+
+def bench(cls, corpus, times, restrict_xpaths):
+    lx = cls(restrict_xpaths=restrict_xpaths)
+    links = []
+    start = time()
+    for _ in xrange(times):
+        links = [lx.extract_links(HtmlResponse(url, body=body)) \
+            for url, body in corpus]
+    return time() - start, links
+
+
+def run(corpus, times, restrict_xpaths):
+    pages = len(corpus) * times
+    print "pages = %d, times = %d, restrict_xpaths = %r" % (len(corpus), \
+        times, restrict_xpaths)
+    results = []
+    for cls in (SgmlLinkExtractor, LxmlHtmlLinkExtractor):
+        elapsed, links = bench(cls, corpus, times, restrict_xpaths)
+        results.append(links)
+        print "%s: %.2f seconds (%.0f pages/second)" % (cls.__name__, \
+            elapsed, pages / elapsed)
+    differ = [url for (url, _), l1, l2 in zip(corpus, *results) if l1 != l2]
+    print "pages with different links: %d" % len(differ)
+    for url in differ[:10]:
+        print "  %s" % url
+
+
+if __name__ == '__main__':
+    o = OptionParser()
+    o.add_option('-r', '--times', type='int', default=TIMES, metavar='NUMBER',
+        help='the number of times to process the corpus')
+    o.add_option('-x', '--restrict-xpath', action='append', default=[],
+        metavar='XPATH', help='extract links only from this region')
+    opt, args = o.parse_args()
+    corpus = files_corpus(args) if args else generated_corpus()
+    run(corpus, opt.times, opt.restrict_xpath)
+
+# Results (in seconds, on an Intel Xeon, single core):
+
+# pages = 200 (generated, 103 links each), times = 3, restrict_xpaths = []
+# SgmlLinkExtractor: 9.65 seconds (62 pages/second)
+# LxmlHtmlLinkExtractor: 5.36 seconds (112 pages/second)
+# pages with different links: 0
+
+# pages = 200 (generated, 103 links each), times = 3, restrict_xpaths = ['//ul']
+# SgmlLinkExtractor: 10.59 seconds (57 pages/second)
+# LxmlHtmlLinkExtractor: 5.25 seconds (114 pages/second)
+# pages with different links: 0
+
+# most of the remaining time of the LxmlHtmlLinkExtractor is spent in URL
+# joining and canonicalization, which are shared by both extractors
@@ -0,0 +1,100 @@
+"""
+Benchmark of the S3 uploads, against a fake (local, in-memory) S3 server.
+
+It uploads the same small objects (like images) creating a new connection for
+each upload (like the S3ImagesStore used to do) and reusing the connection of
+each thread (with scrapy.utils.s3), with the given number of threads, and
+reports the uploads per second and the connections opened.
+
+Usage::
+
+    python run.py [-n UPLOADS] [-s SIZE] [-t THREADS]
+"""
+
+import threading
+from time import time
+from cStringIO import StringIO
+from optparse import OptionParser
+
+from boto.s3.connection import S3Connection, OrdinaryCallingFormat
+
+from scrapy.conf import settings
+from scrapy.utils.s3 import get_s3_connection, upload_file
+from scrapy.utils.test import FakeS3Server
+
+UPLOADS = 1000
+SIZE = 20000
+THREADS = 8
+
+
+def new_connection(server):
+    host, port = server.server_address
+    return S3Connection('key', 'secret', host=host, port=port, is_secure=False,
+        calling_format=OrdinaryCallingFormat())
+
+
+def upload(get_connection, names, data):
+    for name in names:
+        bucket = get_connection().get_bucket('bucket', validate=False)
+        upload_file(bucket, name, StringIO(data))
+    get_connection().close()
+
+
+def bench(get_connection, n, data, nthreads):
+    names = ['images/%d.jpg' % i for i in xrange(n)]
+    threads = [threading.Thread(target=upload, args=(get_connection, \
+        names[i::nthreads], data)) for i in xrange(nthreads)]
+    start = time()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return time() - start
+
+
+def run(n, size, nthreads):
+    server = FakeS3Server()
+    server.start()
+    settings.overrides['AWS_S3_ENDPOINT'] = server.url
+    settings.overrides['AWS_ACCESS_KEY_ID'] = 'key'
+    settings.overrides['AWS_SECRET_ACCESS_KEY'] = 'secret'
+    data = 'x' * size
+    print "uploads = %d, size = %d bytes, threads = %d" % (n, size, nthreads)
+    for name, get_connection in [
+            ('new connection per upload', lambda: new_connection(server)),
+            ('connection reused per thread', get_s3_connection)]:
+        server.connections = 0
+        elapsed = bench(get_connection, n, data, nthreads)
+        print "%s: %.2f seconds (%.0f uploads/second, %d connections)" % \
+            (name, elapsed, n / elapsed, server.connections)
+    server.stop()
+
+
+if __name__ == '__main__':
+    o = OptionParser()
+    o.add_option('-n', '--uploads', type='int', default=UPLOADS,
+        metavar='NUMBER', help='the number of objects to upload')
+    o.add_option('-s', '--size', type='int', default=SIZE, metavar='BYTES',
+        help='the size of the objects')
+    o.add_option('-t', '--threads', type='int', default=THREADS,
+        metavar='NUMBER', help='the number of upload threads')
+    opt, args = o.parse_args()
+    run(opt.uploads, opt.size, opt.threads)
+
+# Results (in seconds, on an Intel Xeon, against the fake S3 server):
+
+# uploads = 1000, size = 20000 bytes, threads = 1
+# new connection per upload: 2.19 seconds (457 uploads/second, 1000 connections)
+# connection reused per thread: 1.21 seconds (828 uploads/second, 1 connections)
+
+# uploads = 1000, size = 20000 bytes, threads = 8
+# new connection per upload: 2.28 seconds (439 uploads/second, 1000 connections)
+# connection reused per thread: 1.59 seconds (630 uploads/second, 8 connections)
+
+# uploads = 200, size = 500000 bytes, threads = 8
+# new connection per upload: 1.30 seconds (154 uploads/second, 200 connections)
+# connection reused per thread: 1.03 seconds (195 uploads/second, 8 connections)
+
+# without TCP_NODELAY, each request on a reused connection waits ~40ms for the
+# delayed ACK of its headers, which makes reusing connections much slower
+# (22 uploads/second with a single thread)
@@ -6,6 +6,7 @@ from scrapy.conf import settings
 from scrapy.http import Request
 from scrapy.utils.url import is_url
 from scrapy.utils.conf import arglist_to_dict
+from scrapy.utils.py26 import cpu_count
 from scrapy.exceptions import UsageError
 
 from collections import defaultdict
@@ -28,6 +29,9 @@ class Command(ScrapyCommand):
             help="set spider argument (may be repeated)")
         parser.add_option("-n", "--nofollow", dest="nofollow", action="store_true", \
             help="don't follow links (for use with URLs only)")
+        parser.add_option("--processes", dest="processes", type="int", \
+            default=None, metavar="N", help="crawl using N worker processes " \
+            "(0 means one per CPU)")
 
     def process_options(self, args, opts):
         ScrapyCommand.process_options(self, args, opts)
@@ -37,8 +41,18 @@ class Command(ScrapyCommand):
             raise UsageError("Invalid -a value, use -a NAME=VALUE", print_help=False)
         if opts.nofollow:
             settings.overrides['CRAWLSPIDER_FOLLOW_LINKS'] = False
+        if opts.processes is not None:
+            settings.overrides['MULTIPROCESS_WORKERS'] = opts.processes or \
+                cpu_count()
 
     def run(self, args, opts):
+        workers = settings.getint('MULTIPROCESS_WORKERS')
+        if workers > 1 and settings['MULTIPROCESS_WORKER'] is None:
+            from scrapy.contrib.multiprocess import MultiprocessCrawler
+            MultiprocessCrawler(workers, self._worker_args(args, opts), \
+                spargs=opts.spargs).start()
+            return
+
         q = self.crawler.queue
         urls, names = self._split_urls_and_names(args)
         for name in names:
@@ -56,8 +70,20 @@ class Command(ScrapyCommand):
                 spider = self.crawler.spiders.create(name, **opts.spargs)
                 for url in urls:
                     q.append_url(url, spider)
+        if settings.getint('MULTIPROCESS_WORKER'):
+            # in multi-process crawls, only the first worker issues the start
+            # requests, and sends them to the workers which own them
+            q.spider_requests = [(s, []) for s, _ in q.spider_requests]
         self.crawler.start()
 
+    def _worker_args(self, args, opts):
+        wargs = list(args)
+        if opts.spider:
+            wargs += ['--spider', opts.spider]
+        for name, value in opts.spargs.items():
+            wargs += ['-a', '%s=%s' % (name, value)]
+        return wargs
+
     def _group_urls_by_spider(self, urls):
         spider_urls = defaultdict(list)
         for url in urls:
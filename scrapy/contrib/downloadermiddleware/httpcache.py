@@ -1,8 +1,11 @@
 from __future__ import with_statement
 
 import os
+import zlib
+import sqlite3
 from os.path import join, exists
 from time import time
+from email.utils import parsedate_tz, mktime_tz
 import cPickle as pickle
 
 from scrapy.xlib.pydispatch import dispatcher
@@ -23,10 +26,9 @@ class HttpCacheMiddleware(object):
     def __init__(self, settings=conf.settings):
         if not settings.getbool('HTTPCACHE_ENABLED'):
             raise NotConfigured
+        self.policy = load_object(settings['HTTPCACHE_POLICY'])(settings)
         self.storage = load_object(settings['HTTPCACHE_STORAGE'])(settings)
         self.ignore_missing = settings.getbool('HTTPCACHE_IGNORE_MISSING')
-        self.ignore_schemes = settings.getlist('HTTPCACHE_IGNORE_SCHEMES')
-        self.ignore_http_codes = map(int, settings.getlist('HTTPCACHE_IGNORE_HTTP_CODES'))
         dispatcher.connect(self.spider_opened, signal=signals.spider_opened)
         dispatcher.connect(self.spider_closed, signal=signals.spider_closed)
 
@@ -37,26 +39,180 @@ class HttpCacheMiddleware(object):
         self.storage.close_spider(spider)
 
     def process_request(self, request, spider):
-        if not self.is_cacheable(request):
+        if not self.policy.should_cache_request(request):
+            request.meta['_dont_cache'] = True
             return
-        response = self.storage.retrieve_response(spider, request)
-        if response and self.is_cacheable_response(response):
-            response.flags.append('cached')
-            return response
-        elif self.ignore_missing:
+        cachedresponse = self.storage.retrieve_response(spider, request)
+        if cachedresponse is not None:
+            cachedresponse.flags.append('cached')
+            if self.policy.is_cached_response_fresh(cachedresponse, request):
+                return cachedresponse
+        if self.ignore_missing:
             raise IgnoreRequest("Ignored request not in cache: %s" % request)
+        if cachedresponse is not None:
+            # keep the stale response, to use it if the server validates it
+            self.policy.set_conditional_validators(cachedresponse, request)
+            request.meta['_cached_response'] = cachedresponse
 
     def process_response(self, request, response, spider):
-        if self.is_cacheable(request) and self.is_cacheable_response(response):
+        if request.meta.pop('_dont_cache', False) or 'cached' in response.flags:
+            return response
+        cachedresponse = request.meta.pop('_cached_response', None)
+        if cachedresponse is not None and \
+                self.policy.is_cached_response_valid(cachedresponse, response, request):
+            response = self.policy.update_cached_response(cachedresponse, \
+                response, request)
+            self.storage.store_response(spider, request, response)
+            return response
+        if self.policy.should_cache_response(response, request):
             self.storage.store_response(spider, request, response)
         return response
 
-    def is_cacheable_response(self, response):
-        return response.status not in self.ignore_http_codes
 
-    def is_cacheable(self, request):
+class DummyPolicy(object):
+    """Cache policy which caches every request (but those with schemes in
+    HTTPCACHE_IGNORE_SCHEMES) and serves any cached response (but those with
+    status codes in HTTPCACHE_IGNORE_HTTP_CODES), as long as the storage
+    returns it"""
+
+    def __init__(self, settings=conf.settings):
+        self.ignore_schemes = settings.getlist('HTTPCACHE_IGNORE_SCHEMES')
+        self.ignore_http_codes = map(int, settings.getlist('HTTPCACHE_IGNORE_HTTP_CODES'))
+
+    def should_cache_request(self, request):
         return urlparse_cached(request).scheme not in self.ignore_schemes
 
+    def should_cache_response(self, response, request):
+        return response.status not in self.ignore_http_codes
+
+    def is_cached_response_fresh(self, cachedresponse, request):
+        return self.should_cache_response(cachedresponse, request)
+
+    def set_conditional_validators(self, cachedresponse, request):
+        pass
+
+    def is_cached_response_valid(self, cachedresponse, response, request):
+        return False
+
+    def update_cached_response(self, cachedresponse, response, request):
+        return cachedresponse
+
+
+class RFC2616Policy(DummyPolicy):
+    """Cache policy which follows the HTTP caching rules of RFC 2616: it
+    honours the Cache-Control and Expires headers, and revalidates stale
+    responses with conditional requests (If-None-Match, If-Modified-Since),
+    using the cached response when the server replies 304 Not Modified"""
+
+    # how long to keep permanent redirects, without explicit expiration
+    maxage = 365 * 24 * 3600
+    # headers updated in the cached response by a 304 response
+    update_headers = ['Date', 'Expires', 'Cache-Control', 'ETag', \
+        'Last-Modified', 'Age']
+
+    def should_cache_request(self, request):
+        if not super(RFC2616Policy, self).should_cache_request(request):
+            return False
+        cc = _parse_cachecontrol(request)
+        return 'no-store' not in cc
+
+    def should_cache_response(self, response, request):
+        if not super(RFC2616Policy, self).should_cache_response(response, request):
+            return False
+        cc = _parse_cachecontrol(response)
+        if 'no-store' in cc or response.status == 304:
+            return False
+        elif 'max-age' in cc or 'Expires' in response.headers:
+            return True
+        elif response.status in (300, 301, 308):
+            return True
+        elif response.status in (200, 203, 401):
+            # without explicit expiration, only if they can be revalidated
+            return 'Last-Modified' in response.headers or \
+                'ETag' in response.headers
+        return False
+
+    def is_cached_response_fresh(self, cachedresponse, request):
+        if not super(RFC2616Policy, self).is_cached_response_fresh( \
+                cachedresponse, request):
+            return False
+        cc = _parse_cachecontrol(cachedresponse)
+        ccreq = _parse_cachecontrol(request)
+        if 'no-cache' not in cc and 'no-cache' not in ccreq:
+            now = time()
+            lifetime = self._freshness_lifetime(cachedresponse, now)
+            if self._current_age(cachedresponse, now) < lifetime:
+                return True
+        return False
+
+    def set_conditional_validators(self, cachedresponse, request):
+        if 'Last-Modified' in cachedresponse.headers:
+            request.headers['If-Modified-Since'] = \
+                cachedresponse.headers['Last-Modified']
+        if 'ETag' in cachedresponse.headers:
+            request.headers['If-None-Match'] = cachedresponse.headers['ETag']
+
+    def is_cached_response_valid(self, cachedresponse, response, request):
+        return response.status == 304
+
+    def update_cached_response(self, cachedresponse, response, request):
+        headers = cachedresponse.headers.copy()
+        for name in self.update_headers:
+            if name in response.headers:
+                headers[name] = response.headers[name]
+        return cachedresponse.replace(headers=headers)
+
+    def _freshness_lifetime(self, response, now):
+        # Reference nsHttpResponseHead::ComputeFreshnessLifetime
+        cc = _parse_cachecontrol(response)
+        if 'max-age' in cc:
+            try:
+                return max(0, int(cc['max-age']))
+            except (TypeError, ValueError):
+                pass
+        date = _rfc1123_to_epoch(response.headers.get('Date')) or now
+        if 'Expires' in response.headers:
+            expires = _rfc1123_to_epoch(response.headers['Expires'])
+            # invalid (or past) expiration dates mean already expired
+            return max(0, (expires or 0) - date)
+        lastmodified = _rfc1123_to_epoch(response.headers.get('Last-Modified'))
+        if lastmodified and lastmodified <= date:
+            # heuristic freshness: 10% of the time since last modified
+            return (date - lastmodified) / 10
+        if response.status in (300, 301, 308):
+            return self.maxage
+        return 0
+
+    def _current_age(self, response, now):
+        # Reference nsHttpResponseHead::ComputeCurrentAge
+        currentage = 0
+        date = _rfc1123_to_epoch(response.headers.get('Date')) or now
+        if now > date:
+            currentage = now - date
+        try:
+            age = int(response.headers.get('Age') or 0)
+        except ValueError:
+            age = 0
+        return max(currentage, age)
+
+
+def _parse_cachecontrol(r):
+    """Return a dict with the directives of the Cache-Control header of the
+    given request or response"""
+    directives = {}
+    for header in r.headers.getlist('Cache-Control'):
+        for directive in header.split(','):
+            key, _, value = directive.strip().partition('=')
+            if key:
+                directives[key.lower()] = value.strip('"') or None
+    return directives
+
+def _rfc1123_to_epoch(date_str):
+    try:
+        return mktime_tz(parsedate_tz(date_str))
+    except Exception:
+        return None
+
 
 class FilesystemCacheStorage(object):
 
@@ -127,3 +283,86 @@ class FilesystemCacheStorage(object):
             return # expired
         with open(metapath, 'rb') as f:
             return pickle.load(f)
+
+
+class SqliteCacheStorage(object):
+    """Cache storage which keeps all the responses of a spider in a single
+    SQLite database (in WAL mode, if supported), one row per request, so
+    each cache hit takes a single read. Response bodies are compressed with
+    zlib if HTTPCACHE_COMPRESS is enabled."""
+
+    commit_interval = 100 # commit every this number of stored responses
+
+    def __init__(self, settings=conf.settings):
+        self.cachedir = data_path(settings['HTTPCACHE_DIR'])
+        self.expiration_secs = settings.getint('HTTPCACHE_EXPIRATION_SECS')
+        self.compress = settings.getbool('HTTPCACHE_COMPRESS')
+        self.dbs = {}
+        self.pending = {}
+
+    def open_spider(self, spider):
+        self._get_db(spider)
+
+    def close_spider(self, spider):
+        db = self.dbs.pop(spider, None)
+        self.pending.pop(spider, None)
+        if db is not None:
+            db.commit()
+            db.close()
+
+    def retrieve_response(self, spider, request):
+        """Return response if present in cache, or None otherwise."""
+        q = "select data from responses where fingerprint=? and timestamp>?"
+        mintime = 0
+        if self.expiration_secs > 0:
+            mintime = time() - self.expiration_secs
+        key = request_fingerprint(request)
+        row = self._get_db(spider).execute(q, (key, mintime)).fetchone()
+        if row is None:
+            return # not cached or expired
+        data = pickle.loads(str(row[0]))
+        body = data['body']
+        if data['compressed']:
+            body = zlib.decompress(body)
+        url = data['response_url']
+        headers = Headers(headers_raw_to_dict(data['headers']))
+        respcls = responsetypes.from_args(headers=headers, url=url)
+        return respcls(url=url, headers=headers, status=data['status'], \
+            body=body)
+
+    def store_response(self, spider, request, response):
+        """Store the given response in the cache."""
+        body = response.body
+        if self.compress:
+            body = zlib.compress(body)
+        data = {
+            'url': request.url,
+            'method': request.method,
+            'status': response.status,
+            'response_url': response.url,
+            'headers': headers_dict_to_raw(response.headers),
+            'body': body,
+            'compressed': self.compress,
+        }
+        q = "insert or replace into responses (fingerprint, timestamp, data) " \
+            "values (?,?,?)"
+        db = self._get_db(spider)
+        db.execute(q, (request_fingerprint(request), time(), \
+            buffer(pickle.dumps(data, protocol=2))))
+        self.pending[spider] = self.pending.get(spider, 0) + 1
+        if self.pending[spider] >= self.commit_interval:
+            db.commit()
+            self.pending[spider] = 0
+
+    def _get_db(self, spider):
+        db = self.dbs.get(spider)
+        if db is None:
+            if not exists(self.cachedir):
+                os.makedirs(self.cachedir)
+            db = sqlite3.connect(join(self.cachedir, '%s.db' % spider.name))
+            db.execute("pragma journal_mode=wal")
+            db.execute("pragma synchronous=normal")
+            db.execute("create table if not exists responses (fingerprint " \
+                "text primary key, timestamp real, data blob)")
+            self.dbs[spider] = db
+        return db
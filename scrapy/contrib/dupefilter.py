@@ -12,9 +12,20 @@ They must implement the following methods:
   return ``True`` if the request was seen before, or ``False`` otherwise. If
   ``dont_record`` is ``True`` the request must not be recorded as seen.
 
+And, optionally, this one:
+
+* flush(spider)
+  save the requests seen so far, if they're persisted (it's called by the
+  scheduler when it saves the state of the job, see JOBDIR)
+
 """
 
+import os
+
 from scrapy.utils.request import request_fingerprint
+from scrapy.utils.job import job_path
+from scrapy.utils.fingerprints import FingerprintSet, ScalableBloomFilter
+from scrapy.stats import stats
 
 
 class NullDupeFilter(dict):
@@ -29,16 +40,51 @@ class NullDupeFilter(dict):
 
 
 class RequestFingerprintDupeFilter(object):
-    """Duplicate filter using scrapy.utils.request.request_fingerprint"""
+    """Duplicate filter using scrapy.utils.request.request_fingerprint
 
-    def __init__(self):
+    If a ``path`` is given, the fingerprints seen for each spider are also
+    appended to a file (named after the spider) inside that directory, and
+    loaded back when the spider is opened again. They're written (and synced
+    to disk) by flush() and when the spider is closed, so the file never has
+    fingerprints of requests which were not saved by the scheduler yet.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
         self.fingerprints = {}
+        self.files = {}
+        self.unsaved = {} # fingerprints not written to the files yet
+        if path and not os.path.exists(path):
+            os.makedirs(path)
+
+    @classmethod
+    def from_settings(cls, settings):
+        return cls(job_path(settings, 'requests.seen'))
 
     def open_spider(self, spider):
-        self.fingerprints[spider] = set()
+        fingerprints = self.fingerprints[spider] = self._fingerprint_set()
+        if self.path:
+            f = open(os.path.join(self.path, spider.name), 'a+')
+            f.seek(0)
+            fingerprints.update(x.rstrip() for x in f)
+            f.seek(0, os.SEEK_END)
+            self.files[spider] = f
+            self.unsaved[spider] = []
 
     def close_spider(self, spider):
         del self.fingerprints[spider]
+        if spider in self.files:
+            self.flush(spider)
+            self.files.pop(spider).close()
+            del self.unsaved[spider]
+
+    def flush(self, spider):
+        f = self.files.get(spider)
+        if f and self.unsaved[spider]:
+            f.write(''.join(fp + '\n' for fp in self.unsaved[spider]))
+            f.flush()
+            os.fsync(f.fileno())
+            self.unsaved[spider] = []
 
     def request_seen(self, spider, request, dont_record=False):
         fp = request_fingerprint(request)
@@ -46,4 +92,62 @@ class RequestFingerprintDupeFilter(object):
             return True
         if not dont_record:
             self.fingerprints[spider].add(fp)
+            if spider in self.files:
+                self.unsaved[spider].append(fp)
         return False
+
+    def _fingerprint_set(self):
+        return set()
+
+
+class CompactFingerprintDupeFilter(RequestFingerprintDupeFilter):
+    """Duplicate filter which stores only the first ``bits`` bits of the
+    request fingerprints, in binary form (see FingerprintSet), taking much
+    less memory than RequestFingerprintDupeFilter.
+
+    If an ``error_rate`` is given, fingerprints are kept in a scalable Bloom
+    filter instead, which takes even less memory but reports (as seen) about
+    that fraction of the new requests.
+
+    The memory used and the estimated rate of false positives are recorded in
+    the spider stats.
+    """
+
+    stats_interval = 65536 # update stats every this number of new requests
+
+    def __init__(self, path=None, bits=64, error_rate=0):
+        self.bits = bits
+        self.error_rate = error_rate
+        super(CompactFingerprintDupeFilter, self).__init__(path)
+
+    @classmethod
+    def from_settings(cls, settings):
+        return cls(job_path(settings, 'requests.seen'), \
+            settings.getint('DUPEFILTER_FINGERPRINT_BITS'), \
+            settings.getfloat('DUPEFILTER_BLOOM_ERROR_RATE'))
+
+    def close_spider(self, spider):
+        self._update_stats(spider)
+        super(CompactFingerprintDupeFilter, self).close_spider(spider)
+
+    def request_seen(self, spider, request, dont_record=False):
+        seen = super(CompactFingerprintDupeFilter, self).request_seen(spider, \
+            request, dont_record)
+        count = len(self.fingerprints[spider])
+        if not seen and count and not count % self.stats_interval:
+            self._update_stats(spider)
+        return seen
+
+    def _fingerprint_set(self):
+        if self.error_rate:
+            return ScalableBloomFilter(self.error_rate)
+        return FingerprintSet(self.bits)
+
+    def _update_stats(self, spider):
+        fingerprints = self.fingerprints[spider]
+        stats.set_value('dupefilter/fingerprints', len(fingerprints), \
+            spider=spider)
+        stats.set_value('dupefilter/memory', fingerprints.memory(), \
+            spider=spider)
+        stats.set_value('dupefilter/error_rate', fingerprints.error_rate(), \
+            spider=spider)
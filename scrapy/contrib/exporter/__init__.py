@@ -4,7 +4,9 @@ Item Exporters are used to export/serialize items into different formats.
 
 import csv
 import pprint
+from functools import partial
 from cPickle import Pickler
+from cStringIO import StringIO
 from xml.sax.saxutils import XMLGenerator
 
 from scrapy.utils.py26 import json
@@ -27,6 +29,9 @@ class BaseItemExporter(object):
         self.fields_to_export = options.pop('fields_to_export', None)
         self.export_empty_fields = options.pop('export_empty_fields', False)
         self.encoding = options.pop('encoding', 'utf-8')
+        self.buffer_size = options.pop('buffer_size', 0)
+        self._buffer = None
+        self._serializers = {}
         if not dont_fail and options:
             raise TypeError("Unexpected options: %s" % ', '.join(options.keys()))
 
@@ -46,28 +51,69 @@ class BaseItemExporter(object):
     def _to_str_if_unicode(self, value):
         return value.encode(self.encoding) if isinstance(value, unicode) else value
 
+    def _buffered(self, file):
+        """Return the file-like object where the exporter should write the
+        data for the given file. Unless buffer_size is zero, it's a buffer
+        which is written to the file by _flush_buffer()"""
+        self._file = file
+        if not self.buffer_size:
+            return file
+        self._buffer = StringIO()
+        return self._buffer
+
+    def _buffered_size(self):
+        """Return the number of bytes in the buffer, not written to the file
+        yet"""
+        return self._buffer.tell() if self._buffer is not None else 0
+
+    def _flush_buffer(self, force=False):
+        """Write the buffer to the file, if it's full (or if force is True).
+        Exporters must call it after exporting each item, and with
+        force=True when finishing"""
+        buffer = self._buffer
+        if buffer is not None and (force or buffer.tell() >= self.buffer_size):
+            self._file.write(buffer.getvalue())
+            buffer.reset()
+            buffer.truncate()
+
+    def _get_serializers(self, item):
+        """Return a dict with the function which serializes each field of the
+        given item, which is computed once per item class"""
+        try:
+            return self._serializers[item.__class__]
+        except KeyError:
+            if self.serialize_field.im_func is BaseItemExporter.serialize_field.im_func:
+                serializers = dict((name, field.get('serializer', \
+                    self._to_str_if_unicode)) for name, field in \
+                    item.fields.iteritems())
+            else: # serialize_field() is overriden
+                serializers = dict((name, partial(self.serialize_field, \
+                    field, name)) for name, field in item.fields.iteritems())
+            self._serializers[item.__class__] = serializers
+            return serializers
+
     def _get_serialized_fields(self, item, default_value=None, include_empty=None):
         """Return the fields to export as an iterable of tuples (name,
         serialized_value)
         """
         if include_empty is None:
             include_empty = self.export_empty_fields
+        serializers = self._get_serializers(item)
+        if self.fields_to_export is None and not include_empty:
+            for field_name, value in item.iteritems():
+                yield field_name, serializers[field_name](value)
+            return
         if self.fields_to_export is None:
-            if include_empty:
-                field_iter = item.fields.iterkeys()
-            else:
-                field_iter = item.iterkeys()
+            field_iter = item.fields.iterkeys()
+        elif include_empty:
+            field_iter = self.fields_to_export
         else:
-            if include_empty:
-                field_iter = self.fields_to_export
-            else:
-                nonempty_fields = set(item.keys())
-                field_iter = (x for x in self.fields_to_export if x in \
-                    nonempty_fields)
+            nonempty_fields = set(item.keys())
+            field_iter = (x for x in self.fields_to_export if x in \
+                nonempty_fields)
         for field_name in field_iter:
             if field_name in item:
-                field = item.fields[field_name]
-                value = self.serialize_field(field, field_name, item[field_name])
+                value = serializers[field_name](item[field_name])
             else:
                 value = default_value
 
@@ -79,11 +125,16 @@ class JsonLinesItemExporter(BaseItemExporter):
     def __init__(self, file, **kwargs):
         self._configure(kwargs)
         self.file = file
+        self._out = self._buffered(file)
         self.encoder = json.JSONEncoder(**kwargs)
 
     def export_item(self, item):
         itemdict = dict(self._get_serialized_fields(item))
-        self.file.write(self.encoder.encode(itemdict) + '\n')
+        self._out.write(self.encoder.encode(itemdict) + '\n')
+        self._flush_buffer()
+
+    def finish_exporting(self):
+        self._flush_buffer(force=True)
 
 
 class JsonItemExporter(JsonLinesItemExporter):
@@ -91,22 +142,25 @@ class JsonItemExporter(JsonLinesItemExporter):
     def __init__(self, file, **kwargs):
         self._configure(kwargs)
         self.file = file
+        self._out = self._buffered(file)
         self.encoder = json.JSONEncoder(**kwargs)
         self.first_item = True
 
     def start_exporting(self):
-        self.file.write("[")
+        self._out.write("[")
 
     def finish_exporting(self):
-        self.file.write("]")
+        self._out.write("]")
+        self._flush_buffer(force=True)
 
     def export_item(self, item):
         if self.first_item:
             self.first_item = False
         else:
-            self.file.write(',\n')
+            self._out.write(',\n')
         itemdict = dict(self._get_serialized_fields(item))
-        self.file.write(self.encoder.encode(itemdict))
+        self._out.write(self.encoder.encode(itemdict))
+        self._flush_buffer()
 
 
 class XmlItemExporter(BaseItemExporter):
@@ -115,7 +169,7 @@ class XmlItemExporter(BaseItemExporter):
         self.item_element = kwargs.pop('item_element', 'item')
         self.root_element = kwargs.pop('root_element', 'items')
         self._configure(kwargs)
-        self.xg = XMLGenerator(file, encoding=self.encoding)
+        self.xg = XMLGenerator(self._buffered(file), encoding=self.encoding)
 
     def start_exporting(self):
         self.xg.startDocument()
@@ -126,10 +180,12 @@ class XmlItemExporter(BaseItemExporter):
         for name, value in self._get_serialized_fields(item, default_value=''):
             self._export_xml_field(name, value)
         self.xg.endElement(self.item_element)
+        self._flush_buffer()
 
     def finish_exporting(self):
         self.xg.endElement(self.root_element)
         self.xg.endDocument()
+        self._flush_buffer(force=True)
 
     def _export_xml_field(self, name, serialized_value):
         self.xg.startElement(name, {})
@@ -146,7 +202,7 @@ class CsvItemExporter(BaseItemExporter):
     def __init__(self, file, include_headers_line=True, **kwargs):
         self._configure(kwargs, dont_fail=True)
         self.include_headers_line = include_headers_line
-        self.csv_writer = csv.writer(file, **kwargs)
+        self.csv_writer = csv.writer(self._buffered(file), **kwargs)
         self._headers_not_written = True
 
     def export_item(self, item):
@@ -158,6 +214,10 @@ class CsvItemExporter(BaseItemExporter):
             include_empty=True)
         values = [x[1] for x in fields]
         self.csv_writer.writerow(values)
+        self._flush_buffer()
+
+    def finish_exporting(self):
+        self._flush_buffer(force=True)
 
     def _write_headers_and_set_fields_to_export(self, item):
         if self.include_headers_line:
@@ -170,10 +230,14 @@ class PickleItemExporter(BaseItemExporter):
 
     def __init__(self, file, protocol=0, **kwargs):
         self._configure(kwargs)
-        self.pickler = Pickler(file, protocol)
+        self.pickler = Pickler(self._buffered(file), protocol)
 
     def export_item(self, item):
         self.pickler.dump(dict(self._get_serialized_fields(item)))
+        self._flush_buffer()
+
+    def finish_exporting(self):
+        self._flush_buffer(force=True)
 
 
 class PprintItemExporter(BaseItemExporter):
@@ -181,7 +245,12 @@ class PprintItemExporter(BaseItemExporter):
     def __init__(self, file, **kwargs):
         self._configure(kwargs)
         self.file = file
+        self._out = self._buffered(file)
 
     def export_item(self, item):
         itemdict = dict(self._get_serialized_fields(item))
-        self.file.write(pprint.pformat(itemdict) + '\n')
+        self._out.write(pprint.pformat(itemdict) + '\n')
+        self._flush_buffer()
+
+    def finish_exporting(self):
+        self._flush_buffer(force=True)
@@ -4,7 +4,8 @@ Feed Exports extension
 See documentation in docs/topics/feed-exports.rst
 """
 
-import sys, os, posixpath
+import sys, os, posixpath, bz2
+from gzip import GzipFile
 from tempfile import TemporaryFile
 from datetime import datetime
 from urlparse import urlparse
@@ -13,13 +14,16 @@ from shutil import copyfileobj
 
 from zope.interface import Interface, implements
 
-from twisted.internet import defer, threads
+from twisted.internet import defer, threads, task
 from scrapy import log, signals
+from scrapy.stats import stats
 from scrapy.xlib.pydispatch import dispatcher
 from scrapy.utils.ftp import ftp_makedirs_cwd
 from scrapy.exceptions import NotConfigured
 from scrapy.utils.misc import load_object
 from scrapy.utils.url import file_uri_to_path
+from scrapy.utils.s3 import get_s3_connection, upload_file
+from scrapy.contrib.exporter import BaseItemExporter
 from scrapy.conf import settings
 
 
@@ -29,21 +33,118 @@ class IFeedStorage(Interface):
     def __init__(uri):
         """Initialize the storage with the parameters given in the URI"""
 
+    def open(spider):
+        """Open the storage for the given spider. It must return a file-like
+        object where the feed will be written, which is passed to store() once
+        the feed is finished"""
+
     def store(file, spider):
-        """Store the given file stream"""
+        """Store the given file stream, and close it"""
 
 
 class BlockingFeedStorage(object):
+    """Base class for storages which store the whole feed at once (in a
+    thread) once it's finished, so it's written to a temporary file until
+    then"""
 
     implements(IFeedStorage)
 
+    def open(self, spider):
+        return TemporaryFile(prefix='feed-')
+
     def store(self, file, spider):
-        return threads.deferToThread(self._store_in_thread, file, spider)
+        file.seek(0)
+        d = threads.deferToThread(self._store_in_thread, file, spider)
+        d.addBoth(lambda x: (file.close(), x)[1])
+        return d
 
     def _store_in_thread(self, file, spider):
         raise NotImplementedError
 
 
+class MultipartFeedStorage(BlockingFeedStorage):
+    """Base class for storages which store the feed in parts (in a thread)
+    while it's being written, so only the part being written is kept in a
+    temporary file. The parts have at least FEED_UPLOAD_PART_SIZE bytes,
+    except the last one."""
+
+    def open(self, spider):
+        return FeedPartsFile(self, spider, settings.getint('FEED_UPLOAD_PART_SIZE'))
+
+    def store(self, file, spider):
+        if isinstance(file, FeedPartsFile):
+            return file.finish()
+        return super(MultipartFeedStorage, self).store(file, spider)
+
+    def _store_part_in_thread(self, file, number, spider):
+        """Store the given part of the feed. Parts are numbered from 1, and
+        stored sequentially"""
+        raise NotImplementedError
+
+    def _finish_in_thread(self, spider):
+        """Called once all the parts have been stored"""
+
+    def _abort_in_thread(self, spider):
+        """Called if storing a part (or finishing) fails"""
+
+
+class FeedPartsFile(object):
+    """File-like object used by the multipart storages, which buffers the data
+    written to it in a temporary file until there's enough for a part, and
+    then passes it to the storage"""
+
+    def __init__(self, storage, spider, part_size):
+        self.storage = storage
+        self.spider = spider
+        self.part_size = part_size
+        self.parts = 0
+        self.nbytes = 0
+        self._buffer = TemporaryFile(prefix='feed-')
+        self._buffered = 0
+        self._dfd = defer.succeed(None)
+
+    def write(self, data):
+        self._buffer.write(data)
+        self._buffered += len(data)
+        self.nbytes += len(data)
+        if self._buffered >= self.part_size:
+            self._store_part()
+
+    def tell(self):
+        return self.nbytes
+
+    def flush(self):
+        pass
+
+    def finish(self):
+        """Store the last part and finish storing the feed. Return a deferred
+        which is fired when done"""
+        if self._buffered or not self.parts:
+            self._store_part()
+        else:
+            self._buffer.close()
+        self._dfd.addCallback(lambda _: threads.deferToThread( \
+            self.storage._finish_in_thread, self.spider))
+        self._dfd.addErrback(self._abort)
+        return self._dfd
+
+    def _store_part(self):
+        buffer, self._buffer = self._buffer, TemporaryFile(prefix='feed-')
+        self._buffered = 0
+        self.parts += 1
+        buffer.seek(0)
+        self._dfd.addCallback(lambda _, number=self.parts: \
+            threads.deferToThread(self.storage._store_part_in_thread, buffer, \
+            number, self.spider))
+        self._dfd.addBoth(lambda x: (buffer.close(), x)[1])
+
+    def _abort(self, failure):
+        d = threads.deferToThread(self.storage._abort_in_thread, self.spider)
+        d.addErrback(log.err, "Error aborting feed storage", spider=self.spider)
+        d.addCallback(lambda _: failure)
+        return d
+
+
 class StdoutFeedStorage(object):
 
     implements(IFeedStorage)
@@ -51,47 +152,101 @@ class StdoutFeedStorage(object):
     def __init__(self, uri, _stdout=sys.stdout):
         self._stdout = _stdout
 
+    def open(self, spider):
+        return TemporaryFile(prefix='feed-')
+
     def store(self, file, spider):
+        file.seek(0)
         copyfileobj(file, self._stdout)
+        file.close()
 
 
 class FileFeedStorage(BlockingFeedStorage):
+    """Storage which writes the feed directly to the target file"""
 
     def __init__(self, uri):
         self.path = file_uri_to_path(uri)
+        self._file = None
+
+    def open(self, spider):
+        self._makedirs()
+        self._file = open(self.path, 'wb')
+        return self._file
+
+    def store(self, file, spider):
+        if file is self._file:
+            self._file = None
+            file.close()
+        else:
+            return super(FileFeedStorage, self).store(file, spider)
 
     def _store_in_thread(self, file, spider):
-        dirname = os.path.dirname(self.path)
-        if dirname and not os.path.exists(dirname):
-            os.makedirs(dirname)
+        self._makedirs()
         f = open(self.path, 'wb')
         copyfileobj(file, f)
         f.close()
 
+    def _makedirs(self):
+        dirname = os.path.dirname(self.path)
+        if dirname and not os.path.exists(dirname):
+            os.makedirs(dirname)
 
-class S3FeedStorage(BlockingFeedStorage):
+
+class S3FeedStorage(MultipartFeedStorage):
+    """Storage which uploads the feed to S3, using a multipart upload if it
+    has more than one part"""
 
     def __init__(self, uri):
         try:
             import boto
         except ImportError:
             raise NotConfigured
-        self.connect_s3 = boto.connect_s3
         u = urlparse(uri)
         self.bucketname = u.hostname
         self.access_key = u.username or settings['AWS_ACCESS_KEY_ID']
         self.secret_key = u.password or settings['AWS_SECRET_ACCESS_KEY']
         self.keyname = u.path
+        self._part = self._upload = None
+
+    def _get_bucket(self):
+        conn = get_s3_connection(self.access_key, self.secret_key)
+        return conn.get_bucket(self.bucketname, validate=False)
 
     def _store_in_thread(self, file, spider):
-        conn = self.connect_s3(self.access_key, self.secret_key)
-        bucket = conn.get_bucket(self.bucketname, validate=False)
-        key = bucket.new_key(self.keyname)
-        key.set_contents_from_file(file)
-        key.close()
+        upload_file(self._get_bucket(), self.keyname, file, \
+            part_size=settings.getint('FEED_UPLOAD_PART_SIZE'))
+
+    def _store_part_in_thread(self, file, number, spider):
+        # the first part is kept until the second one is available, so feeds
+        # with a single part don't need a multipart upload
+        if number == 1:
+            self._part = TemporaryFile(prefix='feed-')
+            copyfileobj(file, self._part)
+            return
+        if number == 2:
+            self._upload = self._get_bucket().initiate_multipart_upload(self.keyname)
+            self._part.seek(0)
+            self._upload.upload_part_from_file(self._part, 1)
+            self._part.close()
+            self._part = None
+        self._upload.upload_part_from_file(file, number)
+
+    def _finish_in_thread(self, spider):
+        if self._upload is not None:
+            self._upload.complete_upload()
+        else:
+            self._part.seek(0)
+            self._store_in_thread(self._part, spider)
+            self._part.close()
 
+    def _abort_in_thread(self, spider):
+        if self._upload is not None:
+            self._upload.cancel_upload()
 
-class FTPFeedStorage(BlockingFeedStorage):
+
+class FTPFeedStorage(MultipartFeedStorage):
+    """Storage which uploads the feed to a FTP server, appending each part to
+    the file"""
 
     def __init__(self, uri):
         u = urlparse(uri)
@@ -102,20 +257,86 @@ class FTPFeedStorage(BlockingFeedStorage):
         self.path = u.path
 
     def _store_in_thread(self, file, spider):
+        self._store_part_in_thread(file, 1, spider)
+
+    def _store_part_in_thread(self, file, number, spider):
         ftp = FTP()
         ftp.connect(self.host, self.port)
         ftp.login(self.username, self.password)
         dirname, filename = posixpath.split(self.path)
         ftp_makedirs_cwd(ftp, dirname)
-        ftp.storbinary('STOR %s' % filename, file)
+        command = 'STOR' if number == 1 else 'APPE'
+        ftp.storbinary('%s %s' % (command, filename), file)
         ftp.quit()
 
 
-class SpiderSlot(object):
-    def __init__(self, file, exp):
+class CompressedFeedFile(object):
+    """File-like object which compresses (with gzip or bz2) the data written
+    to it into the given file. Its tell() method returns the number of bytes
+    written to it (before compression)."""
+
+    compressions = ('gzip', 'bz2')
+
+    def __init__(self, file, compression, level=6):
         self.file = file
-        self.exporter = exp
+        self.nbytes = 0
+        if compression == 'gzip':
+            gzfile = GzipFile(fileobj=file, mode='wb', compresslevel=level)
+            self._write = gzfile.write
+            self._finish = gzfile.close
+        elif compression == 'bz2':
+            compressor = bz2.BZ2Compressor(level)
+            self._write = lambda data: file.write(compressor.compress(data))
+            self._finish = lambda: file.write(compressor.flush())
+        else:
+            raise ValueError("Unknown compression: %s" % compression)
+
+    def write(self, data):
+        self.nbytes += len(data)
+        self._write(data)
+
+    def tell(self):
+        return self.nbytes
+
+    def flush(self):
+        pass
+
+    def finish(self):
+        """Write the remaining compressed data to the file, which is left
+        open"""
+        self._finish()
+
+
+class SpiderSlot(object):
+    def __init__(self, spider):
+        self.spider = spider
+        self.file = None
+        self.storage_file = None
+        self.exporter = None
+        self.storage = None
+        self.uri = None
         self.itemcount = 0
+        self.parts = 0
+        self.stored = []
+        self.rotate_task = None
+
+class _UriParamsProbe(dict):
+    """Records the parameters used to format a feed URI with it"""
+
+    def __missing__(self, key):
+        self[key] = 0
+        return 0
+
+def _uri_params_used(urifmt):
+    """Return the names of the parameters used in the given feed URI, whatever
+    their format (like %(part)s or %(part)05d)"""
+    probe = _UriParamsProbe()
+    try:
+        urifmt % probe
+    except (ValueError, TypeError):
+        return []
+    return probe.keys()
+
 
 class FeedExporter(object):
 
@@ -130,7 +351,21 @@ class FeedExporter(object):
             raise NotConfigured
         if not self._exporter_supported(self.format):
             raise NotConfigured
+        self.compression = settings['FEED_COMPRESSION']
+        if self.compression and \
+                self.compression not in CompressedFeedFile.compressions:
+            log.msg("Unknown feed compression: %s" % self.compression, log.ERROR)
+            raise NotConfigured
+        self.compression_level = settings.getint('FEED_COMPRESSION_LEVEL')
         self.store_empty = settings.getbool('FEED_STORE_EMPTY')
+        self.buffer_size = settings.getint('FEED_BUFFER_SIZE')
+        self.rotate_size = settings.getint('FEED_ROTATE_SIZE')
+        self.rotate_interval = settings.getfloat('FEED_ROTATE_INTERVAL')
+        if (self.rotate_size or self.rotate_interval) and \
+                'part' not in _uri_params_used(self.urifmt):
+            log.msg("FEED_URI must contain %(part)s when feed rotation is " \
+                "enabled", log.ERROR)
+            raise NotConfigured
         uripar = settings['FEED_URI_PARAMS']
         self._uripar = load_object(uripar) if uripar else lambda x, y: None
         self.slots = {}
@@ -139,36 +374,89 @@ class FeedExporter(object):
         dispatcher.connect(self.item_passed, signals.item_passed)
 
     def open_spider(self, spider):
-        file = TemporaryFile(prefix='feed-')
-        exp = self._get_exporter(file)
-        exp.start_exporting()
-        self.slots[spider] = SpiderSlot(file, exp)
+        slot = self.slots[spider] = SpiderSlot(spider)
+        if self.rotate_interval:
+            slot.rotate_task = task.LoopingCall(self._rotate, slot)
+            slot.rotate_task.start(self.rotate_interval, now=False)
 
     def close_spider(self, spider):
         slot = self.slots.pop(spider)
-        if not slot.itemcount and not self.store_empty:
-            return
-        slot.exporter.finish_exporting()
-        nbytes = slot.file.tell()
-        slot.file.seek(0)
-        uri = self.urifmt % self._get_uri_params(spider)
-        storage = self._get_storage(uri)
-        if not storage:
-            return
-        logfmt = "%%s %s feed (%d items, %d bytes) in: %s" % (self.format, \
-            slot.itemcount, nbytes, uri)
-        d = defer.maybeDeferred(storage.store, slot.file, spider)
-        d.addCallback(lambda _: log.msg(logfmt % "Stored", spider=spider))
-        d.addErrback(log.err, logfmt % "Error storing", spider=spider)
-        d.addBoth(lambda _: slot.file.close())
-        return d
+        if slot.rotate_task and slot.rotate_task.running:
+            slot.rotate_task.stop()
+        if slot.file is None and not slot.parts and self.store_empty:
+            self._open_feed(slot)
+        if slot.file is not None:
+            self._store_feed(slot)
+        if slot.stored:
+            return defer.DeferredList(slot.stored)
 
     def item_passed(self, item, spider):
         slot = self.slots[spider]
+        if slot.file is None:
+            self._open_feed(slot)
         slot.exporter.export_item(item)
         slot.itemcount += 1
+        if self.rotate_size and self._feed_size(slot) >= self.rotate_size:
+            self._store_feed(slot)
         return item
 
+    def _rotate(self, slot):
+        if slot.file is not None:
+            self._store_feed(slot)
+
+    def _open_feed(self, slot):
+        slot.uri = self.urifmt % self._get_uri_params(slot.spider, slot.parts)
+        slot.storage = self._get_storage(slot.uri)
+        if hasattr(slot.storage, 'open'):
+            slot.storage_file = slot.storage.open(slot.spider)
+        else: # storages which only implement store()
+            slot.storage_file = TemporaryFile(prefix='feed-')
+        if self.compression:
+            slot.file = CompressedFeedFile(slot.storage_file, \
+                self.compression, self.compression_level)
+        else:
+            slot.file = slot.storage_file
+        slot.exporter = self._get_exporter(slot.file)
+        slot.exporter.start_exporting()
+        slot.itemcount = 0
+        slot.parts += 1
+
+    def _feed_size(self, slot):
+        size = slot.file.tell()
+        if isinstance(slot.exporter, BaseItemExporter):
+            size += slot.exporter._buffered_size()
+        return size
+
+    def _store_feed(self, slot):
+        slot.exporter.finish_exporting()
+        if isinstance(slot.exporter, BaseItemExporter):
+            # in case finish_exporting() is overridden without writing it
+            slot.exporter._flush_buffer(force=True)
+        spider, file = slot.spider, slot.storage_file
+        nbytes = slot.file.tell()
+        stats.inc_value('feedexport/bytes', nbytes, spider=spider)
+        if self.compression:
+            slot.file.finish()
+            compressed = file.tell()
+            stats.inc_value('feedexport/compressed_bytes', compressed, \
+                spider=spider)
+            logfmt = "%%s %s feed (%d items, %d bytes, %d compressed with " \
+                "%s) in: %s" % (self.format, slot.itemcount, nbytes, \
+                compressed, self.compression, slot.uri)
+        else:
+            logfmt = "%%s %s feed (%d items, %d bytes) in: %s" % (self.format, \
+                slot.itemcount, nbytes, slot.uri)
+        streamed = hasattr(slot.storage, 'open')
+        if not streamed:
+            file.seek(0)
+        d = defer.maybeDeferred(slot.storage.store, file, spider)
+        if not streamed:
+            d.addBoth(lambda x: (file.close(), x)[1])
+        d.addCallback(lambda _: log.msg(logfmt % "Stored", spider=spider))
+        d.addErrback(log.err, logfmt % "Error storing", spider=spider)
+        slot.stored.append(d)
+        slot.file = slot.storage_file = slot.exporter = slot.storage = None
+
     def _load_components(self, setting_prefix):
         conf = dict(settings['%s_BASE' % setting_prefix])
         conf.update(settings[setting_prefix])
@@ -196,17 +484,22 @@ class FeedExporter(object):
         else:
             log.msg("Unknown feed storage scheme: %s" % scheme, log.ERROR)
 
-    def _get_exporter(self, *a, **kw):
-        return self.exporters[self.format](*a, **kw)
+    def _get_exporter(self, file):
+        exportercls = self.exporters[self.format]
+        if self.buffer_size and isinstance(exportercls, type) and \
+                issubclass(exportercls, BaseItemExporter):
+            return exportercls(file, buffer_size=self.buffer_size)
+        return exportercls(file)
 
     def _get_storage(self, uri):
         return self.storages[urlparse(uri).scheme](uri)
 
-    def _get_uri_params(self, spider):
+    def _get_uri_params(self, spider, part=0):
         params = {}
         for k in dir(spider):
             params[k] = getattr(spider, k)
         ts = datetime.utcnow().replace(microsecond=0).isoformat().replace(':', '-')
         params['time'] = ts
+        params['part'] = part
         self._uripar(params, spider)
         return params
@@ -4,7 +4,7 @@ from scrapy.utils.url import urljoin_rfc
 from scrapy.utils.markup import remove_tags, remove_entities, replace_escape_chars
 
 from scrapy.link import Link
-from .sgml import SgmlLinkExtractor
+from .sgml import SgmlLinkExtractor, get_restricted_html
 
 linkre = re.compile(
         "<a\s.*?href=(\"[.#]+?\"|\'[.#]+?\'|[^\s]+?)(>|\s.*?>)(.*?)<[/ ]?a>", 
@@ -17,6 +17,12 @@ def clean_link(link_text):
 class RegexLinkExtractor(SgmlLinkExtractor):
     """High performant link extractor"""
 
+    def extract_links(self, response):
+        html = get_restricted_html(response, self.restrict_xpaths)
+        links = self._extract_links(html, response.url, response.encoding)
+        links = self._process_links(links)
+        return links
+
     def _extract_links(self, response_text, response_url, response_encoding):
         base_url = urljoin_rfc(response_url, self.base_url) if self.base_url else response_url
 
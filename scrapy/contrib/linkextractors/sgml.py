@@ -3,6 +3,7 @@ SGMLParser-based Link extractors
 """
 
 import re
+import weakref
 
 from scrapy.selector import HtmlXPathSelector
 from scrapy.link import Link
@@ -10,6 +11,66 @@ from scrapy.utils.misc import arg_to_iter
 from scrapy.utils.python import FixedSGMLParser, unique as unique_list, str_to_unicode
 from scrapy.utils.url import safe_url_string, urljoin_rfc, canonicalize_url, url_is_from_any_domain
 
+class SgmlEventsParser(FixedSGMLParser):
+    """Parser which records the events (start tags, end tags and data) seen by
+    the link extractors, so they can be replayed by all the link extractors
+    used on the same document without parsing it again"""
+
+    def reset(self):
+        FixedSGMLParser.reset(self)
+        self.events = []
+
+    def unknown_starttag(self, tag, attrs):
+        self.events.append((0, tag, attrs))
+
+    def unknown_endtag(self, tag):
+        self.events.append((1, tag, None))
+
+    def handle_data(self, data):
+        self.events.append((2, data, None))
+
+
+def get_restricted_html(response, restrict_xpaths=()):
+    """Return the HTML of the regions of the given response selected by the
+    given XPaths, or its whole body if no XPaths are given"""
+    if not restrict_xpaths:
+        return response.body
+    hxs = HtmlXPathSelector(response)
+    return ''.join(''.join(html_fragm for html_fragm in hxs.select(xpath_expr).extract()) \
+        for xpath_expr in restrict_xpaths)
+
+_events_cache = weakref.WeakKeyDictionary()
+def get_sgml_events(response, restrict_xpaths=()):
+    """Return the SGML events of the given response body (or of the regions
+    selected by the given XPaths), which are cached per response"""
+    cache = _events_cache.setdefault(response, {})
+    if restrict_xpaths not in cache:
+        parser = SgmlEventsParser()
+        parser.feed(get_restricted_html(response, restrict_xpaths))
+        parser.close()
+        cache[restrict_xpaths] = parser.events
+    return cache[restrict_xpaths]
+
+# SGMLParser methods whose calls are not recorded in the SGML events, so link
+# extractors overriding them (or defining start_*, end_* or do_* tag handlers)
+# must parse the documents themselves
+_parser_handlers = ('finish_starttag', 'finish_endtag', 'handle_starttag',
+    'handle_endtag', 'handle_charref', 'handle_entityref', 'handle_comment',
+    'handle_decl', 'handle_pi', 'unknown_charref', 'unknown_entityref',
+    'convert_charref', 'convert_entityref', 'convert_codepoint')
+
+_replayable_classes = {}
+def can_replay_events(cls):
+    """Return True if the given link extractor class only handles the events
+    recorded by SgmlEventsParser, so they can be replayed on its instances"""
+    if cls not in _replayable_classes:
+        _replayable_classes[cls] = not [name for name in dir(cls) \
+            if name.startswith(('start_', 'end_', 'do_')) or \
+            (name in _parser_handlers and \
+            getattr(getattr(cls, name), 'im_func', None) is not getattr(FixedSGMLParser, name).im_func)]
+    return _replayable_classes[cls]
+
+
 class BaseSgmlLinkExtractor(FixedSGMLParser):
 
     def __init__(self, tag="a", attr="href", unique=False, process_value=None):
@@ -20,11 +81,15 @@ class BaseSgmlLinkExtractor(FixedSGMLParser):
         self.current_link = None
         self.unique = unique
 
-    def _extract_links(self, response_text, response_url, response_encoding):
-        """ Do the real extraction work """
+    def _extract_links(self, response_text, response_url, response_encoding, events=None):
+        """ Do the real extraction work. If the SGML events of the response
+        text are given, they're replayed instead of parsing it again """
         self.reset()
-        self.feed(response_text)
-        self.close()
+        if events is None:
+            self.feed(response_text)
+            self.close()
+        else:
+            self.replay(events)
 
         ret = []
         base_url = urljoin_rfc(response_url, self.base_url) if self.base_url else response_url
@@ -46,10 +111,23 @@ class BaseSgmlLinkExtractor(FixedSGMLParser):
 
     def extract_links(self, response):
         # wrapper needed to allow to work directly with text
-        links = self._extract_links(response.body, response.url, response.encoding)
+        events = get_sgml_events(response) if can_replay_events(self.__class__) else None
+        links = self._extract_links(response.body, response.url, \
+            response.encoding, events)
         links = self._process_links(links)
         return links
 
+    def replay(self, events):
+        """Process the given SGML events (see SgmlEventsParser). Only the
+        unknown_starttag, unknown_endtag and handle_data methods are called"""
+        for event, arg1, arg2 in events:
+            if event == 0:
+                self.unknown_starttag(arg1, arg2)
+            elif event == 1:
+                self.unknown_endtag(arg1)
+            else:
+                self.handle_data(arg1)
+
     def reset(self):
         FixedSGMLParser.reset(self)
         self.links = []
@@ -100,14 +178,11 @@ class SgmlLinkExtractor(BaseSgmlLinkExtractor):
             unique=unique, process_value=process_value)
 
     def extract_links(self, response):
-        if self.restrict_xpaths:
-            hxs = HtmlXPathSelector(response)
-            html = ''.join(''.join(html_fragm for html_fragm in hxs.select(xpath_expr).extract()) \
-                for xpath_expr in self.restrict_xpaths)
+        if can_replay_events(self.__class__):
+            html, events = None, get_sgml_events(response, self.restrict_xpaths)
         else:
-            html = response.body
-
-        links = self._extract_links(html, response.url, response.encoding)
+            html, events = get_restricted_html(response, self.restrict_xpaths), None
+        links = self._extract_links(html, response.url, response.encoding, events)
         links = self._process_links(links)
         return links
 
@@ -0,0 +1,496 @@
+"""
+Multi-process crawling: run a crawl in several worker processes, each one with
+its own engine, and partition the requests among them by domain.
+
+See documentation in docs/topics/multiprocess.rst
+"""
+
+import os
+import sys
+import zlib
+import signal
+import pprint
+import shutil
+import tempfile
+import cPickle as pickle
+from collections import defaultdict
+
+from twisted.internet import reactor, protocol, defer, error, task
+from twisted.protocols.basic import NetstringReceiver
+from scrapy.xlib.pydispatch import dispatcher
+
+from scrapy import signals, log
+from scrapy.exceptions import NotConfigured, DontCloseSpider
+from scrapy.stats import stats
+from scrapy.crawler import Crawler
+from scrapy.utils.httpobj import urlparse_cached
+from scrapy.utils.reqser import request_to_string, request_from_string
+from scrapy.utils.ossignal import install_shutdown_handlers, signal_names
+from scrapy.utils.misc import load_object
+from scrapy.conf import settings
+
+CONTROL_SOCKET = 'control.sock'
+
+
+def worker_for(request, workers):
+    """Return the index of the worker which owns (crawls) the given request,
+    among the given number of workers. All the requests to the same domain
+    are owned by the same worker."""
+    host = urlparse_cached(request).hostname or ''
+    return (zlib.crc32(host) & 0xffffffff) % workers
+
+
+def worker_socket(dir, worker):
+    return os.path.join(dir, 'worker-%d.sock' % worker)
+
+
+def aggregate_stats(statslist):
+    """Aggregate the stats of the same spider collected by several workers.
+    Numbers are added up, except maximums and minimums (whose key ends with
+    ``max`` or ``min``), start and finish times take the earliest and latest
+    value, and any other value is taken from the first worker which has it"""
+    result = {}
+    for stats in statslist:
+        for key, value in stats.iteritems():
+            if key not in result:
+                result[key] = value
+            elif key.endswith('max') or key == 'finish_time':
+                result[key] = max(result[key], value)
+            elif key.endswith('min') or key == 'start_time':
+                result[key] = min(result[key], value)
+            elif isinstance(value, (int, long, float)) and \
+                    not isinstance(value, bool) and \
+                    not key.startswith('envinfo/'):
+                result[key] += value
+    return result
+
+
+class MessageProtocol(NetstringReceiver):
+    """Protocol used to exchange messages (pickled tuples) between the
+    processes of a multi-process crawl"""
+
+    MAX_LENGTH = 64 * 1024 * 1024
+    handler = None
+
+    def stringReceived(self, string):
+        self.handler.message_received(self, pickle.loads(string))
+
+    def send(self, *message):
+        self.sendString(pickle.dumps(message, protocol=2))
+
+
+class MessageFactory(protocol.ServerFactory):
+
+    protocol = MessageProtocol
+
+    def __init__(self, handler):
+        self.handler = handler
+
+    def buildProtocol(self, addr):
+        p = protocol.ServerFactory.buildProtocol(self, addr)
+        p.handler = self.handler
+        return p
+
+
+def connect(path, handler, retries=30):
+    """Connect to the unix socket at the given path, retrying every second
+    (up to the given number of times) until it's listening. Return a deferred
+    which fires with the MessageProtocol of the connection."""
+    def _connected(p):
+        p.handler = handler
+        return p
+    def _failed(failure):
+        if not retries or not failure.check(error.ConnectError):
+            return failure
+        d = defer.Deferred()
+        reactor.callLater(1, d.callback, None)
+        return d.addCallback(lambda _: connect(path, handler, retries - 1))
+    d = protocol.ClientCreator(reactor, MessageProtocol).connectUNIX(path)
+    return d.addCallbacks(_connected, _failed)
+
+
+class MultiprocessMiddleware(object):
+    """Scheduler middleware run by each worker process of a multi-process
+    crawl. It sends the requests owned by other workers to them, crawls the
+    requests received from them, answers the termination probes of the parent
+    process (and sends it the scraped items, if it exports the feed), and
+    keeps the spiders open until the parent process detects that all workers
+    have finished."""
+
+    stats_timeout = 30
+
+    def __init__(self):
+        if settings['MULTIPROCESS_WORKER'] is None:
+            raise NotConfigured
+        self.workers = settings.getint('MULTIPROCESS_WORKERS')
+        self.worker = settings.getint('MULTIPROCESS_WORKER')
+        self.dir = settings['MULTIPROCESS_DIR']
+        self.spiders = {} # spider name -> open spider
+        self.pending = defaultdict(list) # spider name -> requests received before opening it
+        self.sent = defaultdict(int)
+        self.received = defaultdict(int)
+        self.finished = set()
+        self.finished_all = False
+        self.acks = []
+        self.peers = {}
+        self.port = reactor.listenUNIX(worker_socket(self.dir, self.worker), \
+            MessageFactory(self))
+        self.control = self._connect(os.path.join(self.dir, CONTROL_SOCKET))
+        self._send(self.control, 'hello', self.worker)
+        dispatcher.connect(self.spider_opened, signal=signals.spider_opened)
+        dispatcher.connect(self.spider_idle, signal=signals.spider_idle)
+        dispatcher.connect(self.spider_closed, signal=signals.spider_closed)
+        dispatcher.connect(self.stats_spider_closed, \
+            signal=signals.stats_spider_closed)
+        dispatcher.connect(self.engine_stopped, signal=signals.engine_stopped)
+        if settings.getbool('MULTIPROCESS_FEED'):
+            dispatcher.connect(self.item_passed, signal=signals.item_passed)
+        reactor.addSystemEventTrigger('before', 'shutdown', self._wait_acks)
+
+    def enqueue_request(self, spider, request):
+        owner = worker_for(request, self.workers)
+        if owner == self.worker:
+            return
+        try:
+            data = request_to_string(request, spider)
+        except ValueError, e:
+            log.msg("Crawling request in worker %d (not the owner): %s" % \
+                (self.worker, e), level=log.WARNING, spider=spider)
+            return
+        self._send(self._peer(owner), 'request', spider.name, data)
+        self.sent[spider.name] += 1
+        return defer.succeed(None)
+
+    def spider_opened(self, spider):
+        self.spiders[spider.name] = spider
+        for data in self.pending.pop(spider.name, []):
+            self._crawl(spider, data)
+
+    def spider_idle(self, spider):
+        if not (self.finished_all or spider.name in self.finished):
+            raise DontCloseSpider
+
+    def spider_closed(self, spider):
+        self.spiders.pop(spider.name, None)
+
+    def item_passed(self, item, spider):
+        try:
+            data = pickle.dumps(item, protocol=2)
+        except Exception, e:
+            log.msg("Worker %d unable to send item to the parent process: %s" \
+                % (self.worker, e), level=log.ERROR, spider=spider)
+            return
+        self._send(self.control, 'item', spider.name, data)
+
+    def stats_spider_closed(self, spider, spider_stats):
+        self.acks.append(defer.Deferred())
+        self._send(self.control, 'stats', self.worker, spider.name, spider_stats)
+
+    def engine_stopped(self):
+        self.port.stopListening()
+
+    def _wait_acks(self):
+        """Wait (before the reactor shuts down) until the parent process has
+        received the stats of all spiders"""
+        dfds = [d for d in self.acks if not d.called]
+        if dfds:
+            call = reactor.callLater(self.stats_timeout, self._cancel_acks)
+            d = defer.DeferredList(dfds)
+            d.addBoth(lambda _: call.active() and call.cancel())
+            return d
+
+    def message_received(self, connection, message):
+        if message[0] == 'request':
+            name, data = message[1:]
+            self.received[name] += 1
+            spider = self.spiders.get(name)
+            if spider:
+                self._crawl(spider, data)
+            else:
+                self.pending[name].append(data)
+        elif message[0] == 'probe':
+            wave = message[1]
+            spiders = {}
+            for name, spider in self.spiders.items():
+                spiders[name] = (self.sent[name], self.received[name], \
+                    self._engine().spider_is_idle(spider))
+            connection.send('status', wave, self.worker, spiders)
+        elif message[0] == 'finish':
+            name = message[1]
+            if name is None:
+                self.finished_all = True
+            else:
+                self.finished.add(name)
+        elif message[0] == 'ack':
+            for d in self.acks:
+                if not d.called:
+                    d.callback(None)
+                    break
+
+    def _engine(self):
+        from scrapy.project import crawler
+        return crawler.engine
+
+    def _crawl(self, spider, data):
+        self._engine().crawl(request_from_string(data, spider), spider)
+
+    def _peer(self, worker):
+        if worker not in self.peers:
+            self.peers[worker] = self._connect(worker_socket(self.dir, worker))
+        return self.peers[worker]
+
+    def _connect(self, path):
+        def _failed(failure):
+            log.msg("Worker %d unable to connect to %s: %s" % (self.worker, \
+                path, failure.getErrorMessage()), level=log.ERROR)
+        return connect(path, self).addErrback(_failed)
+
+    def _send(self, connection, *message):
+        def _send(p):
+            if p is not None:
+                p.send(*message)
+            return p
+        connection.addCallback(_send)
+
+    def _cancel_acks(self):
+        log.msg("Worker %d timed out sending its stats to the parent process" \
+            % self.worker, level=log.WARNING)
+        for d in self.acks:
+            if not d.called:
+                d.callback(None)
+
+
+class WorkerProcessProtocol(protocol.ProcessProtocol):
+
+    def __init__(self, worker):
+        self.worker = worker
+        self.pid = None
+        self.deferred = defer.Deferred()
+
+    def connectionMade(self):
+        self.pid = self.transport.pid
+        log.msg("Worker %d started: pid=%r" % (self.worker, self.pid))
+
+    def processEnded(self, status):
+        if isinstance(status.value, error.ProcessDone):
+            log.msg("Worker %d finished: pid=%r" % (self.worker, self.pid))
+        else:
+            log.msg("Worker %d died: pid=%r exitstatus=%r" % (self.worker, \
+                self.pid, status.value.exitCode), level=log.ERROR)
+        self.deferred.callback(self)
+
+
+class MultiprocessCrawler(object):
+    """Run a crawl in several worker processes (running the crawl command with
+    the given arguments), and coordinate them: detect when all of them have
+    finished, export the feed of the items they scrape, aggregate their stats
+    and forward them the shutdown signals.
+
+    The workers send to each other the requests they don't own. To detect
+    when a spider has finished, this (parent) process probes all the workers
+    in waves, and each one replies with the number of requests it has sent
+    and received for each spider, and whether the spider is idle in it at
+    that moment. A spider is finished when two consecutive waves find it idle
+    in all workers, with the same counters, and the totals of requests sent
+    and received match (so no request was in flight, nor received by any
+    worker, between both waves).
+    """
+
+    check_interval = 1
+
+    def __init__(self, workers, args, settings=settings, spargs=None):
+        self.workers = workers
+        self.args = args
+        self.settings = settings
+        self.spargs = spargs or {}
+        self.processes = []
+        self.connections = {} # worker -> control connection
+        self.wave = 0
+        self.replies = None # worker -> spider name -> (sent, received, idle)
+        self.checked = {}
+        self.finished = set()
+        self.stats = defaultdict(list)
+        self.feeds = None
+        self.feedspiders = {} # spider name -> spider whose feed is exported
+        self.stored = {} # spider name -> deferred fired once its feed is stored
+        self.spiders = None
+        self.crawler = None # unconfigured, only used to bind the spiders
+        self.dir = None
+        if settings['FEED_URI']:
+            from scrapy.contrib.feedexport import FeedExporter
+            try:
+                self.feeds = FeedExporter()
+            except NotConfigured:
+                pass
+
+    def start(self):
+        if not log.started:
+            log.start()
+        self.dir = tempfile.mkdtemp(prefix='scrapy-')
+        self.port = reactor.listenUNIX(os.path.join(self.dir, CONTROL_SOCKET), \
+            MessageFactory(self))
+        dfds = [self._spawn(worker) for worker in range(self.workers)]
+        defer.DeferredList(dfds).addBoth(self._stop)
+        self.check = task.LoopingCall(self._probe)
+        self.check.start(self.check_interval, now=False)
+        install_shutdown_handlers(self._signal_shutdown)
+        reactor.run(installSignalHandlers=False) # blocking call
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+    def worker_settings(self, worker):
+        """Return the settings overrides to use for the given worker"""
+        overrides = dict(self.settings.overrides)
+        overrides['MULTIPROCESS_WORKERS'] = self.workers
+        overrides['MULTIPROCESS_WORKER'] = worker
+        overrides['MULTIPROCESS_DIR'] = self.dir
+        workerdir = 'worker-%d' % worker
+        if self.settings['JOBDIR']:
+            overrides['JOBDIR'] = os.path.join(self.settings['JOBDIR'], workerdir)
+        if self.feeds is not None:
+            overrides['FEED_URI'] = None
+            overrides['MULTIPROCESS_FEED'] = True
+        return overrides
+
+    def _spawn(self, worker):
+        env = os.environ.copy()
+        env['SCRAPY_PICKLED_SETTINGS_TO_OVERRIDE'] = \
+            pickle.dumps(self.worker_settings(worker))
+        args = [sys.executable, '-m', 'scrapy.cmdline', 'crawl'] + self.args
+        pp = WorkerProcessProtocol(worker)
+        pp.deferred.addCallback(self._worker_ended)
+        reactor.spawnProcess(pp, sys.executable, args=args, env=env, \
+            childFDs={0: 'w', 1: 1, 2: 2})
+        self.processes.append(pp)
+        return pp.deferred
+
+    def message_received(self, connection, message):
+        if message[0] == 'hello':
+            self.connections[message[1]] = connection
+        elif message[0] == 'status':
+            wave, worker, spiders = message[1:]
+            if wave == self.wave and self.replies is not None:
+                self.replies[worker] = spiders
+                if len(self.replies) == self.workers:
+                    self._check_finished(self.replies)
+                    self.replies = None
+        elif message[0] == 'item':
+            name, data = message[1:]
+            self.feeds.item_passed(pickle.loads(data), self._feed_spider(name))
+        elif message[0] == 'stats':
+            worker, name, spider_stats = message[1:]
+            self.stats[name].append(spider_stats)
+            connection.send('ack')
+            if self.feeds is not None and len(self.stats[name]) == self.workers:
+                self._close_feed(name)
+
+    def _probe(self):
+        """Start a new wave of the termination probe, once all workers are
+        connected and have replied to the previous one"""
+        if self.replies is not None or len(self.connections) < self.workers:
+            return
+        self.wave += 1
+        self.replies = {}
+        for connection in self.connections.values():
+            connection.send('probe', self.wave)
+
+    def _check_finished(self, replies):
+        names = set()
+        for spiders in replies.values():
+            names.update(spiders)
+        for name in names - self.finished:
+            status = tuple([replies[w].get(name) for w in range(self.workers)])
+            idle = None not in status and all([s[2] for s in status])
+            if idle and sum([s[0] for s in status]) == \
+                    sum([s[1] for s in status]) and \
+                    self.checked.get(name) == status:
+                self._finish(name)
+            self.checked[name] = status
+
+    def _finish(self, name):
+        log.msg("All workers finished spider %s, closing it" % name)
+        self.finished.add(name)
+        self.checked.pop(name, None)
+        self._broadcast('finish', name)
+
+    def _feed_spider(self, name):
+        if name not in self.feedspiders:
+            if self.spiders is None:
+                spman_cls = load_object(self.settings['SPIDER_MANAGER_CLASS'])
+                self.spiders = spman_cls.from_settings(self.settings)
+                self.crawler = Crawler(self.settings)
+            spider = self.spiders.create(name, **self.spargs)
+            spider.set_crawler(self.crawler)
+            stats.open_spider(spider)
+            self.feeds.open_spider(spider)
+            self.feedspiders[name] = spider
+        return self.feedspiders[name]
+
+    def _close_feed(self, name):
+        spider = self._feed_spider(name)
+        self.stored[name] = defer.maybeDeferred(self.feeds.close_spider, spider)
+
+    def _broadcast(self, *message):
+        for worker in range(self.workers):
+            d = connect(worker_socket(self.dir, worker), self, retries=0)
+            d.addCallback(self._send_and_close, message)
+            d.addErrback(lambda _: None) # the worker has already stopped
+
+    def _send_and_close(self, p, message):
+        p.send(*message)
+        p.transport.loseConnection()
+
+    def _worker_ended(self, pp):
+        # stop the rest of workers too, as the requests they would send to
+        # this worker would be lost
+        self._broadcast('finish', None)
+
+    def _stop(self, _):
+        if self.check.running:
+            self.check.stop()
+        self.port.stopListening()
+        # the feeds not closed yet (because some worker died) are stored with
+        # the items received
+        for name in self.feedspiders:
+            if name not in self.stored:
+                self._close_feed(name)
+        d = defer.DeferredList(self.stored.values())
+        d.addBoth(self._stop_reactor)
+
+    def _stop_reactor(self, _):
+        for name, statslist in self.stats.items():
+            if self.settings.getbool('STATS_DUMP'):
+                spider = self.feedspiders.get(name)
+                feedstats = spider and [stats.get_stats(spider)] or []
+                log.msg("Dumping stats of spider %s (aggregated from %d " \
+                    "workers):\n" % (name, len(statslist)) + \
+                    pprint.pformat(aggregate_stats(statslist + feedstats)))
+        try:
+            reactor.stop()
+        except RuntimeError: # raised if already stopped or in shutdown stage
+            pass
+
+    def _signal_shutdown(self, signum, _):
+        install_shutdown_handlers(self._signal_kill)
+        signame = signal_names[signum]
+        log.msg("Received %s, shutting down workers gracefully. Send again " \
+            "to force unclean shutdown" % signame, level=log.INFO)
+        reactor.callFromThread(self._signal_workers, signum)
+
+    def _signal_kill(self, signum, _):
+        install_shutdown_handlers(signal.SIG_IGN)
+        signame = signal_names[signum]
+        log.msg('Received %s twice, forcing unclean shutdown of workers' % \
+            signame, level=log.INFO)
+        reactor.callFromThread(self._signal_workers, signum)
+
+    def _signal_workers(self, signum):
+        # the terminal already sends SIGINT (Ctrl-C) to all the processes of
+        # the group, so only other signals are forwarded to the workers
+        if signum == signal.SIGINT:
+            return
+        for pp in self.processes:
+            if not pp.deferred.called:
+                try:
+                    pp.transport.signalProcess('TERM')
+                except error.ProcessExitedAlready:
+                    pass
@@ -14,15 +14,22 @@ import Image
 from cStringIO import StringIO
 from collections import defaultdict
 
-from twisted.internet import defer, threads
+from twisted.internet import defer, threads, reactor
+from twisted.python.threadpool import ThreadPool
 
 from scrapy.xlib.pydispatch import dispatcher
 from scrapy import log
 from scrapy.stats import stats
+from scrapy.conf import settings
 from scrapy.utils.misc import md5sum
 from scrapy.http import Request
 from scrapy import signals
 from scrapy.exceptions import DropItem, NotConfigured, IgnoreRequest
+from scrapy.utils.s3 import get_s3_connection, upload_file, \
+    defer_to_upload_thread
+from scrapy.utils.sqlite import SqliteDict, PickleSqliteDict
+from scrapy.utils.project import sqlite_db
+from scrapy.utils.job import job_path
 from scrapy.contrib.pipeline.media import MediaPipeline
 
 
@@ -49,16 +56,29 @@ class FSImagesStore(object):
     def persist_image(self, key, image, buf, info):
         absolute_path = self._get_filesystem_path(key)
         self._mkdir(os.path.dirname(absolute_path), info)
-        image.save(absolute_path)
+        # written in the reactor thread pool, not in the image processing
+        # pool, which is reserved for CPU bound work: the writes would take
+        # its queue slots from the conversions, and block the reactor when
+        # the pool is disabled (IMAGES_PROCESSING_THREADS = 0)
+        return threads.deferToThread(self._write_file, absolute_path, buf)
 
     def stat_image(self, key, info):
         absolute_path = self._get_filesystem_path(key)
+        return threads.deferToThread(self._stat_file, absolute_path)
+
+    def _write_file(self, path, buf):
+        # buf already holds the image encoded as JPEG, so there's no need to
+        # encode it again with image.save()
+        with open(path, 'wb') as f:
+            f.write(buf.getvalue())
+
+    def _stat_file(self, path):
         try:
-            last_modified = os.path.getmtime(absolute_path)
+            last_modified = os.path.getmtime(path)
         except: # FIXME: catching everything!
             return {}
 
-        with open(absolute_path, 'rb') as imagefile:
+        with open(path, 'rb') as imagefile:
             checksum = md5sum(imagefile)
 
         return {'last_modified': last_modified, 'checksum': checksum}
@@ -101,26 +121,62 @@ class S3ImagesStore(object):
         return self._get_boto_key(key).addCallback(_onsuccess)
 
     def _get_boto_bucket(self):
-        from boto.s3.connection import S3Connection
-        c = S3Connection(self.AWS_ACCESS_KEY_ID, self.AWS_SECRET_ACCESS_KEY)
+        # connections are reused by all the calls made from the same thread
+        c = get_s3_connection(self.AWS_ACCESS_KEY_ID, self.AWS_SECRET_ACCESS_KEY)
         return c.get_bucket(self.bucket, validate=False)
 
     def _get_boto_key(self, key):
-        b = self._get_boto_bucket()
         key_name = '%s%s' % (self.prefix, key)
-        return threads.deferToThread(b.get_key, key_name)
+        return threads.deferToThread(self._get_boto_key_in_thread, key_name)
+
+    def _get_boto_key_in_thread(self, key_name):
+        return self._get_boto_bucket().get_key(key_name)
 
     def persist_image(self, key, image, buf, info):
         """Upload image to S3 storage"""
         width, height = image.size
-        b = self._get_boto_bucket()
         key_name = '%s%s' % (self.prefix, key)
-        k = b.new_key(key_name)
-        k.set_metadata('width', str(width))
-        k.set_metadata('height', str(height))
+        metadata = {'width': str(width), 'height': str(height)}
         buf.seek(0)
-        return threads.deferToThread(k.set_contents_from_file, buf, \
-                headers=self.HEADERS, policy=self.POLICY)
+        return defer_to_upload_thread(self._persist_in_thread, key_name, buf, \
+            metadata)
+
+    def _persist_in_thread(self, key_name, buf, metadata):
+        upload_file(self._get_boto_bucket(), key_name, buf, \
+            headers=self.HEADERS, policy=self.POLICY, metadata=metadata)
+
+
+class SqliteImagesIndex(object):
+    """Persistent index of the stored images. It keeps the stat of each
+    image (its checksum, modification time, size and path) by key, so the
+    store doesn't need to be checked, and the key where the images with each
+    checksum were first stored, so identical images are stored only once.
+
+    It's kept in the same database as the media index (see MediaPipeline),
+    which the ImagesPipeline doesn't use, as the images are validated
+    against this one instead"""
+
+    def __init__(self, database=None):
+        self.stats = PickleSqliteDict(database, 'images_stats')
+        self.paths = SqliteDict(database, 'images_paths')
+
+    @classmethod
+    def from_settings(cls, settings):
+        database = job_path(settings, 'media.index') or \
+            sqlite_db(settings['SQLITE_DB'])
+        return cls(database)
+
+    def stat_image(self, key):
+        return self.stats.get(key)
+
+    def image_path(self, checksum):
+        return self.paths.get(checksum)
+
+    def image_stored(self, key, path, checksum, size):
+        self.stats[key] = {'checksum': checksum, 'last_modified': time.time(),
+            'width': size[0], 'height': size[1], 'path': path}
+        if checksum not in self.paths:
+            self.paths[checksum] = path
 
 
 class ImagesPipeline(MediaPipeline):
@@ -147,6 +203,9 @@ class ImagesPipeline(MediaPipeline):
     MIN_HEIGHT = 0
     EXPIRES = 90
     THUMBS = {}
+    PROCESSING_THREADS = 4
+    PROCESSING_QUEUE_SIZE = 100
+    INDEX_ENABLED = False
     STORE_SCHEMES = {
             '': FSImagesStore,
             'file': FSImagesStore,
@@ -155,6 +214,10 @@ class ImagesPipeline(MediaPipeline):
 
     def __init__(self, store_uri, download_func=None):
         self.store = self._get_store(store_uri)
+        self.index = SqliteImagesIndex.from_settings(settings) \
+            if self.INDEX_ENABLED else None
+        self.threadpool = None
+        self.processing = defer.DeferredSemaphore(self.PROCESSING_QUEUE_SIZE)
         super(ImagesPipeline, self).__init__(download_func=download_func)
 
     @classmethod
@@ -163,6 +226,10 @@ class ImagesPipeline(MediaPipeline):
         cls.MIN_HEIGHT = settings.getint('IMAGES_MIN_HEIGHT', 0)
         cls.EXPIRES = settings.getint('IMAGES_EXPIRES', 90)
         cls.THUMBS = settings.get('IMAGES_THUMBS', {})
+        cls.PROCESSING_THREADS = settings.getint('IMAGES_PROCESSING_THREADS', 4)
+        cls.PROCESSING_QUEUE_SIZE = settings.getint('CONCURRENT_ITEMS', 100)
+        cls.INDEX_ENABLED = settings.getbool('IMAGES_INDEX_ENABLED') or \
+            settings.getbool('MEDIA_INDEX_ENABLED')
         s3store = cls.STORE_SCHEMES['s3']
         s3store.AWS_ACCESS_KEY_ID = settings['AWS_ACCESS_KEY_ID']
         s3store.AWS_SECRET_ACCESS_KEY = settings['AWS_SECRET_ACCESS_KEY']
@@ -171,6 +238,40 @@ class ImagesPipeline(MediaPipeline):
             raise NotConfigured
         return cls(store_uri)
 
+    def open_spider(self, spider):
+        super(ImagesPipeline, self).open_spider(spider)
+        if self.threadpool is None and self.PROCESSING_THREADS:
+            self.threadpool = ThreadPool(1, self.PROCESSING_THREADS, \
+                self.__class__.__name__)
+            self.threadpool.start()
+            self._shutdown_trigger = reactor.addSystemEventTrigger('during', \
+                'shutdown', self._stop_threadpool)
+
+    def close_spider(self, spider):
+        super(ImagesPipeline, self).close_spider(spider)
+        if self.threadpool is not None and not self.spiderinfo:
+            reactor.removeSystemEventTrigger(self._shutdown_trigger)
+            self._stop_threadpool()
+
+    def _stop_threadpool(self):
+        if self.threadpool is not None:
+            self.threadpool.stop()
+            self.threadpool = None
+
+    def _open_index(self, spider):
+        # the images are indexed (and validated) by self.index
+        return
+
+    def _process(self, func, *args):
+        """Run the given (CPU bound) function in the image processing pool,
+        or in the reactor thread if the pool is disabled. At most
+        PROCESSING_QUEUE_SIZE images are queued or processed at the same
+        time, the rest wait for their turn (and so do their items)"""
+        if self.threadpool is None:
+            return defer.maybeDeferred(func, *args)
+        return self.processing.run(threads.deferToThreadPool, reactor, \
+            self.threadpool, func, *args)
+
     def _get_store(self, uri):
         if os.path.isabs(uri): # to support win32 paths like: C:\\some\dir
             scheme = 'file'
@@ -198,17 +299,24 @@ class ImagesPipeline(MediaPipeline):
         log.msg(msg, level=log.DEBUG, spider=info.spider)
         self.inc_stats(info.spider, status)
 
-        try:
-            key = self.image_key(request.url)
-            checksum = self.image_downloaded(response, request, info)
-        except ImageException, ex:
-            log.msg(str(ex), level=log.WARNING, spider=info.spider)
-            raise
-        except Exception:
-            log.err(spider=info.spider)
-            raise ImageException
+        key = self.image_key(request.url)
+        dfd = defer.maybeDeferred(self.image_downloaded, response, request, info)
+        dfd.addCallbacks(lambda checksum: {'url': request.url, \
+            'path': self._stored_path(key, checksum), 'checksum': checksum}, \
+            self._image_failed, errbackArgs=(info,))
+        return dfd
 
-        return {'url': request.url, 'path': key, 'checksum': checksum}
+    def _stored_path(self, key, checksum):
+        if self.index is not None:
+            return self.index.image_path(checksum) or key
+        return key
+
+    def _image_failed(self, failure, info):
+        if failure.check(ImageException):
+            log.msg(str(failure.value), level=log.WARNING, spider=info.spider)
+            return failure
+        log.err(failure, spider=info.spider)
+        raise ImageException
 
     def media_failed(self, failure, request, info):
         if not isinstance(failure.value, IgnoreRequest):
@@ -238,22 +346,70 @@ class ImagesPipeline(MediaPipeline):
             self.inc_stats(info.spider, 'uptodate')
 
             checksum = result.get('checksum', None)
-            return {'url': request.url, 'path': key, 'checksum': checksum}
+            path = result.get('path', key)
+            return {'url': request.url, 'path': path, 'checksum': checksum}
 
         key = self.image_key(request.url)
+        if self.index is not None:
+            result = self.index.stat_image(key)
+            if result:
+                return _onsuccess(result)
+        start = time.time()
         dfd = defer.maybeDeferred(self.store.stat_image, key, info)
+        dfd.addBoth(self._time_stage, 'stat', start, info)
         dfd.addCallbacks(_onsuccess, lambda _:None)
         dfd.addErrback(log.err, self.__class__.__name__ + '.store.stat_image')
         return dfd
 
     def image_downloaded(self, response, request, info):
-        first_buf = None
-        for key, image, buf in self.get_images(response, request, info):
-            self.store.persist_image(key, image, buf, info)
-            if first_buf is None:
-                first_buf = buf
-        first_buf.seek(0)
-        return md5sum(first_buf)
+        """Convert the image (and its thumbnails) and compute its checksum in
+        the processing pool, then persist them all in the store. Returns a
+        deferred which fires with the checksum of the image"""
+        dfd = self._process(self._process_image, response, request, info)
+        dfd.addCallback(self._persist_images, info)
+        return dfd
+
+    def _process_image(self, response, request, info):
+        # runs in the processing pool: it must not touch the stats or any
+        # other non thread-safe reactor state, so timings are returned
+        start = time.time()
+        images = list(self.get_images(response, request, info))
+        converted = time.time()
+        buf = images[0][2]
+        buf.seek(0)
+        checksum = md5sum(buf)
+        timings = {'convert': converted - start, \
+            'checksum': time.time() - converted}
+        return images, checksum, timings
+
+    def _persist_images(self, result, info):
+        images, checksum, timings = result
+        for stage, elapsed in timings.iteritems():
+            self.inc_time_stats(info.spider, stage, elapsed)
+        key, image = images[0][:2]
+        path = key
+        if self.index is not None:
+            path = self.index.image_path(checksum) or key
+            if path != key: # identical image already stored
+                # only its thumbnails are stored, as they're looked up by
+                # the url of the image (see thumb_key)
+                images = images[1:]
+                stats.inc_value('image_status_count/duplicate', \
+                    spider=info.spider)
+        start = time.time()
+        dlist = [defer.maybeDeferred(self.store.persist_image, k, im, buf, \
+            info) for k, im, buf in images]
+        dfd = defer.DeferredList(dlist, fireOnOneErrback=1, consumeErrors=1)
+        dfd.addErrback(lambda f: f.value.subFailure)
+        dfd.addBoth(self._time_stage, 'persist', start, info)
+        if self.index is not None:
+            dfd.addCallback(lambda _: self.index.image_stored(key, path, \
+                checksum, image.size))
+        return dfd.addCallback(lambda _: checksum)
+
+    def _time_stage(self, result, stage, start, info):
+        self.inc_time_stats(info.spider, stage, time.time() - start)
+        return result
 
     def get_images(self, response, request, info):
         key = self.image_key(request.url)
@@ -276,6 +432,9 @@ class ImagesPipeline(MediaPipeline):
         stats.inc_value('image_count', spider=spider)
         stats.inc_value('image_status_count/%s' % status, spider=spider)
 
+    def inc_time_stats(self, spider, stage, elapsed):
+        stats.inc_value('image_time/%s' % stage, elapsed, spider=spider)
+
     def convert_image(self, image, size=None):
         if image.format == 'PNG' and image.mode == 'RGBA':
             background = Image.new('RGBA', image.size, (255, 255, 255))
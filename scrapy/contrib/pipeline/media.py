@@ -1,10 +1,19 @@
+import time
+import cPickle
 from collections import defaultdict
 from twisted.internet.defer import Deferred, DeferredList
+from twisted.python.failure import Failure
 
 from scrapy.utils.defer import mustbe_deferred, defer_result
 from scrapy import log
+from scrapy.conf import settings
+from scrapy.http import Response
 from scrapy.utils.request import request_fingerprint
 from scrapy.utils.misc import arg_to_iter
+from scrapy.utils.datatypes import LRUCache
+from scrapy.utils.sqlite import PickleSqliteDict
+from scrapy.utils.project import sqlite_db
+from scrapy.utils.job import job_path
 
 
 class MediaPipeline(object):
@@ -12,11 +21,12 @@ class MediaPipeline(object):
     LOG_FAILED_RESULTS = True
 
     class SpiderInfo(object):
-        def __init__(self, spider):
+        def __init__(self, spider, cache_size=0, index=None):
             self.spider = spider
             self.downloading = set()
-            self.downloaded = {}
+            self.downloaded = LRUCache(cache_size) if cache_size else {}
             self.waiting = defaultdict(list)
+            self.index = index
 
     def __init__(self, download_func=None):
         self.spiderinfo = {}
@@ -33,10 +43,22 @@ class MediaPipeline(object):
         return crawler.engine.download
 
     def open_spider(self, spider):
-        self.spiderinfo[spider] = self.SpiderInfo(spider)
+        self.spiderinfo[spider] = self.SpiderInfo(spider, \
+            settings.getint('MEDIA_CACHE_SIZE'), self._open_index(spider))
 
     def close_spider(self, spider):
-        del self.spiderinfo[spider]
+        info = self.spiderinfo.pop(spider)
+        if info.index is not None:
+            info.index.conn.close()
+
+    def _open_index(self, spider):
+        if not settings.getbool('MEDIA_INDEX_ENABLED'):
+            return
+        self.index_expires = settings.getint('MEDIA_INDEX_EXPIRES')
+        database = job_path(settings, 'media.index') or \
+            sqlite_db(settings['SQLITE_DB'])
+        table = 'media_%s' % self.__class__.__name__.lower()
+        return PickleSqliteDict(database, table)
 
     def process_item(self, item, spider):
         info = self.spiderinfo[spider]
@@ -66,7 +88,7 @@ class MediaPipeline(object):
         info.downloading.add(fp)
         dfd = mustbe_deferred(self.media_to_download, request, info)
         dfd.addCallback(self._check_media_to_download, request, info)
-        dfd.addBoth(self._cache_result_and_execute_waiters, fp, info)
+        dfd.addBoth(self._cache_result_and_execute_waiters, fp, request, info)
         dfd.addErrback(log.err, spider=info.spider)
         return dfd.addBoth(lambda _: wad) # it must return wad at last
 
@@ -78,11 +100,27 @@ class MediaPipeline(object):
                 callback=self.media_downloaded, callbackArgs=(request, info),
                 errback=self.media_failed, errbackArgs=(request, info))
 
-    def _cache_result_and_execute_waiters(self, result, fp, info):
+    def _cache_result_and_execute_waiters(self, result, fp, request, info):
         info.downloading.remove(fp)
-        info.downloaded[fp] = result # cache result
         for wad in info.waiting.pop(fp):
             defer_result(result).chainDeferred(wad)
+        # cache only a summary of the result, as it's kept for much longer
+        summary = self.result_summary(result, request, info)
+        info.downloaded[fp] = summary
+        if info.index is not None and not isinstance(summary, Failure):
+            self._index_result(summary, fp, info)
+
+    def _index_result(self, summary, fp, info):
+        # results taken from the index are not indexed again, so they keep
+        # their indexing time and expire
+        if fp in info.index:
+            return
+        try:
+            info.index[fp] = (time.time(), summary)
+        except (cPickle.PicklingError, TypeError), e:
+            log.msg("%s cannot index result %r: %s" % \
+                (self.__class__.__name__, summary, e), level=log.DEBUG, \
+                spider=info.spider)
 
     ### Overradiable Interface
     def download(self, request, info):
@@ -90,8 +128,26 @@ class MediaPipeline(object):
         return self._download_func(request, info.spider)
 
     def media_to_download(self, request, info):
-        """Check request before starting download"""
-        pass
+        """Check request before starting download. By default, returns the
+        result indexed on a previous run (if any)"""
+        return self.indexed_result(request, info)
+
+    def indexed_result(self, request, info):
+        """Return the result of the given request kept in the index by a
+        previous run, or None if the index is disabled, the request wasn't
+        indexed or its result has expired (MEDIA_INDEX_EXPIRES)"""
+        if info.index is None:
+            return
+        fp = request_fingerprint(request)
+        try:
+            indexed, result = info.index[fp]
+        except KeyError:
+            return
+        if self.index_expires and \
+                time.time() - indexed > self.index_expires * 24 * 60 * 60:
+            del info.index[fp]
+            return
+        return result
 
     def get_media_requests(self, item, info):
         """Returns the media requests to download"""
@@ -105,6 +161,16 @@ class MediaPipeline(object):
         """Handler for failed downloads"""
         return failure
 
+    def result_summary(self, result, request, info):
+        """Returns the compact version of a media result which is kept in the
+        results cache (and index) and returned for the requests of the same
+        media that come later"""
+        if isinstance(result, Failure):
+            result.cleanFailure()
+        elif isinstance(result, Response):
+            result = result.replace(body='')
+        return result
+
     def item_completed(self, results, item, info):
         """Called per item when all media requests has been processed"""
         if self.LOG_FAILED_RESULTS:
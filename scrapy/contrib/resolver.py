@@ -1,46 +1,204 @@
-from collections import defaultdict
+import socket
+from collections import deque
 
-from twisted.internet import reactor, defer
+from twisted.internet import reactor, defer, threads, error
 from twisted.internet.base import ThreadedResolver
+from twisted.internet.abstract import isIPAddress
+from twisted.python.threadpool import ThreadPool
+from twisted.python.failure import Failure
 
 from scrapy.xlib.pydispatch import dispatcher
 from scrapy.utils.httpobj import urlparse_cached
+from scrapy.utils.datatypes import LRUCache
+from scrapy.conf import settings
 from scrapy import signals
 
 
+class DnsCache(LRUCache):
+    """LRU cache of hostname -> IP address whose entries expire ttl seconds
+    after being added (or never, if ttl is zero)"""
+
+    def __init__(self, limit, ttl, clock=reactor):
+        LRUCache.__init__(self, limit)
+        self.ttl = ttl
+        self.clock = clock
+        self._expires = {}
+
+    def __setitem__(self, key, value):
+        LRUCache.__setitem__(self, key, value)
+        if self.ttl:
+            self._expires[key] = self.clock.seconds() + self.ttl
+
+    def __delitem__(self, key):
+        LRUCache.__delitem__(self, key)
+        self._expires.pop(key, None)
+
+    def __getitem__(self, key):
+        if self._expired(key):
+            raise KeyError(key)
+        return LRUCache.__getitem__(self, key)
+
+    def get(self, key, default=None):
+        if self._expired(key):
+            return default
+        return LRUCache.get(self, key, default)
+
+    def __contains__(self, key):
+        return not self._expired(key) and LRUCache.__contains__(self, key)
+
+    def clear(self):
+        LRUCache.clear(self)
+        self._expires.clear()
+
+    def _expired(self, key):
+        expires = self._expires.get(key)
+        if expires is not None and expires <= self.clock.seconds():
+            del self[key]
+            return True
+        return False
+
+
+# hostname -> IP address of the hosts resolved by the CachingResolver
+dnscache = DnsCache(settings.getint('DNSCACHE_SIZE'), \
+    settings.getint('DNSCACHE_TTL'))
+
+
 class CachingResolver(object):
     """Scrapy extension to use a caching resolver, instead of default one"""
 
     def __init__(self):
-        self.spider_hostnames = defaultdict(set)
-        self.resolver = _CachingThreadedResolver(reactor)
+        dnscache.limit = settings.getint('DNSCACHE_SIZE')
+        dnscache.ttl = settings.getint('DNSCACHE_TTL')
+        self.resolver = _CachingThreadedResolver(reactor, \
+            settings.getint('DNS_THREADS'), \
+            settings.getint('DNSCACHE_NEGATIVE_TTL'))
         reactor.installResolver(self.resolver)
-        dispatcher.connect(self.request_received, signals.request_received)
-        dispatcher.connect(self.spider_closed, signal=signals.spider_closed)
+        if settings.getbool('DNS_PREFETCH'):
+            dispatcher.connect(self.request_received, signals.request_received)
 
     def request_received(self, request, spider):
-        url_hostname = urlparse_cached(request).hostname
-        self.spider_hostnames[spider].add(url_hostname)
+        # resolve the hostname while the request waits in the scheduler, so
+        # it's already cached when the request is downloaded
+        hostname = urlparse_cached(request).hostname
+        if hostname and not isIPAddress(hostname):
+            self.resolver.prefetch(hostname).addErrback(lambda _: None)
 
-    def spider_closed(self, spider):
-        for hostname in self.spider_hostnames[spider]:
-            self.resolver._cache.pop(hostname, None)
-        self.spider_hostnames.pop(spider, None)
+
+class DNSLookupTimeout(error.DNSLookupError):
+    """The DNS lookup didn't finish in time. Unlike the other lookup errors,
+    timeouts are not cached, as they're usually temporary"""
 
 
 class _CachingThreadedResolver(ThreadedResolver):
+    """Resolver which caches the lookups and runs them in its own pool of
+    threads. Lookups wait in a queue until there's a free thread (and their
+    timeout starts when they run), prefetches wait behind the lookups of the
+    requests being downloaded, and at most prefetch_queue_size of them can
+    be waiting."""
+
+    prefetch_queue_size = 1000
 
-    def __init__(self, *args, **kwargs):
-        ThreadedResolver.__init__(self, *args, **kwargs)
-        self._cache = {}
+    def __init__(self, reactor, threads=10, negative_ttl=60):
+        ThreadedResolver.__init__(self, reactor)
+        self._cache = dnscache
+        # hostname -> error of the failed lookups (not cached if negative_ttl
+        # is zero)
+        self._negative_ttl = negative_ttl
+        self._negative_cache = DnsCache(dnscache.limit, negative_ttl, reactor)
+        # hostname -> (timeout, deferreds waiting for its lookup)
+        self._waiting = {}
+        self._queue = deque()
+        self._prefetch_queue = deque()
+        self._running = 0 # threads busy resolving
+        self._threads = threads
+        self._threadpool = None
 
     def getHostByName(self, name, timeout = (1, 3, 11, 45)):
+        return self._resolve(name, timeout, False)
+
+    def prefetch(self, name):
+        """Resolve the given hostname (if it's not cached) when the resolver
+        is not busy with other lookups, to have it cached for later"""
+        return self._resolve(name, (1, 3, 11, 45), True)
+
+    def _resolve(self, name, timeout, prefetch):
         if name in self._cache:
             return defer.succeed(self._cache[name])
-        dfd = ThreadedResolver.getHostByName(self, name, timeout)
-        dfd.addCallback(self._cache_result, name)
+        if name in self._negative_cache:
+            return defer.fail(self._negative_cache[name])
+        dfd = defer.Deferred()
+        if name in self._waiting: # already being resolved (maybe prefetched)
+            self._waiting[name][1].append(dfd)
+            if not prefetch and name in self._prefetch_queue:
+                self._prefetch_queue.remove(name)
+                self._queue.append(name)
+                self._waiting[name] = (timeout, self._waiting[name][1])
+            return dfd
+        if prefetch:
+            if len(self._prefetch_queue) >= self.prefetch_queue_size:
+                return defer.succeed(None)
+            self._prefetch_queue.append(name)
+        else:
+            self._queue.append(name)
+        self._waiting[name] = (timeout, [dfd])
+        self._run_lookups()
         return dfd
 
+    def _run_lookups(self):
+        while self._running < self._threads and \
+                (self._queue or self._prefetch_queue):
+            queue = self._queue or self._prefetch_queue
+            name = queue.popleft()
+            self._running += 1
+            lookup = self._lookup(name, self._waiting[name][0])
+            lookup.addCallbacks(self._cache_result, self._cache_failure, \
+                callbackArgs=(name,), errbackArgs=(name,))
+            lookup.addBoth(self._fire_waiting, name)
+
+    def _lookup(self, name, timeout):
+        # same as ThreadedResolver.getHostByName, but using our own pool, and
+        # keeping the number of threads busy (including those which are
+        # still running a lookup that timed out)
+        timeoutDelay = sum(timeout) if timeout else 60
+        userDeferred = defer.Deferred()
+        lookupDeferred = threads.deferToThreadPool(self.reactor, \
+            self._get_threadpool(), socket.gethostbyname, name)
+        cancelCall = self.reactor.callLater(timeoutDelay, self._cleanup, \
+            name, lookupDeferred)
+        self._runningQueries[lookupDeferred] = (userDeferred, cancelCall)
+        lookupDeferred.addBoth(self._checkTimeout, name, lookupDeferred)
+        lookupDeferred.addBoth(self._lookup_finished)
+        return userDeferred
+
+    def _cleanup(self, name, lookupDeferred):
+        userDeferred, cancelCall = self._runningQueries.pop(lookupDeferred)
+        userDeferred.errback(DNSLookupTimeout("address %r not found: " \
+            "timeout error" % name))
+
+    def _lookup_finished(self, _):
+        self._running -= 1
+        self._run_lookups()
+
+    def _get_threadpool(self):
+        if self._threadpool is None:
+            self._threadpool = ThreadPool(1, self._threads, 'DNS resolver')
+            self._threadpool.start()
+            self.reactor.addSystemEventTrigger('during', 'shutdown', \
+                self._threadpool.stop)
+        return self._threadpool
+
     def _cache_result(self, result, name):
         self._cache[name] = result
         return result
+
+    def _cache_failure(self, failure, name):
+        if self._negative_ttl and not failure.check(DNSLookupTimeout):
+            self._negative_cache[name] = failure.value
+        return failure
+
+    def _fire_waiting(self, result, name):
+        for dfd in self._waiting.pop(name)[1]:
+            if isinstance(result, Failure):
+                dfd.errback(result)
+            else:
+                dfd.callback(result)
@@ -15,7 +15,11 @@ class DuplicatesFilterMiddleware(object):
         if not clspath:
             raise NotConfigured
 
-        self.dupefilter = load_object(clspath)()
+        dfcls = load_object(clspath)
+        if hasattr(dfcls, 'from_settings'):
+            self.dupefilter = dfcls.from_settings(settings)
+        else:
+            self.dupefilter = dfcls()
 
     def enqueue_request(self, spider, request):
         seen = self.dupefilter.request_seen(spider, request)
@@ -27,3 +31,7 @@ class DuplicatesFilterMiddleware(object):
 
     def close_spider(self, spider):
         self.dupefilter.close_spider(spider)
+
+    def checkpoint(self, spider):
+        if hasattr(self.dupefilter, 'flush'):
+            self.dupefilter.flush(spider)
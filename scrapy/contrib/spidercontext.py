@@ -5,6 +5,7 @@ from scrapy.exceptions import NotConfigured
 from scrapy.utils.misc import load_object
 from scrapy.utils.sqlite import JsonSqliteDict
 from scrapy.utils.project import sqlite_db
+from scrapy.utils.job import job_path
 from scrapy import signals
 
 class ISpiderContextStorage(Interface):
@@ -27,7 +28,9 @@ class SqliteSpiderContextStorage(object):
 
     @classmethod
     def from_settings(cls, settings):
-        return cls(sqlite_db(settings['SQLITE_DB']))
+        database = job_path(settings, 'spider.context') or \
+            sqlite_db(settings['SQLITE_DB'])
+        return cls(database)
 
     def get(self, spider):
         if spider.name in self.d:
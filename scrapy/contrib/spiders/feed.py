@@ -8,7 +8,7 @@ See documentation in docs/topics/spiders.rst
 from scrapy.contrib.spiders.init import InitSpider
 from scrapy.item import BaseItem
 from scrapy.http import Request
-from scrapy.utils.iterators import xmliter, csviter
+from scrapy.utils.iterators import xmliter, xmliter_lxml, csviter
 from scrapy.selector import XmlXPathSelector, HtmlXPathSelector
 from scrapy.exceptions import NotConfigured, NotSupported
 
@@ -17,9 +17,10 @@ class XMLFeedSpider(InitSpider):
     This class intends to be the base class for spiders that scrape
     from XML feeds.
 
-    You can choose whether to parse the file using the 'iternodes' iterator, an
-    'xml' selector, or an 'html' selector.  In most cases, it's convenient to
-    use iternodes, since it's a faster and cleaner.
+    You can choose whether to parse the file using the 'iternodes' iterator,
+    the 'iterparse' iterator, an 'xml' selector, or an 'html' selector.  In
+    most cases, it's convenient to use iternodes, since it's a faster and
+    cleaner. For big feeds, use iterparse, which parses them incrementally.
     """
 
     iterator = 'iternodes'
@@ -73,6 +74,8 @@ class XMLFeedSpider(InitSpider):
         response = self.adapt_response(response)
         if self.iterator == 'iternodes':
             nodes = xmliter(response, self.itertag)
+        elif self.iterator == 'iterparse':
+            nodes = xmliter_lxml(response, self.itertag, self.namespaces)
         elif self.iterator == 'xml':
             selector = XmlXPathSelector(response)
             self._register_namespaces(selector)
@@ -101,6 +104,7 @@ class CSVFeedSpider(InitSpider):
 
     delimiter = None # When this is None, python's csv module's default delimiter is used
     headers = None
+    batch_size = None # When set, rows are parsed in batches with parse_batch
 
     def process_results(self, response, results):
         """This method has the same purpose as the one in XMLFeedSpider"""
@@ -114,6 +118,22 @@ class CSVFeedSpider(InitSpider):
         """This method must be overriden with your custom spider functionality"""
         raise NotImplemented
 
+    def parse_batch(self, response, rows):
+        """Receives a response and a list of (up to batch_size) rows, when
+        batch_size is set. It calls parse_row for each row by default, and can
+        be overriden to process all the rows of the batch at once. It must
+        return the same as parse_row.
+        """
+        results = []
+        for row in rows:
+            ret = self.parse_row(response, row)
+            if isinstance(ret, (BaseItem, Request)):
+                ret = [ret]
+            if not isinstance(ret, (list, tuple)):
+                raise TypeError('You cannot return an "%s" object from a spider' % type(ret).__name__)
+            results.extend(ret)
+        return results
+
     def parse_rows(self, response):
         """Receives a response and a dict (representing each row) with a key for
         each provided (or detected) header of the CSV file.  This spider also
@@ -121,8 +141,15 @@ class CSVFeedSpider(InitSpider):
         process_results methods for pre and post-processing purposes.
         """
 
-        for row in csviter(response, self.delimiter, self.headers):
-            ret = self.parse_row(response, row)
+        if self.batch_size:
+            rows = csviter(response, self.delimiter, self.headers, \
+                batch_size=self.batch_size)
+            parse = self.parse_batch
+        else:
+            rows = csviter(response, self.delimiter, self.headers)
+            parse = self.parse_row
+        for row in rows:
+            ret = parse(response, row)
             if isinstance(ret, (BaseItem, Request)):
                 ret = [ret]
             if not isinstance(ret, (list, tuple)):
@@ -135,4 +162,3 @@ class CSVFeedSpider(InitSpider):
             raise NotConfigured('You must define parse_row method in order to scrape this CSV feed')
         response = self.adapt_response(response)
         return self.parse_rows(response)
-
@@ -0,0 +1,166 @@
+"""
+AutoThrottle is an extension that adjusts the download delay and concurrency
+of each download slot (domain or IP address) to the latency of the server,
+to crawl as fast as the server allows without overloading it.
+
+See documentation in docs/topics/extensions.rst
+"""
+
+from time import time
+
+from twisted.internet.error import TimeoutError as ServerTimeoutError
+from twisted.internet.defer import TimeoutError as UserTimeoutError
+from scrapy.xlib.pydispatch import dispatcher
+
+from scrapy import signals, log
+from scrapy.project import crawler
+from scrapy.exceptions import NotConfigured
+from scrapy.stats import stats
+from scrapy.conf import settings
+
+
+class SlotStats(object):
+    """Latency and throughput of a download slot, as seen by AutoThrottle"""
+
+    smoothing = 0.3 # weight of the last latency in the average
+
+    def __init__(self, slot):
+        self.slot = slot
+        self.firstseen = time()
+        self.responses = 0
+        self.latency = None
+
+    def add(self, latency):
+        self.responses += 1
+        if self.latency is None:
+            self.latency = latency
+        else:
+            self.latency += self.smoothing * (latency - self.latency)
+
+    def throughput(self):
+        """Return the responses per second received since the slot was first
+        seen"""
+        elapsed = time() - self.firstseen
+        return elapsed and self.responses / elapsed
+
+
+class AutoThrottle(object):
+
+    def __init__(self):
+        if not settings.getbool('AUTOTHROTTLE_ENABLED'):
+            raise NotConfigured
+
+        self.debug = settings.getbool('AUTOTHROTTLE_DEBUG')
+        self.target_concurrency = settings.getfloat('AUTOTHROTTLE_TARGET_CONCURRENCY')
+        self.start_delay = settings.getfloat('AUTOTHROTTLE_START_DELAY')
+        self.max_delay = settings.getfloat('AUTOTHROTTLE_MAX_DELAY')
+        self.max_concurrency = settings.getint('AUTOTHROTTLE_MAX_CONCURRENCY')
+        self.slotstats = {}
+        dispatcher.connect(self.spider_opened, signal=signals.spider_opened)
+        dispatcher.connect(self.spider_closed, signal=signals.spider_closed)
+        dispatcher.connect(self.response_downloaded, \
+            signal=signals.response_downloaded)
+        dispatcher.connect(self.download_failed, signal=signals.download_failed)
+        dispatcher.connect(self.download_slot_created, \
+            signal=signals.download_slot_created)
+
+    def spider_opened(self, spider):
+        self.slotstats[spider] = {}
+
+    def spider_closed(self, spider):
+        self.slotstats.pop(spider, None)
+
+    def download_slot_created(self, key, slot, spider):
+        self._slot_stats(spider, key, slot)
+
+    def response_downloaded(self, response, request, spider):
+        key, slot, site = self._get_slot(request, spider)
+        latency = request.meta.get('download_latency')
+        if slot is None or latency is None:
+            return
+        ss = self._slot_stats(spider, key, slot)
+        ss.add(latency)
+        if response.status == 503:
+            self._backoff(spider, key, slot, site)
+        else:
+            self._adjust(spider, key, slot, site, ss, latency, response)
+        self._update_stats(spider, key, slot, ss)
+
+    def download_failed(self, failure, request, spider):
+        if not failure.check(ServerTimeoutError, UserTimeoutError):
+            return
+        key, slot, site = self._get_slot(request, spider)
+        if slot is None:
+            return
+        ss = self._slot_stats(spider, key, slot)
+        self._backoff(spider, key, slot, site)
+        self._update_stats(spider, key, slot, ss)
+
+    def _get_slot(self, request, spider):
+        site = crawler.engine.downloader.sites.get(spider)
+        if site is None:
+            return None, None, None
+        key = site.slot_key(request)
+        return key, site.slots.get(key), site
+
+    def _slot_stats(self, spider, key, slot):
+        slotstats = self.slotstats.setdefault(spider, {})
+        ss = slotstats.get(key)
+        if ss is None:
+            # new slot, whose delay starts at the download delay
+            ss = slotstats[key] = SlotStats(slot)
+            slot.delay = max(slot.delay, self.start_delay)
+            slot.concurrency = self._start_concurrency()
+        elif ss.slot is not slot:
+            # the slot was released and created again by the downloader, so
+            # it keeps the delay and concurrency computed for the old one
+            slot.delay = ss.slot.delay
+            slot.concurrency = ss.slot.concurrency
+            ss.slot = slot
+        return ss
+
+    def _start_concurrency(self):
+        concurrency = int(round(self.target_concurrency)) or 1
+        return min(concurrency, self.max_concurrency) or 1
+
+    def _adjust(self, spider, key, slot, site, ss, latency, response):
+        mindelay = site.download_delay
+        # the delay which keeps (about) target_concurrency requests in
+        # progress with this latency
+        target_delay = ss.latency / self.target_concurrency
+        delay = (slot.delay + target_delay) / 2.0
+        delay = min(max(mindelay, delay), self.max_delay)
+        # don't speed up on error responses, as they're usually faster
+        if response.status != 200 and delay < slot.delay:
+            delay = slot.delay
+        concurrency = slot.concurrency
+        if delay <= mindelay and latency <= ss.latency:
+            # the delay can't go lower and the server keeps up: ramp up
+            concurrency = min(concurrency + 1, self.max_concurrency)
+        self._set(spider, key, slot, delay, concurrency, latency)
+
+    def _backoff(self, spider, key, slot, site):
+        delay = min(max(slot.delay * 2, self.start_delay, site.download_delay), \
+            self.max_delay)
+        self._set(spider, key, slot, delay, max(slot.concurrency // 2, 1))
+
+    def _set(self, spider, key, slot, delay, concurrency, latency=None):
+        if self.debug and (delay != slot.delay or concurrency != slot.concurrency):
+            msg = "AutoThrottle slot %s: delay %.2f -> %.2f, concurrency " \
+                "%d -> %d" % (key, slot.delay, delay, slot.concurrency, concurrency)
+            if latency is not None:
+                msg += " (latency %.2f)" % latency
+            else:
+                msg += " (backoff)"
+            log.msg(msg, level=log.INFO, spider=spider)
+        slot.delay = delay
+        slot.concurrency = concurrency
+
+    def _update_stats(self, spider, key, slot, ss):
+        prefix = 'autothrottle/%s/' % key
+        stats.set_value(prefix + 'responses', ss.responses, spider=spider)
+        if ss.latency is not None:
+            stats.set_value(prefix + 'latency', ss.latency, spider=spider)
+        stats.set_value(prefix + 'throughput', ss.throughput(), spider=spider)
+        stats.set_value(prefix + 'delay', slot.delay, spider=spider)
+        stats.set_value(prefix + 'concurrency', slot.concurrency, spider=spider)
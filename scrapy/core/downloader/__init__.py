@@ -4,14 +4,17 @@ Download web pages using asynchronous IO
 
 import random
 from time import time
+from collections import deque
 
 from twisted.internet import reactor, defer
+from twisted.internet.abstract import isIPAddress
 from twisted.python.failure import Failure
 
 from scrapy.exceptions import IgnoreRequest
 from scrapy.conf import settings
 from scrapy.utils.defer import mustbe_deferred
 from scrapy.utils.signal import send_catch_log
+from scrapy.utils.httpobj import urlparse_cached
 from scrapy.utils import deprecate
 from scrapy import signals
 from scrapy import log
@@ -19,60 +22,143 @@ from .middleware import DownloaderMiddlewareManager
 from .handlers import DownloadHandlers
 
 
+class Slot(object):
+    """Download slot: the queue and state of the requests to a single domain
+    (or IP address)"""
+
+    def __init__(self, concurrency, delay, randomize_delay):
+        self.concurrency = concurrency
+        self.delay = delay
+        self.randomize_delay = randomize_delay
+        self.queue = deque()
+        self.transferring = set()
+        self.lastseen = 0
+        self.waiting = False # waiting for free global/spider slots
+        self.next_request_calls = set()
+        self.hostnames = set() # hosts mapped to this slot by their IP address
+
+    def free_transfer_slots(self):
+        return self.concurrency - len(self.transferring)
+
+    def download_delay(self):
+        if self.randomize_delay:
+            # same policy as wget --random-wait
+            return random.uniform(0.5*self.delay, 1.5*self.delay)
+        return self.delay
+
+    def is_idle(self):
+        return not (self.queue or self.transferring or self.next_request_calls)
+
+    def cancel_request_calls(self):
+        for call in self.next_request_calls:
+            call.cancel()
+        self.next_request_calls.clear()
+
+
 class SpiderInfo(object):
     """Simple class to keep information and state for each open spider"""
 
-    def __init__(self, spider):
+    def __init__(self, spider, total_concurrency=0):
+        self.spider = spider
         if hasattr(spider, 'download_delay'):
             deprecate.attribute(spider, 'download_delay', 'DOWNLOAD_DELAY')
-            self._download_delay = spider.download_delay
+            self.download_delay = spider.download_delay
         else:
-            self._download_delay = spider.settings.getfloat('DOWNLOAD_DELAY')
-        if self._download_delay:
-            self.max_concurrent_requests = 1
+            self.download_delay = spider.settings.getfloat('DOWNLOAD_DELAY')
+        self.randomize_delay = spider.settings.getbool('RANDOMIZE_DOWNLOAD_DELAY')
+        if hasattr(spider, 'max_concurrent_requests'):
+            deprecate.attribute(spider, 'max_concurrent_requests', 'CONCURRENT_REQUESTS_PER_SPIDER')
+            self.max_concurrent_requests = spider.max_concurrent_requests
         else:
-            if hasattr(spider, 'max_concurrent_requests'):
-                deprecate.attribute(spider, 'max_concurrent_requests', 'CONCURRENT_REQUESTS_PER_SPIDER')
-                self.max_concurrent_requests = spider.max_concurrent_requests
-            else:
-                self.max_concurrent_requests = spider.settings.getint('CONCURRENT_REQUESTS_PER_SPIDER')
-        if self._download_delay and spider.settings.getbool('RANDOMIZE_DOWNLOAD_DELAY'):
-            # same policy as wget --random-wait
-            self.random_delay_interval = (0.5*self._download_delay, \
-                1.5*self._download_delay)
-        else:
-            self.random_delay_interval = None
+            self.max_concurrent_requests = spider.settings.getint('CONCURRENT_REQUESTS_PER_SPIDER')
+        self.ip_concurrency = spider.settings.getint('CONCURRENT_REQUESTS_PER_IP')
+        self.domain_concurrency = spider.settings.getint('CONCURRENT_REQUESTS_PER_DOMAIN')
+        self.backout_size = 2 * (self.max_concurrent_requests or \
+            total_concurrency or self.domain_concurrency)
 
         self.active = set()
-        self.queue = []
+        self.slots = {}
+        # hostname -> IP address (the slot key) of the hosts with a slot, if
+        # CONCURRENT_REQUESTS_PER_IP is set. Hosts keep their IP address while
+        # their slot exists, even if the DNS cache entry expires or changes
+        self.ipkeys = {}
         self.transferring = set()
         self.closing = False
         self.lastseen = 0
-        self.next_request_calls = set()
-
-    def free_transfer_slots(self):
-        return self.max_concurrent_requests - len(self.transferring)
 
     def needs_backout(self):
         # use self.active to include requests in the downloader middleware
-        return len(self.active) > 2 * self.max_concurrent_requests
-
-    def download_delay(self):
-        if self.random_delay_interval:
-            return random.uniform(*self.random_delay_interval)
-        else:
-            return self._download_delay
+        return len(self.active) > self.backout_size
+
+    def slot_key(self, request):
+        """Return the key of the download slot for the given request, which
+        is its domain (or IP address, if CONCURRENT_REQUESTS_PER_IP is set),
+        unless the request sets one in its ``download_slot`` meta key"""
+        key = request.meta.get('download_slot')
+        if key is None:
+            key = urlparse_cached(request).hostname or ''
+            if self.ip_concurrency:
+                key = self.ipkeys.get(key, key)
+        return key
+
+    def needs_ipkey(self, request):
+        """Return True if the IP address of the request host must be
+        resolved before choosing its download slot"""
+        hostname = urlparse_cached(request).hostname
+        return bool(self.ip_concurrency and hostname and \
+            hostname not in self.ipkeys and \
+            'download_slot' not in request.meta)
+
+    def get_slot(self, request):
+        """Return the key and download slot for the given request, creating
+        the slot if needed"""
+        key = self.slot_key(request)
+        slot = self.slots.get(key)
+        if slot is None:
+            if self.slots and not len(self.slots) % 100:
+                # release the slots left waiting for their download delay
+                for k in self.slots.keys():
+                    self.release_slot(k)
+            concurrency = self.ip_concurrency or self.domain_concurrency
+            if self.download_delay:
+                concurrency = 1
+            slot = Slot(concurrency, self.download_delay, self.randomize_delay)
+            self.slots[key] = slot
+            send_catch_log(signal=signals.download_slot_created, key=key, \
+                slot=slot, spider=self.spider)
+        hostname = urlparse_cached(request).hostname
+        if self.ip_concurrency and hostname in self.ipkeys and \
+                'download_slot' not in request.meta:
+            slot.hostnames.add(hostname)
+        return key, slot
+
+    def release_slot(self, key):
+        """Remove the given slot if it's idle, and no download delay has to be
+        enforced on it anymore"""
+        slot = self.slots.get(key)
+        if slot and slot.is_idle() and \
+                slot.lastseen + slot.delay * 1.5 <= time():
+            del self.slots[key]
+            for hostname in slot.hostnames:
+                if self.ipkeys.get(hostname) == key:
+                    del self.ipkeys[hostname]
 
     def cancel_request_calls(self):
-        for call in self.next_request_calls:
-            call.cancel()
-        self.next_request_calls.clear()
+        for slot in self.slots.values():
+            slot.cancel_request_calls()
 
 
 class Downloader(object):
     """Mantain many concurrent downloads and provide an HTTP abstraction.
-    It supports a limited number of connections per spider and many spiders in
-    parallel.
+
+    Requests are downloaded through slots (one per domain, or IP address),
+    each with its own queue, concurrency and download delay, so spiders
+    crawling many domains can download from all of them while staying polite
+    with each one. The total number of concurrent downloads is limited by the
+    CONCURRENT_REQUESTS setting and, for each spider, by the
+    CONCURRENT_REQUESTS_PER_SPIDER setting.
+
+    It supports many spiders in parallel.
     """
 
     def __init__(self):
@@ -80,6 +166,9 @@ class Downloader(object):
         self.handlers = DownloadHandlers()
         self.middleware = DownloaderMiddlewareManager.from_settings(settings)
         self.concurrent_spiders = settings.getint('CONCURRENT_SPIDERS')
+        self.total_concurrency = settings.getint('CONCURRENT_REQUESTS')
+        self.transferring = set()
+        self.waiting = deque() # slots waiting for free global/spider slots
 
     def fetch(self, request, spider):
         """Main method to use to request a download
@@ -109,46 +198,109 @@ class Downloader(object):
         if site.closing:
             raise IgnoreRequest
 
+        if site.needs_ipkey(request):
+            # resolve the host first, so all its requests go to the same slot
+            hostname = urlparse_cached(request).hostname
+            if isIPAddress(hostname):
+                dfd = defer.succeed(hostname)
+            else:
+                dfd = self._resolve(hostname)
+            dfd.addErrback(lambda _: hostname)
+            dfd.addCallback(lambda ip: site.ipkeys.setdefault(hostname, ip))
+            return dfd.addCallback(lambda _: self._enqueue(request, spider))
+        return self._enqueue(request, spider)
+
+    def _enqueue(self, request, spider):
+        site = self.sites.get(spider)
+        if not site or site.closing:
+            raise IgnoreRequest
+
         def _downloaded(response):
             send_catch_log(signal=signals.response_downloaded, \
                     response=response, request=request, spider=spider)
             return response
 
-        deferred = defer.Deferred().addCallback(_downloaded)
-        site.queue.append((request, deferred))
-        self._process_queue(spider)
+        def _failed(failure):
+            if not failure.check(IgnoreRequest):
+                send_catch_log(signal=signals.download_failed, \
+                    failure=failure, request=request, spider=spider)
+            return failure
+
+        key, slot = site.get_slot(request)
+        deferred = defer.Deferred().addCallbacks(_downloaded, _failed)
+        slot.queue.append((request, deferred))
+        self._process_queue(spider, key)
         return deferred
 
-    def _process_queue(self, spider):
-        """Effective download requests from site queue"""
+    def _resolve(self, hostname):
+        return reactor.resolve(hostname)
+
+    def _global_slots_full(self):
+        return self.total_concurrency and \
+            len(self.transferring) >= self.total_concurrency
+
+    def _spider_slots_full(self, site):
+        return site.max_concurrent_requests and \
+            len(site.transferring) >= site.max_concurrent_requests
+
+    def _process_queue(self, spider, key):
+        """Effective download requests from the given slot queue"""
         site = self.sites.get(spider)
         if not site:
             return
+        slot = site.slots.get(key)
+        if not slot:
+            return
+
+        if site.closing:
+            while slot.queue:
+                request, deferred = slot.queue.popleft()
+                deferred.errback(Failure(IgnoreRequest()))
+            site.release_slot(key)
+            self._close_if_idle(spider)
+            return
 
         # Delay queue processing if a download_delay is configured
-        now = time()
-        delay = site.download_delay()
-        if delay:
-            penalty = delay - now + site.lastseen
+        if slot.queue and slot.delay:
+            penalty = slot.download_delay() - time() + slot.lastseen
             if penalty > 0:
-                d = defer.Deferred()
-                d.addCallback(self._process_queue)
-                call = reactor.callLater(penalty, d.callback, spider)
-                site.next_request_calls.add(call)
-                d.addBoth(lambda x: site.next_request_calls.remove(call))
+                if not slot.next_request_calls:
+                    call = reactor.callLater(penalty, self._delayed_process_queue, \
+                        spider, key, slot)
+                    slot.next_request_calls.add(call)
                 return
-        site.lastseen = now
 
         # Process enqueued requests if there are free slots to transfer for this site
-        while site.queue and site.free_transfer_slots() > 0:
-            request, deferred = site.queue.pop(0)
-            if site.closing:
-                dfd = defer.fail(Failure(IgnoreRequest()))
-            else:
-                dfd = self._download(site, request, spider)
+        while slot.queue and slot.free_transfer_slots() > 0:
+            if self._global_slots_full() or self._spider_slots_full(site):
+                if not slot.waiting:
+                    slot.waiting = True
+                    self.waiting.append((spider, key))
+                break
+            request, deferred = slot.queue.popleft()
+            slot.lastseen = site.lastseen = time()
+            dfd = self._download(site, slot, key, request, spider)
             dfd.chainDeferred(deferred)
-
-        self._close_if_idle(spider)
+            if slot.delay:
+                break # only one request per delay interval
+
+        site.release_slot(key)
+
+    def _delayed_process_queue(self, spider, key, slot):
+        slot.next_request_calls.clear()
+        self._process_queue(spider, key)
+
+    def _process_waiting(self):
+        """Process the slots waiting for free global (or spider) slots"""
+        waiting, self.waiting = self.waiting, deque()
+        while waiting and not self._global_slots_full():
+            spider, key = waiting.popleft()
+            site = self.sites.get(spider)
+            slot = site and site.slots.get(key)
+            if slot:
+                slot.waiting = False
+                self._process_queue(spider, key)
+        self.waiting.extendleft(reversed(waiting))
 
     def _close_if_idle(self, spider):
         site = self.sites.get(spider)
@@ -156,20 +308,27 @@ class Downloader(object):
             del self.sites[spider]
             site.closing.callback(None)
 
-    def _download(self, site, request, spider):
+    def _download(self, site, slot, key, request, spider):
         # The order is very important for the following deferreds. Do not change!
 
         # 1. Create the download deferred
+        start = time()
         dfd = mustbe_deferred(self.handlers.download_request, request, spider)
 
         # 2. After response arrives,  remove the request from transferring
         # state to free up the transferring slot so it can be used by the
         # following requests (perhaps those which came from the downloader
         # middleware itself)
+        slot.transferring.add(request)
         site.transferring.add(request)
+        self.transferring.add(request)
         def finish_transferring(_):
+            request.meta['download_latency'] = time() - start
+            slot.transferring.remove(request)
             site.transferring.remove(request)
-            self._process_queue(spider)
+            self.transferring.remove(request)
+            self._process_queue(spider, key)
+            self._process_waiting()
             # avoid partially downloaded responses from propagating to the
             # downloader middleware, to speed-up the closing process
             if site.closing:
@@ -182,7 +341,7 @@ class Downloader(object):
     def open_spider(self, spider):
         """Allocate resources to begin processing a spider"""
         assert spider not in self.sites, "Spider already opened: %s" % spider
-        self.sites[spider] = SpiderInfo(spider)
+        self.sites[spider] = SpiderInfo(spider, self.total_concurrency)
 
     def close_spider(self, spider):
         """Free any resources associated with the given spider"""
@@ -190,9 +349,14 @@ class Downloader(object):
         site = self.sites.get(spider)
         site.closing = defer.Deferred()
         site.cancel_request_calls()
-        self._process_queue(spider)
+        for key in site.slots.keys():
+            self._process_queue(spider, key)
+        self._close_if_idle(spider)
         return site.closing
 
     def is_idle(self):
         return not self.sites
 
+    def close(self):
+        """Free the resources shared by all spiders"""
+        self.handlers.close()
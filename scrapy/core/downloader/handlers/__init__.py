@@ -10,6 +10,7 @@ class DownloadHandlers(object):
 
     def __init__(self):
         self._handlers = {}
+        self._closers = []
         self._notconfigured = {}
         handlers = settings.get('DOWNLOAD_HANDLERS_BASE')
         handlers.update(settings.get('DOWNLOAD_HANDLERS', {}))
@@ -21,6 +22,8 @@ class DownloadHandlers(object):
                 self._notconfigured[scheme] = str(ex)
             else:
                 self._handlers[scheme] = dh.download_request
+                if hasattr(dh, 'close'):
+                    self._closers.append(dh.close)
 
     def download_request(self, request, spider):
         scheme = urlparse_cached(request).scheme
@@ -31,3 +34,9 @@ class DownloadHandlers(object):
                     'no handler available for that scheme')
             raise NotSupported("Unsupported URL scheme '%s': %s" % (scheme, msg))
         return handler(request, spider)
+
+    def close(self):
+        """Release any resources (such as idle connections) kept by the
+        download handlers"""
+        for close in self._closers:
+            close()
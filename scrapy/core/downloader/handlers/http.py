@@ -5,6 +5,7 @@ from twisted.internet import reactor
 from scrapy.exceptions import NotSupported
 from scrapy.utils.misc import load_object
 from scrapy.conf import settings
+from scrapy.core.downloader.webclient import HTTPConnectionPool
 from scrapy import optional_features
 
 ssl_supported = 'ssl' in optional_features
@@ -16,15 +17,33 @@ HTTPClientFactory = load_object(settings['DOWNLOADER_HTTPCLIENTFACTORY'])
 
 class HttpDownloadHandler(object):
 
-    def __init__(self, httpclientfactory=HTTPClientFactory):
+    def __init__(self, httpclientfactory=HTTPClientFactory, pool=None):
         self.httpclientfactory = httpclientfactory
+        if pool is None and settings.getbool('DOWNLOADER_HTTPPOOL_ENABLED'):
+            pool = HTTPConnectionPool( \
+                maxperhost=settings.getint('DOWNLOADER_HTTPPOOL_MAXPERHOST'), \
+                maxsize=settings.getint('DOWNLOADER_HTTPPOOL_MAXSIZE'), \
+                timeout=settings.getfloat('DOWNLOADER_HTTPPOOL_TIMEOUT'))
+        self.pool = pool
+        self.maxsize = settings.getint('DOWNLOAD_MAXSIZE')
 
     def download_request(self, request, spider):
         """Return a deferred for the HTTP download"""
-        factory = self.httpclientfactory(request)
+        factory = self.httpclientfactory(request, maxsize=self.maxsize)
+        if self.pool is not None:
+            factory.pool = self.pool
+            protocol = self.pool.get(factory.poolkey)
+            if protocol is not None:
+                factory.reconnect = lambda: self._connect(factory)
+                protocol.reuse(factory)
+                return factory.deferred
         self._connect(factory)
         return factory.deferred
 
+    def close(self):
+        if self.pool is not None:
+            self.pool.close()
+
     def _connect(self, factory):
         host, port = factory.host, factory.port
         if factory.scheme == 'https':
@@ -22,7 +22,8 @@ class S3DownloadHandler(object):
             self.conn = connect_s3(aws_access_key_id, aws_secret_access_key)
         except Exception, ex:
             raise NotConfigured(str(ex))
-        self._download_http = httpdownloadhandler().download_request
+        self._httphandler = httpdownloadhandler()
+        self._download_http = self._httphandler.download_request
 
     def download_request(self, request, spider):
         p = urlparse_cached(request)
@@ -32,3 +33,7 @@ class S3DownloadHandler(object):
         self.conn.add_aws_auth_header(httpreq.headers, httpreq.method, \
                 '%s/%s' % (p.hostname, p.path))
         return self._download_http(httpreq, spider)
+
+    def close(self):
+        if hasattr(self._httphandler, 'close'):
+            self._httphandler.close()
@@ -2,14 +2,20 @@ from urlparse import urlparse, urlunparse, urldefrag
 
 from twisted.python import failure
 from twisted.web.client import PartialDownloadError, HTTPClientFactory
-from twisted.web.http import HTTPClient
-from twisted.internet import defer
+from twisted.web.http import HTTPClient, NO_BODY_CODES
+from twisted.internet import defer, reactor
+from twisted.internet.protocol import ClientFactory, Protocol
 
+from scrapy.exceptions import IgnoreRequest
 from scrapy.http import Headers
 from scrapy.utils.httpobj import urlparse_cached
 from scrapy.core.downloader.responsetypes import responsetypes
 
 
+# methods whose requests can be safely resent (RFC 2616, section 9.1.2)
+IDEMPOTENT_METHODS = ('GET', 'HEAD', 'PUT', 'DELETE', 'OPTIONS', 'TRACE')
+
+
 def _parsed_url_args(parsed):
     path = urlunparse(('', '', parsed.path or '/', parsed.params, parsed.query, ''))
     host = parsed.hostname
@@ -30,9 +36,14 @@ def _parse(url):
 class ScrapyHTTPPageGetter(HTTPClient):
 
     delimiter = '\n'
+    reused = False
 
     def connectionMade(self):
+        self.sendRequest()
+
+    def sendRequest(self):
         self.headers = Headers() # bucket for response headers
+        self.responding = False # any byte of the response received
 
         # Method command
         self.sendCommand(self.factory.method, self.factory.path)
@@ -40,13 +51,36 @@ class ScrapyHTTPPageGetter(HTTPClient):
         for key, values in self.factory.headers.items():
             for value in values:
                 self.sendHeader(key, value)
+        if self.factory.pool is not None and 'Connection' not in self.factory.headers:
+            self.sendHeader('Connection', 'keep-alive')
         self.endHeaders()
         # Body
         if self.factory.body is not None:
             self.transport.write(self.factory.body)
 
+    def reuse(self, factory):
+        """Send the request of the given factory using this (idle) connection,
+        which must have been previously released to a connection pool"""
+        self.firstLine = True
+        self.length = None
+        self._header = ''
+        self.reused = True
+        self.factory = factory
+        factory.startTimeout(self)
+        self.sendRequest()
+
+    def dataReceived(self, data):
+        self.responding = True
+        HTTPClient.dataReceived(self, data)
+
     def lineReceived(self, line):
-        return HTTPClient.lineReceived(self, line.rstrip())
+        HTTPClient.lineReceived(self, line.rstrip())
+        # responses without body (or with an empty one) are complete as soon
+        # as the headers end, there's no need to wait for the connection to
+        # be closed
+        if not line.rstrip() and self.length == 0:
+            self.handleResponseEnd()
+            self.setLineMode()
 
     def handleHeader(self, key, value):
         self.headers.appendlist(key, value)
@@ -56,20 +90,262 @@ class ScrapyHTTPPageGetter(HTTPClient):
 
     def handleEndHeaders(self):
         self.factory.gotHeaders(self.headers)
+        self.received = 0
+        if self.factory.method.upper() == 'HEAD' or \
+                int(self.factory.status) in NO_BODY_CODES:
+            self.length = 0
+
+    def handleResponsePart(self, data):
+        HTTPClient.handleResponsePart(self, data)
+        self.received += len(data)
+        if self.factory.maxsize and self.received > self.factory.maxsize:
+            self.transport.loseConnection()
+            self.factory.noPage(failure.Failure(_maxsize_exceeded(self.factory)))
 
     def connectionLost(self, reason):
         HTTPClient.connectionLost(self, reason)
+        if self.factory.pool is not None:
+            self.factory.pool.discard(self)
+        if self.reused and not self.responding and self.factory.retry():
+            return
         self.factory.noPage(reason)
 
     def handleResponse(self, response):
-        if self.factory.method.upper() == 'HEAD':
-            self.factory.page('')
+        factory = self.factory
+        # release the connection before firing the factory deferred, so it's
+        # available for the requests issued from its callbacks
+        if self.isPersistent():
+            factory.pool.put(factory.poolkey, self)
+        else:
+            self.transport.loseConnection()
+        if factory.method.upper() == 'HEAD':
+            factory.page('')
         elif self.length != None and self.length != 0:
-            self.factory.noPage(failure.Failure(
-                PartialDownloadError(self.factory.status, None, response)))
+            factory.noPage(failure.Failure(
+                PartialDownloadError(factory.status, None, response)))
         else:
-            self.factory.page(response)
+            factory.page(response)
+
+    def isPersistent(self):
+        """Return True if the connection can be reused for another request
+        once the current response has been received"""
+        if self.factory.pool is None or self.length != 0 or \
+                self.transport.disconnecting:
+            return False
+        tokens = [t.strip().lower() for t in self.factory.headers.get('Connection', '').split(',')]
+        if 'close' in tokens:
+            return False
+        connection = self.factory.response_headers.get('Connection', '').lower()
+        return 'keep-alive' in connection
+
+    def timeout(self):
         self.transport.loseConnection()
+        self.factory.noPage(\
+                defer.TimeoutError("Getting %s took longer than %s seconds." % \
+                (self.factory.url, self.factory.timeout)))
+
+
+class ScrapyHTTP11PageGetter(Protocol):
+    """HTTP/1.1 client protocol.
+
+    Unlike ScrapyHTTPPageGetter, the response body can be delimited by its
+    Content-Length, by chunked transfer-encoding (which is decoded as data
+    arrives) or by closing the connection, so connections can be kept alive
+    with any HTTP/1.1 server. The transfer is aborted as soon as the body
+    received exceeds the factory ``maxsize``.
+    """
+
+    MAX_LENGTH = 16384 # max length of status, header and chunk size lines
+
+    _STATUS, _HEADER, _BODY, _CHUNK_SIZE, _CHUNK_DATA, _CHUNK_END, \
+        _TRAILER, _DONE, _ABORTED = range(9)
+    _line_states = (_STATUS, _HEADER, _CHUNK_SIZE, _CHUNK_END, _TRAILER)
+
+    reused = False
+
+    def connectionMade(self):
+        self.sendRequest()
+
+    def sendRequest(self):
+        self.headers = Headers() # bucket for response headers
+        self.responding = False # any byte of the response received
+        self.version = None
+        self.length = None
+        self.chunked = False
+        self.received = 0
+        self._state = self._STATUS
+        self._line = ''
+        self._header = ''
+        self._body = []
+
+        factory = self.factory
+        data = ['%s %s HTTP/1.1\r\n' % (factory.method, factory.path)]
+        for key, values in factory.headers.items():
+            for value in values:
+                data.append('%s: %s\r\n' % (key, value))
+        if factory.pool is None and 'Connection' not in factory.headers:
+            data.append('Connection: close\r\n')
+        data.append('\r\n')
+        if factory.body is not None:
+            data.append(factory.body)
+        self.transport.write(''.join(data))
+
+    def reuse(self, factory):
+        """Send the request of the given factory using this (idle) connection,
+        which must have been previously released to a connection pool"""
+        self.reused = True
+        self.factory = factory
+        factory.startTimeout(self)
+        self.sendRequest()
+
+    def dataReceived(self, data):
+        self.responding = True
+        if self._state in (self._DONE, self._ABORTED):
+            # nothing was expected from the server, don't trust the connection
+            self.transport.loseConnection()
+            return
+        if self._line:
+            data, self._line = self._line + data, ''
+        pos, size = 0, len(data)
+        while pos < size and self._state not in (self._DONE, self._ABORTED):
+            if self._state in self._line_states:
+                eol = data.find('\n', pos)
+                if eol == -1:
+                    self._line = data[pos:]
+                    if len(self._line) > self.MAX_LENGTH:
+                        self._abort(ValueError("HTTP line too long"))
+                    return
+                line, pos = data[pos:eol].rstrip('\r'), eol + 1
+                self.lineReceived(line)
+            else:
+                pos = self.bodyDataReceived(data, pos)
+        if self._state == self._DONE:
+            self.handleResponse(extra=pos < size)
+
+    def lineReceived(self, line):
+        state = self._state
+        if state == self._STATUS:
+            if not line: # tolerate empty lines before the status line
+                return
+            parts = line.split(None, 2)
+            if len(parts) < 2 or not parts[1].isdigit():
+                return self._abort(ValueError("Invalid HTTP status line: %r" % line))
+            self.version = parts[0]
+            self.factory.gotStatus(parts[0], parts[1], \
+                parts[2] if len(parts) > 2 else '')
+            self._state = self._HEADER
+        elif state == self._HEADER:
+            if line and line[0] in ' \t':
+                # multiline header (RFC 2616, section 2.2)
+                self._header += line
+                return
+            if self._header:
+                self.handleHeader(self._header)
+            self._header = line
+            if not line:
+                self.handleEndHeaders()
+        elif state == self._CHUNK_SIZE:
+            try:
+                self.length = int(line.split(';', 1)[0].strip(), 16)
+            except ValueError:
+                return self._abort(ValueError("Invalid chunk size: %r" % line))
+            self._state = self._CHUNK_DATA if self.length else self._TRAILER
+        elif state == self._CHUNK_END:
+            self._state = self._CHUNK_SIZE
+        elif state == self._TRAILER:
+            if not line:
+                self._state = self._DONE
+
+    def handleHeader(self, header):
+        try:
+            key, value = header.split(':', 1)
+        except ValueError:
+            return
+        self.headers.appendlist(key.strip(), value.strip())
+
+    def handleEndHeaders(self):
+        status = int(self.factory.status)
+        if 100 <= status < 200:
+            # interim response, the final one comes next
+            self.headers = Headers()
+            self._state = self._STATUS
+            return
+        self.factory.gotHeaders(self.headers)
+        if self.factory.method.upper() == 'HEAD' or status in NO_BODY_CODES:
+            self._state = self._DONE
+        elif 'chunked' in self.headers.get('Transfer-Encoding', '').lower():
+            self.chunked = True
+            self._state = self._CHUNK_SIZE
+        else:
+            length = self.headers.get('Content-Length')
+            if length is not None:
+                try:
+                    self.length = int(length)
+                except ValueError:
+                    return self._abort(ValueError("Invalid Content-Length: %r" % length))
+                if self.factory.maxsize and self.length > self.factory.maxsize:
+                    return self._abort(_maxsize_exceeded(self.factory))
+            self._state = self._BODY if self.length != 0 else self._DONE
+
+    def bodyDataReceived(self, data, pos):
+        """Consume body data starting at ``pos`` and return the position of
+        the first byte not consumed"""
+        end = len(data) if self.length is None else min(len(data), pos + self.length)
+        # whole string slices are not copied
+        self._body.append(data[pos:end])
+        self.received += end - pos
+        if self.factory.maxsize and self.received > self.factory.maxsize:
+            self._abort(_maxsize_exceeded(self.factory))
+            return len(data)
+        if self.length is not None:
+            self.length -= end - pos
+            if not self.length:
+                if self._state == self._CHUNK_DATA:
+                    self._state = self._CHUNK_END
+                else:
+                    self._state = self._DONE
+        return end
+
+    def handleResponse(self, extra=False):
+        factory = self.factory
+        # release the connection before firing the factory deferred, so it's
+        # available for the requests issued from its callbacks
+        if not extra and self.isPersistent():
+            factory.pool.put(factory.poolkey, self)
+        else:
+            self.transport.loseConnection()
+        body, self._body = ''.join(self._body), []
+        factory.page('' if factory.method.upper() == 'HEAD' else body)
+
+    def isPersistent(self):
+        """Return True if the connection can be reused for another request
+        once the current response has been received"""
+        if self.factory.pool is None or self.transport.disconnecting:
+            return False
+        if 'close' in self.factory.headers.get('Connection', '').lower():
+            return False
+        connection = self.headers.get('Connection', '').lower()
+        if self.version == 'HTTP/1.1':
+            return 'close' not in connection
+        return 'keep-alive' in connection
+
+    def connectionLost(self, reason):
+        if self.factory.pool is not None:
+            self.factory.pool.discard(self)
+        if self.reused and not self.responding and self.factory.retry():
+            return
+        if self._state == self._BODY and self.length is None:
+            # body delimited by connection close
+            self._state = self._DONE
+            body, self._body = ''.join(self._body), []
+            self.factory.page(body)
+        elif self._state in (self._BODY, self._CHUNK_SIZE, self._CHUNK_DATA, \
+                self._CHUNK_END, self._TRAILER):
+            body, self._body = ''.join(self._body), []
+            self.factory.noPage(failure.Failure(
+                PartialDownloadError(self.factory.status, None, body)))
+        else:
+            self.factory.noPage(reason)
 
     def timeout(self):
         self.transport.loseConnection()
@@ -77,6 +353,98 @@ class ScrapyHTTPPageGetter(HTTPClient):
                 defer.TimeoutError("Getting %s took longer than %s seconds." % \
                 (self.factory.url, self.factory.timeout)))
 
+    def _abort(self, exc):
+        self._state = self._ABORTED
+        self._body = []
+        self.transport.loseConnection()
+        self.factory.noPage(failure.Failure(exc))
+
+
+def _maxsize_exceeded(factory):
+    return IgnoreRequest("Cancelling download of %s: response larger than " \
+        "download maxsize (%d bytes)" % (factory.url, factory.maxsize))
+
+
+class HTTPConnectionPool(object):
+    """Keep idle persistent connections around so that they can be reused by
+    the following requests to the same server.
+
+    Connections are keyed by ``(scheme, host, port)`` of the server actually
+    connected to, which is the proxy (not the target site) for proxied
+    requests. Only ``maxperhost`` idle connections are kept for each key and
+    ``maxsize`` in total, the least recently used ones are evicted when those
+    limits are exceeded. Idle connections are also closed (and evicted) after
+    ``timeout`` seconds.
+
+    The ``hits``, ``misses`` and ``evictions`` attributes count the requests
+    that reused a connection, the ones that had to open a new one and the
+    idle connections closed by the pool, respectively.
+    """
+
+    def __init__(self, maxperhost=8, maxsize=100, timeout=30, clock=reactor):
+        self.maxperhost = maxperhost
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._connections = {} # key -> idle connections, most recent last
+        self._idle = [] # all idle connections, most recent last
+        self._keys = {}
+        self._timeouts = {}
+
+    def get(self, key):
+        """Return an idle connection for the given key (removing it from the
+        pool) or None if there isn't any"""
+        for protocol in reversed(self._connections.get(key, [])):
+            self.discard(protocol)
+            if not protocol.transport.disconnecting:
+                self.hits += 1
+                return protocol
+        self.misses += 1
+
+    def put(self, key, protocol):
+        """Add an idle connection to the pool"""
+        self._connections.setdefault(key, []).append(protocol)
+        self._idle.append(protocol)
+        self._keys[protocol] = key
+        if self.timeout:
+            self._timeouts[protocol] = self.clock.callLater(self.timeout, \
+                self._evict, protocol)
+        if len(self._connections[key]) > self.maxperhost:
+            self._evict(self._connections[key][0])
+        if len(self._idle) > self.maxsize:
+            self._evict(self._idle[0])
+
+    def discard(self, protocol):
+        """Remove the given connection from the pool, if it's there"""
+        key = self._keys.pop(protocol, None)
+        if key is None:
+            return
+        self._idle.remove(protocol)
+        conns = self._connections[key]
+        conns.remove(protocol)
+        if not conns:
+            del self._connections[key]
+        call = self._timeouts.pop(protocol, None)
+        if call is not None and call.active():
+            call.cancel()
+
+    def close(self):
+        """Close all idle connections"""
+        for protocol in self._idle[:]:
+            self.discard(protocol)
+            protocol.transport.loseConnection()
+
+    def _evict(self, protocol):
+        self.evictions += 1
+        self.discard(protocol)
+        protocol.transport.loseConnection()
+
+    def __len__(self):
+        return len(self._idle)
+
 
 class ScrapyHTTPClientFactory(HTTPClientFactory):
     """Scrapy implementation of the HTTPClientFactory overwriting the
@@ -89,14 +457,19 @@ class ScrapyHTTPClientFactory(HTTPClientFactory):
     noisy = False
     followRedirect = False
     afterFoundGet = False
+    pool = None
+    # function to resend the request on a new connection, set by the download
+    # handler when the request is sent on a connection taken from the pool
+    reconnect = None
 
-    def __init__(self, request, timeout=180):
+    def __init__(self, request, timeout=180, maxsize=0):
         self.url = urldefrag(request.url)[0]
         self.method = request.method
         self.body = request.body or None
         self.headers = Headers(request.headers)
         self.response_headers = None
         self.timeout = request.meta.get('download_timeout') or timeout
+        self.maxsize = request.meta.get('download_maxsize', maxsize)
         self.deferred = defer.Deferred().addCallback(self._build_response)
 
         self._set_connection_attributes(request)
@@ -110,6 +483,33 @@ class ScrapyHTTPClientFactory(HTTPClientFactory):
             # just in case a broken http/1.1 decides to keep connection alive
             self.headers.setdefault("Connection", "close")
 
+    @property
+    def poolkey(self):
+        return (self.scheme, self.host, self.port)
+
+    def buildProtocol(self, addr):
+        p = ClientFactory.buildProtocol(self, addr)
+        self.startTimeout(p)
+        return p
+
+    def startTimeout(self, protocol):
+        if self.timeout:
+            timeoutCall = reactor.callLater(self.timeout, protocol.timeout)
+            self.deferred.addBoth(self._cancelTimeout, timeoutCall)
+
+    def retry(self):
+        """Called when a connection taken from the pool is closed before any
+        byte of the response is received, which happens when the server
+        closes an idle connection just as the request is sent. Resend the
+        request on a new connection, only once and only if its method is
+        idempotent, and return True if it was resent"""
+        if self.reconnect is None or not self.waiting or \
+                self.method.upper() not in IDEMPOTENT_METHODS:
+            return False
+        reconnect, self.reconnect = self.reconnect, None
+        reconnect()
+        return True
+
     def _build_response(self, body):
         status = int(self.status)
         headers = Headers(self.response_headers)
@@ -126,3 +526,16 @@ class ScrapyHTTPClientFactory(HTTPClientFactory):
 
     def gotHeaders(self, headers):
         self.response_headers = headers
+
+
+class ScrapyHTTP11ClientFactory(ScrapyHTTPClientFactory):
+    """Client factory which talks HTTP/1.1 (see ScrapyHTTP11PageGetter)"""
+
+    protocol = ScrapyHTTP11PageGetter
+
+    def __init__(self, request, timeout=180, maxsize=0):
+        ScrapyHTTPClientFactory.__init__(self, request, timeout, maxsize)
+        # bodies are always delimited in HTTP/1.1 so there's no need to close
+        # the connection after sending one
+        if 'Connection' not in request.headers:
+            self.headers.pop('Connection', None)
@@ -17,7 +17,7 @@ from scrapy.exceptions import IgnoreRequest, DontCloseSpider
 from scrapy.http import Response, Request
 from scrapy.utils.misc import load_object
 from scrapy.utils.signal import send_catch_log, send_catch_log_deferred
-from scrapy.utils.defer import mustbe_deferred
+from scrapy.utils.defer import mustbe_deferred, maybe_deferred
 
 class ExecutionEngine(object):
 
@@ -27,7 +27,9 @@ class ExecutionEngine(object):
         self.closing_dfds = {} # dict (spider -> deferred) of spiders being closed
         self.running = False
         self.paused = False
-        self._next_request_calls = {}
+        self.tick_requests = settings.getint('ENGINE_TICK_REQUESTS')
+        self._tick_spiders = set() # spiders waiting for the next engine tick
+        self._tick_call = None
         self.scheduler = load_object(settings['SCHEDULER'])()
         self.downloader = Downloader()
         self.scraper = Scraper(self, self.settings)
@@ -61,48 +63,70 @@ class ExecutionEngine(object):
             self.scraper.is_idle()
 
     def next_request(self, spider, now=False):
-        """Scrape the next request for the spider passed.
+        """Scrape the next requests for the spider passed.
 
-        The next request to be scraped is retrieved from the scheduler and
-        requested from the downloader.
+        The next requests to be scraped are retrieved from the scheduler and
+        requested from the downloader, in the next engine tick (unless
+        ``now`` is True). A single tick serves all the spiders which called
+        this method since the previous one, and it transfers up to
+        ENGINE_TICK_REQUESTS requests of each spider (leaving the rest for
+        the following tick).
 
         The spider is closed if there are no more pages to scrape.
         """
-        if now:
-            self._next_request_calls.pop(spider, None)
-        elif spider not in self._next_request_calls:
-            call = reactor.callLater(0, self.next_request, spider, now=True)
-            self._next_request_calls[spider] = call
-            return call
-        else:
+        if not now:
+            self._tick_spiders.add(spider)
+            if self._tick_call is None:
+                self._tick_call = reactor.callLater(0, self._tick)
             return
 
         if self.paused:
             return reactor.callLater(5, self.next_request, spider)
 
+        count = 0
         while not self._needs_backout(spider):
+            if self.tick_requests and count >= self.tick_requests:
+                self.next_request(spider)
+                return
             if not self._next_request(spider):
                 break
+            count += 1
 
         if self.spider_is_idle(spider):
             self._spider_idle(spider)
 
+    def _tick(self):
+        self._tick_call = None
+        spiders, self._tick_spiders = self._tick_spiders, set()
+        for spider in spiders:
+            self.next_request(spider, now=True)
+
     def _needs_backout(self, spider):
         return not self.running \
+            or spider in self.closing \
             or self.spider_is_closed(spider) \
             or self.downloader.sites[spider].needs_backout() \
             or self.scraper.sites[spider].needs_backout()
 
     def _next_request(self, spider):
         # Next pending request from scheduler
-        request, deferred = self.scheduler.next_request(spider)
+        request = self.scheduler.next_request(spider)
         if request:
-            dwld = mustbe_deferred(self.download, request, spider)
-            dwld.chainDeferred(deferred).addBoth(lambda _: deferred)
+            dwld = mustbe_deferred(self._download, request, spider)
+            dwld.addBoth(self._handle_downloader_output, request, spider)
             dwld.addErrback(log.err, "Unhandled error on engine._next_request()",
                 spider=spider)
+            dwld.addBoth(lambda _: self.next_request(spider))
             return dwld
 
+    def _handle_downloader_output(self, response, request, spider):
+        if isinstance(response, Request):
+            # a new request to crawl (ie. a redirect) returned by the
+            # downloader middleware
+            self.crawl(response, spider)
+            return
+        return self.scraper.enqueue_scrape(response, request, spider)
+
     def spider_is_idle(self, spider):
         scraper_idle = spider in self.scraper.sites \
             and self.scraper.sites[spider].is_idle()
@@ -130,26 +154,44 @@ class ExecutionEngine(object):
         return len(self.downloader.sites) < self.downloader.concurrent_spiders
 
     def crawl(self, request, spider):
+        if spider in self.closing:
+            # ignore requests for spiders being closed, unless they can be
+            # kept in the job directory for resuming the crawl later
+            if getattr(self.scheduler, 'jobdir', None) and \
+                    self.scheduler.spider_is_open(spider):
+                schd = self.scheduler.enqueue_request(spider, request)
+                schd.addErrback(lambda f: f.trap(IgnoreRequest))
+                schd.addErrback(log.err, "Unhandled error on engine.crawl()", \
+                    spider=spider)
+            return
         assert spider in self.open_spiders, \
             "Spider %r not opened when crawling: %s" % (spider.name, request)
-        if spider in self.closing: # ignore requests for spiders being closed
-            return
-        schd = mustbe_deferred(self.schedule, request, spider)
-        # FIXME: we can't log errors because we would be preventing them from
-        # propagating to the request errback. This should be fixed after the
-        # next core refactoring.
-        #schd.addErrback(log.err, "Error on engine.crawl()")
-        schd.addBoth(self.scraper.enqueue_scrape, request, spider)
+        schd = maybe_deferred(self.schedule, request, spider)
+        # requests rejected by the scheduler (ie. duplicates) are passed to
+        # the scraper, so they get to the request errback
+        schd.addErrback(self.scraper.enqueue_scrape, request, spider)
         schd.addErrback(log.err, "Unhandled error on engine.crawl()", spider=spider)
         schd.addBoth(lambda _: self.next_request(spider))
 
     def schedule(self, request, spider):
+        """Enqueue the request in the scheduler. Return a deferred fired once
+        the request has been enqueued (or rejected)"""
         if spider in self.closing:
             raise IgnoreRequest()
         self.next_request(spider)
         return self.scheduler.enqueue_request(spider, request)
 
     def download(self, request, spider):
+        """Download the given request (bypassing the scheduler) and return a
+        deferred fired with its response. Requests returned by the downloader
+        middleware (ie. redirects) are downloaded too."""
+        def _on_success(response):
+            if isinstance(response, Request):
+                return mustbe_deferred(self.download, response, spider)
+            return response
+        return self._download(request, spider).addCallback(_on_success)
+
+    def _download(self, request, spider):
         def _on_success(response):
             """handle the result of a page download"""
             assert isinstance(response, (Response, Request))
@@ -157,9 +199,7 @@ class ExecutionEngine(object):
                 response.request = request # tie request to response received
                 log.msg(log.formatter.crawled(request, response, spider), \
                     level=log.DEBUG, spider=spider)
-                return response
-            elif isinstance(response, Request):
-                return mustbe_deferred(self.schedule, response, spider)
+            return response
 
         def _on_error(_failure):
             """handle an error processing a page"""
@@ -223,15 +263,23 @@ class ExecutionEngine(object):
             return defer.succeed(None)
         log.msg("Closing spider (%s)" % reason, spider=spider)
         self.closing[spider] = reason
-        self.scheduler.clear_pending_requests(spider)
+        if getattr(self.scheduler, 'jobdir', None):
+            # keep pending requests, including those being downloaded, in
+            # the job directory
+            for request in self.downloader.sites[spider].active:
+                self.scheduler.requeue_request(spider, request)
+        else:
+            self.scheduler.clear_pending_requests(spider)
         dfd = self.downloader.close_spider(spider)
         self.closing_dfds[spider] = dfd
-        dfd.addBoth(lambda _: self.scheduler.close_spider(spider))
-        dfd.addErrback(log.err, "Unhandled error in scheduler.close_spider()", \
-            spider=spider)
+        # the scraper is closed before the scheduler, so that requests
+        # extracted while closing can still be kept in the job directory
         dfd.addBoth(lambda _: self.scraper.close_spider(spider))
         dfd.addErrback(log.err, "Unhandled error in scraper.close_spider()", \
             spider=spider)
+        dfd.addBoth(lambda _: self.scheduler.close_spider(spider))
+        dfd.addErrback(log.err, "Unhandled error in scheduler.close_spider()", \
+            spider=spider)
         dfd.addBoth(lambda _: self._finish_closing_spider(spider))
         return dfd
 
@@ -244,9 +292,10 @@ class ExecutionEngine(object):
     def _finish_closing_spider(self, spider):
         """This function is called after the spider has been closed"""
         reason = self.closing.pop(spider, 'finished')
-        call = self._next_request_calls.pop(spider, None)
-        if call and call.active():
-            call.cancel()
+        self._tick_spiders.discard(spider)
+        if not self._tick_spiders and self._tick_call is not None:
+            self._tick_call.cancel()
+            self._tick_call = None
         dfd = send_catch_log_deferred(signal=signals.spider_closed, \
             spider=spider, reason=reason)
         dfd.addBoth(lambda _: stats.close_spider(spider, reason=reason))
@@ -259,4 +308,5 @@ class ExecutionEngine(object):
 
     @defer.inlineCallbacks
     def _finish_stopping_engine(self):
+        self.downloader.close()
         yield send_catch_log_deferred(signal=signals.engine_stopped)
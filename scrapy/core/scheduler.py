@@ -2,13 +2,21 @@
 The Scrapy Scheduler
 """
 
-from twisted.internet import defer
-from twisted.python.failure import Failure
+import os
+import re
+import shutil
+import cPickle
+from collections import deque
+
+from twisted.internet import task
 
 from scrapy.utils.datatypes import PriorityQueue, PriorityStack
+from scrapy.utils.diskqueue import FifoDiskQueue, LifoDiskQueue
+from scrapy.utils.reqser import request_to_string, request_from_string
+from scrapy.utils.job import job_path, save_file
 from scrapy.core.schedulermw import SchedulerMiddlewareManager
-from scrapy.exceptions import IgnoreRequest
 from scrapy.conf import settings
+from scrapy import log
 
 class Scheduler(object):
     """The scheduler decides what to scrape next. In other words, it defines the
@@ -21,6 +29,11 @@ class Scheduler(object):
     def __init__(self):
         self.pending_requests = {}
         self.dfo = settings['SCHEDULER_ORDER'].upper() == 'DFO'
+        self.jobdir = job_path(settings, 'requests.queue')
+        self.diskdir = self.jobdir or settings['SCHEDULER_DISK_DIR']
+        self.diskwindow = settings.getint('SCHEDULER_DISK_WINDOW')
+        self.checkpoint_interval = settings.getfloat('JOBDIR_CHECKPOINT_INTERVAL')
+        self.checkpoints = {}
         self.middleware = SchedulerMiddlewareManager.from_settings(settings)
 
     def spider_is_open(self, spider):
@@ -37,8 +50,17 @@ class Scheduler(object):
         if spider in self.pending_requests:
             raise RuntimeError('Scheduler spider already opened: %s' % spider)
 
-        Priority = PriorityStack if self.dfo else PriorityQueue
-        self.pending_requests[spider] = Priority()
+        if self.diskdir:
+            path = os.path.join(self.diskdir, spider.name)
+            q = DiskPriorityQueue(path, spider, self.dfo, self.diskwindow, \
+                persist=bool(self.jobdir))
+        else:
+            q = PriorityStack() if self.dfo else PriorityQueue()
+        self.pending_requests[spider] = q
+        if self.jobdir and self.checkpoint_interval:
+            call = task.LoopingCall(self.checkpoint, spider)
+            call.start(self.checkpoint_interval, now=False)
+            self.checkpoints[spider] = call
         return self.middleware.open_spider(spider)
 
     def close_spider(self, spider):
@@ -47,39 +69,262 @@ class Scheduler(object):
         """
         if spider not in self.pending_requests:
             raise RuntimeError('Scheduler spider is not open: %s' % spider)
-        self.pending_requests.pop(spider, None)
+        call = self.checkpoints.pop(spider, None)
+        if call and call.running:
+            call.stop()
+        q = self.pending_requests.pop(spider, None)
+        if hasattr(q, 'close'):
+            q.close()
         return self.middleware.close_spider(spider)
 
+    def checkpoint(self, spider):
+        """Save the state of the given spider (its seen and pending requests)
+        to the job directory, so the job can be resumed from this point even
+        if the process dies before the spider is closed. The seen requests
+        are saved first, so none of the saved pending requests is missing
+        from them. Called every JOBDIR_CHECKPOINT_INTERVAL seconds"""
+        self.middleware.checkpoint(spider)
+        self.pending_requests[spider].flush()
+
     def enqueue_request(self, spider, request):
-        """Enqueue a request to be downloaded for a spider that is currently being scraped."""
+        """Enqueue a request to be downloaded for a spider that is currently
+        being scraped. Return a deferred which is fired once the request has
+        been enqueued, or errbacked if it was rejected (ie. a duplicate).
+        """
         return self.middleware.enqueue_request(self._enqueue_request, spider, request)
 
     def _enqueue_request(self, spider, request):
-        dfd = defer.Deferred()
-        self.pending_requests[spider].push((request, dfd), -request.priority)
-        return dfd
+        self.pending_requests[spider].push(request, -request.priority)
+
+    def requeue_request(self, spider, request):
+        """Put back a request which was already enqueued (and returned by
+        next_request) but couldn't be downloaded, bypassing the scheduler
+        middleware"""
+        self._enqueue_request(spider, request)
 
     def clear_pending_requests(self, spider):
         """Remove all pending requests for the given spider"""
-        q = self.pending_requests[spider]
-        while q:
-            _, dfd = q.pop()[0]
-            dfd.errback(Failure(IgnoreRequest()))
+        self.pending_requests[spider].clear()
 
     def next_request(self, spider):
-        """Return the next available request to be downloaded for a spider.
-
-        Returns a pair ``(request, deferred)`` where ``deferred`` is the
-        `Deferred` instance returned to the original requester.
-
-        ``(None, None)`` is returned if there aren't any request pending for
-        the given spider.
+        """Return the next available request to be downloaded for a spider, or
+        ``None`` if there aren't any request pending for the given spider.
         """
         try:
             return self.pending_requests[spider].pop()[0] # [1] is priority
         except (KeyError, IndexError):
-            return (None, None)
+            return None
 
     def is_idle(self):
         """Checks if the schedulers has any request pendings"""
         return not self.pending_requests
+
+
+class DiskPriorityQueue(object):
+    """A priority queue of requests which keeps only a window of (at most)
+    ``window`` requests per priority in memory, and stores the rest in disk
+    queues under the given ``path``. Its interface is the same as
+    PriorityQueue's.
+
+    Requests which can't be serialized (see scrapy.utils.reqser) are always
+    kept in memory, and they may be returned out of order.
+
+    If ``persist`` is True, the pending requests are kept in ``path`` when the
+    queue is closed (or flushed), and loaded back when it's opened again.
+    Otherwise, any previous content of ``path`` is discarded.
+    """
+
+    level_re = re.compile(r'^p(-?\d+)(\.window)?$')
+
+    def __init__(self, path, spider, dfo=True, window=1000, persist=False):
+        self.path = path
+        self.spider = spider
+        self.dfo = dfo
+        self.window = max(window, 1)
+        self.persist = persist
+        self.levels = {}
+        self.changed = set() # priorities changed since the last flush
+        self.size = 0
+        if os.path.exists(path) and not persist:
+            shutil.rmtree(path)
+        if not os.path.exists(path):
+            os.makedirs(path)
+        for name in os.listdir(path):
+            m = self.level_re.search(name)
+            priority = m and int(m.group(1))
+            if m and priority not in self.levels:
+                level = self._newlevel(priority)
+                self.levels[priority] = level
+                self.size += len(level)
+
+    def push(self, request, priority=0):
+        level = self.levels.get(priority)
+        if level is None:
+            level = self.levels[priority] = self._newlevel(priority)
+        level.push(request)
+        self.changed.add(priority)
+        self.size += 1
+
+    def pop(self):
+        if not self.size:
+            raise IndexError("pop from an empty queue")
+        priority = min(self.levels)
+        level = self.levels[priority]
+        request = level.pop()
+        if not level:
+            level.close()
+            del self.levels[priority]
+        else:
+            self.changed.add(priority)
+        self.size -= 1
+        return (request, priority)
+
+    def clear(self):
+        for level in self.levels.values():
+            level.close()
+        self.levels.clear()
+        self.changed.clear()
+        self.size = 0
+        shutil.rmtree(self.path)
+        os.makedirs(self.path)
+
+    def flush(self):
+        """Save the pending requests (only those of the priorities changed
+        since the last flush), if the queue is persistent"""
+        if self.persist:
+            for priority in self.changed:
+                level = self.levels.get(priority)
+                if level is not None:
+                    level.flush()
+        self.changed.clear()
+
+    def close(self):
+        if self.persist:
+            for level in self.levels.values():
+                level.close(persist=True)
+            self.levels.clear()
+        else:
+            self.clear()
+            shutil.rmtree(self.path)
+
+    def __len__(self):
+        return self.size
+
+    def __nonzero__(self):
+        return bool(self.size)
+
+    def _newlevel(self, priority):
+        path = os.path.join(self.path, 'p%d' % priority)
+        cls = _LifoLevel if self.dfo else _FifoLevel
+        return cls(path, self.spider, self.window)
+
+
+class _Level(object):
+    """The requests of a single priority: a window of requests kept in
+    memory plus a disk queue with the serialized rest. The window is saved
+    to its own file when the level is flushed or closed"""
+
+    def __init__(self, path, spider, window, disk):
+        self.path = path
+        self.spider = spider
+        self.window = window
+        self.memory = deque()
+        self.disk = disk
+        self.pinned = deque() # requests which can't be serialized
+        if os.path.exists(self._windowpath()):
+            f = open(self._windowpath(), 'rb')
+            try:
+                for string in cPickle.load(f):
+                    self.memory.append(request_from_string(string, spider))
+            finally:
+                f.close()
+
+    def pop(self):
+        if self.memory:
+            return self._popmemory()
+        if self.pinned:
+            return self._poppinned()
+        return request_from_string(self.disk.pop(), self.spider)
+
+    def flush(self):
+        self._savewindow()
+        self.disk.flush()
+
+    def close(self, persist=False):
+        if persist:
+            lost = self._savewindow()
+            if lost:
+                log.msg("Discarded %d pending requests which can't be " \
+                    "serialized" % lost, level=log.WARNING, spider=self.spider)
+        elif os.path.exists(self._windowpath()):
+            os.remove(self._windowpath())
+        self.disk.close()
+
+    def _savewindow(self):
+        # return the number of requests which couldn't be saved
+        strings, lost = [], len(self.pinned)
+        for request in self.memory:
+            try:
+                strings.append(request_to_string(request, self.spider))
+            except ValueError:
+                lost += 1
+        if strings:
+            save_file(self._windowpath(), cPickle.dumps(strings, protocol=2))
+        elif os.path.exists(self._windowpath()):
+            os.remove(self._windowpath())
+        return lost
+
+    def __len__(self):
+        return len(self.memory) + len(self.pinned) + len(self.disk)
+
+    def _windowpath(self):
+        return self.path + '.window'
+
+    def _spill(self, request):
+        try:
+            self.disk.push(request_to_string(request, self.spider))
+        except ValueError, e:
+            log.msg("Keeping request in memory: %s" % e, level=log.DEBUG, \
+                spider=self.spider)
+            self.pinned.append(request)
+
+
+class _FifoLevel(_Level):
+
+    def __init__(self, path, spider, window):
+        super(_FifoLevel, self).__init__(path, spider, window, \
+            FifoDiskQueue(path))
+
+    def push(self, request):
+        if not self.disk and len(self.memory) < self.window:
+            self.memory.append(request)
+        else:
+            self._spill(request)
+
+    def _popmemory(self):
+        # the window isn't refilled from disk once it runs out, as requests
+        # moved from disk to memory would be lost if the process died before
+        # saving the window
+        return self.memory.popleft()
+
+    def _poppinned(self):
+        return self.pinned.popleft()
+
+
+class _LifoLevel(_Level):
+
+    def __init__(self, path, spider, window):
+        super(_LifoLevel, self).__init__(path, spider, window, \
+            LifoDiskQueue(path))
+
+    def push(self, request):
+        self.memory.append(request)
+        if len(self.memory) > self.window:
+            # spill the oldest request, which is the last one to be popped
+            self._spill(self.memory.popleft())
+
+    def _popmemory(self):
+        return self.memory.pop()
+
+    def _poppinned(self):
+        return self.pinned.pop()
@@ -7,7 +7,7 @@ TODO: To be removed in Scrapy 0.11
 from twisted.internet.defer import Deferred
 
 from scrapy.middleware import MiddlewareManager
-from scrapy.utils.defer import mustbe_deferred
+from scrapy.utils.defer import maybe_deferred
 from scrapy.utils.conf import build_component_list
 
 class SchedulerMiddlewareManager(MiddlewareManager):
@@ -23,6 +23,8 @@ class SchedulerMiddlewareManager(MiddlewareManager):
         super(SchedulerMiddlewareManager, self)._add_middleware(mw)
         if hasattr(mw, 'enqueue_request'):
             self.methods['enqueue_request'].append(mw.enqueue_request)
+        if hasattr(mw, 'checkpoint'):
+            self.methods['checkpoint'].append(mw.checkpoint)
 
     def enqueue_request(self, wrappedfunc, spider, request):
         def _enqueue_request(request):
@@ -35,5 +37,10 @@ class SchedulerMiddlewareManager(MiddlewareManager):
                     return result
             return wrappedfunc(spider=spider, request=request)
 
-        deferred = mustbe_deferred(_enqueue_request, request)
-        return deferred
+        # the request is enqueued right away, as the engine only transfers
+        # requests to the downloader in its next tick
+        return maybe_deferred(_enqueue_request, request)
+
+    def checkpoint(self, spider):
+        for mwfunc in self.methods['checkpoint']:
+            mwfunc(spider=spider)
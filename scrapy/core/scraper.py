@@ -2,9 +2,9 @@
 extracts information from them"""
 
 from twisted.python.failure import Failure
-from twisted.internet import defer
+from twisted.internet import defer, threads
 
-from scrapy.utils.defer import defer_result, defer_succeed, parallel, iter_errback
+from scrapy.utils.defer import parallel, iter_errback
 from scrapy.utils.spider import iterate_spider_output
 from scrapy.utils.misc import load_object
 from scrapy.utils.signal import send_catch_log, send_catch_log_deferred
@@ -22,8 +22,9 @@ class SpiderInfo(object):
 
     MIN_RESPONSE_SIZE = 1024
 
-    def __init__(self, max_active_size=5000000):
+    def __init__(self, max_active_size=5000000, threaded_callbacks=False):
         self.max_active_size = max_active_size
+        self.threaded_callbacks = threaded_callbacks
         self.queue = []
         self.active = set()
         self.active_size = 0
@@ -65,13 +66,16 @@ class Scraper(object):
         itemproc_cls = load_object(settings['ITEM_PROCESSOR'])
         self.itemproc = itemproc_cls.from_settings(settings)
         self.concurrent_items = settings.getint('CONCURRENT_ITEMS')
+        self.callback_threads = defer.DeferredSemaphore( \
+            max(settings.getint('CALLBACK_THREADS'), 1))
         self.engine = engine
 
     @defer.inlineCallbacks
     def open_spider(self, spider):
         """Open the given spider for scraping and allocate resources for it"""
         assert spider not in self.sites, "Spider already opened: %s" % spider
-        self.sites[spider] = SpiderInfo()
+        self.sites[spider] = SpiderInfo(threaded_callbacks= \
+            spider.settings.getbool('THREADED_CALLBACKS'))
         yield self.itemproc.open_spider(spider)
 
     def close_spider(self, spider):
@@ -136,10 +140,47 @@ class Scraper(object):
                 request_result, request, spider)
 
     def call_spider(self, result, request, spider):
-        dfd = defer_result(result)
+        if not isinstance(result, Failure) and request.meta.get( \
+                'threaded_callback', self.sites[spider].threaded_callbacks):
+            return self.callback_threads.run(self._call_spider_in_thread, \
+                result, request, spider)
+        # responses always come from the downloader in a later reactor loop,
+        # so the spider callback can be called right away
+        if isinstance(result, Failure):
+            dfd = defer.fail(result)
+        else:
+            dfd = defer.succeed(result)
         dfd.addCallbacks(request.callback or spider.parse, request.errback)
         return dfd.addCallback(iterate_spider_output)
 
+    def _call_spider_in_thread(self, response, request, spider):
+        callback = request.callback or spider.parse
+        dfd = threads.deferToThread(self._drain_callback, callback, response)
+        return dfd.addCallback(self._drained_output)
+
+    def _drain_callback(self, callback, response):
+        """Call the given callback and consume its output. This runs in a
+        worker thread, so the (lazy) output iterable doesn't run callback code
+        in the reactor thread"""
+        output = []
+        try:
+            for x in iterate_spider_output(callback(response)):
+                output.append(x)
+        except:
+            return output, Failure()
+        return output, None
+
+    def _drained_output(self, result):
+        output, failure = result
+        if failure is not None and not output:
+            return failure
+        def _output():
+            for x in output:
+                yield x
+            if failure is not None:
+                failure.raiseException()
+        return _output()
+
     def handle_spider_error(self, _failure, request, spider, propagated_failure=None):
         referer = request.headers.get('Referer', None)
         msg = "Spider error processing <%s> (referer: <%s>)" % \
@@ -150,7 +191,7 @@ class Scraper(object):
 
     def handle_spider_output(self, result, request, response, spider):
         if not result:
-            return defer_succeed(None)
+            return defer.succeed(None)
         it = iter_errback(result, self.handle_spider_error, request, spider)
         dfd = parallel(it, self.concurrent_items,
             self._process_spidermw_output, request, response, spider)
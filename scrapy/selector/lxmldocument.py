@@ -0,0 +1,26 @@
+"""
+This module contains a simple class (LxmlDocument) which provides cache of the
+lxml documents (parsed trees) of responses, so that they're parsed only once.
+"""
+
+import weakref
+
+from lxml import etree
+
+from scrapy.utils.trackref import object_ref
+
+
+class LxmlDocument(object_ref):
+
+    cache = weakref.WeakKeyDictionary()
+    __slots__ = ['__weakref__']
+
+    def __new__(cls, response, parser=etree.HTMLParser):
+        """Return the root element of the document of the given response,
+        parsed with the given lxml parser class"""
+        cache = cls.cache.setdefault(response, {})
+        if parser not in cache:
+            lxml_parser = parser(encoding=response.encoding, recover=True)
+            cache[parser] = etree.fromstring(response.body, parser=lxml_parser, \
+                base_url=response.url)
+        return cache[parser]
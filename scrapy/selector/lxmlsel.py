@@ -2,22 +2,84 @@
 XPath selectors based on lxml
 """
 
+import threading
+
 from lxml import etree
 
+from scrapy.conf import settings
 from scrapy.utils.misc import extract_regex
+from scrapy.utils.datatypes import LRUCache
 from scrapy.utils.trackref import object_ref
 from scrapy.utils.python import unicode_to_str
 from scrapy.utils.decorator import deprecated
 from scrapy.http import TextResponse
+from .lxmldocument import LxmlDocument
 from .list import XPathSelectorList
 
 __all__ = ['HtmlXPathSelector', 'XmlXPathSelector', 'XPathSelector', \
     'XPathSelectorList']
 
+
+class XPathCache(object):
+    """Cache of compiled XPath expressions (lxml XPath objects) keyed by the
+    expression and the namespaces, which keeps the most recently used ones.
+    The number of hits and misses are kept in its ``hits`` and ``misses``
+    attributes.
+
+    It's safe to use from several threads (like the ones of the
+    THREADED_CALLBACKS setting), as the access to the cache is serialized."""
+
+    def __init__(self, limit):
+        self.cache = LRUCache(limit)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, xpath, namespaces=None):
+        """Return the compiled XPath object for the given expression and
+        namespaces. Raise ValueError if the expression is invalid."""
+        if namespaces:
+            key = (xpath, tuple(sorted(namespaces.items())))
+        else:
+            key = xpath
+        self._lock.acquire()
+        try:
+            compiled = self.cache.get(key)
+            if compiled is not None:
+                self.hits += 1
+                return compiled
+            self.misses += 1
+        finally:
+            self._lock.release()
+        # compiled outside the lock, so other threads don't wait for it
+        try:
+            compiled = etree.XPath(xpath, namespaces=namespaces)
+        except etree.XPathError:
+            raise ValueError("Invalid XPath: %s" % xpath)
+        self._lock.acquire()
+        try:
+            self.cache[key] = compiled
+        finally:
+            self._lock.release()
+        return compiled
+
+    def __len__(self):
+        return len(self.cache)
+
+    def clear(self):
+        self._lock.acquire()
+        try:
+            self.cache.clear()
+            self.hits = self.misses = 0
+        finally:
+            self._lock.release()
+
+xpath_cache = XPathCache(settings.getint('SELECTORS_XPATH_CACHE_SIZE'))
+
+
 class XPathSelector(object_ref):
 
-    __slots__ = ['response', 'text', 'expr', 'namespaces', '_root', '_xpathev', \
-        '__weakref__']
+    __slots__ = ['response', 'text', 'expr', 'namespaces', '_root', '__weakref__']
     _parser = etree.HTMLParser
     _tostring_method = 'html'
 
@@ -28,27 +90,19 @@ class XPathSelector(object_ref):
         else:
             self.response = response
         self._root = root
-        self._xpathev = None
         self.namespaces = namespaces
         self.expr = expr
 
     @property
     def root(self):
         if self._root is None:
-            parser = self._parser(encoding=self.response.encoding, recover=True)
-            self._root = etree.fromstring(self.response.body, parser=parser, \
-                base_url=self.response.url)
+            self._root = LxmlDocument(self.response, self._parser)
         return self._root
 
-    @property
-    def xpathev(self):
-        if self._xpathev is None:
-            self._xpathev = etree.XPathEvaluator(self.root, namespaces=self.namespaces)
-        return self._xpathev
-
     def select(self, xpath):
+        compiled = xpath_cache.get(xpath, self.namespaces)
         try:
-            result = self.xpathev(xpath)
+            result = compiled(self.root)
         except etree.XPathError:
             raise ValueError("Invalid XPath: %s" % xpath)
         if hasattr(result, '__iter__'):
@@ -15,9 +15,20 @@ Scrapy developers, if you add a setting here remember to:
 
 from os.path import join, abspath, dirname
 
+AUTOTHROTTLE_ENABLED = False
+AUTOTHROTTLE_DEBUG = False
+AUTOTHROTTLE_MAX_CONCURRENCY = 8
+AUTOTHROTTLE_MAX_DELAY = 60.0
+AUTOTHROTTLE_START_DELAY = 5.0
+AUTOTHROTTLE_TARGET_CONCURRENCY = 2.0
+
+AWS_S3_ENDPOINT = None
+
 BOT_NAME = 'scrapybot'
 BOT_VERSION = '1.0'
 
+CALLBACK_THREADS = 4
+
 CLOSESPIDER_TIMEOUT = 0
 CLOSESPIDER_PAGECOUNT = 0
 CLOSESPIDER_ITEMPASSED = 0
@@ -25,7 +36,10 @@ CLOSESPIDER_ITEMPASSED = 0
 COMMANDS_MODULE = ''
 
 CONCURRENT_ITEMS = 100
-CONCURRENT_REQUESTS_PER_SPIDER = 8
+CONCURRENT_REQUESTS = 16
+CONCURRENT_REQUESTS_PER_DOMAIN = 8
+CONCURRENT_REQUESTS_PER_IP = 0
+CONCURRENT_REQUESTS_PER_SPIDER = 0
 CONCURRENT_SPIDERS = 8
 
 COOKIES_DEBUG = False
@@ -42,6 +56,12 @@ DEFAULT_RESPONSE_ENCODING = 'ascii'
 DEPTH_LIMIT = 0
 DEPTH_STATS = True
 
+DNSCACHE_SIZE = 10000
+DNSCACHE_TTL = 300 # in seconds, 0 to never expire
+DNSCACHE_NEGATIVE_TTL = 60 # in seconds, 0 to disable negative caching
+DNS_PREFETCH = True
+DNS_THREADS = 10
+
 DOWNLOAD_DELAY = 0
 
 DOWNLOAD_HANDLERS = {}
@@ -52,11 +72,18 @@ DOWNLOAD_HANDLERS_BASE = {
     's3': 'scrapy.core.downloader.handlers.s3.S3DownloadHandler',
 }
 
+DOWNLOAD_MAXSIZE = 0
+
 DOWNLOAD_TIMEOUT = 180      # 3mins
 
 DOWNLOADER_DEBUG = False
 
-DOWNLOADER_HTTPCLIENTFACTORY = 'scrapy.core.downloader.webclient.ScrapyHTTPClientFactory'
+DOWNLOADER_HTTPCLIENTFACTORY = 'scrapy.core.downloader.webclient.ScrapyHTTP11ClientFactory'
+
+DOWNLOADER_HTTPPOOL_ENABLED = True
+DOWNLOADER_HTTPPOOL_MAXPERHOST = 8
+DOWNLOADER_HTTPPOOL_MAXSIZE = 100
+DOWNLOADER_HTTPPOOL_TIMEOUT = 30
 
 DOWNLOADER_MIDDLEWARES = {}
 
@@ -79,7 +106,9 @@ DOWNLOADER_MIDDLEWARES_BASE = {
 
 DOWNLOADER_STATS = True
 
+DUPEFILTER_BLOOM_ERROR_RATE = 0
 DUPEFILTER_CLASS = 'scrapy.contrib.dupefilter.RequestFingerprintDupeFilter'
+DUPEFILTER_FINGERPRINT_BITS = 64
 
 ENCODING_ALIASES = {}
 
@@ -115,6 +144,8 @@ ENCODING_ALIASES_BASE = {
     'x-sjis': 'shift_jis',
 }
 
+ENGINE_TICK_REQUESTS = 100
+
 EXTENSIONS = {}
 
 EXTENSIONS_BASE = {
@@ -126,12 +157,19 @@ EXTENSIONS_BASE = {
     'scrapy.contrib.closespider.CloseSpider': 0,
     'scrapy.contrib.feedexport.FeedExporter': 0,
     'scrapy.contrib.spidercontext.SpiderContext': 0,
+    'scrapy.contrib.throttle.AutoThrottle': 0,
 }
 
 FEED_URI = None
 FEED_URI_PARAMS = None # a function to extend uri arguments
 FEED_FORMAT = 'jsonlines'
 FEED_STORE_EMPTY = False
+FEED_BUFFER_SIZE = 65536 # in bytes
+FEED_COMPRESSION = None # 'gzip' or 'bz2'
+FEED_COMPRESSION_LEVEL = 6
+FEED_ROTATE_INTERVAL = 0 # in seconds
+FEED_ROTATE_SIZE = 0 # in bytes
+FEED_UPLOAD_PART_SIZE = 5242880 # 5 MB, the minimum part size of S3
 FEED_STORAGES = {}
 FEED_STORAGES_BASE = {
     '': 'scrapy.contrib.feedexport.FileFeedStorage',
@@ -149,8 +187,10 @@ FEED_EXPORTERS_BASE = {
 }
 
 HTTPCACHE_ENABLED = False
+HTTPCACHE_COMPRESS = False
 HTTPCACHE_DIR = 'httpcache'
 HTTPCACHE_IGNORE_MISSING = False
+HTTPCACHE_POLICY = 'scrapy.contrib.downloadermiddleware.httpcache.DummyPolicy'
 HTTPCACHE_STORAGE = 'scrapy.contrib.downloadermiddleware.httpcache.FilesystemCacheStorage'
 HTTPCACHE_EXPIRATION_SECS = 0
 HTTPCACHE_IGNORE_HTTP_CODES = []
@@ -161,6 +201,9 @@ ITEM_PROCESSOR = 'scrapy.contrib.pipeline.ItemPipelineManager'
 # Item pipelines are typically set in specific commands settings
 ITEM_PIPELINES = []
 
+JOBDIR = None
+JOBDIR_CHECKPOINT_INTERVAL = 10
+
 KEEP_ALIVE = False
 
 LOG_ENABLED = True
@@ -177,6 +220,10 @@ MAIL_FROM = 'scrapy@localhost'
 MAIL_PASS = None
 MAIL_USER = None
 
+MEDIA_CACHE_SIZE = 10000
+MEDIA_INDEX_ENABLED = False
+MEDIA_INDEX_EXPIRES = 90
+
 MEMDEBUG_ENABLED = False        # enable memory debugging
 MEMDEBUG_NOTIFY = []            # send memory debugging report by mail at engine shutdown
 
@@ -186,6 +233,11 @@ MEMUSAGE_NOTIFY_MAIL = []
 MEMUSAGE_REPORT = False
 MEMUSAGE_WARNING_MB = 0
 
+MULTIPROCESS_DIR = None
+MULTIPROCESS_FEED = False
+MULTIPROCESS_WORKER = None
+MULTIPROCESS_WORKERS = 1
+
 NEWSPIDER_MODULE = ''
 
 QUEUE_POLL_INTERVAL = 5
@@ -203,17 +255,25 @@ RETRY_PRIORITY_ADJUST = -1
 
 ROBOTSTXT_OBEY = False
 
+S3_UPLOAD_PART_SIZE = 5242880 # 5 MB, the minimum part size of S3
+S3_UPLOAD_THREADS = 8
+
 SCHEDULER = 'scrapy.core.scheduler.Scheduler'
 
+SCHEDULER_DISK_DIR = None
+SCHEDULER_DISK_WINDOW = 1000
+
 SCHEDULER_MIDDLEWARES = {}
 
 SCHEDULER_MIDDLEWARES_BASE = {
+    'scrapy.contrib.multiprocess.MultiprocessMiddleware': 100,
     'scrapy.contrib.schedulermiddleware.duplicatesfilter.DuplicatesFilterMiddleware': 500,
 }
 
 SCHEDULER_ORDER = 'DFO'
 
 SELECTORS_BACKEND = None # possible values: libxml2, lxml
+SELECTORS_XPATH_CACHE_SIZE = 256
 
 SPIDER_MANAGER_CLASS = 'scrapy.spidermanager.SpiderManager'
 
@@ -254,6 +314,8 @@ STATSMAILER_RCPTS = []
 
 TEMPLATES_DIR = abspath(join(dirname(__file__), '..', 'templates'))
 
+THREADED_CALLBACKS = False
+
 URLLENGTH_LIMIT = 2083
 
 USER_AGENT = '%s/%s' % (BOT_NAME, BOT_VERSION)
@@ -58,7 +58,7 @@ class Shell(object):
                 BaseSpider('default'), log_multiple=True)
         spider.set_crawler(self.crawler)
         self.crawler.engine.open_spider(spider)
-        d = self.crawler.engine.schedule(request, spider)
+        d = self.crawler.engine.download(request, spider)
         d.addCallback(lambda x: (x, spider))
         return d
 
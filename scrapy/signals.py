@@ -13,6 +13,8 @@ spider_closed = object()
 request_received = object()
 response_received = object()
 response_downloaded = object()
+download_failed = object()
+download_slot_created = object()
 item_scraped = object()
 item_passed = object()
 item_dropped = object()
@@ -70,6 +70,28 @@ class BaseItemExporterTest(unittest.TestCase):
         self.assertEqual(ie.serialize_field(i.fields['name'], 'name', i['name']), 'John\xc2\xa3')
         self.assertEqual(ie.serialize_field(i.fields['age'], 'age', i['age']), '24')
 
+    def test_buffer_size(self):
+        ie = self._get_exporter(buffer_size=100)
+        if ie.__class__ is BaseItemExporter:
+            return
+        ie.start_exporting()
+        ie.export_item(self.i)
+        self.assertEqual(self.output.getvalue(), '')
+        for _ in range(10):
+            ie.export_item(self.i)
+        # written once the buffer is full
+        self.failUnless(len(self.output.getvalue()) >= 100)
+        ie.finish_exporting()
+        output = self.output.getvalue()
+
+        self.output = StringIO()
+        ie = self._get_exporter(buffer_size=0)
+        ie.start_exporting()
+        for _ in range(11):
+            ie.export_item(self.i)
+        ie.finish_exporting()
+        self.assertEqual(self.output.getvalue(), output)
+
 
 class PprintItemExporterTest(BaseItemExporterTest):
 
@@ -191,6 +213,22 @@ class CustomItemExporterTest(unittest.TestCase):
             ie.serialize_field(i.fields['name'], 'name', i['name']), 'John')
         self.assertEqual(
             ie.serialize_field(i.fields['age'], 'age', i['age']), '23')
+        self.assertEqual(dict(ie._get_serialized_fields(i)),
+            {'name': 'John', 'age': '23'})
+
+    def test_serializers_per_item_class(self):
+        class OtherItem(Item):
+            name = Field(serializer=lambda x: x.upper())
+            age = Field()
+
+        ie = BaseItemExporter()
+        i1 = TestItem(name=u'John', age='22')
+        i2 = OtherItem(name=u'John', age='22')
+        for _ in range(2):
+            self.assertEqual(dict(ie._get_serialized_fields(i1)),
+                {'name': 'John', 'age': '22'})
+            self.assertEqual(dict(ie._get_serialized_fields(i2)),
+                {'name': u'JOHN', 'age': '22'})
 
 
 if __name__ == '__main__':
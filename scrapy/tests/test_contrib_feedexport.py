@@ -1,14 +1,22 @@
-import os, urlparse
+import os, urlparse, glob, gzip, bz2
 
 from zope.interface.verify import verifyObject
 from twisted.trial import unittest
 from twisted.internet import defer
 from cStringIO import StringIO
 
+from scrapy.conf import settings
+from scrapy.stats import stats
 from scrapy.spider import BaseSpider
-from scrapy.contrib.feedexport import IFeedStorage, FileFeedStorage, FTPFeedStorage, S3FeedStorage, StdoutFeedStorage
+from scrapy.item import Item, Field
+from scrapy.exceptions import NotConfigured
+from scrapy.contrib.exporter import JsonLinesItemExporter
+from scrapy.contrib.feedexport import IFeedStorage, FileFeedStorage, FTPFeedStorage, \
+    S3FeedStorage, StdoutFeedStorage, MultipartFeedStorage, FeedExporter, \
+    CompressedFeedFile
 from scrapy.utils.url import path_to_file_uri
-from scrapy.utils.test import assert_aws_environ
+from scrapy.utils.test import assert_aws_environ, get_crawler, FakeS3Server
+from scrapy import optional_features
 
 class FeedStorageTest(unittest.TestCase):
 
@@ -47,6 +55,90 @@ class FileFeedStorageTest(FeedStorageTest):
         st = FileFeedStorage(path)
         verifyObject(IFeedStorage, st)
 
+    @defer.inlineCallbacks
+    def test_open_store(self):
+        path = os.path.abspath(self.mktemp())
+        path = os.path.join(path, 'more', 'file.txt')
+        storage = FileFeedStorage(path)
+        file = storage.open(BaseSpider("default"))
+        file.write("content")
+        file.flush()
+        # written directly to the target file
+        self.failUnlessEqual(open(path).read(), "content")
+        yield storage.store(file, BaseSpider("default"))
+        self.failUnless(file.closed)
+
+
+class TestMultipartFeedStorage(MultipartFeedStorage):
+
+    def __init__(self, uri, fail_part=None):
+        self.parts = []
+        self.finished = self.aborted = False
+        self.fail_part = fail_part
+
+    def _store_part_in_thread(self, file, number, spider):
+        if number == self.fail_part:
+            raise IOError("part %d failed" % number)
+        self.parts.append((number, file.read()))
+
+    def _finish_in_thread(self, spider):
+        self.finished = True
+
+    def _abort_in_thread(self, spider):
+        self.aborted = True
+
+
+class MultipartFeedStorageTest(unittest.TestCase):
+
+    def setUp(self):
+        self.old_overrides = settings.overrides.copy()
+        settings.overrides['FEED_UPLOAD_PART_SIZE'] = 10
+
+    def tearDown(self):
+        settings.overrides.clear()
+        settings.overrides.update(self.old_overrides)
+
+    def _write(self, storage, chunks):
+        file = storage.open(BaseSpider("default"))
+        for chunk in chunks:
+            file.write(chunk)
+        return file
+
+    @defer.inlineCallbacks
+    def test_parts(self):
+        storage = TestMultipartFeedStorage('test:')
+        verifyObject(IFeedStorage, storage)
+        file = self._write(storage, ['12345', '678901', '234', '5678901', 'a'])
+        self.assertEqual(file.tell(), 22)
+        yield storage.store(file, BaseSpider("default"))
+        self.assertEqual(storage.parts, [(1, '12345678901'), (2, '2345678901'), (3, 'a')])
+        self.failUnless(storage.finished)
+        self.failIf(storage.aborted)
+
+    @defer.inlineCallbacks
+    def test_empty(self):
+        storage = TestMultipartFeedStorage('test:')
+        yield storage.store(self._write(storage, []), BaseSpider("default"))
+        self.assertEqual(storage.parts, [(1, '')])
+        self.failUnless(storage.finished)
+
+    @defer.inlineCallbacks
+    def test_abort(self):
+        storage = TestMultipartFeedStorage('test:', fail_part=2)
+        file = self._write(storage, ['1' * 10, '2' * 10, '3' * 10, '4'])
+        yield self.assertFailure(storage.store(file, BaseSpider("default")), IOError)
+        self.assertEqual(storage.parts, [(1, '1' * 10)])
+        self.failIf(storage.finished)
+        self.failUnless(storage.aborted)
+
+    @defer.inlineCallbacks
+    def test_store_file(self):
+        storage = TestMultipartFeedStorage('test:')
+        storage._store_in_thread = lambda file, spider: \
+            storage.parts.append((0, file.read()))
+        yield storage.store(StringIO("content"), BaseSpider("default"))
+        self.assertEqual(storage.parts, [(0, 'content')])
+
 
 class FTPFeedStorageTest(FeedStorageTest):
 
@@ -76,6 +168,40 @@ class S3FeedStorageTest(unittest.TestCase):
         key = connect_s3().get_bucket(u.hostname, validate=False).get_key(u.path)
         self.failUnlessEqual(key.get_contents_as_string(), "content")
 
+
+class FakeS3FeedStorageTest(unittest.TestCase):
+
+    skip = 'boto' not in optional_features and 'missing boto library'
+
+    def setUp(self):
+        self.server = FakeS3Server()
+        self.server.start()
+        self.old_overrides = settings.overrides.copy()
+        settings.overrides['AWS_S3_ENDPOINT'] = self.server.url
+        settings.overrides['FEED_UPLOAD_PART_SIZE'] = 10
+
+    def tearDown(self):
+        self.server.stop()
+        settings.overrides.clear()
+        settings.overrides.update(self.old_overrides)
+
+    @defer.inlineCallbacks
+    def test_store(self):
+        storage = S3FeedStorage('s3://key:secret@bucket/export.csv')
+        yield storage.store(StringIO("content"), BaseSpider("default"))
+        self.assertEqual(self.server.objects['/bucket/export.csv'][0], "content")
+
+    @defer.inlineCallbacks
+    def test_store_parts(self):
+        storage = S3FeedStorage('s3://key:secret@bucket/export.csv')
+        file = storage.open(BaseSpider("default"))
+        for chunk in ['12345', '678901', '234', '5678901', 'a']:
+            file.write(chunk)
+        yield storage.store(file, BaseSpider("default"))
+        self.assertEqual(self.server.objects['/bucket/export.csv'][0], \
+            '12345678901234567890' '1a')
+        self.assertEqual(self.server.uploads, {})
+
 class StdoutFeedStorageTest(FeedStorageTest):
 
     @defer.inlineCallbacks
@@ -84,3 +210,113 @@ class StdoutFeedStorageTest(FeedStorageTest):
         storage = StdoutFeedStorage('stdout:', _stdout=out)
         yield storage.store(StringIO("content"), BaseSpider("default"))
         self.assertEqual(out.getvalue(), "content")
+
+
+class TestItem(Item):
+    name = Field()
+
+
+class NotFinishingExporter(JsonLinesItemExporter):
+
+    def finish_exporting(self):
+        pass
+
+
+class FeedExporterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.old_overrides = settings.overrides.copy()
+        self.dir = os.path.abspath(self.mktemp())
+        settings.overrides['FEED_URI'] = os.path.join(self.dir, '%(name)s-%(part)s.jl')
+        self.spider = BaseSpider('default')
+        self.spider.set_crawler(get_crawler())
+        stats.open_spider(self.spider)
+
+    def tearDown(self):
+        stats.close_spider(self.spider, 'finished')
+        settings.overrides.clear()
+        settings.overrides.update(self.old_overrides)
+
+    def _feeds(self, pattern='*.jl', open=open):
+        return [open(x).read().splitlines() for x in \
+            sorted(glob.glob(os.path.join(self.dir, pattern)))]
+
+    @defer.inlineCallbacks
+    def _export(self, items):
+        exporter = FeedExporter()
+        exporter.open_spider(self.spider)
+        for name in items:
+            exporter.item_passed(TestItem(name=name), self.spider)
+        yield exporter.close_spider(self.spider)
+
+    @defer.inlineCallbacks
+    def test_export(self):
+        yield self._export(['a', 'b', 'c'])
+        self.assertEqual(self._feeds(), [['{"name": "a"}', '{"name": "b"}', '{"name": "c"}']])
+        self.assertEqual(stats.get_value('feedexport/bytes', spider=self.spider), 42)
+        self.assertEqual(stats.get_value('feedexport/compressed_bytes', spider=self.spider), None)
+
+    @defer.inlineCallbacks
+    def test_empty(self):
+        yield self._export([])
+        self.assertEqual(self._feeds(), [])
+        settings.overrides['FEED_STORE_EMPTY'] = True
+        yield self._export([])
+        self.assertEqual(self._feeds(), [[]])
+
+    @defer.inlineCallbacks
+    def test_rotate_size(self):
+        settings.overrides['FEED_ROTATE_SIZE'] = 28
+        yield self._export(['a', 'b', 'c', 'd', 'e'])
+        self.assertEqual(self._feeds(), [['{"name": "a"}', '{"name": "b"}'],
+            ['{"name": "c"}', '{"name": "d"}'], ['{"name": "e"}']])
+
+    @defer.inlineCallbacks
+    def test_buffer_flushed(self):
+        settings.overrides['FEED_EXPORTERS'] = {'jsonlines': \
+            'scrapy.tests.test_contrib_feedexport.NotFinishingExporter'}
+        yield self._export(['a', 'b'])
+        self.assertEqual(self._feeds(), [['{"name": "a"}', '{"name": "b"}']])
+
+    def test_rotate_uri(self):
+        settings.overrides['FEED_ROTATE_INTERVAL'] = 60
+        settings.overrides['FEED_URI'] = os.path.join(self.dir, 'feed.jl')
+        self.assertRaises(NotConfigured, FeedExporter)
+        settings.overrides['FEED_URI'] = os.path.join(self.dir, 'feed-%%(part)s.jl')
+        self.assertRaises(NotConfigured, FeedExporter)
+        settings.overrides['FEED_URI'] = os.path.join(self.dir, 'feed-%(part)05d.jl')
+        self.assertEqual(FeedExporter().rotate_interval, 60)
+
+    @defer.inlineCallbacks
+    def test_compression(self):
+        for compression, opener in (('gzip', gzip.open), ('bz2', bz2.BZ2File)):
+            settings.overrides['FEED_COMPRESSION'] = compression
+            settings.overrides['FEED_URI'] = os.path.join(self.dir, \
+                '%%(name)s-%%(part)s.jl.%s' % compression)
+            yield self._export(['a', 'b'])
+            self.assertEqual(self._feeds('*.' + compression, opener),
+                [['{"name": "a"}', '{"name": "b"}']])
+        self.assertEqual(stats.get_value('feedexport/bytes', spider=self.spider), 56)
+        self.failUnless(stats.get_value('feedexport/compressed_bytes', spider=self.spider))
+
+    def test_unknown_compression(self):
+        settings.overrides['FEED_COMPRESSION'] = 'zip'
+        self.assertRaises(NotConfigured, FeedExporter)
+
+
+class CompressedFeedFileTest(unittest.TestCase):
+
+    def test_write(self):
+        data = 'some data to compress\n' * 100
+        for compression, decompress in (('gzip', lambda x: gzip.GzipFile( \
+                fileobj=StringIO(x)).read()), ('bz2', bz2.decompress)):
+            out = StringIO()
+            f = CompressedFeedFile(out, compression, 9)
+            f.write(data[:10])
+            f.write(data[10:])
+            self.assertEqual(f.tell(), len(data))
+            f.finish()
+            self.failIf(out.closed)
+            self.failUnless(len(out.getvalue()) < len(data))
+            self.assertEqual(decompress(out.getvalue()), data)
+        self.assertRaises(ValueError, CompressedFeedFile, StringIO(), 'zip')
@@ -3,8 +3,13 @@ import unittest
 
 from scrapy.http import HtmlResponse
 from scrapy.link import Link
-from scrapy.contrib.linkextractors.sgml import SgmlLinkExtractor, BaseSgmlLinkExtractor
+from scrapy.contrib.linkextractors.sgml import SgmlLinkExtractor, BaseSgmlLinkExtractor, \
+    get_sgml_events, can_replay_events
 from scrapy.contrib.linkextractors.image import HTMLImageLinkExtractor
+try:
+    from scrapy.contrib.linkextractors.lxmlhtml import LxmlHtmlLinkExtractor
+except ImportError:
+    LxmlHtmlLinkExtractor = None
 from scrapy.tests import get_testdata
 
 class LinkExtractorTestCase(unittest.TestCase):
@@ -80,77 +85,80 @@ class LinkExtractorTestCase(unittest.TestCase):
         self.assertEqual(lx.matches(url2), True)
 
 class SgmlLinkExtractorTestCase(unittest.TestCase):
+
+    extractor_cls = SgmlLinkExtractor
+
     def setUp(self):
         body = get_testdata('link_extractor', 'sgml_linkextractor.html')
         self.response = HtmlResponse(url='http://example.com/index', body=body)
 
     def test_urls_type(self):
         '''Test that the resulting urls are regular strings and not a unicode objects'''
-        lx = SgmlLinkExtractor()
+        lx = self.extractor_cls()
         self.assertTrue(all(isinstance(link.url, str) for link in lx.extract_links(self.response)))
 
     def test_extraction(self):
         '''Test the extractor's behaviour among different situations'''
 
-        lx = SgmlLinkExtractor()
+        lx = self.extractor_cls()
         self.assertEqual([link for link in lx.extract_links(self.response)],
             [ Link(url='http://example.com/sample1.html', text=u''),
               Link(url='http://example.com/sample2.html', text=u'sample 2'),
               Link(url='http://example.com/sample3.html', text=u'sample 3 text'),
               Link(url='http://www.google.com/something', text=u'') ])
 
-        lx = SgmlLinkExtractor(allow=('sample', ))
+        lx = self.extractor_cls(allow=('sample', ))
         self.assertEqual([link for link in lx.extract_links(self.response)],
             [ Link(url='http://example.com/sample1.html', text=u''),
               Link(url='http://example.com/sample2.html', text=u'sample 2'),
               Link(url='http://example.com/sample3.html', text=u'sample 3 text') ])
 
-        lx = SgmlLinkExtractor(allow=('sample', ), unique=False)
+        lx = self.extractor_cls(allow=('sample', ), unique=False)
         self.assertEqual([link for link in lx.extract_links(self.response)],
             [ Link(url='http://example.com/sample1.html', text=u''),
               Link(url='http://example.com/sample2.html', text=u'sample 2'),
               Link(url='http://example.com/sample3.html', text=u'sample 3 text'),
               Link(url='http://example.com/sample3.html', text=u'sample 3 repetition') ])
 
-        lx = SgmlLinkExtractor(allow=('sample', ))
+        lx = self.extractor_cls(allow=('sample', ))
         self.assertEqual([link for link in lx.extract_links(self.response)],
             [ Link(url='http://example.com/sample1.html', text=u''),
               Link(url='http://example.com/sample2.html', text=u'sample 2'),
               Link(url='http://example.com/sample3.html', text=u'sample 3 text'),
               ])
 
-        lx = SgmlLinkExtractor(allow=('sample', ), deny=('3', ))
+        lx = self.extractor_cls(allow=('sample', ), deny=('3', ))
         self.assertEqual([link for link in lx.extract_links(self.response)],
             [ Link(url='http://example.com/sample1.html', text=u''),
               Link(url='http://example.com/sample2.html', text=u'sample 2') ])
 
-        lx = SgmlLinkExtractor(allow_domains=('google.com', ))
+        lx = self.extractor_cls(allow_domains=('google.com', ))
         self.assertEqual([link for link in lx.extract_links(self.response)],
             [ Link(url='http://www.google.com/something', text=u'') ])
 
-        lx = SgmlLinkExtractor(tags=('img', ), attrs=('src', ))
+        lx = self.extractor_cls(tags=('img', ), attrs=('src', ))
         self.assertEqual([link for link in lx.extract_links(self.response)],
             [ Link(url='http://example.com/sample2.jpg', text=u'') ])
 
     def test_extraction_using_single_values(self):
         '''Test the extractor's behaviour among different situations'''
 
-        lx = SgmlLinkExtractor(allow='sample')
+        lx = self.extractor_cls(allow='sample')
         self.assertEqual([link for link in lx.extract_links(self.response)],
             [ Link(url='http://example.com/sample1.html', text=u''),
               Link(url='http://example.com/sample2.html', text=u'sample 2'),
               Link(url='http://example.com/sample3.html', text=u'sample 3 text') ])
 
-        lx = SgmlLinkExtractor(allow='sample', deny='3')
+        lx = self.extractor_cls(allow='sample', deny='3')
         self.assertEqual([link for link in lx.extract_links(self.response)],
             [ Link(url='http://example.com/sample1.html', text=u''),
               Link(url='http://example.com/sample2.html', text=u'sample 2') ])
 
-        lx = SgmlLinkExtractor(allow_domains='google.com')
+        lx = self.extractor_cls(allow_domains='google.com')
         self.assertEqual([link for link in lx.extract_links(self.response)],
             [ Link(url='http://www.google.com/something', text=u'') ])
 
-        lx = SgmlLinkExtractor(deny_domains='example.com')
+        lx = self.extractor_cls(deny_domains='example.com')
         self.assertEqual([link for link in lx.extract_links(self.response)],
             [ Link(url='http://www.google.com/something', text=u'') ])
 
@@ -158,23 +166,23 @@ class SgmlLinkExtractorTestCase(unittest.TestCase):
         url1 = 'http://lotsofstuff.com/stuff1/index'
         url2 = 'http://evenmorestuff.com/uglystuff/index'
 
-        lx = SgmlLinkExtractor(allow=(r'stuff1', ))
+        lx = self.extractor_cls(allow=(r'stuff1', ))
         self.assertEqual(lx.matches(url1), True)
         self.assertEqual(lx.matches(url2), False)
 
-        lx = SgmlLinkExtractor(deny=(r'uglystuff', ))
+        lx = self.extractor_cls(deny=(r'uglystuff', ))
         self.assertEqual(lx.matches(url1), True)
         self.assertEqual(lx.matches(url2), False)
 
-        lx = SgmlLinkExtractor(allow_domains=('evenmorestuff.com', ))
+        lx = self.extractor_cls(allow_domains=('evenmorestuff.com', ))
         self.assertEqual(lx.matches(url1), False)
         self.assertEqual(lx.matches(url2), True)
 
-        lx = SgmlLinkExtractor(deny_domains=('lotsofstuff.com', ))
+        lx = self.extractor_cls(deny_domains=('lotsofstuff.com', ))
         self.assertEqual(lx.matches(url1), False)
         self.assertEqual(lx.matches(url2), True)
 
-        lx = SgmlLinkExtractor(allow=('blah1', ), deny=('blah2', ),
+        lx = self.extractor_cls(allow=('blah1', ), deny=('blah2', ),
             allow_domains=('blah1.com', ), deny_domains=('blah2.com', ))
         self.assertEqual(lx.matches('http://blah1.com/blah1'), True)
         self.assertEqual(lx.matches('http://blah1.com/blah2'), False)
@@ -182,7 +190,7 @@ class SgmlLinkExtractorTestCase(unittest.TestCase):
         self.assertEqual(lx.matches('http://blah2.com/blah2'), False)
 
     def test_restrict_xpaths(self):
-        lx = SgmlLinkExtractor(restrict_xpaths=('//div[@id="subwrapper"]', ))
+        lx = self.extractor_cls(restrict_xpaths=('//div[@id="subwrapper"]', ))
         self.assertEqual([link for link in lx.extract_links(self.response)],
             [ Link(url='http://example.com/sample1.html', text=u''),
               Link(url='http://example.com/sample2.html', text=u'sample 2') ])
@@ -200,7 +208,7 @@ class SgmlLinkExtractorTestCase(unittest.TestCase):
         </body></html>"""
         response = HtmlResponse("http://example.org/somepage/index.html", body=html, encoding='windows-1252')
 
-        lx = SgmlLinkExtractor(restrict_xpaths="//div[@class='links']") 
+        lx = self.extractor_cls(restrict_xpaths="//div[@class='links']") 
         self.assertEqual(lx.extract_links(response),
                          [Link(url='http://example.org/about.html', text=u'About us\xa3')])
 
@@ -217,10 +225,70 @@ class SgmlLinkExtractorTestCase(unittest.TestCase):
             if m:
                 return m.group(1)
 
-        lx = SgmlLinkExtractor(process_value=process_value)
+        lx = self.extractor_cls(process_value=process_value)
         self.assertEqual(lx.extract_links(response),
                          [Link(url='http://example.org/other/page.html', text='Link text')])
 
+    def test_events_cache(self):
+        """The response is parsed only once for all link extractors"""
+        events = get_sgml_events(self.response)
+        self.assert_(get_sgml_events(self.response) is events)
+        restricted = get_sgml_events(self.response, ('//p',))
+        self.assert_(restricted is not events)
+        self.assert_(get_sgml_events(self.response, ('//p',)) is restricted)
+
+        lx = self.extractor_cls(allow=('sample', ))
+        links = lx.extract_links(self.response)
+        parsed = lx._extract_links(self.response.body, self.response.url,
+            self.response.encoding)
+        self.assertEqual(lx._process_links(parsed), links)
+
+    def test_events_tag_handlers(self):
+        """Link extractors with their own tag handlers parse the response"""
+        class HandlersLinkExtractor(self.extractor_cls):
+            def reset(self):
+                self.extractor_cls.reset(self)
+                self.seen = []
+            def start_p(self, attrs):
+                self.seen.append('p')
+            def handle_entityref(self, name):
+                self.seen.append(name)
+        HandlersLinkExtractor.extractor_cls = self.extractor_cls
+
+        html = """<p><a href="/a">A &amp; B</a></p>"""
+        response = HtmlResponse("http://example.org/", body=html)
+        lx = HandlersLinkExtractor()
+        self.assertEqual(lx.extract_links(response),
+                         [Link(url='http://example.org/a', text='AB')])
+        self.assertEqual(lx.seen, ['p', 'amp'])
+        self.assert_(can_replay_events(self.extractor_cls))
+        self.assertFalse(can_replay_events(HandlersLinkExtractor))
+
+class LxmlHtmlLinkExtractorTestCase(SgmlLinkExtractorTestCase):
+
+    extractor_cls = LxmlHtmlLinkExtractor
+    if LxmlHtmlLinkExtractor is None:
+        skip = "lxml not available"
+
+    def test_events_cache(self):
+        pass # no SGML events are used
+
+    def test_events_tag_handlers(self):
+        pass # no SGML events are used
+
+    def test_link_text(self):
+        html = """<p><a href="/a">Item <b>12</b> here</a>
+        <a href="/b">Line<br>break</a><a href="/c"><!-- c -->after comment</a>
+        <a href="/d">&pound;10 &amp; more</a></p>"""
+        response = HtmlResponse("http://example.org/", body=html, encoding='latin1')
+        lx = self.extractor_cls()
+        self.assertEqual(lx.extract_links(response),
+            [Link(url='http://example.org/a', text=u'Item12'),
+             Link(url='http://example.org/b', text=u'Linebreak'),
+             Link(url='http://example.org/c', text=u'after comment'),
+             Link(url='http://example.org/d', text=u'\xa310 & more')])
+
+
 class HTMLImageLinkExtractorTestCase(unittest.TestCase):
     def setUp(self):
         body = get_testdata('link_extractor', 'image_linkextractor.html')
@@ -0,0 +1,284 @@
+import os
+import shutil
+import tempfile
+from datetime import datetime
+
+from twisted.trial import unittest
+from twisted.internet import reactor, defer
+
+from scrapy.xlib.pydispatch import dispatcher
+from scrapy import signals
+from scrapy.contrib.multiprocess import worker_for, aggregate_stats, \
+    MultiprocessMiddleware, MultiprocessCrawler, MessageFactory, CONTROL_SOCKET
+from scrapy.contrib.schedulermiddleware.duplicatesfilter import \
+    DuplicatesFilterMiddleware
+from scrapy.exceptions import NotConfigured, DontCloseSpider, IgnoreRequest
+from scrapy.http import Request
+from scrapy.item import Item, Field
+from scrapy.spider import BaseSpider
+from scrapy.settings import CrawlerSettings
+from scrapy.conf import settings
+
+
+class WorkerForTest(unittest.TestCase):
+
+    def test_same_domain(self):
+        r1 = Request('http://www.example.com/a')
+        r2 = Request('http://www.example.com:8080/b?c=d')
+        self.assertEqual(worker_for(r1, 4), worker_for(r2, 4))
+
+    def test_partition(self):
+        workers = set()
+        for i in range(100):
+            w = worker_for(Request('http://www.example%d.com/' % i), 4)
+            self.assert_(0 <= w < 4)
+            workers.add(w)
+        self.assertEqual(workers, set(range(4)))
+
+
+class AggregateStatsTest(unittest.TestCase):
+
+    def test_aggregate(self):
+        s1 = {'item_scraped_count': 3, 'memusage/max': 1.5, 'finish_reason': 'finished',
+            'envinfo/pid': 100,
+            'start_time': datetime(2011, 1, 1), 'finish_time': datetime(2011, 1, 2)}
+        s2 = {'item_scraped_count': 4, 'memusage/max': 2.0, 'finish_reason': 'shutdown',
+            'start_time': datetime(2010, 1, 1), 'finish_time': datetime(2010, 1, 2),
+            'downloader/request_count': 5, 'envinfo/pid': 101}
+        self.assertEqual(aggregate_stats([s1, s2]), {
+            'item_scraped_count': 7,
+            'memusage/max': 2.0,
+            'envinfo/pid': 100,
+            'finish_reason': 'finished',
+            'start_time': datetime(2010, 1, 1),
+            'finish_time': datetime(2011, 1, 2),
+            'downloader/request_count': 5,
+        })
+
+
+class MultiprocessCrawlerTest(unittest.TestCase):
+
+    def _crawler(self, **overrides):
+        settings = CrawlerSettings()
+        settings.overrides.update(overrides)
+        crawler = MultiprocessCrawler(2, ['somespider'], settings)
+        crawler.dir = '/tmp/scrapy-test'
+        return crawler
+
+    def test_worker_settings(self):
+        crawler = self._crawler(LOG_LEVEL='INFO')
+        overrides = crawler.worker_settings(1)
+        self.assertEqual(overrides['LOG_LEVEL'], 'INFO')
+        self.assertEqual(overrides['MULTIPROCESS_WORKERS'], 2)
+        self.assertEqual(overrides['MULTIPROCESS_WORKER'], 1)
+        self.assertEqual(overrides['MULTIPROCESS_DIR'], '/tmp/scrapy-test')
+        self.failIf('JOBDIR' in overrides)
+
+    def test_jobdir(self):
+        crawler = self._crawler(JOBDIR='crawls/job1')
+        self.assertEqual(crawler.worker_settings(0)['JOBDIR'], 'crawls/job1/worker-0')
+        self.assertEqual(crawler.worker_settings(1)['JOBDIR'], 'crawls/job1/worker-1')
+
+    def test_middleware_disabled(self):
+        self.assertRaises(NotConfigured, MultiprocessMiddleware)
+
+
+class TestItem(Item):
+    name = Field()
+
+
+class WorkerEngine(object):
+    """Engine of a test worker, which only records the requests crawled (if
+    not filtered out as duplicates)"""
+
+    def __init__(self, spider):
+        self.crawled = []
+        self.busy = False
+        self.dupefilter = DuplicatesFilterMiddleware()
+        self.dupefilter.open_spider(spider)
+
+    def crawl(self, request, spider):
+        try:
+            self.dupefilter.enqueue_request(spider, request)
+        except IgnoreRequest:
+            return
+        self.crawled.append(request.url)
+
+    def spider_is_idle(self, spider):
+        return not self.busy
+
+
+class MultiprocessTest(unittest.TestCase):
+    """Run a parent process and two workers (without their engines) in this
+    process, connected through their unix sockets"""
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.old_overrides = settings.overrides.copy()
+        settings.overrides['FEED_URI'] = os.path.join(self.dir, '%(name)s.jl')
+        settings.overrides['FEED_FORMAT'] = 'jsonlines'
+        settings.overrides['SPIDER_MODULES'] = \
+            ['scrapy.tests.test_spidermanager.test_spiders']
+        self.parent = MultiprocessCrawler(2, ['spider1'])
+        self.parent.dir = self.dir
+        self.parent.port = reactor.listenUNIX(os.path.join(self.dir, \
+            CONTROL_SOCKET), MessageFactory(self.parent))
+        settings.overrides.update(self.parent.worker_settings(0))
+        self.spider = BaseSpider('spider1')
+        self.engines = [WorkerEngine(self.spider), WorkerEngine(self.spider)]
+        self.workers = [self._worker(0), self._worker(1)]
+        return self._wait_until(lambda: len(self.parent.connections) == 2)
+
+    @defer.inlineCallbacks
+    def tearDown(self):
+        for mw in self.workers:
+            for connection in [mw.control] + mw.peers.values():
+                connection.addCallback(lambda p: p.transport.loseConnection())
+            yield mw.port.stopListening()
+            for name in ['spider_opened', 'spider_idle', 'spider_closed', \
+                    'stats_spider_closed', 'engine_stopped', 'item_passed']:
+                dispatcher.disconnect(getattr(mw, name), getattr(signals, name))
+        yield self.parent.port.stopListening()
+        feeds = self.parent.feeds
+        dispatcher.disconnect(feeds.open_spider, signals.spider_opened)
+        dispatcher.disconnect(feeds.close_spider, signals.spider_closed)
+        dispatcher.disconnect(feeds.item_passed, signals.item_passed)
+        if self.parent.spiders is not None:
+            dispatcher.disconnect(self.parent.spiders.close_spider, \
+                signals.spider_closed)
+        settings.overrides.clear()
+        settings.overrides.update(self.old_overrides)
+        shutil.rmtree(self.dir)
+
+    def _worker(self, worker):
+        settings.overrides['MULTIPROCESS_WORKER'] = worker
+        mw = MultiprocessMiddleware()
+        mw._engine = lambda: self.engines[worker]
+        return mw
+
+    def _wait_until(self, condition):
+        d = defer.Deferred()
+        def check():
+            if condition():
+                d.callback(None)
+            else:
+                reactor.callLater(0.01, check)
+        check()
+        return d
+
+    def _probe(self):
+        self.parent._probe()
+        return self._wait_until(lambda: self.parent.replies is None)
+
+    def _url(self, worker):
+        for i in range(100):
+            url = 'http://www.example%d.com/' % i
+            if worker_for(Request(url), 2) == worker:
+                return url
+
+    def _open_spider(self):
+        for mw in self.workers:
+            mw.spider_opened(self.spider)
+
+    @defer.inlineCallbacks
+    def test_routing(self):
+        self._open_spider()
+        url0, url1 = self._url(0), self._url(1)
+        self.assertEqual(self.workers[0].enqueue_request(self.spider, \
+            Request(url0)), None)
+        self.assert_(self.workers[0].enqueue_request(self.spider, \
+            Request(url1)) is not None)
+        yield self._wait_until(lambda: self.engines[1].crawled)
+        self.assertEqual(self.engines[0].crawled, [])
+        self.assertEqual(self.engines[1].crawled, [url1])
+        self.assertEqual(self.workers[0].sent['spider1'], 1)
+        self.assertEqual(self.workers[1].received['spider1'], 1)
+
+    @defer.inlineCallbacks
+    def test_routing_before_opening_spider(self):
+        self.workers[0].spider_opened(self.spider)
+        url1 = self._url(1)
+        self.workers[0].enqueue_request(self.spider, Request(url1))
+        yield self._wait_until(lambda: self.workers[1].received['spider1'])
+        self.assertEqual(self.engines[1].crawled, [])
+        self.workers[1].spider_opened(self.spider)
+        self.assertEqual(self.engines[1].crawled, [url1])
+
+    @defer.inlineCallbacks
+    def test_routing_dont_filter(self):
+        self._open_spider()
+        url1 = self._url(1)
+        for i in range(2):
+            self.workers[0].enqueue_request(self.spider, \
+                Request(url1, dont_filter=True))
+        self.workers[0].enqueue_request(self.spider, Request(url1))
+        yield self._wait_until(lambda: self.workers[1].received['spider1'] == 3)
+        self.assertEqual(self.engines[1].crawled, [url1, url1])
+
+    @defer.inlineCallbacks
+    def test_finish(self):
+        self._open_spider()
+        # the counters match, but the request received keeps worker 1 busy
+        self.engines[1].busy = True
+        self.workers[0].enqueue_request(self.spider, Request(self._url(1)))
+        yield self._wait_until(lambda: self.engines[1].crawled)
+        yield self._probe()
+        yield self._probe()
+        self.assertEqual(self.parent.finished, set())
+        self.assertRaises(DontCloseSpider, self.workers[0].spider_idle, \
+            self.spider)
+        # finished only once two waves find all workers idle
+        self.engines[1].busy = False
+        yield self._probe()
+        self.assertEqual(self.parent.finished, set())
+        yield self._probe()
+        self.assertEqual(self.parent.finished, set(['spider1']))
+        yield self._wait_until(lambda: 'spider1' in self.workers[0].finished and \
+            'spider1' in self.workers[1].finished)
+        for mw in self.workers:
+            mw.spider_idle(self.spider)
+
+    @defer.inlineCallbacks
+    def test_request_in_flight(self):
+        self._open_spider()
+        self.workers[0].sent['spider1'] = 1
+        yield self._probe()
+        yield self._probe()
+        self.assertEqual(self.parent.finished, set())
+        # received between two waves
+        self.workers[1].received['spider1'] = 1
+        yield self._probe()
+        self.assertEqual(self.parent.finished, set())
+        yield self._probe()
+        self.assertEqual(self.parent.finished, set(['spider1']))
+
+    @defer.inlineCallbacks
+    def test_spider_not_opened(self):
+        self.workers[0].spider_opened(self.spider)
+        yield self._probe()
+        yield self._probe()
+        self.assertEqual(self.parent.finished, set())
+
+    @defer.inlineCallbacks
+    def test_feed(self):
+        overrides = self.parent.worker_settings(1)
+        self.assertEqual(overrides['FEED_URI'], None)
+        self.assert_(overrides['MULTIPROCESS_FEED'])
+        self._open_spider()
+        self.workers[0].item_passed(TestItem(name='a'), self.spider)
+        self.workers[1].item_passed(TestItem(name='b'), self.spider)
+        # not picklable
+        self.workers[1].item_passed(TestItem(name=lambda: None), self.spider)
+        self.workers[0].stats_spider_closed(self.spider, {})
+        yield self._wait_until(lambda: self.parent.stats['spider1'])
+        self.failIf('spider1' in self.parent.stored)
+        self.workers[1].stats_spider_closed(self.spider, {})
+        yield self._wait_until(lambda: 'spider1' in self.parent.stored)
+        yield self.parent.stored['spider1']
+        lines = open(os.path.join(self.dir, 'spider1.jl')).read().splitlines()
+        self.assertEqual(sorted(lines), ['{"name": "a"}', '{"name": "b"}'])
+        yield self._wait_until(lambda: self.workers[1].acks[0].called)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,168 @@
+from twisted.trial import unittest
+from twisted.internet import defer, task
+from twisted.internet.error import DNSLookupError
+
+import time
+
+from scrapy.contrib import resolver as resolvermod
+from scrapy.contrib.resolver import DnsCache, _CachingThreadedResolver, \
+    DNSLookupTimeout, dnscache
+
+
+class DnsCacheTest(unittest.TestCase):
+
+    def test_ttl(self):
+        clock = task.Clock()
+        cache = DnsCache(10, 60, clock)
+        cache['example.com'] = '1.2.3.4'
+        clock.advance(59)
+        self.assertEqual(cache.get('example.com'), '1.2.3.4')
+        self.assertEqual(cache['example.com'], '1.2.3.4')
+        clock.advance(1)
+        self.assertFalse('example.com' in cache)
+        self.assertEqual(cache.get('example.com', 'x'), 'x')
+        self.assertRaises(KeyError, cache.__getitem__, 'example.com')
+        self.assertEqual(len(cache), 0)
+
+    def test_no_ttl(self):
+        clock = task.Clock()
+        cache = DnsCache(10, 0, clock)
+        cache['example.com'] = '1.2.3.4'
+        clock.advance(1e9)
+        self.assertEqual(cache.get('example.com'), '1.2.3.4')
+
+    def test_limit(self):
+        cache = DnsCache(2, 60, task.Clock())
+        cache['a.com'] = '1.1.1.1'
+        cache['b.com'] = '2.2.2.2'
+        cache.get('a.com')
+        cache['c.com'] = '3.3.3.3'
+        self.assertEqual(sorted(cache.keys()), ['a.com', 'c.com'])
+        self.assertEqual(len(cache._expires), 2)
+
+
+class CachingThreadedResolverTest(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = task.Clock()
+        self.resolver = _CachingThreadedResolver(self.clock, negative_ttl=60)
+        self.lookups = []
+        self.resolver._lookup = self._lookup
+        dnscache.clear()
+
+    def tearDown(self):
+        dnscache.clear()
+
+    def _lookup(self, name, timeout):
+        dfd = defer.Deferred()
+        self.lookups.append((name, dfd))
+        def finished(result):
+            self.resolver._lookup_finished(None)
+            return result
+        return dfd.addBoth(finished)
+
+    @defer.inlineCallbacks
+    def test_cache(self):
+        dfd = self.resolver.getHostByName('example.com')
+        self.lookups[0][1].callback('1.2.3.4')
+        ip = yield dfd
+        self.assertEqual(ip, '1.2.3.4')
+        self.assertEqual(dnscache['example.com'], '1.2.3.4')
+        ip = yield self.resolver.getHostByName('example.com')
+        self.assertEqual(ip, '1.2.3.4')
+        self.assertEqual(len(self.lookups), 1)
+
+    @defer.inlineCallbacks
+    def test_concurrent_lookups(self):
+        # a prefetched hostname isn't resolved again while it's being resolved
+        dfds = [self.resolver.getHostByName('example.com') for _ in range(3)]
+        self.assertEqual(len(self.lookups), 1)
+        self.lookups[0][1].callback('1.2.3.4')
+        for dfd in dfds:
+            ip = yield dfd
+            self.assertEqual(ip, '1.2.3.4')
+
+    @defer.inlineCallbacks
+    def test_negative_cache(self):
+        dfd = self.resolver.getHostByName('example.com')
+        self.lookups[0][1].errback(DNSLookupError('not found'))
+        yield self.assertFailure(dfd, DNSLookupError)
+        dfd = self.resolver.getHostByName('example.com')
+        yield self.assertFailure(dfd, DNSLookupError)
+        self.assertEqual(len(self.lookups), 1)
+        # failures expire sooner
+        self.clock.advance(60)
+        self.resolver.getHostByName('example.com')
+        self.assertEqual(len(self.lookups), 2)
+        self.lookups[1][1].callback('1.2.3.4')
+
+    @defer.inlineCallbacks
+    def test_lookup(self):
+        from twisted.internet import reactor
+        resolver = _CachingThreadedResolver(reactor, threads=2)
+        ip = yield resolver.getHostByName('localhost')
+        self.assertEqual(ip, '127.0.0.1')
+        resolver._threadpool.stop()
+
+    def test_prefetch_after_lookups(self):
+        self.resolver._threads = 1
+        for name in ['a.com', 'b.com', 'c.com']:
+            self.resolver.prefetch(name)
+        self.resolver.getHostByName('d.com')
+        self.resolver.getHostByName('c.com') # moved ahead of b.com
+        for i in range(4):
+            self.lookups[i][1].callback('1.2.3.4')
+        self.assertEqual([x[0] for x in self.lookups], \
+            ['a.com', 'd.com', 'c.com', 'b.com'])
+
+    def test_prefetch_queue_size(self):
+        self.resolver._threads = 1
+        self.resolver.prefetch_queue_size = 1
+        for name in ['a.com', 'b.com', 'c.com']:
+            self.resolver.prefetch(name)
+        self.assertEqual(list(self.resolver._prefetch_queue), ['b.com'])
+        self.assertFalse('c.com' in self.resolver._waiting)
+
+
+class _SlowSocket(object):
+
+    def __init__(self, delay):
+        self.delay = delay
+
+    def gethostbyname(self, name):
+        time.sleep(self.delay)
+        return '127.0.0.1'
+
+
+class ResolverTimeoutTest(unittest.TestCase):
+
+    def setUp(self):
+        from twisted.internet import reactor
+        self.resolver = _CachingThreadedResolver(reactor, threads=1)
+        self.socket = resolvermod.socket
+        dnscache.clear()
+
+    def tearDown(self):
+        resolvermod.socket = self.socket
+        self.resolver._threadpool.stop()
+        dnscache.clear()
+
+    @defer.inlineCallbacks
+    def test_queued_lookups_dont_time_out(self):
+        # the timeout starts when the lookup runs, not when it's queued
+        resolvermod.socket = _SlowSocket(0.1)
+        dfds = [self.resolver.getHostByName('h%d' % i, (0.25,)) \
+            for i in range(5)]
+        for dfd in dfds:
+            ip = yield dfd
+            self.assertEqual(ip, '127.0.0.1')
+
+    @defer.inlineCallbacks
+    def test_timeouts_are_not_cached(self):
+        resolvermod.socket = _SlowSocket(0.2)
+        dfd = self.resolver.getHostByName('h1', (0.05,))
+        yield self.assertFailure(dfd, DNSLookupTimeout)
+        self.assertFalse('h1' in self.resolver._negative_cache)
+        ip = yield self.resolver.getHostByName('h1', (1,))
+        self.assertEqual(ip, '127.0.0.1')
+
@@ -0,0 +1,117 @@
+from twisted.trial import unittest
+
+from scrapy.conf import settings
+from scrapy.core.downloader import SpiderInfo
+from scrapy.exceptions import NotConfigured
+from scrapy.http import Request, Response
+from scrapy.spider import BaseSpider
+from scrapy.utils.test import get_crawler
+
+
+class TestSpider(BaseSpider):
+    name = 'test'
+    DOWNLOAD_DELAY = 0.5
+
+
+class AutoThrottleTest(unittest.TestCase):
+
+    overrides = {
+        'AUTOTHROTTLE_ENABLED': True,
+        'AUTOTHROTTLE_START_DELAY': 5.0,
+        'AUTOTHROTTLE_MAX_DELAY': 60.0,
+        'AUTOTHROTTLE_TARGET_CONCURRENCY': 2.0,
+        'AUTOTHROTTLE_MAX_CONCURRENCY': 4,
+    }
+
+    def setUp(self):
+        self.old_overrides = settings.overrides.copy()
+        settings.overrides.update(self.overrides)
+        crawler = get_crawler()
+        self.spider = TestSpider()
+        self.spider.set_crawler(crawler)
+        crawler.install()
+        try:
+            from scrapy.contrib.throttle import AutoThrottle
+            self.at = AutoThrottle()
+        finally:
+            crawler.uninstall()
+        self.at.spider_opened(self.spider)
+        self.site = SpiderInfo(self.spider)
+        self.request = Request('http://www.example.com/')
+        self.key, self.slot = self.site.get_slot(self.request)
+        self.ss = self.at.slotstats[self.spider][self.key]
+
+    def tearDown(self):
+        del self.at # disconnect its signal handlers
+        settings.overrides.clear()
+        settings.overrides.update(self.old_overrides)
+
+    def _response(self, latency, status=200):
+        self.ss.add(latency)
+        response = Response(self.request.url, status=status)
+        self.at._adjust(self.spider, self.key, self.slot, self.site, self.ss, \
+            latency, response)
+
+    def test_disabled(self):
+        settings.overrides['AUTOTHROTTLE_ENABLED'] = False
+        from scrapy.contrib.throttle import AutoThrottle
+        self.assertRaises(NotConfigured, AutoThrottle)
+
+    def test_start(self):
+        self.assertEqual(self.slot.delay, 5.0)
+        self.assertEqual(self.slot.concurrency, 2)
+
+    def test_slow_server(self):
+        for _ in range(20):
+            self._response(40.0)
+        self.assertAlmostEqual(self.slot.delay, 20.0, 2)
+        for _ in range(20):
+            self._response(500.0)
+        self.assertEqual(self.slot.delay, 60.0)
+
+    def test_fast_server(self):
+        for _ in range(20):
+            self._response(0.1)
+        self.assertEqual(self.slot.delay, 0.5)
+        self.assertEqual(self.slot.concurrency, 4)
+
+    def test_error_responses(self):
+        self._response(0.1, status=404)
+        self.assertEqual(self.slot.delay, 5.0)
+        self._response(100.0, status=404)
+        self.assertTrue(self.slot.delay > 5.0)
+
+    def test_backoff(self):
+        for _ in range(20):
+            self._response(0.1)
+        self.at._backoff(self.spider, self.key, self.slot, self.site)
+        self.assertEqual(self.slot.delay, 5.0)
+        self.assertEqual(self.slot.concurrency, 2)
+        self.at._backoff(self.spider, self.key, self.slot, self.site)
+        self.assertEqual(self.slot.delay, 10.0)
+        self.assertEqual(self.slot.concurrency, 1)
+        for _ in range(5):
+            self.at._backoff(self.spider, self.key, self.slot, self.site)
+        self.assertEqual(self.slot.delay, 60.0)
+        self.assertEqual(self.slot.concurrency, 1)
+
+    def test_new_slot(self):
+        # throttled before downloading anything
+        key, slot = self.site.get_slot(Request('http://www.example.org/'))
+        self.assertEqual(slot.delay, 5.0)
+        self.assertEqual(slot.concurrency, 2)
+        self.assert_(self.at.slotstats[self.spider][key].slot is slot)
+
+    def test_recreated_slot(self):
+        for _ in range(20):
+            self._response(0.1)
+        del self.site.slots[self.key]
+        key, slot = self.site.get_slot(self.request)
+        self.assert_(slot is not self.slot)
+        self.assert_(self.at.slotstats[self.spider][key] is self.ss)
+        self.assertEqual(slot.delay, 0.5)
+        self.assertEqual(slot.concurrency, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,216 @@
+from twisted.trial import unittest
+from twisted.internet import defer
+from twisted.internet.error import DNSLookupError
+
+from scrapy.core.downloader import Downloader
+from scrapy.http import Request, Response
+from scrapy.spider import BaseSpider
+from scrapy.utils.test import get_crawler
+
+
+class FakeHandlers(object):
+    """Download handlers which return deferreds to be fired by the tests"""
+
+    def __init__(self):
+        self.downloading = []
+
+    def download_request(self, request, spider):
+        d = defer.Deferred()
+        self.downloading.append((request, d))
+        return d
+
+    def urls(self):
+        return [r.url for r, _ in self.downloading]
+
+    def finish(self, url):
+        for request, d in self.downloading:
+            if request.url == url:
+                self.downloading.remove((request, d))
+                d.callback(Response(url))
+                return
+
+    def close(self):
+        pass
+
+
+class TestSpider(BaseSpider):
+    name = 'test'
+    CONCURRENT_REQUESTS_PER_DOMAIN = 2
+    CONCURRENT_REQUESTS_PER_SPIDER = 0
+    DOWNLOAD_DELAY = 0
+
+
+class DownloaderTestCase(unittest.TestCase):
+
+    spider_class = TestSpider
+    total_concurrency = 16
+
+    def setUp(self):
+        crawler = get_crawler()
+        self.spider = self.spider_class()
+        self.spider.set_crawler(crawler)
+        crawler.install()
+        try:
+            self.downloader = Downloader()
+        finally:
+            crawler.uninstall()
+        self.downloader.handlers = self.handlers = FakeHandlers()
+        self.downloader.total_concurrency = self.total_concurrency
+        self.downloader.open_spider(self.spider)
+
+    def tearDown(self):
+        if self.spider in self.downloader.sites:
+            return self.downloader.close_spider(self.spider)
+
+    def _enqueue(self, *urls):
+        dfds = [self.downloader.enqueue(Request(u), self.spider) for u in urls]
+        for d in dfds:
+            d.addErrback(lambda _: None)
+        return dfds
+
+
+class DownloaderSlotsTest(DownloaderTestCase):
+
+    def test_per_domain_concurrency(self):
+        self._enqueue('http://a.com/1', 'http://a.com/2', 'http://a.com/3', \
+            'http://b.com/1', 'http://b.com/2')
+        self.assertEqual(self.handlers.urls(), ['http://a.com/1', \
+            'http://a.com/2', 'http://b.com/1', 'http://b.com/2'])
+        site = self.downloader.sites[self.spider]
+        self.assertEqual(sorted(site.slots), ['a.com', 'b.com'])
+        self.assertEqual(len(site.slots['a.com'].queue), 1)
+
+        self.handlers.finish('http://b.com/1')
+        self.assertEqual(len(self.handlers.downloading), 3)
+        self.handlers.finish('http://a.com/1')
+        self.assert_('http://a.com/3' in self.handlers.urls())
+
+    def test_idle_slots_released(self):
+        self._enqueue('http://a.com/1')
+        site = self.downloader.sites[self.spider]
+        self.assertEqual(site.slots.keys(), ['a.com'])
+        self.handlers.finish('http://a.com/1')
+        self.assertEqual(site.slots, {})
+
+    def test_download_slot_meta(self):
+        r = Request('http://a.com/1', meta={'download_slot': 'myslot'})
+        self.downloader.enqueue(r, self.spider)
+        site = self.downloader.sites[self.spider]
+        self.assertEqual(site.slots.keys(), ['myslot'])
+        self.handlers.finish('http://a.com/1')
+
+    def test_global_concurrency(self):
+        self.downloader.total_concurrency = 3
+        self._enqueue('http://a.com/1', 'http://a.com/2', 'http://b.com/1', \
+            'http://b.com/2', 'http://c.com/1')
+        self.assertEqual(len(self.handlers.downloading), 3)
+        self.handlers.finish('http://a.com/1')
+        self.handlers.finish('http://a.com/2')
+        self.assertEqual(sorted(self.handlers.urls()), ['http://b.com/1', \
+            'http://b.com/2', 'http://c.com/1'])
+
+    def test_spider_concurrency(self):
+        site = self.downloader.sites[self.spider]
+        site.max_concurrent_requests = 1
+        self._enqueue('http://a.com/1', 'http://b.com/1')
+        self.assertEqual(self.handlers.urls(), ['http://a.com/1'])
+        self.handlers.finish('http://a.com/1')
+        self.assertEqual(self.handlers.urls(), ['http://b.com/1'])
+
+    def test_close_spider(self):
+        dfds = [self.downloader.enqueue(Request(u), self.spider) for u in \
+            ['http://a.com/1', 'http://a.com/2', 'http://a.com/3']]
+        failed = []
+        for d in dfds:
+            d.addErrback(failed.append)
+        downloading = self.handlers.urls()
+        self.downloader.close_spider(self.spider)
+        # queued requests fail on close, and those being downloaded when
+        # they finish
+        self.assertEqual(len(failed), 3 - len(downloading))
+        for url in downloading:
+            self.handlers.finish(url)
+        self.assertEqual(len(failed), 3)
+
+
+class DelayedSpider(TestSpider):
+    DOWNLOAD_DELAY = 10
+    RANDOMIZE_DOWNLOAD_DELAY = False
+
+
+class DownloaderDelayTest(DownloaderTestCase):
+
+    spider_class = DelayedSpider
+
+    def test_per_domain_concurrency(self):
+        self._enqueue('http://a.com/1', 'http://a.com/2', 'http://b.com/1')
+        self.assertEqual(self.handlers.urls(), ['http://a.com/1', \
+            'http://b.com/1'])
+        self.handlers.finish('http://a.com/1')
+        # the second request waits for the download delay
+        self.assertEqual(self.handlers.urls(), ['http://b.com/1'])
+        slot = self.downloader.sites[self.spider].slots['a.com']
+        self.assertEqual(len(slot.next_request_calls), 1)
+
+    def test_idle_slots_released(self):
+        self._enqueue('http://a.com/1')
+        self.handlers.finish('http://a.com/1')
+        # kept until the download delay passes
+        site = self.downloader.sites[self.spider]
+        self.assertEqual(site.slots.keys(), ['a.com'])
+
+
+class PerIPSpider(TestSpider):
+    CONCURRENT_REQUESTS_PER_IP = 1
+
+
+class DownloaderPerIPTest(DownloaderTestCase):
+
+    spider_class = PerIPSpider
+
+    def setUp(self):
+        DownloaderTestCase.setUp(self)
+        self.ips = {'a.com': '1.1.1.1', 'b.com': '1.1.1.1', 'c.com': '2.2.2.2'}
+        self.lookups = []
+        self.downloader._resolve = self._resolve
+
+    def _resolve(self, hostname):
+        self.lookups.append(hostname)
+        if hostname in self.ips:
+            return defer.succeed(self.ips[hostname])
+        return defer.fail(DNSLookupError(hostname))
+
+    def test_per_ip_concurrency(self):
+        self._enqueue('http://a.com/1', 'http://b.com/1', 'http://c.com/1', \
+            'http://1.1.1.1/1')
+        site = self.downloader.sites[self.spider]
+        self.assertEqual(sorted(site.slots), ['1.1.1.1', '2.2.2.2'])
+        self.assertEqual(self.handlers.urls(), ['http://a.com/1', \
+            'http://c.com/1'])
+        self.handlers.finish('http://a.com/1')
+        self.assertEqual(self.handlers.urls(), ['http://c.com/1', \
+            'http://b.com/1'])
+
+    def test_slot_key_is_stable(self):
+        # the host keeps its IP address while its slot is in use, even if it
+        # resolves to another one later (eg. after its DNS entry expires)
+        self._enqueue('http://a.com/1', 'http://a.com/2')
+        self.ips['a.com'] = '3.3.3.3'
+        self._enqueue('http://a.com/3')
+        site = self.downloader.sites[self.spider]
+        self.assertEqual(self.lookups, ['a.com'])
+        self.assertEqual(site.slots.keys(), ['1.1.1.1'])
+        self.assertEqual(site.slot_key(Request('http://a.com/4')), '1.1.1.1')
+        for i in range(1, 4):
+            self.handlers.finish('http://a.com/%d' % i)
+        # resolved again once its slot is released
+        self.assertEqual(site.slots, {})
+        self.assertEqual(site.ipkeys, {})
+        self._enqueue('http://a.com/5')
+        self.assertEqual(site.slots.keys(), ['3.3.3.3'])
+
+    def test_unresolved_host(self):
+        self._enqueue('http://unknown.com/1')
+        site = self.downloader.sites[self.spider]
+        self.assertEqual(site.slots.keys(), ['unknown.com'])
+        self.handlers.finish('http://unknown.com/1')
@@ -4,21 +4,40 @@ from twisted.trial import unittest
 from twisted.protocols.policies import WrappingFactory
 from twisted.python.filepath import FilePath
 from twisted.internet import reactor, defer
+from twisted.internet.error import ConnectionDone
+from twisted.internet.protocol import ServerFactory
+from twisted.protocols.basic import LineReceiver
 from twisted.web import server, static, util, resource
 from twisted.web.test.test_webclient import ForeverTakingResource, \
         NoLengthResource, HostHeaderResource, \
         PayloadResource, BrokenDownloadResource
 
-from scrapy.core.downloader.webclient import PartialDownloadError
+from scrapy.core.downloader.webclient import PartialDownloadError, \
+        HTTPConnectionPool, ScrapyHTTPClientFactory, ScrapyHTTP11ClientFactory
 from scrapy.core.downloader.handlers.file import FileDownloadHandler
 from scrapy.core.downloader.handlers.http import HttpDownloadHandler
 from scrapy.core.downloader.handlers.s3 import S3DownloadHandler
 from scrapy.spider import BaseSpider
 from scrapy.http import Request
+from scrapy.exceptions import IgnoreRequest
 from scrapy.utils.url import path_to_file_uri
 from scrapy import optional_features
 
 
+def close_connections(handler, wrapper):
+    """Close the idle connections kept by the given download handler and
+    return a deferred fired when the server side of all connections is gone"""
+    handler.close()
+    d = defer.Deferred()
+    def _check():
+        if wrapper.protocols:
+            reactor.callLater(0.01, _check)
+        else:
+            d.callback(None)
+    _check()
+    return d
+
+
 class FileTestCase(unittest.TestCase):
 
     def setUp(self):
@@ -61,10 +80,12 @@ class HttpTestCase(unittest.TestCase):
         self.wrapper = WrappingFactory(self.site)
         self.port = reactor.listenTCP(0, self.wrapper, interface='127.0.0.1')
         self.portno = self.port.getHost().port
-        self.download_request = HttpDownloadHandler().download_request
+        self.download_handler = HttpDownloadHandler()
+        self.download_request = self.download_handler.download_request
 
     def tearDown(self):
-        return self.port.stopListening()
+        d = close_connections(self.download_handler, self.wrapper)
+        return d.addCallback(lambda _: self.port.stopListening())
 
     def getURL(self, path):
         return "http://127.0.0.1:%d/%s" % (self.portno, path)
@@ -76,6 +97,18 @@ class HttpTestCase(unittest.TestCase):
         d.addCallback(self.assertEquals, "0123456789")
         return d
 
+    def test_download_chunked(self):
+        request = Request(self.getURL('nolength'))
+        d = self.download_request(request, BaseSpider('foo'))
+        d.addCallback(lambda r: r.body)
+        d.addCallback(self.assertEquals, "nolength")
+        return d
+
+    def test_download_maxsize(self):
+        request = Request(self.getURL('file'), meta={'download_maxsize': 5})
+        d = self.download_request(request, BaseSpider('foo'))
+        return self.assertFailure(d, IgnoreRequest)
+
     def test_download_head(self):
         request = Request(self.getURL('file'), method='HEAD')
         d = self.download_request(request, BaseSpider('foo'))
@@ -132,11 +165,157 @@ class HttpTestCase(unittest.TestCase):
         return d
 
     def test_broken_download(self):
-        request = Request(self.getURL('broken'))
+        # the server only drops the connection (instead of keeping it alive
+        # waiting for the missing bytes) if asked to close it
+        request = Request(self.getURL('broken'), headers={'Connection': 'close'})
         d = self.download_request(request, BaseSpider('foo'))
         return self.assertFailure(d, PartialDownloadError)
 
 
+class KeepAliveProtocol(LineReceiver):
+    """HTTP/1.0 server which keeps connections alive and responds with the
+    number of the connection used"""
+
+    def connectionMade(self):
+        self.factory.connections.append(self)
+        self.number = len(self.factory.connections)
+
+    def lineReceived(self, line):
+        if not line:
+            body = str(self.number)
+            self.transport.write("HTTP/1.0 200 OK\r\n"
+                "Content-Length: %d\r\n"
+                "Connection: Keep-Alive\r\n"
+                "\r\n%s" % (len(body), body))
+
+    def connectionLost(self, reason):
+        self.factory.closed.append(self)
+        if len(self.factory.closed) == len(self.factory.connections):
+            self.factory.allclosed.callback(None)
+
+
+class HttpKeepAliveTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.factory = ServerFactory()
+        self.factory.protocol = KeepAliveProtocol
+        self.factory.connections = []
+        self.factory.closed = []
+        self.factory.allclosed = defer.Deferred()
+        self.port = reactor.listenTCP(0, self.factory, interface='127.0.0.1')
+        self.portno = self.port.getHost().port
+        self.pool = HTTPConnectionPool(maxperhost=1)
+        self.handler = HttpDownloadHandler(pool=self.pool)
+
+    def tearDown(self):
+        self.handler.close()
+        self.factory.allclosed.addCallback(lambda _: self.port.stopListening())
+        return self.factory.allclosed
+
+    def getURL(self, path):
+        return "http://127.0.0.1:%d/%s" % (self.portno, path)
+
+    @defer.inlineCallbacks
+    def test_reuse_connection(self):
+        spider = BaseSpider('foo')
+        r1 = yield self.handler.download_request(Request(self.getURL('a')), spider)
+        r2 = yield self.handler.download_request(Request(self.getURL('b')), spider)
+        self.assertEquals(r1.body, '1')
+        self.assertEquals(r2.body, '1')
+        self.assertEquals((self.pool.hits, self.pool.misses), (1, 1))
+
+    @defer.inlineCallbacks
+    def test_concurrent_requests(self):
+        spider = BaseSpider('foo')
+        responses = yield defer.gatherResults([ \
+            self.handler.download_request(Request(self.getURL('a')), spider), \
+            self.handler.download_request(Request(self.getURL('b')), spider)])
+        self.assertEquals(sorted(r.body for r in responses), ['1', '2'])
+        # only one idle connection is kept per host
+        self.assertEquals(len(self.pool), 1)
+        self.assertEquals(self.pool.evictions, 1)
+        r = yield self.handler.download_request(Request(self.getURL('c')), spider)
+        self.assertEquals(self.pool.hits, 1)
+        self.assert_(r.body in ('1', '2'))
+
+
+class DroppingKeepAliveProtocol(KeepAliveProtocol):
+    """Server which closes the kept alive connections, without responding,
+    when they receive a second request"""
+
+    requests = 0
+
+    def lineReceived(self, line):
+        if not line:
+            self.requests += 1
+            if self.requests > 1:
+                self.transport.loseConnection()
+                return
+        KeepAliveProtocol.lineReceived(self, line)
+
+    def connectionLost(self, reason):
+        self.factory.closed.append(self)
+
+
+class HttpKeepAliveRetryTestCase(unittest.TestCase):
+
+    clientfactory = ScrapyHTTPClientFactory
+
+    def setUp(self):
+        self.factory = ServerFactory()
+        self.factory.protocol = DroppingKeepAliveProtocol
+        self.factory.connections = []
+        self.factory.closed = []
+        self.wrapper = WrappingFactory(self.factory)
+        self.port = reactor.listenTCP(0, self.wrapper, interface='127.0.0.1')
+        self.portno = self.port.getHost().port
+        self.pool = HTTPConnectionPool(maxperhost=1)
+        self.handler = HttpDownloadHandler(self.clientfactory, pool=self.pool)
+
+    def tearDown(self):
+        d = close_connections(self.handler, self.wrapper)
+        return d.addCallback(lambda _: self.port.stopListening())
+
+    def getURL(self, path):
+        return "http://127.0.0.1:%d/%s" % (self.portno, path)
+
+    @defer.inlineCallbacks
+    def test_retry_on_new_connection(self):
+        spider = BaseSpider('foo')
+        r1 = yield self.handler.download_request(Request(self.getURL('a')), spider)
+        r2 = yield self.handler.download_request(Request(self.getURL('b')), spider)
+        self.assertEquals(r1.body, '1')
+        self.assertEquals(r2.body, '2')
+        self.assertEquals((self.pool.hits, self.pool.misses), (1, 1))
+
+    @defer.inlineCallbacks
+    def test_retry_only_once(self):
+        spider = BaseSpider('foo')
+        yield self.handler.download_request(Request(self.getURL('a')), spider)
+        # the request is not resent if the new connection is dropped too
+        DroppingKeepAliveProtocol.requests = 1
+        try:
+            d = self.handler.download_request(Request(self.getURL('b')), spider)
+            yield self.assertFailure(d, ConnectionDone)
+        finally:
+            DroppingKeepAliveProtocol.requests = 0
+        self.assertEquals(len(self.factory.connections), 2)
+
+    @defer.inlineCallbacks
+    def test_no_retry_for_post(self):
+        spider = BaseSpider('foo')
+        yield self.handler.download_request(Request(self.getURL('a')), spider)
+        d = self.handler.download_request(Request(self.getURL('b'), \
+            method='POST', headers={'Connection': 'keep-alive'}), spider)
+        yield self.assertFailure(d, ConnectionDone)
+        self.assertEquals(len(self.factory.connections), 1)
+
+
+class Http11KeepAliveRetryTestCase(HttpKeepAliveRetryTestCase):
+
+    clientfactory = ScrapyHTTP11ClientFactory
+
+
 class UriResource(resource.Resource):
     """Return the full uri that was requested"""
 
@@ -151,13 +330,15 @@ class HttpProxyTestCase(unittest.TestCase):
 
     def setUp(self):
         site = server.Site(UriResource(), timeout=None)
-        wrapper = WrappingFactory(site)
-        self.port = reactor.listenTCP(0, wrapper, interface='127.0.0.1')
+        self.wrapper = WrappingFactory(site)
+        self.port = reactor.listenTCP(0, self.wrapper, interface='127.0.0.1')
         self.portno = self.port.getHost().port
-        self.download_request = HttpDownloadHandler().download_request
+        self.download_handler = HttpDownloadHandler()
+        self.download_request = self.download_handler.download_request
 
     def tearDown(self):
-        return self.port.stopListening()
+        d = close_connections(self.download_handler, self.wrapper)
+        return d.addCallback(lambda _: self.port.stopListening())
 
     def getURL(self, path):
         return "http://127.0.0.1:%d/%s" % (self.portno, path)
@@ -1,8 +1,10 @@
 import unittest, tempfile, shutil, time
+from email.utils import formatdate
 
 from scrapy.http import Response, HtmlResponse, Request
 from scrapy.spider import BaseSpider
-from scrapy.contrib.downloadermiddleware.httpcache import FilesystemCacheStorage, HttpCacheMiddleware
+from scrapy.contrib.downloadermiddleware.httpcache import FilesystemCacheStorage, \
+    SqliteCacheStorage, HttpCacheMiddleware
 from scrapy.settings import Settings
 from scrapy.exceptions import IgnoreRequest
 
@@ -26,6 +28,8 @@ class HttpCacheMiddlewareTest(unittest.TestCase):
             'HTTPCACHE_DIR': self.tmpdir,
             'HTTPCACHE_EXPIRATION_SECS': 1,
             'HTTPCACHE_IGNORE_HTTP_CODES': [],
+            'HTTPCACHE_STORAGE': '%s.%s' % (self.storage_class.__module__, \
+                self.storage_class.__name__),
         }
         settings.update(new_settings)
         return Settings(settings)
@@ -136,12 +140,146 @@ class HttpCacheMiddlewareTest(unittest.TestCase):
         self.assertEqualResponse(self.response, response)
         assert 'cached' in response.flags
 
+    def test_storage_reopen(self):
+        storage = self._get_storage(HTTPCACHE_EXPIRATION_SECS=0)
+        storage.open_spider(self.spider)
+        storage.store_response(self.spider, self.request, self.response)
+        storage.close_spider(self.spider)
+        storage = self._get_storage(HTTPCACHE_EXPIRATION_SECS=0)
+        storage.open_spider(self.spider)
+        response = storage.retrieve_response(self.spider, self.request)
+        self.assertEqualResponse(self.response, response)
+        storage.close_spider(self.spider)
+
     def assertEqualResponse(self, response1, response2):
         self.assertEqual(response1.url, response2.url)
         self.assertEqual(response1.status, response2.status)
         self.assertEqual(response1.headers, response2.headers)
         self.assertEqual(response1.body, response2.body)
 
+
+class SqliteCacheStorageTest(HttpCacheMiddlewareTest):
+
+    storage_class = SqliteCacheStorage
+
+    def test_storage_compress(self):
+        storage = self._get_storage(HTTPCACHE_COMPRESS=True)
+        storage.store_response(self.spider, self.request, self.response)
+        response = storage.retrieve_response(self.spider, self.request)
+        self.assertEqualResponse(self.response, response)
+        storage.close_spider(self.spider)
+        # compressed responses can still be read with compression disabled
+        storage = self._get_storage(HTTPCACHE_COMPRESS=False)
+        response = storage.retrieve_response(self.spider, self.request)
+        self.assertEqualResponse(self.response, response)
+        storage.close_spider(self.spider)
+
+
+class RFC2616PolicyTest(unittest.TestCase):
+
+    def setUp(self):
+        self.spider = BaseSpider('example.com')
+        self.tmpdir = tempfile.mkdtemp()
+        self.mw = HttpCacheMiddleware(Settings({
+            'HTTPCACHE_ENABLED': True,
+            'HTTPCACHE_DIR': self.tmpdir,
+            'HTTPCACHE_EXPIRATION_SECS': 0,
+            'HTTPCACHE_POLICY': 'scrapy.contrib.downloadermiddleware.httpcache.RFC2616Policy',
+        }))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _response(self, status=200, body='test body', age=0, \
+            url='http://www.example.com', **headers):
+        headers = dict((k.replace('_', '-'), v) for k, v in headers.items())
+        headers.setdefault('Date', formatdate(time.time() - age, usegmt=True))
+        return Response(url, status=status, headers=headers, body=body)
+
+    def _cache(self, response):
+        request = Request(response.url)
+        assert self.mw.process_request(request, self.spider) is None
+        self.mw.process_response(request, response, self.spider)
+        return Request(response.url)
+
+    def test_fresh_response(self):
+        request = self._cache(self._response(Cache_Control='max-age=600'))
+        cached = self.mw.process_request(request, self.spider)
+        assert isinstance(cached, Response)
+        assert 'cached' in cached.flags
+        self.assertEqual(cached.body, 'test body')
+
+    def test_expires(self):
+        expires = formatdate(time.time() + 600, usegmt=True)
+        request = self._cache(self._response(Expires=expires))
+        assert isinstance(self.mw.process_request(request, self.spider), Response)
+        request = self._cache(self._response(Expires='0', \
+            url='http://www.example.com/expired'))
+        assert self.mw.process_request(request, self.spider) is None
+
+    def test_uncacheable_responses(self):
+        for n, response in enumerate([
+                self._response(Cache_Control='no-store, max-age=600'),
+                self._response(), # no validators nor expiration
+                self._response(status=302)]):
+            response = response.replace(url='http://www.example.com/%d' % n)
+            request = self._cache(response)
+            assert self.mw.process_request(request, self.spider) is None
+            assert '_cached_response' not in request.meta
+
+    def test_ignore_missing(self):
+        stale = self._cache(self._response(age=3600, ETag='"abc"'))
+        fresh = self._cache(self._response(Cache_Control='max-age=600', \
+            url='http://www.example.com/fresh'))
+        self.mw.ignore_missing = True
+        # stale responses are not revalidated either
+        self.assertRaises(IgnoreRequest, self.mw.process_request, stale, self.spider)
+        assert 'If-None-Match' not in stale.headers
+        assert isinstance(self.mw.process_request(fresh, self.spider), Response)
+
+    def test_fresh_check_keeps_request(self):
+        response = self._response(age=3600, ETag='"abc"')
+        request = Request(response.url)
+        assert not self.mw.policy.is_cached_response_fresh(response, request)
+        assert 'If-None-Match' not in request.headers
+
+    def test_no_cache_request(self):
+        request = self._cache(self._response(Cache_Control='max-age=600'))
+        request.headers['Cache-Control'] = 'no-cache'
+        assert self.mw.process_request(request, self.spider) is None
+
+    def test_revalidation(self):
+        lastmodified = formatdate(time.time() - 3700, usegmt=True)
+        response = self._response(age=3600, ETag='"abc"', \
+            Last_Modified=lastmodified)
+        request = self._cache(response)
+        # stale (heuristic freshness of 10 secs), so it must be revalidated
+        assert self.mw.process_request(request, self.spider) is None
+        self.assertEqual(request.headers['If-None-Match'], '"abc"')
+        self.assertEqual(request.headers['If-Modified-Since'], lastmodified)
+        notmodified = self._response(status=304, body='', \
+            Cache_Control='max-age=600')
+        cached = self.mw.process_response(request, notmodified, self.spider)
+        self.assertEqual(cached.status, 200)
+        self.assertEqual(cached.body, 'test body')
+        assert 'cached' in cached.flags
+        # the headers of the 304 response make it fresh again
+        request = Request('http://www.example.com')
+        cached = self.mw.process_request(request, self.spider)
+        assert isinstance(cached, Response)
+        self.assertEqual(cached.body, 'test body')
+
+    def test_revalidation_changed(self):
+        request = self._cache(self._response(age=3600, ETag='"abc"'))
+        assert self.mw.process_request(request, self.spider) is None
+        changed = self._response(body='new body', Cache_Control='max-age=600')
+        response = self.mw.process_response(request, changed, self.spider)
+        self.assertEqual(response.body, 'new body')
+        request = Request('http://www.example.com')
+        cached = self.mw.process_request(request, self.spider)
+        self.assertEqual(cached.body, 'new body')
+
+
 if __name__ == '__main__':
     unittest.main()
 
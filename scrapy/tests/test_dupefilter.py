@@ -1,8 +1,13 @@
+import os
 import unittest
+import tempfile
+import shutil
 
 from scrapy.http import Request
 from scrapy.spider import BaseSpider
-from scrapy.contrib.dupefilter import RequestFingerprintDupeFilter, NullDupeFilter
+from scrapy.contrib.dupefilter import RequestFingerprintDupeFilter, \
+    CompactFingerprintDupeFilter, NullDupeFilter
+from scrapy.stats import stats
 
 
 class RequestFingerprintDupeFilterTest(unittest.TestCase):
@@ -24,6 +29,109 @@ class RequestFingerprintDupeFilterTest(unittest.TestCase):
 
         filter.close_spider(spider)
 
+    def test_persistence(self):
+        path = tempfile.mkdtemp()
+        try:
+            spider = BaseSpider('foo')
+            r1 = Request('http://scrapytest.org/1')
+            r2 = Request('http://scrapytest.org/2')
+
+            filter = RequestFingerprintDupeFilter(path)
+            filter.open_spider(spider)
+            assert not filter.request_seen(spider, r1)
+            assert not filter.request_seen(spider, r2, dont_record=True)
+            filter.close_spider(spider)
+
+            filter = RequestFingerprintDupeFilter(path)
+            filter.open_spider(spider)
+            assert filter.request_seen(spider, r1)
+            assert not filter.request_seen(spider, r2)
+            filter.close_spider(spider)
+
+            # other spiders don't share the seen requests
+            spider2 = BaseSpider('bar')
+            filter.open_spider(spider2)
+            assert not filter.request_seen(spider2, r1)
+            filter.close_spider(spider2)
+        finally:
+            shutil.rmtree(path)
+
+
+    def test_flush(self):
+        path = tempfile.mkdtemp()
+        try:
+            spider = BaseSpider('foo')
+            r1 = Request('http://scrapytest.org/1')
+            r2 = Request('http://scrapytest.org/2')
+            filter = RequestFingerprintDupeFilter(path)
+            filter.open_spider(spider)
+            filter.request_seen(spider, r1)
+            # fingerprints are only written when flushed
+            self.assertEqual(open(os.path.join(path, 'foo')).read(), '')
+            filter.flush(spider)
+            filter.request_seen(spider, r2)
+
+            # reopened without closing it, as if the process died
+            filter2 = RequestFingerprintDupeFilter(path)
+            filter2.open_spider(spider)
+            assert filter2.request_seen(spider, r1, dont_record=True)
+            assert not filter2.request_seen(spider, r2, dont_record=True)
+            filter2.close_spider(spider)
+            filter.close_spider(spider)
+        finally:
+            shutil.rmtree(path)
+
+
+class CompactFingerprintDupeFilterTest(unittest.TestCase):
+
+    def _test_filter(self, filter):
+        spider = BaseSpider('foo')
+        stats.open_spider(spider)
+        filter.open_spider(spider)
+
+        r1 = Request('http://scrapytest.org/1')
+        r2 = Request('http://scrapytest.org/2')
+        r3 = Request('http://scrapytest.org/2')
+
+        assert not filter.request_seen(spider, r1)
+        assert filter.request_seen(spider, r1)
+        assert not filter.request_seen(spider, r2)
+        assert filter.request_seen(spider, r3)
+
+        filter.close_spider(spider)
+        self.assertEqual(stats.get_value('dupefilter/fingerprints', \
+            spider=spider), 2)
+        assert stats.get_value('dupefilter/memory', spider=spider) > 0
+        assert stats.get_value('dupefilter/error_rate', spider=spider) < 0.01
+        stats.close_spider(spider, 'finished')
+
+    def test_filter(self):
+        self._test_filter(CompactFingerprintDupeFilter())
+
+    def test_filter_128bits(self):
+        self._test_filter(CompactFingerprintDupeFilter(bits=128))
+
+    def test_filter_bloom(self):
+        self._test_filter(CompactFingerprintDupeFilter(error_rate=0.001))
+
+    def test_persistence(self):
+        path = tempfile.mkdtemp()
+        try:
+            spider = BaseSpider('foo')
+            r1 = Request('http://scrapytest.org/1')
+            stats.open_spider(spider)
+            filter = CompactFingerprintDupeFilter(path)
+            filter.open_spider(spider)
+            assert not filter.request_seen(spider, r1)
+            filter.close_spider(spider)
+            filter = CompactFingerprintDupeFilter(path)
+            filter.open_spider(spider)
+            assert filter.request_seen(spider, r1)
+            filter.close_spider(spider)
+            stats.close_spider(spider, 'finished')
+        finally:
+            shutil.rmtree(path)
+
 
 class NullDupeFilterTest(unittest.TestCase):
 
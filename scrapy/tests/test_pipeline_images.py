@@ -4,6 +4,15 @@ from tempfile import mkdtemp
 from shutil import rmtree
 
 from twisted.trial import unittest
+from twisted.internet import defer
+
+from scrapy.http import Request, Response
+from scrapy.spider import BaseSpider
+from scrapy.stats import stats
+from scrapy.utils.misc import md5sum
+from scrapy.utils.test import FakeS3Server
+from scrapy.conf import settings
+from scrapy import optional_features
 
 
 try:
@@ -86,6 +95,122 @@ class ImagesPipelineTestCase(unittest.TestCase):
         self.assertEquals(converted.mode, 'RGB')
         self.assertEquals(converted.getcolors(), [(10000, (205, 230, 255))])
 
+    @defer.inlineCallbacks
+    def test_process_item(self):
+        spider = BaseSpider('images.com')
+        stats.open_spider(spider)
+        self.pipeline.THUMBS = {'small': (10, 10)}
+        self.pipeline.open_spider(spider)
+        self.assertTrue(self.pipeline.threadpool is not None)
+        buf = StringIO()
+        Image.new('RGB', (100, 100), (0, 127, 255)).save(buf, 'JPEG')
+        url = 'http://www.example.com/image.jpg'
+        response = Response(url, body=buf.getvalue())
+        item = {'image_urls': [url]}
+        self.pipeline.get_media_requests = lambda item, info: \
+            [Request(url, meta={'response': response})]
+        try:
+            item = yield self.pipeline.process_item(item, spider)
+        finally:
+            self.pipeline.close_spider(spider)
+        self.assertTrue(self.pipeline.threadpool is None)
+
+        [image] = item['images']
+        self.assertEqual(image['path'], self.pipeline.image_key(url))
+        for key in [image['path'], self.pipeline.thumb_key(url, 'small')]:
+            path = self.pipeline.store._get_filesystem_path(key)
+            self.assertTrue(os.path.exists(path))
+        path = self.pipeline.store._get_filesystem_path(image['path'])
+        self.assertEqual(image['checksum'], md5sum(open(path, 'rb')))
+        for stage in ['stat', 'convert', 'checksum', 'persist']:
+            self.assert_(stats.get_value('image_time/%s' % stage, \
+                spider=spider) is not None)
+        stats.close_spider(spider, 'finished')
+
+
+    @defer.inlineCallbacks
+    def test_index(self):
+        from scrapy.contrib.pipeline.images import ImagesPipeline
+        ImagesPipeline.INDEX_ENABLED = True
+        try:
+            pipeline = ImagesPipeline(self.tempdir, \
+                download_func=_mocked_download_func)
+        finally:
+            ImagesPipeline.INDEX_ENABLED = False
+        pipeline.THUMBS = {'small': (10, 10)}
+        spider = BaseSpider('images.com')
+        stats.open_spider(spider)
+        pipeline.open_spider(spider)
+        buf = StringIO()
+        Image.new('RGB', (100, 100), (0, 127, 255)).save(buf, 'JPEG')
+        urls = ['http://www.example.com/1.jpg', 'http://www.example.com/2.jpg']
+        responses = dict((x, Response(x, body=buf.getvalue())) for x in urls)
+        pipeline.get_media_requests = lambda item, info: [Request(x, \
+            meta={'response': responses[x]}) for x in item['image_urls']]
+        try:
+            item = yield pipeline.process_item({'image_urls': urls[:1]}, spider)
+            item = yield pipeline.process_item({'image_urls': urls[1:]}, spider)
+            # identical images are stored only once
+            [image] = item['images']
+            self.assertEqual(image['path'], pipeline.image_key(urls[0]))
+            self.assertFalse(os.path.exists(pipeline.store. \
+                _get_filesystem_path(pipeline.image_key(urls[1]))))
+            # but their thumbnails are
+            for x in urls:
+                self.assertTrue(os.path.exists(pipeline.store. \
+                    _get_filesystem_path(pipeline.thumb_key(x, 'small'))))
+            self.assertEqual(pipeline.index.stat_image( \
+                pipeline.image_key(urls[1]))['width'], 100)
+
+            # the store isn't checked for images in the index
+            pipeline.store.stat_image = lambda key, info: self.fail()
+            for x in urls:
+                result = yield pipeline.media_to_download(Request(x), \
+                    pipeline.spiderinfo[spider])
+                self.assertEqual(result['path'], pipeline.image_key(urls[0]))
+                self.assertEqual(result['checksum'], image['checksum'])
+
+            # unless they've expired
+            key = pipeline.image_key(urls[0])
+            stat = pipeline.index.stat_image(key)
+            stat['last_modified'] -= (pipeline.EXPIRES + 1) * 24 * 60 * 60
+            pipeline.index.stats[key] = stat
+            pipeline.store.stat_image = lambda key, info: {}
+            result = yield pipeline.media_to_download(Request(urls[0]), \
+                pipeline.spiderinfo[spider])
+            self.assertEqual(result, None)
+            # and there's no separate media index
+            self.assertEqual(pipeline.spiderinfo[spider].index, None)
+        finally:
+            pipeline.close_spider(spider)
+            stats.close_spider(spider, 'finished')
+
+    @defer.inlineCallbacks
+    def test_s3_store(self):
+        if 'boto' not in optional_features:
+            raise unittest.SkipTest('missing boto library')
+        from scrapy.contrib.pipeline.images import S3ImagesStore
+        server = FakeS3Server()
+        server.start()
+        settings.overrides['AWS_S3_ENDPOINT'] = server.url
+        S3ImagesStore.AWS_ACCESS_KEY_ID = 'key'
+        S3ImagesStore.AWS_SECRET_ACCESS_KEY = 'secret'
+        try:
+            store = S3ImagesStore('s3://bucket/images/')
+            image, buf = self.pipeline.convert_image(Image.new('RGB', (20, 10)))
+            yield store.persist_image('full/1.jpg', image, buf, None)
+            data, headers = server.objects['/bucket/images/full/1.jpg']
+            self.assertEqual(data, buf.getvalue())
+            self.assertEqual(headers['x-amz-meta-width'], '20')
+            result = yield store.stat_image('full/1.jpg', None)
+            buf.seek(0)
+            self.assertEqual(result['checksum'], md5sum(buf))
+            self.assertEqual(server.connections, 2) # one per thread
+        finally:
+            S3ImagesStore.AWS_ACCESS_KEY_ID = None
+            S3ImagesStore.AWS_SECRET_ACCESS_KEY = None
+            del settings.overrides['AWS_S3_ENDPOINT']
+            server.stop()
 
 
 def _create_image(format, *a, **kw):
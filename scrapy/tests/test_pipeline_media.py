@@ -8,6 +8,7 @@ from scrapy.http import Request, Response
 from scrapy.spider import BaseSpider
 from scrapy.utils.request import request_fingerprint
 from scrapy.contrib.pipeline.media import MediaPipeline
+from scrapy.conf import settings
 from scrapy.utils.test import get_crawler
 from scrapy.utils.signal import disconnect_all
 from scrapy import signals
@@ -215,13 +216,17 @@ class MediaPipelineTestCase(BaseMediaPipelineTestCase):
         self.assertTrue(new_item is item)
         self.assertEqual(new_item['results'], [(True, rsp1)])
 
-        # rsp2 is ignored, rsp1 must be in results because request fingerprints are the same
+        # rsp2 is ignored, the cached summary of rsp1 (without body) must be
+        # in results because request fingerprints are the same
         req2 = Request(req1.url, meta=dict(response=Response('http://donot.download.me')))
         item = dict(requests=req2)
         new_item = yield self.pipe.process_item(item, self.spider)
         self.assertTrue(new_item is item)
         self.assertEqual(request_fingerprint(req1), request_fingerprint(req2))
-        self.assertEqual(new_item['results'], [(True, rsp1)])
+        [(ok, rsp)] = new_item['results']
+        self.assertTrue(ok)
+        self.assertEqual(rsp.url, rsp1.url)
+        self.assertEqual(rsp.body, '')
 
     @inlineCallbacks
     def test_results_are_cached_for_requests_of_single_item(self):
@@ -258,6 +263,16 @@ class MediaPipelineTestCase(BaseMediaPipelineTestCase):
         new_item = yield self.pipe.process_item(item, self.spider)
         self.assertEqual(new_item['results'], [(True, rsp1), (True, rsp1)])
 
+    @inlineCallbacks
+    def test_cached_failures_are_cleaned(self):
+        self.pipe.LOG_FAILED_RESULTS = False
+        fail = Failure(Exception())
+        req = Request('url1', meta=dict(response=fail))
+        yield self.pipe.process_item(dict(requests=req), self.spider)
+        cached = self.info.downloaded[request_fingerprint(req)]
+        self.assertTrue(cached is fail)
+        self.assertEqual(cached.tb, None)
+
     @inlineCallbacks
     def test_use_media_to_download_result(self):
         req = Request('url', meta=dict(result='ITSME', response=self.fail))
@@ -266,3 +281,70 @@ class MediaPipelineTestCase(BaseMediaPipelineTestCase):
         self.assertEqual(new_item['results'], [(True, 'ITSME')])
         self.assertEqual(self.pipe._mockcalled, \
                 ['get_media_requests', 'media_to_download', 'item_completed'])
+
+
+class MediaPipelineCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.spider = BaseSpider('media.com')
+        settings.overrides['MEDIA_CACHE_SIZE'] = 2
+        settings.overrides['MEDIA_INDEX_ENABLED'] = True
+        settings.overrides['SQLITE_DB'] = ':memory:'
+
+    def tearDown(self):
+        del settings.overrides['MEDIA_CACHE_SIZE']
+        del settings.overrides['MEDIA_INDEX_ENABLED']
+        del settings.overrides['SQLITE_DB']
+
+    def _process(self, pipe, urls):
+        item = dict(requests=[Request(x, meta=dict(response=Response(x, \
+            body='body'))) for x in urls])
+        return pipe.process_item(item, self.spider)
+
+    @inlineCallbacks
+    def test_cache_size(self):
+        settings.overrides['MEDIA_INDEX_ENABLED'] = False
+        pipe = MockedMediaPipeline(download_func=_mocked_download_func)
+        pipe.open_spider(self.spider)
+        info = pipe.spiderinfo[self.spider]
+        yield self._process(pipe, ['url1', 'url2', 'url3'])
+        self.assertEqual(len(info.downloaded), 2)
+        fp1, fp3 = [request_fingerprint(Request(x)) for x in ['url1', 'url3']]
+        self.assertFalse(fp1 in info.downloaded)
+        self.assertEqual(info.downloaded[fp3].body, '')
+        pipe.close_spider(self.spider)
+
+    @inlineCallbacks
+    def test_index(self):
+        pipe = MockedMediaPipeline(download_func=_mocked_download_func)
+        pipe.open_spider(self.spider)
+        index = pipe.spiderinfo[self.spider].index
+        yield self._process(pipe, ['url1', 'url2', 'url3'])
+        self.assertEqual(len(index), 3)
+
+        # a result evicted from the memory cache is taken from the index (by
+        # media_to_download) instead of downloading it again
+        pipe._mockcalled = []
+        item = yield self._process(pipe, ['url1'])
+        self.assertEqual(pipe._mockcalled, \
+            ['get_media_requests', 'media_to_download', 'item_completed'])
+        [(ok, rsp)] = item['results']
+        self.assertEqual(rsp.url, 'url1')
+        pipe.close_spider(self.spider)
+
+    @inlineCallbacks
+    def test_index_expires(self):
+        pipe = MockedMediaPipeline(download_func=_mocked_download_func)
+        pipe.open_spider(self.spider)
+        index = pipe.spiderinfo[self.spider].index
+        yield self._process(pipe, ['url1', 'url2', 'url3'])
+        fp = request_fingerprint(Request('url1'))
+        indexed, result = index[fp]
+        index[fp] = (indexed - 91 * 24 * 60 * 60, result)
+        pipe._mockcalled = []
+        yield self._process(pipe, ['url1'])
+        self.assertEqual(pipe._mockcalled, ['get_media_requests', \
+            'media_to_download', 'download', 'media_downloaded', \
+            'item_completed'])
+        self.assert_(index[fp][0] > indexed)
+        pipe.close_spider(self.spider)
@@ -0,0 +1,207 @@
+import os
+import unittest
+import tempfile
+import shutil
+
+from scrapy.http import Request
+from scrapy.spider import BaseSpider
+from scrapy.core.scheduler import Scheduler, DiskPriorityQueue
+from scrapy.exceptions import IgnoreRequest
+from scrapy.conf import settings
+
+
+class TestSpider(BaseSpider):
+    name = 'test'
+
+    def parse(self, response):
+        pass
+
+
+class DiskPriorityQueueTest(unittest.TestCase):
+
+    dfo = False
+    window = 2
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.qpath = os.path.join(self.tmpdir, 'test')
+        self.spider = TestSpider()
+        self.q = DiskPriorityQueue(self.qpath, self.spider, dfo=self.dfo, \
+            window=self.window)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _pop_all(self):
+        l = []
+        while self.q:
+            r, pr = self.q.pop()
+            l.append((r.url, pr))
+        return l
+
+    def test_priorities(self):
+        for i, pr in [(1, 0), (2, -1), (3, 1), (4, 0), (5, -1)]:
+            self.q.push(Request('http://example.com/%d' % i), pr)
+        self.assertEqual(len(self.q), 5)
+        urls = self._pop_all()
+        self.assertEqual([pr for _, pr in urls], [-1, -1, 0, 0, 1])
+        self.assertEqual(len(self.q), 0)
+        self.assertRaises(IndexError, self.q.pop)
+
+    def test_order(self):
+        urls = ['http://example.com/%d' % i for i in range(10)]
+        for url in urls:
+            self.q.push(Request(url, callback=self.spider.parse))
+        if self.dfo:
+            urls.reverse()
+        result = []
+        while self.q:
+            r, _ = self.q.pop()
+            self.assertEqual(r.callback, self.spider.parse)
+            result.append(r.url)
+        self.assertEqual(result, urls)
+
+    def test_spills_to_disk(self):
+        for i in range(10):
+            self.q.push(Request('http://example.com/%d' % i), 0)
+        level = self.q.levels[0]
+        self.assertEqual(len(level.memory), self.window)
+        self.assertEqual(len(level.disk), 10 - self.window)
+
+    def test_unserializable_requests_kept_in_memory(self):
+        cb = lambda x: x
+        for i in range(5):
+            self.q.push(Request('http://example.com/%d' % i, callback=cb))
+        self.assertEqual(len(self.q), 5)
+        result = []
+        while self.q:
+            r, _ = self.q.pop()
+            self.assert_(r.callback is cb)
+            result.append(r.url)
+        self.assertEqual(sorted(result), \
+            ['http://example.com/%d' % i for i in range(5)])
+
+    def test_clear(self):
+        for i in range(10):
+            self.q.push(Request('http://example.com/%d' % i), i % 3)
+        self.q.clear()
+        self.assertEqual(len(self.q), 0)
+        self.assertEqual(os.listdir(self.qpath), [])
+        self.q.push(Request('http://example.com/'))
+        self.assertEqual(self.q.pop()[0].url, 'http://example.com/')
+
+    def test_close(self):
+        for i in range(10):
+            self.q.push(Request('http://example.com/%d' % i))
+        self.q.close()
+        self.failIf(os.path.exists(self.qpath))
+
+    def test_persist(self):
+        self.q.close()
+        q = DiskPriorityQueue(self.qpath, self.spider, dfo=self.dfo, \
+            window=self.window, persist=True)
+        urls = ['http://example.com/%d' % i for i in range(10)]
+        for i, url in enumerate(urls):
+            q.push(Request(url, callback=self.spider.parse), i % 2)
+        # requests which can't be serialized are lost
+        q.push(Request('http://example.com/lost', callback=lambda x: x), 5)
+        expected = [(u, 0) for u in urls[::2]] + [(u, 1) for u in urls[1::2]]
+        if self.dfo:
+            expected = expected[4::-1] + expected[:4:-1]
+        self.assertEqual(q.pop()[0].url, expected.pop(0)[0])
+        q.close()
+
+        q = DiskPriorityQueue(self.qpath, self.spider, dfo=self.dfo, \
+            window=self.window, persist=True)
+        self.assertEqual(len(q), 9)
+        result = []
+        while q:
+            r, pr = q.pop()
+            self.assertEqual(r.callback, self.spider.parse)
+            result.append((r.url, pr))
+        self.assertEqual(result, expected)
+        q.close()
+
+    def test_flush(self):
+        self.q.close()
+        q = DiskPriorityQueue(self.qpath, self.spider, dfo=self.dfo, \
+            window=self.window, persist=True)
+        urls = ['http://example.com/%d' % i for i in range(5)]
+        for url in urls:
+            q.push(Request(url))
+        q.flush()
+        # reopened without closing it, as if the process died
+        q = DiskPriorityQueue(self.qpath, self.spider, dfo=self.dfo, \
+            window=self.window, persist=True)
+        self.assertEqual(len(q), 5)
+        result = []
+        while q:
+            result.append(q.pop()[0].url)
+        if self.dfo:
+            urls.reverse()
+        self.assertEqual(result, urls)
+        q.close()
+        self.assertEqual(os.listdir(self.qpath), [])
+
+    def test_flush_popped_requests(self):
+        # requests popped from memory after the last flush are returned again
+        self.q.close()
+        q = DiskPriorityQueue(self.qpath, self.spider, dfo=self.dfo, \
+            window=self.window, persist=True)
+        urls = ['http://example.com/%d' % i for i in range(5)]
+        for url in urls:
+            q.push(Request(url))
+        q.flush()
+        q.pop()
+        q.pop()
+        q = DiskPriorityQueue(self.qpath, self.spider, dfo=self.dfo, \
+            window=self.window, persist=True)
+        result = []
+        while q:
+            result.append(q.pop()[0].url)
+        self.assertEqual(sorted(result), urls)
+        q.close()
+
+
+class DfoDiskPriorityQueueTest(DiskPriorityQueueTest):
+    dfo = True
+
+class SchedulerCheckpointTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        settings.overrides['JOBDIR'] = self.tmpdir
+        self.spider = TestSpider()
+
+    def tearDown(self):
+        del settings.overrides['JOBDIR']
+        shutil.rmtree(self.tmpdir)
+
+    def _scheduler(self):
+        scheduler = Scheduler()
+        scheduler.open_spider(self.spider)
+        return scheduler
+
+    def test_checkpoint(self):
+        scheduler = self._scheduler()
+        self.assert_(scheduler.checkpoints[self.spider].running)
+        urls = ['http://example.com/%d' % i for i in range(3)]
+        for url in urls:
+            scheduler.enqueue_request(self.spider, Request(url))
+        scheduler.checkpoint(self.spider)
+        # as if the process died before closing the spider
+        scheduler.checkpoints[self.spider].stop()
+
+        scheduler = self._scheduler()
+        for url in urls:
+            dfd = scheduler.enqueue_request(self.spider, Request(url))
+            # already seen
+            self.assert_(isinstance(dfd.result.value, IgnoreRequest))
+            dfd.addErrback(lambda _: None)
+        self.assertEqual(len(scheduler.pending_requests[self.spider]), 3)
+        scheduler.close_spider(self.spider)
+        self.assertEqual(scheduler.checkpoints, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import thread
+
+from twisted.trial import unittest
+from twisted.internet import defer
+
+from scrapy.core.scraper import Scraper
+from scrapy.http import Request, Response
+from scrapy.item import Item, Field
+from scrapy.spider import BaseSpider
+from scrapy.utils.test import get_crawler
+
+
+class TestItem(Item):
+    thread = Field()
+
+
+class TestSpider(BaseSpider):
+    name = 'test'
+
+    def parse(self, response):
+        for i in range(3):
+            yield TestItem(thread=thread.get_ident())
+
+    def parse_error(self, response):
+        yield TestItem(thread=thread.get_ident())
+        raise ValueError('parse error')
+
+    def parse_raise(self, response):
+        raise ValueError('parse error')
+
+
+class ThreadedSpider(TestSpider):
+    THREADED_CALLBACKS = True
+
+
+class ThreadedCallbacksTest(unittest.TestCase):
+
+    spider_class = ThreadedSpider
+
+    @defer.inlineCallbacks
+    def setUp(self):
+        crawler = get_crawler()
+        self.spider = self.spider_class()
+        self.spider.set_crawler(crawler)
+        self.scraper = Scraper(None, crawler.settings)
+        yield self.scraper.open_spider(self.spider)
+        self.response = Response('http://www.example.com')
+
+    def tearDown(self):
+        return self.scraper.close_spider(self.spider)
+
+    def _call(self, request):
+        dfd = self.scraper.call_spider(self.response, request, self.spider)
+        return dfd.addCallback(list)
+
+    @defer.inlineCallbacks
+    def test_threaded_callback(self):
+        output = yield self._call(Request('http://www.example.com'))
+        self.assertEqual(len(output), 3)
+        for item in output:
+            self.assertNotEqual(item['thread'], thread.get_ident())
+
+    @defer.inlineCallbacks
+    def test_meta_overrides_setting(self):
+        request = Request('http://www.example.com', \
+            meta={'threaded_callback': False})
+        output = yield self._call(request)
+        for item in output:
+            self.assertEqual(item['thread'], thread.get_ident())
+
+    @defer.inlineCallbacks
+    def test_error_after_output(self):
+        request = Request('http://www.example.com', \
+            callback=self.spider.parse_error)
+        output = yield self.scraper.call_spider(self.response, request, \
+            self.spider)
+        output = iter(output)
+        self.assert_(isinstance(output.next(), TestItem))
+        self.assertRaises(ValueError, output.next)
+
+    def test_error(self):
+        request = Request('http://www.example.com', \
+            callback=self.spider.parse_raise)
+        return self.assertFailure(self._call(request), ValueError)
+
+
+class NonThreadedCallbacksTest(ThreadedCallbacksTest):
+
+    spider_class = TestSpider
+
+    @defer.inlineCallbacks
+    def test_threaded_callback(self):
+        output = yield self._call(Request('http://www.example.com'))
+        for item in output:
+            self.assertEqual(item['thread'], thread.get_ident())
+
+    @defer.inlineCallbacks
+    def test_meta_overrides_setting(self):
+        request = Request('http://www.example.com', \
+            meta={'threaded_callback': True})
+        output = yield self._call(request)
+        for item in output:
+            self.assertNotEqual(item['thread'], thread.get_ident())
@@ -2,11 +2,14 @@
 Selectors tests, specific for lxml backend
 """
 
+from twisted.trial import unittest
+
 from scrapy.http import TextResponse, XmlResponse
 has_lxml = True
 try:
     from scrapy.selector.lxmlsel import XmlXPathSelector, HtmlXPathSelector, \
-        XPathSelector
+        XPathSelector, XPathCache, xpath_cache
+    from scrapy.selector.lxmldocument import LxmlDocument
 except ImportError:
     has_lxml = False
 from scrapy.utils.test import libxml2debug
@@ -34,3 +37,84 @@ class LxmlXPathSelectorTestCase(test_selector.XPathSelectorTestCase):
     #    xxs = XmlXPathSelector(text='<root>la\x00la</root>')
     #    self.assertEqual(xxs.extract(),
     #                     u'<root>la</root>')
+
+
+class XPathCacheTest(unittest.TestCase):
+
+    if not has_lxml:
+        skip = "lxml not available"
+
+    def test_cache(self):
+        cache = XPathCache(2)
+        x1 = cache.get('//a')
+        self.assert_(cache.get('//a') is x1)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        cache.get('//b')
+        cache.get('//c') # discards //a, the least recently used
+        self.assertEqual(len(cache), 2)
+        self.assert_(cache.get('//a') is not x1)
+        self.assertEqual((cache.hits, cache.misses), (1, 4))
+
+    def test_namespaces(self):
+        cache = XPathCache(10)
+        x1 = cache.get('//x:a', {'x': 'http://example.com/x'})
+        x2 = cache.get('//x:a', {'x': 'http://example.com/y'})
+        self.assert_(x1 is not x2)
+        self.assert_(cache.get('//x:a', {'x': 'http://example.com/x'}) is x1)
+
+    def test_invalid(self):
+        cache = XPathCache(10)
+        self.assertRaises(ValueError, cache.get, '//a[')
+        self.assertEqual(len(cache), 0)
+
+    def test_threads(self):
+        import sys, threading
+        cache = XPathCache(16)
+        errors = []
+        def run():
+            try:
+                for i in range(500):
+                    cache.get('//a[%d]' % (i % 40))
+            except Exception, e:
+                errors.append(e)
+        interval = sys.getcheckinterval()
+        sys.setcheckinterval(1)
+        try:
+            threads = [threading.Thread(target=run) for _ in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        finally:
+            sys.setcheckinterval(interval)
+        self.assertEqual(errors, [])
+        self.assertEqual(len(cache), 16)
+        self.assertEqual(len(cache.cache.keys()), 16)
+        self.assertEqual(cache.hits + cache.misses, 2000)
+
+    def test_selectors(self):
+        xpath_cache.clear()
+        body = '<root><a>1</a><a>2</a></root>'
+        for cls in HtmlXPathSelector, XmlXPathSelector:
+            xs = cls(text=body)
+            for a in xs.select('//a'):
+                a.select('text()')
+        self.assertEqual((xpath_cache.hits, xpath_cache.misses), (4, 2))
+
+
+class LxmlDocumentTest(unittest.TestCase):
+
+    if not has_lxml:
+        skip = "lxml not available"
+
+    def test_cache(self):
+        response = TextResponse('http://example.com', body='<p>text</p>')
+        hxs1 = HtmlXPathSelector(response)
+        hxs2 = HtmlXPathSelector(response)
+        self.assert_(hxs1.root is hxs2.root)
+        self.assert_(hxs1.root is LxmlDocument(response))
+        xxs = XmlXPathSelector(response)
+        self.assert_(xxs.root is not hxs1.root)
+        self.assertEqual(xxs.root.tag, 'p')
+        other = TextResponse('http://example.com', body='<p>text</p>')
+        self.assert_(HtmlXPathSelector(other).root is not hxs1.root)
@@ -5,6 +5,7 @@ import warnings
 from twisted.trial import unittest
 
 from scrapy.spider import BaseSpider
+from scrapy.http import XmlResponse, TextResponse
 from scrapy.contrib.spiders.init import InitSpider
 from scrapy.contrib.spiders.crawl import CrawlSpider
 from scrapy.contrib.spiders.feed import XMLFeedSpider, CSVFeedSpider
@@ -44,10 +45,69 @@ class XMLFeedSpiderTest(BaseSpiderTest):
 
     spider_class = XMLFeedSpider
 
+    def test_iterators(self):
+        body = """<?xml version="1.0" encoding="UTF-8"?>
+            <rss xmlns:g="http://base.google.com/ns/1.0"><channel>
+                <item><title>one</title><g:id>1</g:id></item>
+                <item><title>two</title><g:id>2</g:id></item>
+            </channel></rss>"""
+        response = XmlResponse(url='http://example.com/feed.xml', body=body)
+
+        class _XMLSpider(self.spider_class):
+            name = 'example'
+            namespaces = [('g', 'http://base.google.com/ns/1.0')]
+
+            def parse_node(self, response, selector):
+                selector.register_namespace(*self.namespaces[0])
+                return [{'title': selector.select('title/text()').extract(),
+                    'id': selector.select('g:id/text()').extract()}]
+
+        for iterator in ('iternodes', 'iterparse', 'xml'):
+            spider = _XMLSpider(iterator=iterator)
+            self.assertEqual(list(spider.parse(response)),
+                [{'title': [u'one'], 'id': [u'1']},
+                 {'title': [u'two'], 'id': [u'2']}], iterator)
+
 class CSVFeedSpiderTest(BaseSpiderTest):
 
     spider_class = CSVFeedSpider
 
+    def test_batch_size(self):
+        body = 'id,name\n1,one\n2,two\n3,three\n'
+        response = TextResponse(url='http://example.com/feed.csv', body=body)
+
+        class _CSVSpider(self.spider_class):
+            name = 'example'
+            batches = []
+
+            def parse_row(self, response, row):
+                return [row['name']]
+
+            def parse_batch(self, response, rows):
+                self.batches.append(len(rows))
+                return super(_CSVSpider, self).parse_batch(response, rows)
+
+        spider = _CSVSpider()
+        self.assertEqual(list(spider.parse(response)), [u'one', u'two', u'three'])
+        self.assertEqual(spider.batches, [])
+        spider = _CSVSpider(batch_size=2)
+        self.assertEqual(list(spider.parse(response)), [u'one', u'two', u'three'])
+        self.assertEqual(spider.batches, [2, 1])
+
+    def test_batch_size_wrong_type(self):
+        body = 'id,name\n1,one\n'
+        response = TextResponse(url='http://example.com/feed.csv', body=body)
+
+        class _CSVSpider(self.spider_class):
+            name = 'example'
+
+            def parse_row(self, response, row):
+                return row['name']
+
+        for batch_size in (None, 2):
+            spider = _CSVSpider(batch_size=batch_size)
+            self.assertRaises(TypeError, list, spider.parse(response))
+
 class CrawlSpiderTest(BaseSpiderTest):
 
     spider_class = CrawlSpider
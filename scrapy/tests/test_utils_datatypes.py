@@ -1,7 +1,8 @@
 import copy
 import unittest
 
-from scrapy.utils.datatypes import PriorityQueue, PriorityStack, CaselessDict
+from scrapy.utils.datatypes import PriorityQueue, PriorityStack, CaselessDict, \
+    LRUCache
 
 __doctests__ = ['scrapy.utils.datatypes']
 
@@ -200,6 +201,45 @@ class CaselessDictTest(unittest.TestCase):
         assert isinstance(h2, CaselessDict)
 
 
+class LRUCacheTest(unittest.TestCase):
+
+    def test_limit(self):
+        c = LRUCache(3)
+        for i in range(5):
+            c[i] = str(i)
+        self.assertEqual(len(c), 3)
+        self.assertEqual(c.keys(), [4, 3, 2])
+        self.failIf(0 in c)
+        self.assertRaises(KeyError, c.__getitem__, 0)
+        self.assertEqual(c.get(0, 'x'), 'x')
+
+    def test_recently_used(self):
+        c = LRUCache(3)
+        c['a'], c['b'], c['c'] = 1, 2, 3
+        self.assertEqual(c['a'], 1)
+        c['d'] = 4 # discards b
+        self.assertEqual(c.keys(), ['d', 'a', 'c'])
+        self.assertEqual(c.get('c'), 3)
+        c['a'] = 10 # updating a key also moves it to the front
+        c['e'] = 5 # discards d
+        self.assertEqual(c.keys(), ['e', 'a', 'c'])
+        self.assertEqual(c['a'], 10)
+
+    def test_delete(self):
+        c = LRUCache(3)
+        c['a'], c['b'], c['c'] = 1, 2, 3
+        del c['b']
+        self.assertEqual(c.pop('a'), 1)
+        self.assertEqual(c.pop('a', None), None)
+        self.assertRaises(KeyError, c.pop, 'a')
+        self.assertEqual(c.popitem(), ('c', 3))
+        self.assertEqual(len(c), 0)
+        self.assertRaises(KeyError, c.popitem)
+        c['x'] = 1
+        c.clear()
+        self.assertEqual(c.keys(), [])
+
+
 if __name__ == "__main__":
     unittest.main()
 
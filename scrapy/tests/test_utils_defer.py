@@ -2,8 +2,9 @@ from twisted.trial import unittest
 from twisted.internet import reactor, defer
 from twisted.python.failure import Failure
 
-from scrapy.utils.defer import mustbe_deferred, process_chain, \
-    process_chain_both, process_parallel, iter_errback
+from scrapy.exceptions import IgnoreRequest
+from scrapy.utils.defer import mustbe_deferred, maybe_deferred, process_chain, \
+    process_chain_both, process_parallel, iter_errback, parallel
 
 
 class MustbeDeferredTest(unittest.TestCase):
@@ -31,6 +32,53 @@ class MustbeDeferredTest(unittest.TestCase):
         steps.append(2) # add another value, that should be catched by assertEqual
         return dfd
 
+class MaybeDeferredTest(unittest.TestCase):
+    def test_success_function(self):
+        steps = []
+        def _append(v):
+            steps.append(v)
+            return steps
+
+        dfd = maybe_deferred(_append, 1)
+        dfd.addCallback(self.assertEqual, [1])
+        steps.append(2)
+        return dfd
+
+    def test_ignore_request(self):
+        def _ignore():
+            raise IgnoreRequest('ignored')
+
+        dfd = maybe_deferred(_ignore)
+        return self.assertFailure(dfd, IgnoreRequest)
+
+    def test_failure_result(self):
+        dfd = maybe_deferred(lambda: Failure(TypeError()))
+        return self.assertFailure(dfd, TypeError)
+
+class ParallelTest(unittest.TestCase):
+
+    @defer.inlineCallbacks
+    def test_synchronous_calls(self):
+        results = []
+        yield parallel(range(10), 3, results.append)
+        self.assertEqual(results, range(10))
+
+    @defer.inlineCallbacks
+    def test_concurrency(self):
+        active = []
+        maxactive = []
+        def _call(n):
+            active.append(n)
+            maxactive.append(len(active))
+            d = defer.Deferred()
+            d.addCallback(lambda _: active.remove(n))
+            reactor.callLater(0.01 * (n % 3), d.callback, None)
+            return d
+        yield parallel(range(10), 3, _call)
+        self.assertEqual(active, [])
+        self.assertEqual(len(maxactive), 10)
+        self.assertEqual(max(maxactive), 3)
+
 def cb1(value, arg1, arg2):
     return "(cb1 %s %s %s)" % (value, arg1, arg2)
 def cb2(value, arg1, arg2):
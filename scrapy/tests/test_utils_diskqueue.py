@@ -0,0 +1,200 @@
+import os
+import unittest
+import tempfile
+import shutil
+
+from scrapy.utils.diskqueue import FifoDiskQueue, LifoDiskQueue
+
+
+class FifoDiskQueueTest(unittest.TestCase):
+
+    chunksize = 100000
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.qdir = os.path.join(self.tmpdir, 'queue')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def queue(self):
+        return FifoDiskQueue(self.qdir, chunksize=self.chunksize)
+
+    def test_empty(self):
+        q = self.queue()
+        self.assertEqual(len(q), 0)
+        self.assertEqual(q.pop(), None)
+        q.close()
+
+    def test_push_pop(self):
+        q = self.queue()
+        q.push('a')
+        q.push('b')
+        q.push('')
+        self.assertEqual(len(q), 3)
+        self.assertEqual(q.pop(), 'a')
+        q.push('c')
+        self.assertEqual(q.pop(), 'b')
+        self.assertEqual(q.pop(), '')
+        self.assertEqual(q.pop(), 'c')
+        self.assertEqual(q.pop(), None)
+        self.assertEqual(len(q), 0)
+        q.close()
+
+    def test_binary_element(self):
+        elem = ''.join(map(chr, range(256)))
+        q = self.queue()
+        q.push(elem)
+        self.assertEqual(q.pop(), elem)
+        q.close()
+
+    def test_close_open(self):
+        q = self.queue()
+        for x in ['a', 'b', 'c']:
+            q.push(x)
+        self.assertEqual(q.pop(), 'a')
+        q.close()
+        del q
+
+        q = self.queue()
+        self.assertEqual(len(q), 2)
+        q.push('d')
+        self.assertEqual([q.pop() for _ in range(3)], ['b', 'c', 'd'])
+        q.close()
+
+    def test_cleanup(self):
+        q = self.queue()
+        q.push('a')
+        q.pop()
+        q.close()
+        self.failIf(os.path.exists(self.qdir))
+
+    def test_many(self):
+        q = self.queue()
+        values = [str(i) for i in range(1000)]
+        for x in values:
+            q.push(x)
+        self.assertEqual([q.pop() for _ in values], values)
+        self.assertEqual(q.pop(), None)
+        q.close()
+
+    def test_reopen_without_closing(self):
+        # as if the process died: records pushed after the last flush are
+        # recovered, and those popped after it are returned again (unless
+        # their chunk was removed)
+        q = self.queue()
+        for x in ['a', 'b', 'c']:
+            q.push(x)
+        self.assertEqual(q.pop(), 'a')
+        q.flush()
+        q.push('d')
+        q.push('e')
+        self.assertEqual(q.pop(), 'b')
+
+        q = self.queue()
+        q.push('f')
+        result = [q.pop() for _ in range(len(q))]
+        if self.chunksize == 1:
+            self.assertEqual(result, ['c', 'd', 'e', 'f'])
+        else:
+            self.assertEqual(result, ['b', 'c', 'd', 'e', 'f'])
+        self.assertEqual(q.pop(), None)
+        q.close()
+        self.failIf(os.path.exists(self.qdir))
+
+    def test_incomplete_record(self):
+        q = self.queue()
+        q.push('a')
+        q.push('b')
+        q.flush()
+        # a record only partially written when the process died
+        chunk = sorted(x for x in os.listdir(self.qdir) if x.startswith('q'))[-1]
+        f = open(os.path.join(self.qdir, chunk), 'ab')
+        f.write('\x00\x00\x00\x10abc')
+        f.close()
+
+        q = self.queue()
+        self.assertEqual(len(q), 2)
+        q.push('c')
+        self.assertEqual([q.pop() for _ in range(3)], ['a', 'b', 'c'])
+        q.close()
+
+
+class ChunkSize1FifoDiskQueueTest(FifoDiskQueueTest):
+    chunksize = 1
+
+    def test_chunks_removed(self):
+        q = self.queue()
+        for x in ['a', 'b', 'c']:
+            q.push(x)
+        q.pop()
+        q.pop()
+        chunks = [x for x in os.listdir(self.qdir) if x.startswith('q')]
+        self.assertEqual(len(chunks), 2) # the one being read plus the head
+        q.close()
+
+class ChunkSize3FifoDiskQueueTest(FifoDiskQueueTest):
+    chunksize = 3
+
+
+class LifoDiskQueueTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.qpath = os.path.join(self.tmpdir, 'lifo')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_empty(self):
+        q = LifoDiskQueue(self.qpath)
+        self.assertEqual(len(q), 0)
+        self.assertEqual(q.pop(), None)
+        q.close()
+        self.failIf(os.path.exists(self.qpath))
+
+    def test_push_pop(self):
+        q = LifoDiskQueue(self.qpath)
+        q.push('a')
+        q.push('b')
+        q.push('')
+        self.assertEqual(len(q), 3)
+        self.assertEqual(q.pop(), '')
+        q.push('c')
+        self.assertEqual(q.pop(), 'c')
+        self.assertEqual(q.pop(), 'b')
+        self.assertEqual(q.pop(), 'a')
+        self.assertEqual(q.pop(), None)
+        q.close()
+
+    def test_close_open(self):
+        q = LifoDiskQueue(self.qpath)
+        for x in ['a', 'b', 'c']:
+            q.push(x)
+        self.assertEqual(q.pop(), 'c')
+        q.close()
+        del q
+
+        q = LifoDiskQueue(self.qpath)
+        self.assertEqual(len(q), 2)
+        q.push('d')
+        self.assertEqual([q.pop() for _ in range(3)], ['d', 'b', 'a'])
+        q.close()
+
+    def test_reopen_without_closing(self):
+        q = LifoDiskQueue(self.qpath)
+        for x in ['a', 'b', 'c']:
+            q.push(x)
+        q.flush()
+        self.assertEqual(q.pop(), 'c')
+        q.push('d')
+        q.push('e')
+
+        q = LifoDiskQueue(self.qpath)
+        self.assertEqual(len(q), 4)
+        self.assertEqual([q.pop() for _ in range(4)], ['e', 'd', 'b', 'a'])
+        q.close()
+        self.failIf(os.path.exists(self.qpath))
+
+if __name__ == "__main__":
+    unittest.main()
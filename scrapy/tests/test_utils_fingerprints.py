@@ -0,0 +1,91 @@
+import unittest
+import hashlib
+
+from scrapy.utils.fingerprints import FingerprintSet, BloomFilter, \
+    ScalableBloomFilter
+
+
+def fingerprints(n, prefix=''):
+    return [hashlib.sha1('%s%d' % (prefix, i)).hexdigest() for i in xrange(n)]
+
+
+class FingerprintSetTest(unittest.TestCase):
+
+    bits = 64
+
+    def test_add_contains(self):
+        s = FingerprintSet(self.bits, capacity=16)
+        fps = fingerprints(1000)
+        for fp in fps:
+            assert fp not in s
+            s.add(fp)
+            assert fp in s
+        s.add(fps[0])
+        self.assertEqual(len(s), 1000)
+        for fp in fps:
+            assert fp in s
+        for fp in fingerprints(1000, 'other'):
+            assert fp not in s
+
+    def test_update(self):
+        s = FingerprintSet(self.bits)
+        s.update(fingerprints(10))
+        self.assertEqual(len(s), 10)
+
+    def test_truncated_fingerprints(self):
+        s = FingerprintSet(self.bits)
+        fp = '0' * 40
+        s.add(fp)
+        assert fp in s
+        assert fp[:self.bits/4] + 'f' * (40 - self.bits/4) in s
+        assert 'f' + fp[1:] not in s
+
+    def test_memory(self):
+        s = FingerprintSet(self.bits, capacity=1000)
+        s.update(fingerprints(1000))
+        self.assert_(s.memory() <= 2 * 1000 * self.bits / 8 / s.max_load)
+        self.assert_(0 < s.error_rate() < 1e-9)
+
+    def test_invalid_bits(self):
+        self.assertRaises(ValueError, FingerprintSet, 48)
+        self.assertRaises(ValueError, FingerprintSet, 192)
+
+
+class FingerprintSet128Test(FingerprintSetTest):
+    bits = 128
+
+
+class BloomFilterTest(unittest.TestCase):
+
+    def test_add_contains(self):
+        f = BloomFilter(1000, 0.01)
+        fps = fingerprints(1000)
+        for fp in fps:
+            f.add(fp)
+        for fp in fps:
+            assert fp in f
+        falsepos = len([fp for fp in fingerprints(1000, 'x') if fp in f])
+        self.assert_(falsepos < 30, falsepos)
+        self.assert_(0.005 < f.error_rate() < 0.015, f.error_rate())
+
+
+class ScalableBloomFilterTest(unittest.TestCase):
+
+    def test_grows(self):
+        f = ScalableBloomFilter(0.01, capacity=100)
+        fps = fingerprints(2000)
+        f.update(fps)
+        self.assert_(len(f.filters) > 1)
+        for fp in fps:
+            assert fp in f
+        falsepos = len([fp for fp in fingerprints(2000, 'x') if fp in f])
+        self.assert_(falsepos < 40, falsepos)
+        self.assert_(f.error_rate() < 0.01, f.error_rate())
+        self.assert_(f.memory() < 2000 * 3)
+
+    def test_invalid_error_rate(self):
+        self.assertRaises(ValueError, ScalableBloomFilter, 0)
+        self.assertRaises(ValueError, ScalableBloomFilter, 1)
+
+if __name__ == "__main__":
+    unittest.main()
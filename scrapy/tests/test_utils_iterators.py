@@ -1,8 +1,7 @@
 import os
 from twisted.trial import unittest
 
-from scrapy.utils.iterators import csviter, xmliter
-from scrapy.contrib_exp.iterators import xmliter_lxml
+from scrapy.utils.iterators import csviter, xmliter, xmliter_lxml
 from scrapy.http import XmlResponse, TextResponse
 from scrapy.tests import get_testdata
 
@@ -97,6 +96,27 @@ class LxmlXmliterTestCase(XmliterTestCase):
     except ImportError:
         skip = "lxml not available"
 
+    def test_xmliter_prefixed_nodename(self):
+        body = """<?xml version="1.0" encoding="UTF-8"?>
+            <feed xmlns="http://www.w3.org/2005/Atom">
+                <entry><title>one</title></entry>
+                <entry><title>two</title></entry>
+            </feed>"""
+        response = XmlResponse(url='http://example.com', body=body)
+        nodes = xmliter_lxml(response, 'a:entry', [('a', 'http://www.w3.org/2005/Atom')])
+        self.assertEqual([x.select('a:title/text()').extract() for x in nodes],
+                         [[u'one'], [u'two']])
+
+    def test_xmliter_nodes_freed(self):
+        body = '<products>%s</products>' % ''.join('<product id="%d"><name>' \
+            'Name %d</name></product>' % (i, i) for i in range(10))
+        response = XmlResponse(url='http://example.com', body=body)
+        nodes = list(xmliter_lxml(response, 'product'))
+        self.assertEqual([x.select('@id').extract() for x in nodes],
+                         [[str(i)] for i in range(10)])
+        # each selector has its own document, which only has its node
+        self.assertEqual(nodes[3].select('//name/text()').extract(), [u'Name 3'])
+
 
 class UtilsCsvTestCase(unittest.TestCase):
     sample_feeds_dir = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'sample_data', 'feeds')
@@ -158,6 +178,14 @@ class UtilsCsvTestCase(unittest.TestCase):
                           {u'id': u'3', u'name': u'multi',   u'value': u'foo\nbar'},
                           {u'id': u'4', u'name': u'empty',   u'value': u''}])
 
+    def test_csviter_batch_size(self):
+        body = get_testdata('feeds', 'feed-sample3.csv')
+        response = TextResponse(url="http://example.com/", body=body)
+
+        self.assertEqual([[row['id'] for row in batch] for batch in \
+                          csviter(response, batch_size=3)],
+                         [[u'1', u'2', u'3'], [u'4']])
+
     def test_csviter_exception(self):
         body = get_testdata('feeds', 'feed-sample3.csv')
 
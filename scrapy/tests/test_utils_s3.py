@@ -0,0 +1,70 @@
+import threading
+from cStringIO import StringIO
+
+from twisted.trial import unittest
+from twisted.internet import defer
+
+from scrapy import optional_features
+from scrapy.conf import settings
+from scrapy.utils.test import FakeS3Server
+from scrapy.utils.s3 import get_s3_connection, upload_file, \
+    defer_to_upload_thread
+
+
+class S3UtilsTest(unittest.TestCase):
+
+    skip = 'boto' not in optional_features and 'missing boto library'
+
+    def setUp(self):
+        self.server = FakeS3Server()
+        self.server.start()
+        settings.overrides['AWS_S3_ENDPOINT'] = self.server.url
+        settings.overrides['AWS_ACCESS_KEY_ID'] = 'key'
+        settings.overrides['AWS_SECRET_ACCESS_KEY'] = 'secret'
+
+    def tearDown(self):
+        self.server.stop()
+        for name in ['AWS_S3_ENDPOINT', 'AWS_ACCESS_KEY_ID', \
+                'AWS_SECRET_ACCESS_KEY']:
+            del settings.overrides[name]
+
+    def _get_bucket(self):
+        return get_s3_connection().get_bucket('bucket', validate=False)
+
+    def test_get_s3_connection(self):
+        conn = get_s3_connection()
+        self.assert_(get_s3_connection() is conn)
+        self.assert_(get_s3_connection('other', 'secret') is not conn)
+        conns = []
+        t = threading.Thread(target=lambda: conns.append(get_s3_connection()))
+        t.start()
+        t.join()
+        self.assert_(conns[0] is not conn)
+
+    def test_upload_file(self):
+        upload_file(self._get_bucket(), 'some/key', StringIO('content'), \
+            metadata={'width': '10'})
+        data, headers = self.server.objects['/bucket/some/key']
+        self.assertEqual(data, 'content')
+        self.assertEqual(headers['x-amz-meta-width'], '10')
+        key = self._get_bucket().get_key('some/key')
+        self.assertEqual(key.get_contents_as_string(), 'content')
+
+    def test_upload_file_multipart(self):
+        data = 'x' * 10 + 'y' * 10 + 'z' * 5
+        upload_file(self._get_bucket(), 'key', StringIO(data), part_size=10)
+        self.assertEqual(self.server.objects['/bucket/key'][0], data)
+        self.assertEqual(self.server.uploads, {})
+
+    def test_connections_are_reused(self):
+        for i in range(5):
+            upload_file(self._get_bucket(), 'key%d' % i, StringIO('content'))
+        self.assertEqual(len(self.server.objects), 5)
+        self.assertEqual(self.server.connections, 1)
+
+    @defer.inlineCallbacks
+    def test_defer_to_upload_thread(self):
+        bucket = self._get_bucket()
+        yield defer.DeferredList([defer_to_upload_thread(upload_file, \
+            bucket, 'key%d' % i, StringIO('content')) for i in range(3)])
+        self.assertEqual(len(self.server.objects), 3)
@@ -7,13 +7,16 @@ from urlparse import urlparse
 
 from twisted.trial import unittest
 from twisted.web import server, static, error, util
-from twisted.internet import reactor, defer
+from twisted.internet import reactor, defer, task
 from twisted.test.proto_helpers import StringTransport
 from twisted.python.filepath import FilePath
+from twisted.python import failure
+from twisted.internet.error import ConnectionDone
 from twisted.protocols.policies import WrappingFactory
 
 from scrapy.core.downloader import webclient as client
 from scrapy.http import Request, Headers
+from scrapy.exceptions import IgnoreRequest
 
 
 def getPage(url, contextFactory=None, *args, **kwargs):
@@ -186,6 +189,262 @@ class ScrapyHTTPPageGetterTests(unittest.TestCase):
         self.assertEqual(protocol.headers,
             Headers({'Hello': ['World'], 'Foo': ['Bar']}))
 
+    def test_keepalive(self):
+        pool = client.HTTPConnectionPool()
+        factory = client.ScrapyHTTPClientFactory(Request('http://foo/bar'))
+        factory.pool = pool
+        transport = StringTransport()
+        protocol = client.ScrapyHTTPPageGetter()
+        protocol.factory = factory
+        protocol.makeConnection(transport)
+        self.assertEqual(transport.value(),
+            "GET /bar HTTP/1.0\r\n"
+            "Host: foo\r\n"
+            "Connection: keep-alive\r\n"
+            "\r\n")
+        protocol.dataReceived("HTTP/1.0 200 OK\r\n"
+            "Content-Length: 5\r\n"
+            "Connection: Keep-Alive\r\n"
+            "\r\n"
+            "hello")
+        self.assertEqual(len(pool), 1)
+        self.failIf(transport.disconnecting)
+        self.assertEqual(pool.get(factory.poolkey), protocol)
+
+        # the same connection is used for the next request
+        factory2 = client.ScrapyHTTPClientFactory(Request('http://foo/baz'))
+        factory2.pool = pool
+        transport.clear()
+        protocol.reuse(factory2)
+        self.assertEqual(transport.value(),
+            "GET /baz HTTP/1.0\r\n"
+            "Host: foo\r\n"
+            "Connection: keep-alive\r\n"
+            "\r\n")
+        protocol.dataReceived("HTTP/1.0 204 No Content\r\n"
+            "Connection: Keep-Alive\r\n"
+            "\r\n")
+        self.assertEqual(len(pool), 1)
+        body = []
+        factory.deferred.addCallback(lambda r: body.append(r.body))
+        factory2.deferred.addCallback(lambda r: body.append(r.status))
+        self.assertEqual(body, ['hello', 204])
+        pool.close()
+        self.failUnless(transport.disconnecting)
+
+    def test_no_keepalive(self):
+        pool = client.HTTPConnectionPool()
+        factory = client.ScrapyHTTPClientFactory(Request('http://foo/bar'))
+        factory.pool = pool
+        transport = StringTransport()
+        protocol = client.ScrapyHTTPPageGetter()
+        protocol.factory = factory
+        protocol.makeConnection(transport)
+        protocol.dataReceived("HTTP/1.0 200 OK\r\n"
+            "Content-Length: 5\r\n"
+            "\r\n"
+            "hello")
+        self.assertEqual(len(pool), 0)
+        self.failUnless(transport.disconnecting)
+
+
+class ScrapyHTTP11PageGetterTests(unittest.TestCase):
+
+    def _protocol(self, request, maxsize=0, pool=None):
+        factory = client.ScrapyHTTP11ClientFactory(request, maxsize=maxsize)
+        factory.pool = pool
+        protocol = client.ScrapyHTTP11PageGetter()
+        protocol.factory = factory
+        protocol.makeConnection(StringTransport())
+        return protocol
+
+    def _result(self, protocol):
+        result = []
+        protocol.factory.deferred.addBoth(result.append)
+        self.assertEqual(len(result), 1)
+        return result[0]
+
+    def test_request(self):
+        def _lines(protocol):
+            head, body = protocol.transport.value().split('\r\n\r\n', 1)
+            lines = head.split('\r\n')
+            return lines[0], set(lines[1:]), body
+
+        protocol = self._protocol(Request('http://foo/bar', method='POST',
+            body='name=value'))
+        self.assertEqual(_lines(protocol), ("POST /bar HTTP/1.1",
+            set(["Content-Length: 10", "Host: foo", "Connection: close"]),
+            "name=value"))
+        # connections are only closed if there's no pool to release them to
+        protocol = self._protocol(Request('http://foo/bar', method='POST',
+            body='name=value'), pool=client.HTTPConnectionPool())
+        self.assertEqual(_lines(protocol), ("POST /bar HTTP/1.1",
+            set(["Content-Length: 10", "Host: foo"]), "name=value"))
+
+    def test_content_length(self):
+        protocol = self._protocol(Request('http://foo/bar'))
+        for data in ["HTTP/1.1 200 OK\r\nContent-Le", "ngth: 10\r\n",
+                "X-Multi: a\r\n b\r\n\r\n01234", "56789"]:
+            protocol.dataReceived(data)
+        response = self._result(protocol)
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response.body, '0123456789')
+        self.assertEqual(response.headers['X-Multi'], 'a b')
+        self.failUnless(protocol.transport.disconnecting)
+
+    def test_chunked(self):
+        pool = client.HTTPConnectionPool()
+        protocol = self._protocol(Request('http://foo/bar'), pool=pool)
+        protocol.dataReceived("HTTP/1.1 200 OK\r\n"
+            "Transfer-Encoding: chunked\r\n"
+            "\r\n"
+            "5\r\nhello\r\n"
+            "1;name=value\r\n \r\n")
+        protocol.dataReceived("5\r\nwor")
+        protocol.dataReceived("ld\r\n")
+        self.failIf(protocol.factory.deferred.called)
+        protocol.dataReceived("0\r\nX-Trailer: value\r\n\r\n")
+        response = self._result(protocol)
+        self.assertEqual(response.body, 'hello world')
+        # connection was released to the pool
+        self.failIf(protocol.transport.disconnecting)
+        self.assertEqual(len(pool), 1)
+        pool.close()
+
+    def test_chunked_many_chunks(self):
+        protocol = self._protocol(Request('http://foo/bar'))
+        protocol.dataReceived("HTTP/1.1 200 OK\r\n"
+            "Transfer-Encoding: chunked\r\n"
+            "\r\n" + "1\r\na\r\n" * 5000 + "0\r\n\r\n")
+        self.assertEqual(self._result(protocol).body, 'a' * 5000)
+
+    def test_body_until_close(self):
+        protocol = self._protocol(Request('http://foo/bar'))
+        protocol.dataReceived("HTTP/1.0 200 OK\r\n\r\nsome")
+        protocol.dataReceived(" data")
+        self.failIf(protocol.factory.deferred.called)
+        protocol.connectionLost(failure.Failure(ConnectionDone()))
+        self.assertEqual(self._result(protocol).body, 'some data')
+
+    def test_partial_chunked(self):
+        protocol = self._protocol(Request('http://foo/bar'))
+        protocol.dataReceived("HTTP/1.1 200 OK\r\n"
+            "Transfer-Encoding: chunked\r\n"
+            "\r\n"
+            "5\r\nhel")
+        protocol.connectionLost(failure.Failure(ConnectionDone()))
+        result = self._result(protocol)
+        self.failUnless(result.check(client.PartialDownloadError))
+        self.assertEqual(result.value.response, 'hel')
+
+    def test_continue(self):
+        protocol = self._protocol(Request('http://foo/bar'))
+        protocol.dataReceived("HTTP/1.1 100 Continue\r\n\r\n"
+            "HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+        response = self._result(protocol)
+        self.assertEqual((response.status, response.body), (200, 'ok'))
+
+    def test_no_body(self):
+        protocol = self._protocol(Request('http://foo/bar', method='HEAD'))
+        protocol.dataReceived("HTTP/1.1 200 OK\r\nContent-Length: 10\r\n\r\n")
+        self.assertEqual(self._result(protocol).body, '')
+        protocol = self._protocol(Request('http://foo/bar'))
+        protocol.dataReceived("HTTP/1.1 304 Not Modified\r\n\r\n")
+        self.assertEqual(self._result(protocol).status, 304)
+
+    def test_maxsize_content_length(self):
+        protocol = self._protocol(Request('http://foo/bar'), maxsize=10)
+        protocol.dataReceived("HTTP/1.1 200 OK\r\nContent-Length: 11\r\n\r\n")
+        self.failUnless(self._result(protocol).check(IgnoreRequest))
+        self.failUnless(protocol.transport.disconnecting)
+
+    def test_maxsize_chunked(self):
+        protocol = self._protocol(Request('http://foo/bar'), maxsize=10)
+        protocol.dataReceived("HTTP/1.1 200 OK\r\n"
+            "Transfer-Encoding: chunked\r\n"
+            "\r\n"
+            "6\r\nhello \r\n")
+        self.failIf(protocol.factory.deferred.called)
+        protocol.dataReceived("6\r\nworld!\r\n")
+        self.failUnless(self._result(protocol).check(IgnoreRequest))
+        self.failUnless(protocol.transport.disconnecting)
+        # further data is ignored
+        protocol.dataReceived("0\r\n\r\n")
+
+    def test_maxsize_meta(self):
+        protocol = self._protocol(Request('http://foo/bar', \
+            meta={'download_maxsize': 5}), maxsize=100)
+        protocol.dataReceived("HTTP/1.0 200 OK\r\n\r\n123456")
+        self.failUnless(self._result(protocol).check(IgnoreRequest))
+
+
+class HTTPConnectionPoolTest(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = task.Clock()
+        self.pool = client.HTTPConnectionPool(maxperhost=2, maxsize=3, \
+            timeout=10, clock=self.clock)
+
+    def _connection(self):
+        protocol = client.ScrapyHTTPPageGetter()
+        protocol.transport = StringTransport()
+        return protocol
+
+    def test_get_put(self):
+        key = ('http', 'example.com', 80)
+        self.assertEqual(self.pool.get(key), None)
+        c1, c2 = self._connection(), self._connection()
+        self.pool.put(key, c1)
+        self.pool.put(key, c2)
+        self.assertEqual(self.pool.get(('http', 'example.com', 8080)), None)
+        self.assertEqual(self.pool.get(key), c2)
+        self.assertEqual(self.pool.get(key), c1)
+        self.assertEqual(self.pool.get(key), None)
+        self.assertEqual((self.pool.hits, self.pool.misses), (2, 3))
+        self.assertEqual(len(self.pool), 0)
+
+    def test_limits(self):
+        key1 = ('http', 'example.com', 80)
+        key2 = ('https', 'example.com', 443)
+        conns = [self._connection() for _ in range(4)]
+        self.pool.put(key1, conns[0])
+        self.pool.put(key1, conns[1])
+        self.pool.put(key1, conns[2])
+        # per host limit
+        self.failUnless(conns[0].transport.disconnecting)
+        self.assertEqual(len(self.pool), 2)
+        self.pool.put(key2, conns[3])
+        self.assertEqual(len(self.pool), 3)
+        self.assertEqual(self.pool.evictions, 1)
+        self.pool.put(key2, self._connection())
+        # global limit
+        self.failUnless(conns[1].transport.disconnecting)
+        self.assertEqual(len(self.pool), 3)
+        self.assertEqual(self.pool.evictions, 2)
+
+    def test_timeout(self):
+        key = ('http', 'example.com', 80)
+        c1, c2 = self._connection(), self._connection()
+        self.pool.put(key, c1)
+        self.clock.advance(5)
+        self.pool.put(key, c2)
+        self.clock.advance(6)
+        self.failUnless(c1.transport.disconnecting)
+        self.failIf(c2.transport.disconnecting)
+        self.assertEqual(self.pool.evictions, 1)
+        self.assertEqual(self.pool.get(key), c2)
+        self.clock.advance(10)
+        self.failIf(c2.transport.disconnecting)
+
+    def test_discard(self):
+        key = ('http', 'example.com', 80)
+        c1 = self._connection()
+        self.pool.put(key, c1)
+        self.pool.discard(c1)
+        self.pool.discard(c1)
+        self.assertEqual(self.pool.get(key), None)
+        self.assertEqual(self.clock.getDelayedCalls(), [])
+
 
 from twisted.web.test.test_webclient import ForeverTakingResource, \
         ErrorResource, NoLengthResource, HostHeaderResource, \
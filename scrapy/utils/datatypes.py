@@ -325,6 +325,11 @@ class PriorityQueue(object):
     def __nonzero__(self):
         return bool(self.negitems or self.pzero or self.positems)
 
+    def clear(self):
+        self.negitems.clear()
+        self.pzero.clear()
+        self.positems.clear()
+
 class PriorityStack(PriorityQueue):
     """A simple priority stack which is similar to PriorityQueue but pops its
     items in reverse order (for the same priority)"""
@@ -337,3 +342,95 @@ class PriorityStack(PriorityQueue):
         else:
             self.positems[priority].append(item)
 
+
+
+class LRUCache(object):
+    """Dictionary-like object which keeps up to ``limit`` items, discarding the
+    least recently used (read or written) ones when it gets full"""
+
+    def __init__(self, limit):
+        self.limit = limit
+        self._map = {} # key -> link, where links are [prev, next, key, value]
+        self._root = root = []
+        root[:] = [root, root, None, None]
+
+    def __getitem__(self, key):
+        link = self._map[key]
+        if self._root[1] is not link:
+            self._move_to_front(link)
+        return link[3]
+
+    def get(self, key, default=None):
+        link = self._map.get(key)
+        if link is None:
+            return default
+        if self._root[1] is not link:
+            self._move_to_front(link)
+        return link[3]
+
+    def __setitem__(self, key, value):
+        link = self._map.get(key)
+        if link is not None:
+            link[3] = value
+            if self._root[1] is not link:
+                self._move_to_front(link)
+            return
+        if len(self._map) >= self.limit:
+            self.popitem()
+        root = self._root
+        first = root[1]
+        link = [root, first, key, value]
+        first[0] = root[1] = self._map[key] = link
+
+    def __delitem__(self, key):
+        link = self._map.pop(key)
+        prev, next = link[0], link[1]
+        prev[1] = next
+        next[0] = prev
+
+    def pop(self, key, *default):
+        if key not in self._map:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        value = self._map[key][3]
+        del self[key]
+        return value
+
+    def popitem(self):
+        """Remove and return the least recently used (key, value) pair"""
+        last = self._root[0]
+        if last is self._root:
+            raise KeyError('popitem(): cache is empty')
+        del self[last[2]]
+        return last[2], last[3]
+
+    def __contains__(self, key):
+        return key in self._map
+
+    def __len__(self):
+        return len(self._map)
+
+    def __iter__(self):
+        """Iterate over the keys, from the most to the least recently used"""
+        link = self._root[1]
+        while link is not self._root:
+            yield link[2]
+            link = link[1]
+
+    def keys(self):
+        return list(self)
+
+    def clear(self):
+        self._map.clear()
+        root = self._root
+        root[:] = [root, root, None, None]
+
+    def _move_to_front(self, link):
+        root = self._root
+        prev, next = link[0], link[1]
+        prev[1] = next
+        next[0] = prev
+        first = root[1]
+        link[0], link[1] = root, first
+        first[0] = root[1] = link
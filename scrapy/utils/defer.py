@@ -35,27 +35,72 @@ def mustbe_deferred(f, *args, **kw):
     """Same as twisted.internet.defer.maybeDeferred, but delay calling
     callback/errback to next reactor loop
     """
+    return defer_result(_call(f, *args, **kw))
+
+def maybe_deferred(f, *args, **kw):
+    """Same as twisted.internet.defer.maybeDeferred (ie. the result is
+    available right away, without waiting for the next reactor loop), but
+    faster for IgnoreRequest errors.
+
+    Use it instead of mustbe_deferred only where running the callbacks
+    right away can't recurse back into the caller.
+    """
+    result = _call(f, *args, **kw)
+    if isinstance(result, defer.Deferred):
+        return result
+    elif isinstance(result, failure.Failure):
+        return defer.fail(result)
+    else:
+        return defer.succeed(result)
+
+def _call(f, *args, **kw):
+    """Call the given function and return its result, or a Failure if it
+    raised an exception"""
     try:
-        result = f(*args, **kw)
+        return f(*args, **kw)
     # FIXME: Hack to avoid introspecting tracebacks. This to speed up
     # processing of IgnoreRequest errors which are, by far, the most common
     # exception in Scrapy - see #125
     except IgnoreRequest, e:
-        return defer_fail(failure.Failure(e))
+        return failure.Failure(e)
     except:
-        return defer_fail(failure.Failure())
-    else:
-        return defer_result(result)
+        return failure.Failure()
 
 def parallel(iterable, count, callable, *args, **named):
     """Execute a callable over the objects in the given iterable, in parallel,
     using no more than ``count`` concurrent calls.
 
-    Taken from: http://jcalderone.livejournal.com/24285.html
+    The calls are made by a single cooperative task, and another one (up to
+    ``count``) is only started when a call returns a deferred which hasn't
+    fired yet, so iterables of synchronous calls don't pay for ``count``
+    tasks.
+
+    Based on: http://jcalderone.livejournal.com/24285.html
     """
     coop = task.Cooperator()
-    work = (callable(elem, *args, **named) for elem in iterable)
-    return defer.DeferredList([coop.coiterate(work) for i in xrange(count)])
+    dfds = []
+    finished = []
+    dlist = defer.Deferred()
+    def _work():
+        for elem in iterable:
+            result = callable(elem, *args, **named)
+            if isinstance(result, defer.Deferred) and not result.called and \
+                    len(dfds) < count:
+                # this task waits for the result, so start another one
+                _start_task()
+            yield result
+    def _start_task():
+        dfd = coop.coiterate(work)
+        dfds.append(dfd)
+        dfd.addBoth(_task_finished)
+    def _task_finished(result):
+        finished.append(result)
+        if len(finished) == len(dfds):
+            defer.DeferredList(dfds).chainDeferred(dlist)
+        return result
+    work = _work()
+    _start_task()
+    return dlist
 
 def process_chain(callbacks, input, *a, **kw):
     """Return a Deferred built by chaining the given callbacks"""
@@ -0,0 +1,258 @@
+"""
+Persistent queues of strings, stored on disk.
+
+Both queues keep their state in a directory (FifoDiskQueue) or a file
+(LifoDiskQueue) and, once closed, they can be reopened later to continue
+where they were left.
+
+Records are written to disk as soon as they're pushed, and their state can be
+saved (and synced to disk) at any time with flush(), so they can also be
+reopened if the process dies without closing them: the pushed records are
+recovered, and (most of) those popped after the last flush() are returned
+again.
+"""
+
+import os
+import struct
+import glob
+
+from scrapy.utils.py26 import json
+from scrapy.utils.job import save_file
+
+
+class FifoDiskQueue(object):
+    """Persistent FIFO queue of strings.
+
+    Records are appended to fixed size chunk files (``chunksize`` records
+    each) and read back sequentially, so memory usage doesn't depend on the
+    queue size. Chunk files are removed once all their records are popped.
+
+    The position of the head and tail of the queue is kept in ``info.json``,
+    which is saved by flush() and close(), and brought up to date with the
+    chunk files when the queue is opened.
+    """
+
+    szhdr_format = ">L"
+    szhdr_size = struct.calcsize(szhdr_format)
+
+    def __init__(self, path, chunksize=100000):
+        self.path = path
+        if not os.path.exists(path):
+            os.makedirs(path)
+        self.info = self._loadinfo(chunksize)
+        self.chunksize = self.info['chunksize']
+        self._recover()
+        self.headf = self._openchunk(self.info['head'][0], 'ab+')
+        self.tailf = self._openchunk(self.info['tail'][0])
+        self.tailf.seek(self.info['tail'][2])
+
+    def push(self, string):
+        hnum, hpos = self.info['head']
+        hpos += 1
+        szhdr = struct.pack(self.szhdr_format, len(string))
+        self.headf.write(szhdr + string)
+        self.headf.flush()
+        if hpos == self.chunksize:
+            hpos = 0
+            hnum += 1
+            self.headf.close()
+            self.headf = self._openchunk(hnum, 'ab+')
+        self.info['size'] += 1
+        self.info['head'] = [hnum, hpos]
+
+    def pop(self):
+        tnum, tcnt, toffset = self.info['tail']
+        if [tnum, tcnt] >= self.info['head']:
+            return
+        tfd = self.tailf
+        if tnum == self.info['head'][0]:
+            tfd.seek(toffset)
+        szhdr = tfd.read(self.szhdr_size)
+        if not szhdr:
+            return
+        size, = struct.unpack(self.szhdr_format, szhdr)
+        data = tfd.read(size)
+        tcnt += 1
+        toffset += self.szhdr_size + size
+        self.info['size'] -= 1
+        self.info['tail'] = [tnum, tcnt, toffset]
+        if tcnt == self.chunksize and tnum <= self.info['head'][0]:
+            tfd.close()
+            self.info['tail'] = [tnum + 1, 0, 0]
+            # the chunk is removed only once the info doesn't refer to it
+            self._saveinfo(self.info)
+            os.remove(tfd.name)
+            self.tailf = self._openchunk(tnum + 1)
+        return data
+
+    def flush(self):
+        """Save the state of the queue and sync it to disk"""
+        os.fsync(self.headf.fileno())
+        self._saveinfo(self.info)
+
+    def close(self):
+        self.headf.close()
+        self.tailf.close()
+        if len(self) == 0:
+            self._cleanup()
+        else:
+            self._saveinfo(self.info)
+
+    def __len__(self):
+        return self.info['size']
+
+    def _openchunk(self, number, mode='rb'):
+        return open(self._chunkpath(number), mode)
+
+    def _chunkpath(self, number):
+        return os.path.join(self.path, 'q%05d' % number)
+
+    def _recover(self):
+        # count the records pushed since the info was last saved (if the
+        # queue wasn't closed), which are already in the chunk files
+        hnum = self.info['head'][0]
+        hpos = self._scanchunk(hnum)
+        while hpos == self.chunksize:
+            hnum += 1
+            hpos = self._scanchunk(hnum)
+        tnum, tcnt, _ = self.info['tail']
+        self.info['head'] = [hnum, hpos]
+        self.info['size'] = (hnum - tnum) * self.chunksize + hpos - tcnt
+
+    def _scanchunk(self, number):
+        # return the number of records in the given chunk, removing any
+        # incomplete record left at its end
+        path = self._chunkpath(number)
+        if not os.path.exists(path):
+            return 0
+        end = os.path.getsize(path)
+        count = offset = 0
+        f = open(path, 'rb+')
+        try:
+            while count < self.chunksize:
+                f.seek(offset)
+                szhdr = f.read(self.szhdr_size)
+                if len(szhdr) < self.szhdr_size:
+                    break
+                size, = struct.unpack(self.szhdr_format, szhdr)
+                if offset + self.szhdr_size + size > end:
+                    break
+                offset += self.szhdr_size + size
+                count += 1
+            if offset < end:
+                f.truncate(offset)
+        finally:
+            f.close()
+        return count
+
+    def _loadinfo(self, chunksize):
+        infopath = self._infopath()
+        if os.path.exists(infopath):
+            f = open(infopath)
+            try:
+                info = json.load(f)
+            finally:
+                f.close()
+        else:
+            info = {
+                'chunksize': chunksize,
+                'size': 0,
+                'tail': [0, 0, 0],
+                'head': [0, 0],
+            }
+        return info
+
+    def _saveinfo(self, info):
+        save_file(self._infopath(), json.dumps(info))
+
+    def _infopath(self):
+        return os.path.join(self.path, 'info.json')
+
+    def _cleanup(self):
+        for x in glob.glob(os.path.join(self.path, 'q*')) + \
+                glob.glob(self._infopath() + '*'):
+            os.remove(x)
+        if not os.listdir(self.path):
+            os.rmdir(self.path)
+
+
+class LifoDiskQueue(object):
+    """Persistent LIFO queue of strings.
+
+    Each record is stored followed by its size, so the last one can be read
+    without scanning the file, which is truncated after each pop. The number
+    of records is kept at the start of the file, and saved by flush() and
+    close(), so the records are counted again (from the end of the file)
+    when the queue is opened.
+    """
+
+    SIZE_FORMAT = ">L"
+    SIZE_SIZE = struct.calcsize(SIZE_FORMAT)
+
+    def __init__(self, path):
+        self.path = path
+        if os.path.exists(path):
+            self.f = open(path, 'rb+')
+            qsize = self.f.read(self.SIZE_SIZE)
+            self.size, = struct.unpack(self.SIZE_FORMAT, qsize)
+            self.size = self._count(self.size)
+            self.f.seek(0, os.SEEK_END)
+        else:
+            self.f = open(path, 'wb+')
+            self.f.write(struct.pack(self.SIZE_FORMAT, 0))
+            self.size = 0
+
+    def push(self, string):
+        ssize = struct.pack(self.SIZE_FORMAT, len(string))
+        self.f.write(string + ssize)
+        self.f.flush()
+        self.size += 1
+
+    def pop(self):
+        if not self.size:
+            return
+        self.f.seek(-self.SIZE_SIZE, os.SEEK_END)
+        size, = struct.unpack(self.SIZE_FORMAT, self.f.read())
+        self.f.seek(-size-self.SIZE_SIZE, os.SEEK_END)
+        data = self.f.read(size)
+        self.f.seek(-size, os.SEEK_CUR)
+        self.f.truncate()
+        self.size -= 1
+        return data
+
+    def flush(self):
+        """Save the number of records and sync the queue to disk"""
+        self.f.seek(0)
+        self.f.write(struct.pack(self.SIZE_FORMAT, self.size))
+        self.f.seek(0, os.SEEK_END)
+        self.f.flush()
+        os.fsync(self.f.fileno())
+
+    def close(self):
+        if self.size:
+            self.f.seek(0)
+            self.f.write(struct.pack(self.SIZE_FORMAT, self.size))
+        self.f.close()
+        if not self.size:
+            os.remove(self.path)
+
+    def __len__(self):
+        return self.size
+
+    def _count(self, saved):
+        # count the records walking back from the end of the file, as the
+        # saved number is stale if the queue wasn't closed. Returns the saved
+        # number if the records can't be walked
+        self.f.seek(0, os.SEEK_END)
+        pos = self.f.tell()
+        count = 0
+        while pos > self.SIZE_SIZE:
+            if pos < 2 * self.SIZE_SIZE:
+                return saved
+            self.f.seek(pos - self.SIZE_SIZE)
+            size, = struct.unpack(self.SIZE_FORMAT, self.f.read(self.SIZE_SIZE))
+            pos -= self.SIZE_SIZE + size
+            if pos < self.SIZE_SIZE:
+                return saved
+            count += 1
+        return count
@@ -17,6 +17,7 @@ def get_engine_status(engine=None):
         "len(engine.scheduler.pending_requests)",
         "engine.downloader.is_idle()",
         "len(engine.downloader.sites)",
+        "len(engine.downloader.transferring)",
         "engine.scraper.is_idle()",
         "len(engine.scraper.sites)",
     ]
@@ -25,7 +26,7 @@ def get_engine_status(engine=None):
         "engine.closing.get(spider)",
         "engine.scheduler.spider_has_pending_requests(spider)",
         "len(engine.scheduler.pending_requests[spider])",
-        "len(engine.downloader.sites[spider].queue)",
+        "len(engine.downloader.sites[spider].slots)",
         "len(engine.downloader.sites[spider].active)",
         "len(engine.downloader.sites[spider].transferring)",
         "engine.downloader.sites[spider].closing",
@@ -0,0 +1,209 @@
+"""
+Compact sets of fingerprints (hex digests, like those returned by
+scrapy.utils.request.request_fingerprint), for keeping track of the requests
+seen in very large crawls.
+
+This module must not depend on any module outside the Standard Library.
+"""
+
+import math
+from array import array
+
+# a 32 bits unsigned type code, to build the tables with 32 bits words
+_typecode = [x for x in 'ILH' if array(x).itemsize == 4][0]
+
+
+class FingerprintSet(object):
+    """A set of fingerprints which stores only their first ``bits`` bits (in
+    binary form), in an open addressing hash table backed by an array.
+
+    It uses about 11-22 bytes per 64 bits fingerprint, instead of the ~100
+    bytes taken by the hex strings stored in a Python set, at the cost of a
+    small probability of false positives (see error_rate()).
+    """
+
+    max_load = 0.75
+
+    def __init__(self, bits=64, capacity=1024):
+        if bits % 32 or not 32 <= bits <= 160:
+            raise ValueError("Fingerprint bits must be a multiple of 32 " \
+                "between 32 and 160, got %r" % bits)
+        self.bits = bits
+        self.words = bits // 32
+        self.size = 0
+        self._alloc(max(int(capacity / self.max_load), 8))
+
+    def add(self, fp):
+        key = self._key(fp)
+        i = self._lookup(key)
+        if not self.tables[0][i]:
+            self._store(i, key)
+            self.size += 1
+            if self.size > self.threshold:
+                self._resize(self.capacity * 2)
+
+    def update(self, fps):
+        for fp in fps:
+            self.add(fp)
+
+    def memory(self):
+        """Return the memory used by the table, in bytes"""
+        return sum(len(t) * t.itemsize for t in self.tables)
+
+    def error_rate(self):
+        """Return the estimated probability of a new fingerprint being reported
+        as already seen"""
+        return self.size / 2.0 ** self.bits
+
+    def __contains__(self, fp):
+        return bool(self.tables[0][self._lookup(self._key(fp))])
+
+    def __len__(self):
+        return self.size
+
+    def _key(self, fp):
+        key = [int(fp[i:i+8], 16) for i in xrange(0, self.words * 8, 8)]
+        # the first word is never zero, as zero marks the empty slots
+        key[0] = key[0] or 1
+        return key
+
+    def _lookup(self, key):
+        """Return the slot holding the given key, or the empty slot where it
+        would be stored"""
+        tables, mask = self.tables, self.mask
+        first = tables[0]
+        k0 = key[0]
+        i = k0 & mask
+        while True:
+            v = first[i]
+            if not v:
+                return i
+            if v == k0:
+                for t, k in zip(tables[1:], key[1:]):
+                    if t[i] != k:
+                        break
+                else:
+                    return i
+            i = (i + 1) & mask
+
+    def _store(self, i, key):
+        for t, k in zip(self.tables, key):
+            t[i] = k
+
+    def _alloc(self, capacity):
+        # capacity is always a power of two, so slots can be masked. Words are
+        # stored in separate tables, so the first one can be probed fast
+        self.capacity = 1 << int(math.ceil(math.log(capacity, 2)))
+        self.mask = self.capacity - 1
+        self.threshold = int(self.capacity * self.max_load)
+        self.tables = [array(_typecode, [0]) * self.capacity \
+            for _ in xrange(self.words)]
+
+    def _resize(self, capacity):
+        old = self.tables
+        self._alloc(capacity)
+        for i in xrange(len(old[0])):
+            if old[0][i]:
+                key = [t[i] for t in old]
+                self._store(self._lookup(key), key)
+
+
+class BloomFilter(object):
+    """A Bloom filter for up to ``capacity`` fingerprints with the given
+    (maximum) error rate"""
+
+    def __init__(self, capacity, error_rate):
+        self.capacity = capacity
+        self.max_error_rate = error_rate
+        self.hashes = int(math.ceil(math.log(1.0 / error_rate, 2)))
+        self.nbits = int(math.ceil(capacity * abs(math.log(error_rate)) / \
+            math.log(2) ** 2))
+        self.bits = array('B', [0]) * ((self.nbits + 7) // 8)
+        self.count = 0
+
+    def add(self, fp):
+        bits = self.bits
+        for i in self._positions(fp):
+            bits[i >> 3] |= 1 << (i & 7)
+        self.count += 1
+
+    def memory(self):
+        return len(self.bits)
+
+    def error_rate(self):
+        """Return the estimated error rate, given the number of fingerprints
+        added"""
+        k, m = self.hashes, self.nbits
+        return (1 - math.exp(-float(k) * self.count / m)) ** k
+
+    def __contains__(self, fp):
+        bits = self.bits
+        for i in self._positions(fp):
+            if not bits[i >> 3] & (1 << (i & 7)):
+                return False
+        return True
+
+    def __len__(self):
+        return self.count
+
+    def _positions(self, fp):
+        # double hashing with two 48 bits hashes taken from the fingerprint
+        h1 = int(fp[:12], 16)
+        h2 = int(fp[12:24], 16) | 1
+        m = self.nbits
+        return [(h1 + i * h2) % m for i in xrange(self.hashes)]
+
+
+class ScalableBloomFilter(object):
+    """A Bloom filter which grows as fingerprints are added, while keeping
+    its error rate below ``error_rate``. It's made of a series of Bloom
+    filters of growing capacities (by ``growth``) and tightening error rates
+    (by ``ratio``), as described in "Scalable Bloom Filters" (Almeida et al.)
+
+    It uses about 3 bytes per fingerprint for an error rate of 0.1%, but
+    fingerprints must be (at least) 96 bits long.
+    """
+
+    def __init__(self, error_rate=0.001, capacity=100000, growth=2, ratio=0.9):
+        if not 0 < error_rate < 1:
+            raise ValueError("Error rate must be between 0 and 1, got %r" % \
+                error_rate)
+        self.growth = growth
+        self.ratio = ratio
+        self.filters = [BloomFilter(capacity, error_rate * (1 - ratio))]
+
+    def add(self, fp):
+        """Add the given fingerprint, which must not be in the filter
+        already (as that would waste filter capacity)"""
+        last = self.filters[-1]
+        if last.count >= last.capacity:
+            last = BloomFilter(last.capacity * self.growth, \
+                last.max_error_rate * self.ratio)
+            self.filters.append(last)
+        last.add(fp)
+
+    def update(self, fps):
+        for fp in fps:
+            if fp not in self:
+                self.add(fp)
+
+    def memory(self):
+        """Return the memory used by the filters bits, in bytes"""
+        return sum(f.memory() for f in self.filters)
+
+    def error_rate(self):
+        """Return the estimated probability of a new fingerprint being reported
+        as already seen"""
+        p = 1.0
+        for f in self.filters:
+            p *= 1 - f.error_rate()
+        return 1 - p
+
+    def __contains__(self, fp):
+        for f in reversed(self.filters):
+            if fp in f:
+                return True
+        return False
+
+    def __len__(self):
+        return sum(len(f) for f in self.filters)
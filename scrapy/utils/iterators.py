@@ -1,10 +1,12 @@
-import re, csv
+import re, csv, codecs
+from copy import deepcopy
+from itertools import islice, izip
 from cStringIO import StringIO
 
 from scrapy.http import Response
 from scrapy.selector import XmlXPathSelector
 from scrapy import log
-from scrapy.utils.python import re_rsearch, str_to_unicode
+from scrapy.utils.python import re_rsearch
 from scrapy.utils.response import body_or_str
 
 
@@ -32,7 +34,63 @@ def xmliter(obj, nodename):
         yield XmlXPathSelector(text=nodetext).select('//' + nodename)[0]
 
 
-def csviter(obj, delimiter=None, headers=None, encoding=None):
+def xmliter_lxml(obj, nodename, namespaces=None):
+    """Return a iterator of XPathSelector's over all nodes of a XML document,
+    like xmliter() does, but parsing the document incrementally with lxml
+    iterparse. The document is never decoded nor copied as a whole, and the
+    nodes are freed once they're yielded, so the memory used doesn't grow
+    with the size of the document.
+
+    namespaces is an optional list of (prefix, uri) tuples, which are
+    registered in the selectors returned, and can also be used to prefix the
+    nodename (for example: 'g:item').
+
+    Each selector is built on its own copy of the node, so it's safe to keep
+    them after the iteration has moved on.
+    """
+    from lxml import etree
+    from scrapy.selector.lxmlsel import XmlXPathSelector
+    namespaces = dict(namespaces or ())
+    if ':' in nodename:
+        prefix, name = nodename.split(':', 1)
+        nodename = '{%s}%s' % (namespaces[prefix], name)
+    reader = _StreamReader(obj)
+    iterable = etree.iterparse(reader, tag=nodename, encoding=reader.encoding)
+    for _, node in iterable:
+        root = deepcopy(node)
+        root.tail = None
+        node.clear()
+        while node.getprevious() is not None:
+            del node.getparent()[0]
+        yield XmlXPathSelector(root=root, namespaces=namespaces or None)
+
+
+class _StreamReader(object):
+
+    def __init__(self, obj):
+        self._ptr = 0
+        if isinstance(obj, Response):
+            self._text, self.encoding = obj.body, obj.encoding
+        else:
+            self._text, self.encoding = obj, 'utf-8'
+        self._is_unicode = isinstance(self._text, unicode)
+
+    def read(self, n=65535):
+        self.read = self._read_unicode if self._is_unicode else self._read_string
+        return self.read(n).lstrip()
+
+    def _read_string(self, n=65535):
+        s, e = self._ptr, self._ptr + n
+        self._ptr = e
+        return self._text[s:e]
+
+    def _read_unicode(self, n=65535):
+        s, e = self._ptr, self._ptr + n
+        self._ptr = e
+        return self._text[s:e].encode('utf-8')
+
+
+def csviter(obj, delimiter=None, headers=None, encoding=None, batch_size=None):
     """ Returns an iterator of dictionaries from the given csv object
 
     obj can be:
@@ -44,11 +102,29 @@ def csviter(obj, delimiter=None, headers=None, encoding=None):
 
     headers is an iterable that when provided offers the keys
     for the returned dictionaries, if not the first row is used.
+
+    batch_size, if given, makes the iterator return lists of (up to)
+    batch_size dictionaries instead of single ones.
+
+    Rows with a wrong number of fields are ignored, and logged once the whole
+    csv object has been iterated.
     """
+    rows = _csvrows(obj, delimiter, headers, encoding)
+    if batch_size:
+        return _batches(rows, batch_size)
+    return rows
+
+def _csvrows(obj, delimiter, headers, encoding):
     encoding = obj.encoding if isinstance(obj, Response) else encoding or 'utf-8'
-    def _getrow(csv_r):
-        return [str_to_unicode(field, encoding) for field in csv_r.next()]
+    decode = codecs.getdecoder(encoding)
+    def _decode(row):
+        # decode all the fields at once, unless they contain the separator
+        fields = decode('\0'.join(row))[0].split(u'\0')
+        if len(fields) != len(row):
+            fields = [decode(field)[0] for field in row]
+        return fields
 
+    # cStringIO shares the buffer of the (str) body instead of copying it
     lines = StringIO(body_or_str(obj, unicode=False))
     if delimiter:
         csv_r = csv.reader(lines, delimiter=delimiter)
@@ -56,13 +132,26 @@ def csviter(obj, delimiter=None, headers=None, encoding=None):
         csv_r = csv.reader(lines)
 
     if not headers:
-        headers = _getrow(csv_r)
+        headers = _decode(csv_r.next())
+    nfields = len(headers)
 
-    while True:
-        row = _getrow(csv_r)
-        if len(row) != len(headers):
-            log.msg("ignoring row %d (length: %d, should be: %d)" % (csv_r.line_num, len(row), len(headers)), log.WARNING)
+    ignored, first_ignored = 0, None
+    for row in csv_r:
+        if len(row) != nfields:
+            if not ignored:
+                first_ignored = (csv_r.line_num, len(row))
+            ignored += 1
             continue
-        else:
-            yield dict(zip(headers, row))
+        yield dict(izip(headers, _decode(row)))
 
+    if ignored:
+        log.msg("ignored %d rows with a wrong number of fields (should be: " \
+            "%d), the first at line %d (length: %d)" % ((ignored, nfields) + \
+            first_ignored), log.WARNING)
+
+def _batches(iterable, size):
+    while True:
+        batch = list(islice(iterable, size))
+        if not batch:
+            return
+        yield batch
@@ -0,0 +1,37 @@
+"""
+Helper functions for persisting the state of a job (ie. a crawl) in the job
+directory (the JOBDIR setting), so it can be paused and resumed later.
+"""
+
+import os
+
+def job_dir(settings):
+    """Return the job directory (creating it if it doesn't exist) or None if
+    the JOBDIR setting is not set"""
+    path = settings['JOBDIR']
+    if path and not os.path.exists(path):
+        os.makedirs(path)
+    return path
+
+def job_path(settings, *parts):
+    """Return the given path inside the job directory, or None if the JOBDIR
+    setting is not set"""
+    path = job_dir(settings)
+    if path:
+        return os.path.join(path, *parts)
+
+def save_file(path, data):
+    """Replace the contents of the given file with data, syncing it to disk.
+    The data is written to a temporary file first, so the file is never left
+    half written if the process dies while saving it"""
+    tmppath = path + '.tmp'
+    f = open(tmppath, 'wb')
+    try:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    finally:
+        f.close()
+    if os.name == 'nt' and os.path.exists(path):
+        os.remove(path) # rename doesn't replace files on Windows
+    os.rename(tmppath, path)
@@ -0,0 +1,96 @@
+"""
+Helper functions for serializing (and deserializing) requests, so that they
+can be stored outside the process memory (for example, in disk queues).
+"""
+
+import cPickle as pickle
+
+from scrapy.http import Request
+from scrapy.utils.misc import load_object
+
+
+def request_to_dict(request, spider=None):
+    """Convert Request object to a dict.
+
+    If a spider is given, it will try to find out the name of the spider
+    method used in the callback and errback and store that as the callback.
+    """
+    cb = request.callback
+    if callable(cb):
+        cb = _find_method(spider, cb)
+    eb = request.errback
+    if callable(eb):
+        eb = _find_method(spider, eb)
+    d = {
+        'url': request.url,
+        'callback': cb,
+        'errback': eb,
+        'method': request.method,
+        'headers': dict(request.headers),
+        'body': request.body,
+        'cookies': request.cookies,
+        'meta': request.meta,
+        '_encoding': request._encoding,
+        'priority': request.priority,
+        'dont_filter': request.dont_filter,
+    }
+    if type(request) is not Request:
+        d['_class'] = '%s.%s' % (request.__module__, request.__class__.__name__)
+    return d
+
+
+def request_from_dict(d, spider=None):
+    """Create Request object from a dict.
+
+    If a spider is given, it will try to resolve the callbacks looking at the
+    spider for methods with the same name.
+    """
+    cb = d['callback']
+    if cb and spider:
+        cb = _get_method(spider, cb)
+    eb = d['errback']
+    if eb and spider:
+        eb = _get_method(spider, eb)
+    request_cls = load_object(d['_class']) if '_class' in d else Request
+    return request_cls(
+        url=d['url'],
+        callback=cb,
+        errback=eb,
+        method=d['method'],
+        headers=d['headers'],
+        body=d['body'],
+        cookies=d['cookies'],
+        meta=d['meta'],
+        encoding=d['_encoding'],
+        priority=d['priority'],
+        dont_filter=d['dont_filter'])
+
+
+def request_to_string(request, spider=None):
+    """Serialize the request to a compact (binary) string. Raise ValueError if
+    the request can't be serialized (for example, because its callback is not
+    a spider method or its meta contains unpicklable objects)"""
+    d = request_to_dict(request, spider)
+    try:
+        return pickle.dumps(d, protocol=2)
+    except (pickle.PicklingError, TypeError), e:
+        raise ValueError("Unable to serialize request %s: %s" % (request, e))
+
+
+def request_from_string(s, spider=None):
+    """Deserialize a request serialized with request_to_string()"""
+    return request_from_dict(pickle.loads(s), spider)
+
+
+def _find_method(obj, func):
+    if obj and getattr(func, 'im_self', None) is obj:
+        return func.im_func.__name__
+    raise ValueError("Function %s is not a method of: %s" % (func, obj))
+
+
+def _get_method(obj, name):
+    name = str(name)
+    try:
+        return getattr(obj, name)
+    except AttributeError:
+        raise ValueError("Method %r not found in: %s" % (name, obj))
@@ -0,0 +1,122 @@
+"""
+Helper functions for using S3 (through boto) from threads, reusing the
+connections and uploading big files in parts.
+
+Requires the boto library: http://code.google.com/p/boto/
+"""
+
+import socket
+import threading
+from urlparse import urlparse
+from itertools import count
+from cStringIO import StringIO
+
+from twisted.internet import threads, reactor
+from twisted.python.threadpool import ThreadPool
+
+from scrapy.conf import settings
+
+_local = threading.local()
+_uploadpool = None
+_connection_class = None
+
+
+def get_s3_connection(access_key=None, secret_key=None):
+    """Return a S3 connection with the given credentials (or the
+    AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY settings) to S3, or to the
+    server set in AWS_S3_ENDPOINT.
+
+    Connections are created once per thread and reused by the next calls made
+    from the same thread, so they keep their HTTP connections open between
+    requests. boto connections must not be shared between threads.
+    """
+    access_key = access_key or settings['AWS_ACCESS_KEY_ID']
+    secret_key = secret_key or settings['AWS_SECRET_ACCESS_KEY']
+    endpoint = settings['AWS_S3_ENDPOINT']
+    conns = _local.__dict__.setdefault('conns', {})
+    key = (access_key, secret_key, endpoint)
+    if key not in conns:
+        from boto.s3.connection import OrdinaryCallingFormat
+        kwargs = {}
+        if endpoint:
+            u = urlparse(endpoint)
+            kwargs = {'host': u.hostname, 'port': u.port, \
+                'is_secure': u.scheme == 'https', \
+                'calling_format': OrdinaryCallingFormat()}
+        conns[key] = _get_connection_class()(access_key, secret_key, **kwargs)
+    return conns[key]
+
+
+def _get_connection_class():
+    global _connection_class
+    if _connection_class is None:
+        from boto.s3.connection import S3Connection
+
+        class NoDelayS3Connection(S3Connection):
+            """S3 connection which disables the Nagle algorithm in its HTTP
+            connections. httplib sends the headers and the body of the
+            requests in separate writes, so (on persistent connections) the
+            body would wait for the delayed ACK of the headers"""
+
+            def new_http_connection(self, *args, **kwargs):
+                conn = S3Connection.new_http_connection(self, *args, **kwargs)
+                connect = conn.connect
+                def _connect():
+                    connect()
+                    conn.sock.setsockopt(socket.IPPROTO_TCP, \
+                        socket.TCP_NODELAY, 1)
+                conn.connect = _connect
+                return conn
+
+        _connection_class = NoDelayS3Connection
+    return _connection_class
+
+
+def upload_file(bucket, keyname, file, headers=None, policy=None, \
+        metadata=None, part_size=None):
+    """Upload the contents of the given file (from its current position) to
+    the key of the bucket, using a multipart upload if it's bigger than
+    part_size (which defaults to the S3_UPLOAD_PART_SIZE setting)"""
+    part_size = part_size or settings.getint('S3_UPLOAD_PART_SIZE')
+    start = file.tell()
+    file.seek(0, 2)
+    size = file.tell() - start
+    file.seek(start)
+    if size <= part_size:
+        key = bucket.new_key(keyname)
+        for name, value in (metadata or {}).iteritems():
+            key.set_metadata(name, value)
+        key.set_contents_from_file(file, headers=headers, policy=policy)
+        return
+    upload = bucket.initiate_multipart_upload(keyname, headers=headers, \
+        policy=policy, metadata=metadata)
+    try:
+        for number in count(1):
+            data = file.read(part_size)
+            if not data:
+                break
+            upload.upload_part_from_file(StringIO(data), number)
+        upload.complete_upload()
+    except:
+        upload.cancel_upload()
+        raise
+
+
+def defer_to_upload_thread(func, *args, **kwargs):
+    """Like twisted.internet.threads.deferToThread, but run the function in
+    the pool of S3 upload threads (which has S3_UPLOAD_THREADS threads at
+    most, and is shared by all the uploads) instead of the reactor thread
+    pool, so the uploads don't starve the other threaded calls"""
+    global _uploadpool
+    if _uploadpool is None:
+        _uploadpool = ThreadPool(1, settings.getint('S3_UPLOAD_THREADS'), \
+            'S3 uploads')
+        _uploadpool.start()
+        reactor.addSystemEventTrigger('during', 'shutdown', _stop_upload_pool)
+    return threads.deferToThreadPool(reactor, _uploadpool, func, *args, \
+        **kwargs)
+
+def _stop_upload_pool():
+    global _uploadpool
+    _uploadpool.stop()
+    _uploadpool = None
@@ -3,6 +3,16 @@ This module contains some assorted functions used in tests
 """
 
 import os
+import sys
+import time
+import socket
+import hashlib
+import threading
+from urlparse import urlparse
+from cgi import parse_qs
+from email.utils import formatdate
+from BaseHTTPServer import HTTPServer, BaseHTTPRequestHandler
+from SocketServer import ThreadingMixIn
 
 from twisted.trial.unittest import SkipTest
 
@@ -59,3 +69,143 @@ def get_crawler(settings_dict=None):
             setattr(settings_module, k, v)
     settings = CrawlerSettings(settings_module)
     return Crawler(settings)
+
+
+class FakeS3Server(ThreadingMixIn, HTTPServer):
+    """In-memory S3 server (running in its own thread) which supports the
+    object operations used by Scrapy: put, head, get and multipart uploads.
+    It doesn't check authentication. The number of TCP connections received
+    is kept in ``connections``, to check they're reused.
+
+    Point the S3 helpers to it with the AWS_S3_ENDPOINT setting::
+
+        server = FakeS3Server()
+        server.start()
+        settings.overrides['AWS_S3_ENDPOINT'] = server.url
+    """
+
+    daemon_threads = True
+
+    def __init__(self, host='127.0.0.1', port=0):
+        HTTPServer.__init__(self, (host, port), _FakeS3RequestHandler)
+        self.objects = {} # path -> (data, headers)
+        self.uploads = {} # upload id -> {part number: data}
+        self.connections = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return 'http://%s:%d' % self.server_address
+
+    def start(self):
+        t = threading.Thread(target=self.serve_forever)
+        t.setDaemon(True)
+        t.start()
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def handle_error(self, request, client_address):
+        # clients closing their persistent connections are not errors
+        if not isinstance(sys.exc_info()[1], socket.error):
+            HTTPServer.handle_error(self, request, client_address)
+
+
+class _FakeS3RequestHandler(BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+    # send each response in a single write, to avoid the delayed ACKs which
+    # slow down the persistent connections
+    wbufsize = -1
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        BaseHTTPRequestHandler.setup(self)
+        self.server.lock.acquire()
+        self.server.connections += 1
+        self.server.lock.release()
+
+    def log_message(self, *args):
+        pass
+
+    def _parse(self):
+        u = urlparse(self.path)
+        return u.path, parse_qs(u.query, keep_blank_values=True)
+
+    def _body(self):
+        return self.rfile.read(int(self.headers.get('Content-Length') or 0))
+
+    def _respond(self, status, body='', headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+        self.wfile.flush()
+
+    def _etag(self, data):
+        return '"%s"' % hashlib.md5(data).hexdigest()
+
+    def do_PUT(self):
+        path, query = self._parse()
+        data = self._body()
+        if 'uploadId' in query:
+            upload = self.server.uploads[query['uploadId'][0]]
+            upload[int(query['partNumber'][0])] = data
+        else:
+            headers = dict((k, v) for k, v in self.headers.items() \
+                if k.startswith('x-amz-meta-') or k == 'content-type')
+            self.server.objects[path] = (data, headers)
+        self._respond(200, headers={'ETag': self._etag(data)})
+
+    def do_POST(self):
+        path, query = self._parse()
+        self._body()
+        if 'uploads' in query:
+            uploadid = hashlib.md5('%s%s' % (path, time.time())).hexdigest()
+            self.server.uploads[uploadid] = {}
+            bucket, key = path.lstrip('/').split('/', 1)
+            body = '<?xml version="1.0" encoding="UTF-8"?>' \
+                '<InitiateMultipartUploadResult><Bucket>%s</Bucket>' \
+                '<Key>%s</Key><UploadId>%s</UploadId>' \
+                '</InitiateMultipartUploadResult>' % (bucket, key, uploadid)
+        else:
+            parts = self.server.uploads.pop(query['uploadId'][0])
+            data = ''.join(parts[n] for n in sorted(parts))
+            self.server.objects[path] = (data, {})
+            body = '<?xml version="1.0" encoding="UTF-8"?>' \
+                '<CompleteMultipartUploadResult><Location>%s</Location>' \
+                '<ETag>%s</ETag></CompleteMultipartUploadResult>' % \
+                (path, self._etag(data))
+        self._respond(200, body, {'Content-Type': 'application/xml'})
+
+    def do_DELETE(self):
+        path, query = self._parse()
+        if 'uploadId' in query:
+            self.server.uploads.pop(query['uploadId'][0], None)
+        else:
+            self.server.objects.pop(path, None)
+        self._respond(204)
+
+    def do_GET(self):
+        path, query = self._parse()
+        if 'uploadId' in query:
+            parts = self.server.uploads[query['uploadId'][0]]
+            body = '<?xml version="1.0" encoding="UTF-8"?><ListPartsResult>' \
+                '<IsTruncated>false</IsTruncated>%s</ListPartsResult>' % \
+                ''.join('<Part><PartNumber>%d</PartNumber><ETag>%s</ETag>' \
+                    '<Size>%d</Size></Part>' % (n, self._etag(parts[n]), \
+                    len(parts[n])) for n in sorted(parts))
+            return self._respond(200, body, {'Content-Type': 'application/xml'})
+        if path not in self.server.objects:
+            return self._respond(404)
+        data, headers = self.server.objects[path]
+        headers = dict(headers, ETag=self._etag(data), \
+            **{'Last-Modified': formatdate(usegmt=True)})
+        self._respond(200, data, headers)
+
+    do_HEAD = do_GET
+